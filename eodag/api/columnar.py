@@ -0,0 +1,764 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib
+import numbers
+import operator
+import os
+
+import numpy
+import orjson
+import shapely
+from shapely.geometry import box
+
+from eodag.api.product import EOProduct
+from eodag.api.search_result import SearchResult
+from eodag.utils.exceptions import ValidationError
+
+#: Columns holding the provider and the product type of the products, named as in
+#: their geojson representation
+PROVIDER_COLUMN = "eodag_provider"
+PRODUCT_TYPE_COLUMN = "eodag_product_type"
+GEOMETRY_COLUMN = "geometry"
+#: GeoParquet bbox covering column, used to push bbox filters down to row groups
+BBOX_COLUMN = "bbox"
+
+#: Serialization formats of the search results, by file extension
+SERIALIZATION_FORMATS = {
+    ".geojson": "geojson",
+    ".json": "geojson",
+    ".parquet": "parquet",
+    ".geoparquet": "parquet",
+    ".fgb": "fgb",
+    ".geojsonl": "geojsonseq",
+    ".geojsons": "geojsonseq",
+    ".ndjson": "geojsonseq",
+    ".jsonl": "geojsonseq",
+}
+
+#: Key of the eodag metadata of the Arrow tables and FlatGeobuf layers
+EODAG_METADATA_KEY = "eodag"
+
+#: Pandas types of the columns with missing values written to FlatGeobuf files,
+#: by column kind
+NULLABLE_DTYPES = {"bool": "boolean", "int": "Int64", "float": "Float64"}
+
+#: Default number of products by parquet row group, the unit of the filters pushdown
+DEFAULT_PARQUET_ROW_GROUP_SIZE = 10000
+
+FILTER_OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda column, values: numpy.isin(column, list(values)),
+    "not in": lambda column, values: ~numpy.isin(column, list(values)),
+}
+
+
+def import_optional_dependency(name):
+    """Import a module needed by the columnar search results conversions, which are
+    optional dependencies of eodag
+
+    :param name: The name of the module
+    :type name: str
+    :returns: The module
+    :rtype: module
+    :raises: :class:`NotImplementedError`
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise NotImplementedError(
+            f"{name} needed for this functionality, install using "
+            "`pip install eodag[columnar]`"
+        )
+
+
+def get_serialization_format(filename, format=None):
+    """Get the format to serialize search results in, from the file extension if
+    not given
+
+    >>> get_serialization_format("results.parquet")
+    'parquet'
+    >>> get_serialization_format("results.txt")
+    'geojson'
+
+    :param filename: The name of the file
+    :type filename: str
+    :param format: (optional) The format, one of ``geojson``, ``geojsonseq``,
+                   ``parquet`` or ``fgb``
+    :type format: str
+    :returns: The serialization format
+    :rtype: str
+    :raises: :class:`~eodag.utils.exceptions.ValidationError`
+    """
+    if format is None:
+        extension = os.path.splitext(filename)[1].lower()
+        return SERIALIZATION_FORMATS.get(extension, "geojson")
+    if format not in set(SERIALIZATION_FORMATS.values()):
+        raise ValidationError(
+            f"Unknown serialization format {format}, should be one of "
+            f"{', '.join(sorted(set(SERIALIZATION_FORMATS.values())))}"
+        )
+    return format
+
+
+def filters_to_sql(filters):
+    """Build an SQL where clause from filters on properties
+
+    >>> print(filters_to_sql([("cloudCover", "<", 20), ("platform", "in", ["S2A"])]))
+    "cloudCover" < 20 AND "platform" IN ('S2A')
+    >>> print(filters_to_sql([("online", "=", True)]))
+    "online" = 1
+
+    :param filters: The filters, as ``(property, operator, value)`` tuples that must
+                    all be true
+    :type filters: list(tuple)
+    :returns: The where clause
+    :rtype: str
+    """
+
+    def to_sql_value(value):
+        # booleans are integers in OGR SQL
+        if isinstance(value, bool):
+            return str(int(value))
+        if isinstance(value, str):
+            return "'{}'".format(value.replace("'", "''"))
+        return str(value)
+
+    clauses = []
+    for name, op, value in filters:
+        if op in ("in", "not in"):
+            sql_value = "({})".format(", ".join(to_sql_value(v) for v in value))
+        else:
+            sql_value = to_sql_value(value)
+        sql_op = {"==": "=", "in": "IN", "not in": "NOT IN"}.get(op, op)
+        clauses.append('"{}" {} {}'.format(name.replace('"', '""'), sql_op, sql_value))
+    return " AND ".join(clauses)
+
+
+def match_product(product, bbox=None, filters=None):
+    """Check if a product intersects a bounding box and matches filters on its
+    properties, the same way :meth:`ColumnarSearchResult.selection_mask` does
+
+    :param product: The product
+    :type product: :class:`~eodag.api.product._product.EOProduct`
+    :param bbox: (optional) The bounding box the product must intersect, as
+                 ``(lonmin, latmin, lonmax, latmax)``
+    :type bbox: tuple
+    :param filters: (optional) The filters on the properties, as
+                    ``(property, operator, value)`` tuples that must all be true
+    :type filters: list(tuple)
+    :returns: Whether the product matches
+    :rtype: bool
+    """
+    if bbox is not None and not product.geometry.intersects(box(*bbox)):
+        return False
+    for name, op, value in filters or []:
+        try:
+            operator_method = FILTER_OPERATORS[op]
+        except KeyError:
+            raise ValidationError(
+                f"Unknown filter operator {op}, should be one of "
+                f"{', '.join(FILTER_OPERATORS)}"
+            )
+        if product.properties.get(name, None) is None or not operator_method(
+            product.properties[name], value
+        ):
+            return False
+    return True
+
+
+def _spatial_sort_key(geometries):
+    """Z-order curve index of the geometries centroids, to store the geometries
+    close to each other together
+    """
+    centroids = shapely.centroid(geometries)
+    scale = numpy.iinfo(numpy.uint16).max
+    x = numpy.nan_to_num((shapely.get_x(centroids) + 180) / 360)
+    y = numpy.nan_to_num((shapely.get_y(centroids) + 90) / 180)
+    key = numpy.zeros(len(geometries), dtype=numpy.uint64)
+    for coord, shift in ((x, 0), (y, 1)):
+        bits = (numpy.clip(coord, 0, 1) * scale).astype(numpy.uint64)
+        for i in range(16):
+            key |= ((bits >> numpy.uint64(i)) & numpy.uint64(1)) << numpy.uint64(
+                2 * i + shift
+            )
+    return key
+
+
+def _value_kind(value):
+    """Get the kind of a value stored in a column"""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, numbers.Integral):
+        return "int"
+    if isinstance(value, numbers.Real):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    return "json"
+
+
+def _column_kind(column):
+    """Get the kind of the values of a column, ``bool``, ``int``, ``float`` or
+    ``str``, ``json`` if they are lists, dicts or of several kinds, and None if they
+    are all missing
+
+    >>> _column_kind(_to_column([1, None, 2.5]))
+    'float'
+    >>> _column_kind(_to_column([12, "12A"]))
+    'json'
+    """
+    if column.dtype.kind in "biuf":
+        return {"b": "bool", "f": "float"}.get(column.dtype.kind, "int")
+    kinds = {_value_kind(v) for v in column.tolist() if v is not None}
+    if kinds == {"int", "float"}:
+        return "float"
+    if len(kinds) > 1:
+        return "json"
+    return kinds.pop() if kinds else None
+
+
+def _encode_columns(columns):
+    """Encode as JSON strings the values of the columns that cannot be typed, i.e.
+    holding lists, dicts or values of several kinds, so that they can be written to
+    Arrow tables or files
+
+    :param columns: The columns, by name
+    :type columns: dict(str, :class:`numpy.ndarray`)
+    :returns: The encoded columns, and the kind of each column (see
+              :func:`_column_kind`) needed to decode them
+    :rtype: tuple(dict, dict)
+    """
+    encoded = {}
+    kinds = {}
+    for name, column in columns.items():
+        kinds[name] = _column_kind(column)
+        if kinds[name] == "json":
+            column = _to_column(
+                [
+                    None
+                    if v is None
+                    else orjson.dumps(
+                        v, option=orjson.OPT_SERIALIZE_NUMPY, default=str
+                    ).decode("utf-8")
+                    for v in column.tolist()
+                ]
+            )
+        encoded[name] = column
+    return encoded, kinds
+
+
+def _decode_column(column, kind=None):
+    """Decode a column encoded with :func:`_encode_columns` and read from a file,
+    missing values (None or NaN) being None
+
+    :param column: The column as read
+    :type column: :class:`numpy.ndarray`
+    :param kind: (optional) The kind of the column when it was encoded
+    :type kind: str
+    :returns: The decoded column
+    :rtype: :class:`numpy.ndarray`
+    """
+    if column.dtype.kind in "biu" or (
+        column.dtype.kind == "f" and not numpy.isnan(column).any()
+    ):
+        # readers may give integers and booleans as floats
+        if kind == "int" and column.dtype.kind == "f":
+            return column.astype(numpy.int64)
+        if kind == "bool" and column.dtype.kind != "b":
+            return column.astype(bool)
+        return column
+    values = [
+        None if v is None or (isinstance(v, float) and numpy.isnan(v)) else v
+        for v in column.tolist()
+    ]
+    convert = {"json": orjson.loads, "bool": bool, "int": int}.get(kind, None)
+    if convert is not None:
+        values = [None if v is None else convert(v) for v in values]
+    return _to_column(values)
+
+
+def _read_column_kinds(metadata):
+    """Get the columns kinds from the eodag metadata of an Arrow table or a
+    FlatGeobuf layer, empty if it has none"""
+    metadata = metadata or {}
+    eodag_metadata = metadata.get(
+        EODAG_METADATA_KEY, metadata.get(EODAG_METADATA_KEY.encode(), None)
+    )
+    if not eodag_metadata:
+        return {}
+    return orjson.loads(eodag_metadata).get("column_kinds", {})
+
+
+def _split_filters(filters, names, kinds):
+    """Split the filters between the ones that the readers can apply, and the ones
+    on missing or JSON encoded columns, to be applied once read"""
+    pushed_filters = []
+    remaining_filters = []
+    for name, op, value in filters or []:
+        if name in names and kinds.get(name, None) != "json":
+            pushed_filters.append((name, op, value))
+        else:
+            remaining_filters.append((name, op, value))
+    return pushed_filters, remaining_filters
+
+
+def _to_column(values):
+    """Build a numpy array from the given values, with a native dtype if they are all
+    numbers so that it can be converted to Arrow without copy
+    """
+    if values and all(
+        isinstance(v, numbers.Real) and not isinstance(v, bool) for v in values
+    ):
+        return numpy.array(values)
+    column = numpy.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+class ColumnarSearchResult(object):
+    """A column-oriented collection of search results, intended to filter, sort and
+    analyse large result sets without going through each product.
+
+    The properties of the products are held as numpy arrays, one per property,
+    missing values being None, and their geometries as a Shapely 2 array. It can be
+    built from and converted to a :class:`~eodag.api.search_result.SearchResult`,
+    and exported to Arrow or GeoPandas, which are optional dependencies.
+
+    :param columns: The properties of the products, by property name, including the
+                    ``eodag_provider`` and ``eodag_product_type`` ones
+    :type columns: dict(str, :class:`numpy.ndarray`)
+    :param geometries: The geometries of the products
+    :type geometries: :class:`numpy.ndarray`
+    :param downloaders: (optional) The download plugins and authentication plugins of
+                        the products, by provider
+    :type downloaders: dict(str, tuple)
+    """
+
+    def __init__(self, columns, geometries, downloaders=None):
+        self.columns = columns
+        self.geometries = geometries
+        self.downloaders = downloaders if downloaders is not None else {}
+
+    @classmethod
+    def from_search_result(cls, search_result):
+        """Build a columnar search result from the given products
+
+        :param search_result: The products
+        :type search_result: :class:`~eodag.api.search_result.SearchResult`
+        :returns: The columnar search result
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        all_properties = [product.properties for product in search_result]
+        names = list(dict.fromkeys(k for props in all_properties for k in props))
+        columns = {
+            name: _to_column([props.get(name) for props in all_properties])
+            for name in names
+            if name not in (PROVIDER_COLUMN, PRODUCT_TYPE_COLUMN, GEOMETRY_COLUMN)
+        }
+        columns[PROVIDER_COLUMN] = _to_column([p.provider for p in search_result])
+        columns[PRODUCT_TYPE_COLUMN] = _to_column(
+            [p.product_type for p in search_result]
+        )
+        geometries = numpy.empty(len(search_result), dtype=object)
+        geometries[:] = [product.geometry for product in search_result]
+        downloaders = {
+            product.provider: (product.downloader, product.downloader_auth)
+            for product in search_result
+            if product.downloader is not None
+        }
+        return cls(columns, geometries, downloaders=downloaders)
+
+    def to_search_result(self):
+        """Build back the products of this columnar search result
+
+        :returns: The products
+        :rtype: :class:`~eodag.api.search_result.SearchResult`
+        """
+        return SearchResult([self[i] for i in range(len(self))])
+
+    @property
+    def properties_names(self):
+        """The names of the properties of the products"""
+        return [
+            name
+            for name in self.columns
+            if name not in (PROVIDER_COLUMN, PRODUCT_TYPE_COLUMN)
+        ]
+
+    def __len__(self):
+        return len(self.geometries)
+
+    def __getitem__(self, key):
+        """Get the product at the given position, or the columnar search result made
+        of the products selected by the given slice, indices or boolean mask
+        """
+        if isinstance(key, numbers.Integral):
+            return self._build_product(key)
+        return self.__class__(
+            {name: column[key] for name, column in self.columns.items()},
+            self.geometries[key],
+            downloaders=self.downloaders,
+        )
+
+    def take(self, indices):
+        """Select products by their positions
+
+        :param indices: The positions of the products to keep
+        :type indices: list(int) or :class:`numpy.ndarray`
+        :returns: The selected products
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        return self[numpy.asarray(indices, dtype=numpy.intp)]
+
+    def sort(self, by, reverse=False):
+        """Sort the products on one of their properties
+
+        :param by: The name of the property
+        :type by: str
+        :param reverse: (optional) Sort in descending order
+        :type reverse: bool
+        :returns: The sorted products
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        order = numpy.argsort(self.columns[by], kind="stable")
+        return self.take(order[::-1] if reverse else order)
+
+    def _build_product(self, index):
+        properties = {
+            name: self.columns[name][index]
+            for name in self.properties_names
+            if self.columns[name][index] is not None
+        }
+        # numpy scalars back to python ones
+        properties = {
+            k: v.item() if isinstance(v, numpy.generic) else v
+            for k, v in properties.items()
+        }
+        properties[GEOMETRY_COLUMN] = self.geometries[index]
+        provider = self.columns[PROVIDER_COLUMN][index]
+        product_type = self.columns[PRODUCT_TYPE_COLUMN][index]
+        # as in the products read from their geojson representation
+        if provider is not None:
+            properties[PROVIDER_COLUMN] = provider
+        if product_type is not None:
+            properties[PRODUCT_TYPE_COLUMN] = product_type
+        product = EOProduct(provider, properties, productType=product_type)
+        if provider in self.downloaders:
+            product.downloader, product.downloader_auth = self.downloaders[provider]
+        return product
+
+    def crunch(self, cruncher, **search_params):
+        """Do some crunching with the underlying columns, using its vectorized
+        implementation if the cruncher has one
+
+        :param cruncher: The plugin instance to use to work on the products
+        :type cruncher: subclass of :class:`~eodag.plugins.crunch.base.Crunch`
+        :param search_params: The criteria that have been used to produce this result
+        :type search_params: dict
+        :returns: The result of the application of the crunching method
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        return self.take(cruncher.proceed_columnar(self, **search_params))
+
+    # crunchers shortcuts, which only rely on crunch()
+    filter_date = SearchResult.filter_date
+    filter_duplicates = SearchResult.filter_duplicates
+    filter_latest_intersect = SearchResult.filter_latest_intersect
+    filter_latest_by_name = SearchResult.filter_latest_by_name
+    filter_minimal_cover = SearchResult.filter_minimal_cover
+    filter_overlap = SearchResult.filter_overlap
+    filter_property = SearchResult.filter_property
+    filter_online = SearchResult.filter_online
+
+    def to_arrow(self):
+        """Convert to an Arrow table, the geometries being encoded as WKB in its
+        ``geometry`` column. Numeric columns are not copied. The values of the columns
+        holding lists, dicts or values of several types, like numbers and strings, are
+        stored as JSON strings.
+
+        :returns: The Arrow table
+        :rtype: :class:`pyarrow.Table`
+        """
+        pa = import_optional_dependency("pyarrow")
+        columns, kinds = _encode_columns(self.columns)
+        arrays = [pa.array(column) for column in columns.values()]
+        arrays.append(pa.array(shapely.to_wkb(self.geometries), type=pa.binary()))
+        names = list(columns) + [GEOMETRY_COLUMN]
+        # geoparquet metadata, read by the tools supporting geospatial Arrow tables
+        geo_metadata = {
+            "version": "1.0.0",
+            "primary_column": GEOMETRY_COLUMN,
+            "columns": {
+                GEOMETRY_COLUMN: {
+                    "encoding": "WKB",
+                    "geometry_types": sorted(
+                        {g.geom_type for g in self.geometries if g is not None}
+                    ),
+                }
+            },
+        }
+        return pa.table(
+            arrays,
+            names=names,
+            metadata={
+                "geo": orjson.dumps(geo_metadata),
+                EODAG_METADATA_KEY: orjson.dumps({"column_kinds": kinds}),
+            },
+        )
+
+    @classmethod
+    def from_arrow(cls, table):
+        """Build a columnar search result from an Arrow table such as the ones built by
+        :meth:`to_arrow`. Numeric columns without missing values are not copied.
+
+        :param table: The Arrow table
+        :type table: :class:`pyarrow.Table`
+        :returns: The columnar search result
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        kinds = _read_column_kinds(table.schema.metadata)
+        columns = {}
+        for name in table.column_names:
+            if name in (GEOMETRY_COLUMN, BBOX_COLUMN):
+                continue
+            column = table.column(name).to_numpy()
+            if column.dtype.kind not in "biuf":
+                column = column.astype(object)
+            columns[name] = _decode_column(column, kinds.get(name, None))
+        geometries = shapely.from_wkb(table.column(GEOMETRY_COLUMN).to_numpy())
+        for name in (PROVIDER_COLUMN, PRODUCT_TYPE_COLUMN):
+            if name not in columns:
+                columns[name] = numpy.full(len(geometries), None, dtype=object)
+        return cls(columns, geometries)
+
+    def to_geodataframe(self):
+        """Convert to a GeoPandas GeoDataFrame, in WGS84 coordinates
+
+        :returns: The GeoDataFrame
+        :rtype: :class:`geopandas.GeoDataFrame`
+        """
+        geopandas = import_optional_dependency("geopandas")
+        return geopandas.GeoDataFrame(
+            dict(self.columns), geometry=self.geometries, crs="EPSG:4326"
+        )
+
+    def select(self, bbox=None, filters=None):
+        """Select the products intersecting a bounding box and matching filters on
+        their properties (see :meth:`selection_mask`)
+
+        :param bbox: (optional) The bounding box the products must intersect
+        :type bbox: tuple
+        :param filters: (optional) The filters on the properties
+        :type filters: list(tuple)
+        :returns: The selected products
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        return self[self.selection_mask(bbox=bbox, filters=filters)]
+
+    def selection_mask(self, bbox=None, filters=None):
+        """Get which products intersect a bounding box and match filters on their
+        properties
+
+        :param bbox: (optional) The bounding box the products must intersect, as
+                     ``(lonmin, latmin, lonmax, latmax)``
+        :type bbox: tuple
+        :param filters: (optional) The filters on the properties, as
+                        ``(property, operator, value)`` tuples that must all be true.
+                        Operator is one of ``=, ==, !=, <, <=, >, >=, in, not in``
+        :type filters: list(tuple)
+        :returns: Whether each product is selected
+        :rtype: :class:`numpy.ndarray`
+        """
+        mask = numpy.ones(len(self), dtype=bool)
+        if bbox is not None:
+            mask &= shapely.intersects(self.geometries, box(*bbox))
+        for name, op, value in filters or []:
+            try:
+                operator_method = FILTER_OPERATORS[op]
+            except KeyError:
+                raise ValidationError(
+                    f"Unknown filter operator {op}, should be one of "
+                    f"{', '.join(FILTER_OPERATORS)}"
+                )
+            column = self.columns.get(name, None)
+            if column is None:
+                mask[:] = False
+                continue
+            # products missing the property do not match
+            present = numpy.array([v is not None for v in column.tolist()], dtype=bool)
+            matches = numpy.zeros(len(self), dtype=bool)
+            matches[present] = numpy.asarray(
+                operator_method(column[present], value), dtype=bool
+            )
+            mask &= matches
+        return mask
+
+    def to_parquet(self, filename, row_group_size=DEFAULT_PARQUET_ROW_GROUP_SIZE):
+        """Write to a GeoParquet file. Products are sorted along a space filling
+        curve so that each row group covers a small area, and a ``bbox`` covering
+        column allows to skip the row groups outside of a searched bounding box.
+        Columns are encoded as by :meth:`to_arrow`.
+
+        :param filename: The name of the file to write
+        :type filename: str
+        :param row_group_size: (optional) The number of products by row group
+        :type row_group_size: int
+        """
+        pa = import_optional_dependency("pyarrow")
+        pq = import_optional_dependency("pyarrow.parquet")
+        sorted_results = self.take(numpy.argsort(_spatial_sort_key(self.geometries)))
+        table = sorted_results.to_arrow()
+        bounds = shapely.bounds(sorted_results.geometries)
+        table = table.append_column(
+            BBOX_COLUMN,
+            pa.StructArray.from_arrays(
+                [pa.array(bounds[:, i]) for i in range(4)],
+                names=["xmin", "ymin", "xmax", "ymax"],
+            ),
+        )
+        geo_metadata = orjson.loads(table.schema.metadata[b"geo"])
+        geo_metadata["version"] = "1.1.0"
+        geo_metadata["columns"][GEOMETRY_COLUMN]["covering"] = {
+            "bbox": {
+                key: [BBOX_COLUMN, key] for key in ("xmin", "ymin", "xmax", "ymax")
+            }
+        }
+        table = table.replace_schema_metadata(
+            dict(table.schema.metadata, geo=orjson.dumps(geo_metadata))
+        )
+        pq.write_table(table, filename, row_group_size=row_group_size)
+
+    @classmethod
+    def from_parquet(cls, filename, bbox=None, filters=None):
+        """Read a GeoParquet file written by :meth:`to_parquet`. The filters and the
+        bounding box are pushed down to the parquet reader, which skips the row
+        groups not matching them. Filters on properties missing from the file match
+        no products, as with :meth:`select`
+
+        :param filename: The name of the file to read
+        :type filename: str
+        :param bbox: (optional) The bounding box the products must intersect, as
+                     ``(lonmin, latmin, lonmax, latmax)``
+        :type bbox: tuple
+        :param filters: (optional) The filters on the properties (see :meth:`select`)
+        :type filters: list(tuple)
+        :returns: The columnar search result
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        pc = import_optional_dependency("pyarrow.compute")
+        pq = import_optional_dependency("pyarrow.parquet")
+        schema = pq.read_schema(filename)
+        kinds = _read_column_kinds(schema.metadata)
+        # filters on missing or JSON encoded properties are applied once read
+        pushed_filters, remaining_filters = _split_filters(filters, schema.names, kinds)
+        expression = None
+        if pushed_filters:
+            expression = pq.filters_to_expression(
+                [(n, "==" if op == "=" else op, v) for n, op, v in pushed_filters]
+            )
+        if bbox is not None:
+            lonmin, latmin, lonmax, latmax = bbox
+            bbox_expression = (
+                (pc.field(BBOX_COLUMN, "xmin") <= lonmax)
+                & (pc.field(BBOX_COLUMN, "xmax") >= lonmin)
+                & (pc.field(BBOX_COLUMN, "ymin") <= latmax)
+                & (pc.field(BBOX_COLUMN, "ymax") >= latmin)
+            )
+            expression = (
+                bbox_expression if expression is None else expression & bbox_expression
+            )
+        table = pq.read_table(filename, filters=expression)
+        # the bbox covering only tells the products envelopes intersect it
+        return cls.from_arrow(table).select(bbox=bbox, filters=remaining_filters)
+
+    def to_flatgeobuf(self, filename):
+        """Write to a FlatGeobuf file, with a spatial index. Columns are encoded as
+        by :meth:`to_arrow`, the columns kinds being kept in the layer metadata.
+
+        :param filename: The name of the file to write
+        :type filename: str
+        """
+        geopandas = import_optional_dependency("geopandas")
+        pandas = import_optional_dependency("pandas")
+        columns, kinds = _encode_columns(self.columns)
+        # nullable types, so that booleans and numbers with missing values are not
+        # written as strings
+        for name, column in columns.items():
+            if column.dtype == object and kinds[name] in NULLABLE_DTYPES:
+                columns[name] = pandas.array(
+                    column.tolist(), dtype=NULLABLE_DTYPES[kinds[name]]
+                )
+        geodataframe = geopandas.GeoDataFrame(
+            columns, geometry=self.geometries, crs="EPSG:4326"
+        )
+        geodataframe.to_file(
+            filename,
+            driver="FlatGeobuf",
+            spatial_index=True,
+            engine="pyogrio",
+            layer_metadata={
+                EODAG_METADATA_KEY: orjson.dumps({"column_kinds": kinds}).decode()
+            },
+        )
+
+    @classmethod
+    def from_flatgeobuf(cls, filename, bbox=None, filters=None):
+        """Read a FlatGeobuf file written by :meth:`to_flatgeobuf`. Its spatial
+        index is used to only read the products intersecting the bounding box, and
+        the filters are applied by the reader. Filters on properties missing from the
+        file match no products, as with :meth:`select`
+
+        :param filename: The name of the file to read
+        :type filename: str
+        :param bbox: (optional) The bounding box the products must intersect, as
+                     ``(lonmin, latmin, lonmax, latmax)``
+        :type bbox: tuple
+        :param filters: (optional) The filters on the properties (see :meth:`select`)
+        :type filters: list(tuple)
+        :returns: The columnar search result
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        geopandas = import_optional_dependency("geopandas")
+        pyogrio = import_optional_dependency("pyogrio")
+        info = pyogrio.read_info(filename)
+        kinds = _read_column_kinds(info.get("layer_metadata", None))
+        pushed_filters, remaining_filters = _split_filters(
+            filters, info["fields"].tolist(), kinds
+        )
+        geodataframe = geopandas.read_file(
+            filename,
+            bbox=tuple(bbox) if bbox is not None else None,
+            where=filters_to_sql(pushed_filters) if pushed_filters else None,
+            engine="pyogrio",
+        )
+        columns = {}
+        for name in geodataframe.columns:
+            if name == geodataframe.geometry.name:
+                continue
+            column = geodataframe[name].to_numpy()
+            if column.dtype.kind not in "biuf":
+                column = numpy.where(geodataframe[name].isna(), None, column)
+            columns[name] = _decode_column(column, kinds.get(name, None))
+        geometries = numpy.asarray(geodataframe.geometry.array, dtype=object)
+        return cls(columns, geometries).select(bbox=bbox, filters=remaining_filters)
@@ -15,22 +15,43 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+import datetime
 import logging
 import os
+import queue
 import re
 import shutil
+import threading
+import time
+from collections import UserList
+from contextlib import nullcontext
 from operator import itemgetter
 
+import concurrent.futures
+import dateutil.parser
 import geojson
+import orjson
 import pkg_resources
 import yaml.parser
+from dateutil import tz
 from pkg_resources import resource_filename
+from shapely.prepared import prep
 from whoosh import analysis, fields
 from whoosh.fields import Schema
 from whoosh.index import create_in, exists_in, open_dir
 from whoosh.qparser import QueryParser
 
-from eodag.api.product.metadata_mapping import mtd_cfg_as_conversion_and_querypath
+from eodag.api.columnar import (
+    ColumnarSearchResult,
+    get_serialization_format,
+    match_product,
+)
+from eodag.api.product import EOProduct
+from eodag.api.product.metadata_mapping import (
+    NOT_AVAILABLE,
+    mtd_cfg_as_conversion_and_querypath,
+)
 from eodag.api.search_result import SearchResult
 from eodag.config import (
     SimpleYamlProxyConfig,
@@ -45,12 +66,15 @@ from eodag.config import (
 )
 from eodag.plugins.download.base import DEFAULT_DOWNLOAD_TIMEOUT, DEFAULT_DOWNLOAD_WAIT
 from eodag.plugins.manager import PluginManager
+from eodag.plugins.search.base import SearchContext
 from eodag.utils import (
     GENERIC_PRODUCT_TYPE,
     MockResponse,
     _deprecated,
     deepcopy,
     get_geometry_from_various,
+    get_geometry_tiles,
+    get_prepared_geometry,
     makedirs,
     obj_md5sum,
     string_to_jsonpath,
@@ -61,6 +85,7 @@ from eodag.utils.exceptions import (
     MisconfiguredError,
     NoMatchingProductType,
     PluginImplementationError,
+    RequestError,
     UnsupportedProvider,
 )
 from eodag.utils.stac_reader import HTTP_REQ_TIMEOUT, fetch_stac_items
@@ -74,6 +99,8 @@ DEFAULT_ITEMS_PER_PAGE = 20
 # 20 (DEFAULT_ITEMS_PER_PAGE) to increase it to the known and currentminimum
 # value (mundi)
 DEFAULT_MAX_ITEMS_PER_PAGE = 50
+# Time windows shorter than this are not split anymore when searching all the products
+MIN_SEARCH_TIME_WINDOW = datetime.timedelta(seconds=1)
 
 
 class EODataAccessGateway(object):
@@ -274,6 +301,23 @@ class EODataAccessGateway(object):
             new_priority = max_priority + 1
             self._plugins_manager.set_priority(provider, new_priority)
 
+    def set_search_cache(self, cache):
+        """Set the cache storing the providers responses to search requests.
+
+        Identical search requests are then answered from the cache until the cached
+        responses expire, without sending any request to the providers. The raw
+        responses are stored, the search results being built again from them. A
+        search given ``refresh_cache=True`` sends its requests anyway, and replaces
+        the cached responses with the new ones.
+
+        :param cache: The search responses cache to use, or None to disable caching.
+                      For example
+                      :class:`~eodag.utils.cache.MemorySearchCache` or
+                      :class:`~eodag.utils.cache.SQLiteSearchCache`
+        :type cache: :class:`~eodag.utils.cache.SearchCache`
+        """
+        self._plugins_manager.search_cache = cache
+
     def get_preferred_provider(self):
         """Get the provider currently set as the preferred one for searching
         products, along with its priority.
@@ -831,6 +875,9 @@ class EODataAccessGateway(object):
         end=None,
         geom=None,
         locations=None,
+        providers=None,
+        max_workers=None,
+        provider_timeout=None,
         **kwargs,
     ):
         """Look for products matching criteria on known providers.
@@ -840,6 +887,13 @@ class EODataAccessGateway(object):
         are configurable through user configuration file or individual
         environment variable.
 
+        If ``providers`` is set, the search is instead sent concurrently to each of
+        the given providers and their results are merged, ordered by provider priority.
+        Errors and timeouts of a provider do not abort the search: they are
+        collected in the ``errors`` attribute of the returned
+        :class:`~eodag.api.search_result.SearchResult`. For a search by ``id``, the
+        given providers are raced and the first single-match result is returned.
+
         :param page: (optional) The page number to return
         :type page: int
         :param items_per_page: (optional) The number of results that must appear in one single
@@ -872,8 +926,25 @@ class EODataAccessGateway(object):
                           'PA' such as Panama and Pakistan in the shapefile configured with
                           name=country and attr=ISO3
         :type locations: dict
+        :param providers: (optional) Providers to search on concurrently: ``"all"`` for
+                          every provider supporting the product type, or a list of
+                          provider names
+        :type providers: Union[str, list]
+        :param max_workers: (optional) Maximum number of providers searched at the same
+                            time when ``providers`` is set. Defaults to the number of
+                            providers
+        :type max_workers: int
+        :param provider_timeout: (optional) Maximum time in seconds to wait for each
+                                 provider when ``providers`` is set, counted from
+                                 the start of its search
+        :type provider_timeout: float
         :param kwargs: Some other criteria that will be used to do the search,
-                       using paramaters compatibles with the provider
+                       using paramaters compatibles with the provider. A
+                       ``provider`` can be given to search on it instead of the
+                       preferred one, e.g. a local catalog (see
+                       :class:`~eodag.plugins.search.local_catalog.LocalCatalogSearch`).
+                       ``refresh_cache=True`` ignores the responses stored in the
+                       search cache (see :meth:`set_search_cache`)
         :type kwargs: Union[int, str, bool, dict]
         :returns: A collection of EO products matching the criteria and the total
                   number of results found
@@ -896,11 +967,31 @@ class EODataAccessGateway(object):
             )
             # remove auth from search_kwargs as a loop over providers will be performed
             search_kwargs.pop("auth", None)
+            if providers is not None:
+                # race the candidate providers instead of requesting them one by one
+                if providers != "all":
+                    search_kwargs["provider"] = providers
+                return self._search_by_id(
+                    search_kwargs.pop("id"),
+                    race=True,
+                    max_workers=max_workers,
+                    **search_kwargs,
+                )
             return self._search_by_id(search_kwargs.pop("id"), **search_kwargs)
         search_kwargs.update(
             page=page,
             items_per_page=items_per_page,
         )
+        if providers is not None:
+            search_kwargs.pop("auth", None)
+            search_kwargs.pop("product_type_config", None)
+            return self._search_providers(
+                providers,
+                max_workers=max_workers,
+                timeout=provider_timeout,
+                raise_errors=raise_errors,
+                **search_kwargs,
+            )
         search_plugin.clear()
         return self._do_search(
             search_plugin, count=True, raise_errors=raise_errors, **search_kwargs
@@ -913,6 +1004,7 @@ class EODataAccessGateway(object):
         end=None,
         geom=None,
         locations=None,
+        prefetch=0,
         **kwargs,
     ):
         """Iterate over the pages of a products search.
@@ -943,8 +1035,16 @@ class EODataAccessGateway(object):
                           'PA' such as Panama and Pakistan in the shapefile configured with
                           name=country and attr=ISO3
         :type locations: dict
+        :param prefetch: (optional) Number of next pages requested in advance while
+                         the current page is processed by the caller, concurrently on
+                         page/offset paginated providers and one after the other on a
+                         background worker otherwise. No page is requested in advance
+                         if set to 0
+        :type prefetch: int
         :param kwargs: Some other criteria that will be used to do the search,
-                       using paramaters compatibles with the provider
+                       using paramaters compatibles with the provider.
+                       ``refresh_cache=True`` ignores the responses stored in the
+                       search cache (see :meth:`set_search_cache`)
         :type kwargs: Union[int, str, bool, dict]
         :returns: An iterator that yields page per page a collection of EO products
                   matching the criteria
@@ -954,13 +1054,38 @@ class EODataAccessGateway(object):
             start=start, end=end, geom=geom, locations=locations, **kwargs
         )
         search_plugin = search_kwargs.pop("search_plugin")
+        if prefetch and self._has_offset_pagination(search_plugin):
+            pages = self._search_iter_page_parallel(
+                search_plugin,
+                prefetch,
+                items_per_page=items_per_page,
+                **search_kwargs,
+            )
+        else:
+            pages = self._search_iter_page_plugin(
+                search_plugin, items_per_page=items_per_page, **search_kwargs
+            )
+            if prefetch:
+                pages = self._prefetch_pages(pages, prefetch)
+        yield from pages
+
+    def _search_iter_page_plugin(
+        self, search_plugin, items_per_page=DEFAULT_ITEMS_PER_PAGE, **search_kwargs
+    ):
+        """Internal method that iterates over the pages of a products search, using
+        the given search plugin.
+
+        :param search_plugin: The search plugin to use
+        :type search_plugin: eodag.plugins.base.Search
+        :param items_per_page: (optional) The number of results requested per page
+        :type items_per_page: int
+        :param search_kwargs: The prepared search criteria
+        :type search_kwargs: Any
+        :returns: An iterator that yields page per page a collection of EO products
+                  matching the criteria
+        :rtype: Iterator[:class:`~eodag.api.search_result.SearchResult`]
+        """
         iteration = 1
-        # Store the search plugin config pagination.next_page_url_tpl to reset it later
-        # since it might be modified if the next_page_url mechanism is used by the
-        # plugin. (same thing for next_page_query_obj, next_page_query_obj with POST reqs)
-        pagination_config = getattr(search_plugin.config, "pagination", {})
-        prev_next_page_url_tpl = pagination_config.get("next_page_url_tpl", None)
-        prev_next_page_query_obj = pagination_config.get("next_page_query_obj", None)
         # Page has to be set to a value even if use_next is True, this is required
         # internally by the search plugin (see collect_search_urls)
         search_kwargs.update(
@@ -970,46 +1095,47 @@ class EODataAccessGateway(object):
         prev_product = None
         next_page_url = None
         next_page_query_obj = None
+        search_context = SearchContext()
+        use_search_context = getattr(
+            search_plugin, "use_search_context", lambda context: nullcontext()
+        )
         while True:
-            if iteration > 1 and next_page_url:
-                pagination_config["next_page_url_tpl"] = next_page_url
-            if iteration > 1 and next_page_query_obj:
-                pagination_config["next_page_query_obj"] = next_page_query_obj
-            logger.info("Iterate search over multiple pages: page #%s", iteration)
-            try:
-                products, _ = self._do_search(
-                    search_plugin, count=False, raise_errors=True, **search_kwargs
-                )
-            except Exception:
-                products = SearchResult([])
-            finally:
-                # we don't want that next(search_iter_page(...)) modifies the plugin
-                # indefinitely. So we reset after each request, but before the generator
-                # yields, the attr next_page_url (to None) and
-                # config.pagination["next_page_url_tpl"] (to its original value).
-                next_page_url = getattr(search_plugin, "next_page_url", None)
-                next_page_query_obj = getattr(search_plugin, "next_page_query_obj", {})
-                next_page_merge = getattr(search_plugin, "next_page_merge", None)
-
-                if next_page_url:
-                    search_plugin.next_page_url = None
-                    if prev_next_page_url_tpl:
-                        search_plugin.config.pagination[
-                            "next_page_url_tpl"
-                        ] = prev_next_page_url_tpl
-                if next_page_query_obj:
-                    if prev_next_page_query_obj:
-                        search_plugin.config.pagination[
-                            "next_page_query_obj"
-                        ] = prev_next_page_query_obj
-                    # Update next_page_query_obj for next page req
-                    if next_page_merge:
-                        search_plugin.next_page_query_obj = dict(
-                            getattr(search_plugin, "query_params", {}),
-                            **next_page_query_obj,
-                        )
-                    else:
-                        search_plugin.next_page_query_obj = next_page_query_obj
+            # the state of this search, including the next page url or query object
+            # returned by the provider, is kept in its own search context between the
+            # pages, as the plugin may be used by other searches in the meantime
+            with use_search_context(search_context):
+                if iteration > 1 and next_page_url:
+                    search_context.pagination["next_page_url_tpl"] = next_page_url
+                if iteration > 1 and next_page_query_obj:
+                    search_context.pagination[
+                        "next_page_query_obj"
+                    ] = next_page_query_obj
+                logger.info("Iterate search over multiple pages: page #%s", iteration)
+                try:
+                    products, _ = self._do_search(
+                        search_plugin, count=False, raise_errors=True, **search_kwargs
+                    )
+                except RequestError:
+                    # stop iterating when the provider fails, other errors are raised
+                    products = SearchResult([])
+                finally:
+                    next_page_url = getattr(search_plugin, "next_page_url", None)
+                    next_page_query_obj = getattr(
+                        search_plugin, "next_page_query_obj", {}
+                    )
+                    next_page_merge = getattr(search_plugin, "next_page_merge", None)
+
+                    if next_page_url:
+                        search_plugin.next_page_url = None
+                    if next_page_query_obj:
+                        # Update next_page_query_obj for next page req
+                        if next_page_merge:
+                            search_plugin.next_page_query_obj = dict(
+                                getattr(search_plugin, "query_params", {}),
+                                **next_page_query_obj,
+                            )
+                        else:
+                            search_plugin.next_page_query_obj = next_page_query_obj
 
             if len(products) > 0:
                 # The first products between two iterations are compared. If they
@@ -1046,6 +1172,145 @@ class EODataAccessGateway(object):
             last_page_with_products,
         )
 
+    @staticmethod
+    def _prefetch_pages(pages, prefetch):
+        """Internal method that consumes a pages iterator on a background worker,
+        keeping up to ``prefetch`` pages ahead of the caller.
+
+        Pages are still requested one after the other on the same search plugin, so
+        that pagination relying on the previous response (next page url or query
+        object) keeps working, but the network time overlaps with the processing of
+        the already yielded pages. Errors raised while requesting a page are raised
+        again when that page is reached by the caller.
+
+        :param pages: The pages iterator to consume
+        :type pages: Iterator[:class:`~eodag.api.search_result.SearchResult`]
+        :param prefetch: The maximum number of pages requested in advance
+        :type prefetch: int
+        :returns: An iterator that yields the same pages as ``pages``
+        :rtype: Iterator[:class:`~eodag.api.search_result.SearchResult`]
+        """
+        pages_queue = queue.Queue(maxsize=prefetch)
+        stop_event = threading.Event()
+        end_of_pages = object()
+
+        def put(item):
+            # stop waiting for room in the queue if the caller is gone
+            while not stop_event.is_set():
+                try:
+                    pages_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch_pages():
+            try:
+                for page in pages:
+                    if not put(page):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                # end the pages iteration if the caller stopped early
+                pages.close()
+                put(end_of_pages)
+
+        worker = threading.Thread(target=fetch_pages, daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = pages_queue.get()
+                if item is end_of_pages:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop_event.set()
+
+    def _search_iter_page_parallel(
+        self,
+        search_plugin,
+        prefetch,
+        items_per_page=DEFAULT_ITEMS_PER_PAGE,
+        **search_kwargs,
+    ):
+        """Internal method that iterates over the pages of a products search on a
+        page/offset paginated provider, requesting the ``prefetch`` next pages
+        concurrently while the current page is processed by the caller.
+
+        Each page is requested using its own copy of the search plugin. The iteration
+        stops like in :meth:`_search_iter_page_plugin`, and errors raised while
+        requesting a page are raised again when that page is reached by the caller.
+
+        :param search_plugin: A search plugin using a page/offset pagination
+        :type search_plugin: eodag.plugins.base.Search
+        :param prefetch: The maximum number of pages requested in advance
+        :type prefetch: int
+        :param items_per_page: (optional) The number of results requested per page
+        :type items_per_page: int
+        :param search_kwargs: The prepared search criteria
+        :type search_kwargs: Any
+        :returns: An iterator that yields page per page a collection of EO products
+                  matching the criteria
+        :rtype: Iterator[:class:`~eodag.api.search_result.SearchResult`]
+        """
+        search_kwargs.pop("page", None)
+
+        def search_page(page):
+            logger.info("Iterate search over multiple pages: page #%s", page)
+            page_search_plugin = copy.copy(search_plugin)
+            try:
+                products, _ = self._do_search(
+                    page_search_plugin,
+                    count=False,
+                    raise_errors=True,
+                    page=page,
+                    items_per_page=items_per_page,
+                    **search_kwargs,
+                )
+            except RequestError:
+                # stop iterating when the provider fails, other errors are raised
+                products = SearchResult([])
+            return products
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=prefetch + 1)
+        # the current page and the next ones requested in advance
+        futures = []
+        next_page = 1
+        prev_product = None
+        try:
+            while True:
+                while len(futures) <= prefetch:
+                    futures.append(executor.submit(search_page, next_page))
+                    next_page += 1
+                products = futures.pop(0).result()
+                if len(products) == 0:
+                    break
+                # same workaround as in _search_iter_page_plugin for providers not
+                # handling pagination
+                product = products[0]
+                if (
+                    prev_product
+                    and product.properties["id"] == prev_product.properties["id"]
+                    and product.provider == prev_product.provider
+                ):
+                    logger.warning(
+                        "Iterate over pages: stop iterating since the next page "
+                        "appears to have the same products as in the previous one. "
+                        "This provider may not implement pagination.",
+                    )
+                    break
+                yield products
+                prev_product = product
+                if len(products) < items_per_page:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def search_all(
         self,
         items_per_page=None,
@@ -1053,6 +1318,9 @@ class EODataAccessGateway(object):
         end=None,
         geom=None,
         locations=None,
+        workers=None,
+        max_total_items=None,
+        tile_size=None,
         **kwargs,
     ):
         """Search and return all the products matching the search criteria.
@@ -1060,6 +1328,25 @@ class EODataAccessGateway(object):
         It iterates over the pages of a search query and collects all the returned
         products into a single :class:`~eodag.api.search_result.SearchResult` instance.
 
+        If ``workers`` is set and the provider paginates its results using a page
+        number or an offset, the pages following the first one are requested
+        concurrently once the total number of results is known. Products are still
+        returned in the pages order. Other providers, paginated using a cursor, are
+        iterated over sequentially.
+
+        Some providers limit the number of results a single query can page through.
+        If this limit is known (``max_total_items`` argument or the
+        ``pagination.max_total_items`` provider configuration parameter), the searched
+        time interval is split into windows matching less results than this limit,
+        which are then searched one by one (or concurrently if ``workers`` is set),
+        and the products found in several windows are de-duplicated.
+
+        Huge or complex search geometries can also be split into a grid of simple
+        bounding boxes (``tile_size`` argument or the ``geometry_tile_size`` provider
+        search configuration parameter), searched one by one (or concurrently if
+        ``workers`` is set). The results are merged, de-duplicated, and the products
+        not intersecting the original search geometry are filtered out locally.
+
         :param items_per_page: (optional) The number of results requested internally per
                                page. The maximum number of items than can be requested
                                at once to a provider has been configured in EODAG for
@@ -1095,8 +1382,21 @@ class EODataAccessGateway(object):
                           'PA' such as Panama and Pakistan in the shapefile configured with
                           name=country and attr=ISO3
         :type locations: dict
+        :param workers: (optional) Maximum number of pages requested at the same time
+                        on page/offset paginated providers
+        :type workers: int
+        :param max_total_items: (optional) Maximum number of results a single query can
+                                page through on the provider. Overrides the provider
+                                ``pagination.max_total_items`` configuration
+        :type max_total_items: int
+        :param tile_size: (optional) Size in degrees of the tiles the search geometry is
+                          split into. Overrides the provider ``geometry_tile_size``
+                          search configuration
+        :type tile_size: float
         :param kwargs: Some other criteria that will be used to do the search,
-                       using paramaters compatibles with the provider
+                       using paramaters compatibles with the provider.
+                       ``refresh_cache=True`` ignores the responses stored in the
+                       search cache (see :meth:`set_search_cache`)
         :type kwargs: Union[int, str, bool, dict]
         :returns: An iterator that yields page per page a collection of EO products
                   matching the criteria
@@ -1135,16 +1435,62 @@ class EODataAccessGateway(object):
             search_plugin.provider,
             items_per_page,
         )
-        all_results = SearchResult([])
-        for page_results in self.search_iter_page(
-            items_per_page=items_per_page,
-            start=start,
-            end=end,
-            geom=geom,
-            locations=locations,
-            **kwargs,
-        ):
-            all_results.data.extend(page_results.data)
+        if max_total_items is None:
+            max_total_items = getattr(search_plugin.config, "pagination", {}).get(
+                "max_total_items", None
+            )
+        if tile_size is None:
+            tile_size = getattr(search_plugin.config, "geometry_tile_size", None)
+        parallel_pages = (
+            workers and workers > 1 and self._has_offset_pagination(search_plugin)
+        )
+        all_results = None
+        if max_total_items or parallel_pages or tile_size:
+            search_kwargs = self._prepare_search(
+                start=start,
+                end=end,
+                geom=geom,
+                locations=locations,
+                tile_size=tile_size,
+                **kwargs,
+            )
+            search_plugin = search_kwargs.pop("search_plugin")
+            search_tiles = search_kwargs.pop("search_tiles", None)
+            if search_tiles:
+                all_results = self._search_all_tiles(
+                    search_plugin,
+                    search_tiles,
+                    items_per_page=items_per_page,
+                    max_total_items=max_total_items,
+                    workers=workers,
+                    **search_kwargs,
+                )
+            elif max_total_items:
+                all_results = self._search_all_time_windows(
+                    search_plugin,
+                    items_per_page=items_per_page,
+                    max_total_items=max_total_items,
+                    workers=workers,
+                    **search_kwargs,
+                )
+            if all_results is None and parallel_pages and not search_tiles:
+                all_results = self._search_all_parallel(
+                    search_plugin,
+                    items_per_page=items_per_page,
+                    workers=workers,
+                    **search_kwargs,
+                )
+        if all_results is None:
+            all_results = SearchResult([])
+            for page_results in self.search_iter_page(
+                items_per_page=items_per_page,
+                start=start,
+                end=end,
+                geom=geom,
+                locations=locations,
+                **kwargs,
+            ):
+                all_results.data.extend(page_results.data)
         logger.info(
             "Found %s result(s) on provider '%s'",
             len(all_results),
@@ -1152,7 +1498,363 @@ class EODataAccessGateway(object):
         )
         return all_results
 
-    def _search_by_id(self, uid, provider=None, **kwargs):
+    @staticmethod
+    def _has_offset_pagination(search_plugin):
+        """Internal method that checks if the pages of a search can be requested
+        independently from each other, i.e. if the pagination of the given search
+        plugin relies on a page number or an offset and not on a cursor returned
+        in the previous page.
+
+        :param search_plugin: A search plugin
+        :type search_plugin: eodag.plugins.base.Search
+        :returns: Whether the search plugin uses a page/offset pagination or not
+        :rtype: bool
+        """
+        pagination = getattr(search_plugin.config, "pagination", None)
+        if not isinstance(pagination, dict):
+            return False
+        if pagination.get("next_page_url_key_path") or pagination.get(
+            "next_page_query_obj_key_path"
+        ):
+            return False
+        for tpl_key in ("next_page_url_tpl", "next_page_query_obj"):
+            tpl = pagination.get(tpl_key)
+            if isinstance(tpl, str) and any(
+                "{%s}" % param in tpl for param in ("page", "skip", "skip_base_1")
+            ):
+                return True
+        return False
+
+    def _search_all_parallel(
+        self,
+        search_plugin,
+        items_per_page=DEFAULT_MAX_ITEMS_PER_PAGE,
+        workers=2,
+        **kwargs,
+    ):
+        """Internal method that collects all the products of a search on a page/offset
+        paginated provider, requesting the pages concurrently.
+
+        The first page is requested alone to get the total number of results, then
+        the remaining pages are requested concurrently using copies of the search
+        plugin, and merged in the pages order. The errors of the pages that could not
+        be requested are kept in the ``errors`` of the result.
+
+        :param search_plugin: A search plugin using a page/offset pagination
+        :type search_plugin: eodag.plugins.base.Search
+        :param items_per_page: (optional) The number of results requested per page
+        :type items_per_page: int
+        :param workers: (optional) The maximum number of pages requested at the same time
+        :type workers: int
+        :param kwargs: The prepared search criteria
+        :type kwargs: Any
+        :returns: All the products matching the search criteria, or None if the total
+                  number of results was not returned by the provider
+        :rtype: :class:`~eodag.api.search_result.SearchResult` or None
+        """
+        search_plugin.clear()
+        first_page, total_results = self._do_search(
+            search_plugin, count=True, page=1, items_per_page=items_per_page, **kwargs
+        )
+        if len(first_page) < items_per_page:
+            return first_page
+        # _do_search falls back to the number of returned products if the provider did
+        # not return any count. Pages can only be iterated over in that case.
+        if not total_results or total_results <= len(first_page):
+            logger.debug(
+                "Total number of results not available for provider %s, falling back "
+                "to sequential pages iteration",
+                search_plugin.provider,
+            )
+            return None
+
+        nb_pages = -(-total_results // items_per_page)
+        logger.info(
+            "Requesting %s pages of %s products concurrently on provider %s",
+            nb_pages,
+            items_per_page,
+            search_plugin.provider,
+        )
+
+        def search_page(page):
+            # each page is requested using its own copy of the plugin search context
+            page_search_plugin = copy.copy(search_plugin)
+            try:
+                page_results, _ = self._do_search(
+                    page_search_plugin,
+                    count=False,
+                    raise_errors=True,
+                    page=page,
+                    items_per_page=items_per_page,
+                    **kwargs,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Could not get page %s on provider %s, its products are missing: %s",
+                    page,
+                    search_plugin.provider,
+                    e,
+                )
+                return SearchResult([], errors=[(search_plugin.provider, e)])
+            return page_results
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = executor.map(search_page, range(2, nb_pages + 1))
+            all_results = SearchResult(first_page.data, errors=list(first_page.errors))
+            for page_results in pages:
+                all_results.data.extend(page_results.data)
+                all_results.errors.extend(page_results.errors)
+        return all_results
+
+    def _search_all_time_windows(
+        self,
+        search_plugin,
+        items_per_page=DEFAULT_MAX_ITEMS_PER_PAGE,
+        max_total_items=None,
+        workers=None,
+        **kwargs,
+    ):
+        """Internal method that collects all the products of a search on a provider
+        limiting the number of results a single query can page through.
+
+        The searched time interval is split into sub-windows, bisecting the windows
+        that match more than ``max_total_items`` products, then the products of each
+        window are collected and de-duplicated on their id. Windows are searched
+        concurrently if ``workers`` is set. The errors of the windows that could not
+        be counted, and then were not split, are kept in the ``errors`` of the result.
+
+        :param search_plugin: A search plugin
+        :type search_plugin: eodag.plugins.base.Search
+        :param items_per_page: (optional) The number of results requested per page
+        :type items_per_page: int
+        :param max_total_items: The maximum number of results a query can page through
+        :type max_total_items: int
+        :param workers: (optional) The maximum number of queries sent at the same time
+        :type workers: int
+        :param kwargs: The prepared search criteria
+        :type kwargs: Any
+        :returns: All the products matching the search criteria, or None if the
+                  searched time interval could not be split
+        :rtype: :class:`~eodag.api.search_result.SearchResult` or None
+        """
+        product_type_config = kwargs.get("product_type_config", None) or {}
+        start = kwargs.pop("startTimeFromAscendingNode", None) or (
+            product_type_config.get("missionStartDate", None)
+        )
+        end = kwargs.pop("completionTimeFromAscendingNode", None) or (
+            product_type_config.get("missionEndDate", None)
+        )
+        if not start:
+            logger.debug(
+                "No start date available for the search, its time interval cannot be split"
+            )
+            return None
+        start = dateutil.parser.parse(start)
+        end = dateutil.parser.parse(end) if end else datetime.datetime.utcnow()
+        if not start.tzinfo:
+            start = start.replace(tzinfo=tz.UTC)
+        if not end.tzinfo:
+            end = end.replace(tzinfo=tz.UTC)
+
+        def window_kwargs(window):
+            window_start, window_end = window
+            return dict(
+                kwargs,
+                startTimeFromAscendingNode=window_start.strftime(
+                    "%Y-%m-%dT%H:%M:%S.%fZ"
+                ),
+                completionTimeFromAscendingNode=window_end.strftime(
+                    "%Y-%m-%dT%H:%M:%S.%fZ"
+                ),
+            )
+
+        def count_window(window):
+            # a copy of the plugin is used as windows may be counted concurrently
+            window_search_plugin = copy.copy(search_plugin)
+            count_kwargs = window_kwargs(window)
+            product_type_config = count_kwargs.pop("product_type_config", None)
+            refresh_cache = count_kwargs.pop("refresh_cache", False)
+            if hasattr(window_search_plugin, "search_context"):
+                window_search_plugin.search_context.product_type_config = (
+                    product_type_config
+                )
+                window_search_plugin.search_context.refresh_cache = refresh_cache
+            try:
+                _, count = window_search_plugin.query(
+                    count=True, page=1, items_per_page=1, **count_kwargs
+                )
+            except Exception as e:
+                logger.warning(
+                    "Could not count the results of the time window %s - %s on "
+                    "provider %s, it will not be split: %s",
+                    window[0],
+                    window[1],
+                    search_plugin.provider,
+                    e,
+                )
+                count_errors.append((search_plugin.provider, e))
+                count = None
+            return count
+
+        def search_window(window):
+            window_results = SearchResult([])
+            for page_results in self._search_iter_page_plugin(
+                copy.copy(search_plugin),
+                items_per_page=items_per_page,
+                **window_kwargs(window),
+            ):
+                window_results.data.extend(page_results.data)
+            return window_results
+
+        # windows of the same bisection level are counted together
+        count_errors = []
+        windows = []
+        windows_to_count = [(start.astimezone(tz.UTC), end.astimezone(tz.UTC))]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers or 1
+        ) as executor:
+            while windows_to_count:
+                counts = list(executor.map(count_window, windows_to_count))
+                next_windows_to_count = []
+                for window, count in zip(windows_to_count, counts):
+                    window_start, window_end = window
+                    if count == 0:
+                        continue
+                    if (
+                        count is not None
+                        and count > max_total_items
+                        and window_end - window_start > MIN_SEARCH_TIME_WINDOW
+                    ):
+                        middle = window_start + (window_end - window_start) / 2
+                        next_windows_to_count += [
+                            (window_start, middle),
+                            (middle, window_end),
+                        ]
+                    else:
+                        if count is not None and count > max_total_items:
+                            logger.warning(
+                                "%s results found in the time window %s - %s which "
+                                "cannot be split further: results above %s may be "
+                                "missing",
+                                count,
+                                window_start,
+                                window_end,
+                                max_total_items,
+                            )
+                        windows.append(window)
+                windows_to_count = next_windows_to_count
+        windows.sort()
+        logger.info(
+            "Search time interval split into %s window(s) on provider %s",
+            len(windows),
+            search_plugin.provider,
+        )
+
+        all_results = SearchResult([], errors=count_errors)
+        seen_ids = set()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers or 1
+        ) as executor:
+            for window_results in executor.map(search_window, windows):
+                for product in window_results:
+                    product_id = product.properties.get("id", None)
+                    # products on windows boundaries may be returned twice, those
+                    # without id cannot be told apart and are all kept
+                    if product_id not in (None, NOT_AVAILABLE):
+                        if product_id in seen_ids:
+                            continue
+                        seen_ids.add(product_id)
+                    all_results.data.append(product)
+        return all_results
+
+    def _search_all_tiles(
+        self,
+        search_plugin,
+        search_tiles,
+        items_per_page=DEFAULT_MAX_ITEMS_PER_PAGE,
+        max_total_items=None,
+        workers=None,
+        **kwargs,
+    ):
+        """Internal method that collects all the products of a search whose geometry
+        has been split into tiles.
+
+        Each tile is searched with its own copy of the search plugin, concurrently if
+        ``workers`` is set, its time interval being split as well if
+        ``max_total_items`` is set. Products are de-duplicated on their id, and those
+        not intersecting the original search geometry are filtered out.
+
+        :param search_plugin: A search plugin
+        :type search_plugin: eodag.plugins.base.Search
+        :param search_tiles: The tiles the search geometry has been split into
+        :type search_tiles: list[:class:`shapely.geometry.base.BaseGeometry`]
+        :param items_per_page: (optional) The number of results requested per page
+        :type items_per_page: int
+        :param max_total_items: (optional) The maximum number of results a query can
+                                page through on the provider
+        :type max_total_items: int
+        :param workers: (optional) The maximum number of tiles, and of time windows
+                        of a tile, searched at the same time
+        :type workers: int
+        :param kwargs: The prepared search criteria
+        :type kwargs: Any
+        :returns: All the products matching the search criteria
+        :rtype: :class:`~eodag.api.search_result.SearchResult`
+        """
+        search_geometry = kwargs.pop("geometry")
+        logger.info(
+            "Search geometry split into %s tile(s) on provider %s",
+            len(search_tiles),
+            search_plugin.provider,
+        )
+
+        def search_tile(tile):
+            tile_search_plugin = copy.copy(search_plugin)
+            tile_results = None
+            if max_total_items:
+                tile_results = self._search_all_time_windows(
+                    tile_search_plugin,
+                    items_per_page=items_per_page,
+                    max_total_items=max_total_items,
+                    workers=workers,
+                    geometry=tile,
+                    **kwargs,
+                )
+            if tile_results is None:
+                tile_results = SearchResult([])
+                for page_results in self._search_iter_page_plugin(
+                    tile_search_plugin,
+                    items_per_page=items_per_page,
+                    geometry=tile,
+                    **kwargs,
+                ):
+                    tile_results.data.extend(page_results.data)
+            return tile_results
+
+        prepared_search_geometry = prep(search_geometry)
+        all_results = SearchResult([])
+        seen_ids = set()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers or 1
+        ) as executor:
+            for tile_results in executor.map(search_tile, search_tiles):
+                all_results.errors.extend(tile_results.errors)
+                for product in tile_results:
+                    product_id = product.properties.get("id", None)
+                    # products overlapping several tiles are returned several times,
+                    # those without id cannot be told apart and are all kept
+                    if product_id not in (None, NOT_AVAILABLE):
+                        if product_id in seen_ids:
+                            continue
+                        seen_ids.add(product_id)
+                    if not prepared_search_geometry.intersects(product.geometry):
+                        continue
+                    # intersected with the whole search geometry when needed
+                    product.search_kwargs["geometry"] = search_geometry
+                    all_results.data.append(product)
+        return all_results
+
+    def _search_by_id(self, uid, provider=None, race=False, max_workers=None, **kwargs):
         """Internal method that enables searching a product by its id.
 
         Keeps requesting providers until a result matching the id is supplied. The
@@ -1162,61 +1864,119 @@ class EODataAccessGateway(object):
         the search can be slow, if the priority order is such that the provider that
         contains the requested product has the lowest priority. However, you can always
         speed up a little the search by passing the name of the provider on which to
-        perform the search, if this information is available
+        perform the search, if this information is available, or use the ``race`` mode,
+        where all the providers are requested at once and the first one returning the
+        product wins.
 
         :param uid: The uid of the EO product
         :type uid: str
         :param provider: (optional) The provider on which to search the product.
                          This may be useful for performance reasons when the user
-                         knows this product is available on the given provider
-        :type provider: str
+                         knows this product is available on the given provider. A list
+                         of providers can also be given in ``race`` mode
+        :type provider: Union[str, list]
+        :param race: (optional) Request all the providers concurrently and return the
+                     first single-match result
+        :type race: bool
+        :param max_workers: (optional) Maximum number of providers requested at the same
+                            time in ``race`` mode. Defaults to the number of providers
+        :type max_workers: int
         :param kwargs: Search criteria to help finding the right product
         :type kwargs: Any
         :returns: A search result with one EO product or None at all, and the number
                   of EO products retrieved (0 or 1)
         :rtype: tuple(:class:`~eodag.api.search_result.SearchResult`, int)
         """
-        get_search_plugins_kwargs = dict(
-            provider=provider, product_type=kwargs.get("productType", None)
+        product_type = kwargs.get("productType", None)
+        if isinstance(provider, (list, tuple)):
+            search_plugins = (
+                next(self._plugins_manager.get_search_plugins(provider=p))
+                for p in provider
+            )
+        else:
+            search_plugins = self._plugins_manager.get_search_plugins(
+                provider=provider, product_type=product_type
+            )
+
+        if race:
+            search_plugins = list(search_plugins)
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers or len(search_plugins) or None
+            )
+            futures = [
+                executor.submit(self._search_by_id_on_plugin, plugin, uid, **kwargs)
+                for plugin in search_plugins
+            ]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    if future.exception() is not None:
+                        logger.debug(
+                            "Error while searching product with id '%s': %s",
+                            uid,
+                            future.exception(),
+                        )
+                    elif future.result() is not None:
+                        return future.result(), 1
+            finally:
+                # ignore the searches still running once the product is found
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
+        else:
+            for plugin in search_plugins:
+                results = self._search_by_id_on_plugin(plugin, uid, **kwargs)
+                if results is not None:
+                    return results, 1
+        return SearchResult([]), 0
+
+    def _search_by_id_on_plugin(self, plugin, uid, **kwargs):
+        """Internal method that searches a product by its id on a single provider.
+
+        :param plugin: The search plugin of the provider
+        :type plugin: eodag.plugins.base.Search
+        :param uid: The uid of the EO product
+        :type uid: str
+        :param kwargs: Search criteria to help finding the right product
+        :type kwargs: Any
+        :returns: A search result with the matching EO product, or None if no single
+                  product matching the id was found
+        :rtype: :class:`~eodag.api.search_result.SearchResult` or None
+        """
+        logger.info(
+            "Searching product with id '%s' on provider: %s", uid, plugin.provider
         )
-        for plugin in self._plugins_manager.get_search_plugins(
-            **get_search_plugins_kwargs
+        logger.debug("Using plugin class for search: %s", plugin.__class__.__name__)
+        auth_plugin = self._plugins_manager.get_auth_plugin(plugin.provider)
+        if getattr(plugin.config, "need_auth", False) and callable(
+            getattr(auth_plugin, "authenticate", None)
         ):
+            plugin.auth = auth_plugin.authenticate()
+        plugin.clear()
+        results, _ = self._do_search(plugin, auth=auth_plugin, id=uid, **kwargs)
+        if len(results) == 1:
+            if not results[0].product_type:
+                # guess product type from properties
+                guesses = self.guess_product_type(**results[0].properties)
+                results[0].product_type = guesses[0]
+                # reset driver
+                results[0].driver = results[0].get_driver()
+            return results
+        elif len(results) > 1:
+            if getattr(plugin.config, "two_passes_id_search", False):
+                # check if id of one product exactly matches id that was searched for
+                # required if provider does not offer search by id and therefore other
+                # parameters which might not given an exact result are used
+                for result in results:
+                    if result.properties["id"] == uid.split(".")[0]:
+                        return SearchResult([results[0]])
             logger.info(
-                "Searching product with id '%s' on provider: %s", uid, plugin.provider
+                "Several products found for this id (%s). You may try searching using more selective criteria.",
+                results,
             )
-            logger.debug("Using plugin class for search: %s", plugin.__class__.__name__)
-            auth_plugin = self._plugins_manager.get_auth_plugin(plugin.provider)
-            if getattr(plugin.config, "need_auth", False) and callable(
-                getattr(auth_plugin, "authenticate", None)
-            ):
-                plugin.auth = auth_plugin.authenticate()
-            plugin.clear()
-            results, _ = self._do_search(plugin, auth=auth_plugin, id=uid, **kwargs)
-            if len(results) == 1:
-                if not results[0].product_type:
-                    # guess product type from properties
-                    guesses = self.guess_product_type(**results[0].properties)
-                    results[0].product_type = guesses[0]
-                    # reset driver
-                    results[0].driver = results[0].get_driver()
-                return results, 1
-            elif len(results) > 1:
-                if getattr(plugin.config, "two_passes_id_search", False):
-                    # check if id of one product exactly matches id that was searched for
-                    # required if provider does not offer search by id and therefore other
-                    # parameters which might not given an exact result are used
-                    for result in results:
-                        if result.properties["id"] == uid.split(".")[0]:
-                            return [results[0]], 1
-                logger.info(
-                    "Several products found for this id (%s). You may try searching using more selective criteria.",
-                    results,
-                )
-        return SearchResult([]), 0
+        return None
 
     def _prepare_search(
-        self, start=None, end=None, geom=None, locations=None, **kwargs
+        self, start=None, end=None, geom=None, locations=None, tile_size=None, **kwargs
     ):
         """Internal method to prepare the search kwargs and get the search
         and auth plugins.
@@ -1245,6 +2005,9 @@ class EODataAccessGateway(object):
         :type geom: Union[str, dict, shapely.geometry.base.BaseGeometry]
         :param locations: (optional) Location filtering by name using locations configuration
         :type locations: dict
+        :param tile_size: (optional) If set, the search geometry is split into tiles of
+                          this size in degrees, returned as ``search_tiles``
+        :type tile_size: float
         :param kwargs: Some other criteria
                        * id and/or a provider for a search by
                        * search criteria to guess the product type
@@ -1300,11 +2063,17 @@ class EODataAccessGateway(object):
 
         kwargs["locations"] = locations
         kwargs["geometry"] = get_geometry_from_various(self.locations_config, **kwargs)
+        if kwargs["geometry"] is not None:
+            # parsed and prepared once for the whole query, the products of the
+            # results share it to compute their search intersection
+            kwargs["geometry"] = get_prepared_geometry(kwargs["geometry"])
         # remove locations_args from kwargs now that they have been used
         locations_dict = {loc["name"]: loc for loc in self.locations_config}
         for arg in locations_dict.keys():
             kwargs.pop(arg, None)
         del kwargs["locations"]
+        if tile_size and kwargs["geometry"] is not None:
+            kwargs["search_tiles"] = get_geometry_tiles(kwargs["geometry"], tile_size)
 
         # fetch product types list if product_type is unknown
         if (
@@ -1316,10 +2085,19 @@ class EODataAccessGateway(object):
             )
             self.fetch_product_types_list()
 
+        provider = None
+        if kwargs.get("id") is None and isinstance(kwargs.get("provider"), str):
+            # search on the given provider instead of the preferred one
+            provider = kwargs.pop("provider")
         search_plugin = next(
-            self._plugins_manager.get_search_plugins(product_type=product_type)
+            self._plugins_manager.get_search_plugins(
+                product_type=product_type, provider=provider
+            )
         )
-        if search_plugin.provider != self.get_preferred_provider()[0]:
+        if (
+            provider is None
+            and search_plugin.provider != self.get_preferred_provider()[0]
+        ):
             logger.warning(
                 "Product type '%s' is not available with provider '%s'. "
                 "Searching it on provider '%s' instead.",
@@ -1333,15 +2111,37 @@ class EODataAccessGateway(object):
                 product_type,
                 search_plugin.provider,
             )
-        # Add product_types_config to plugin config. This dict contains product
-        # type metadata that will also be stored in each product's properties.
+        auth_plugin = self._setup_search_plugin(search_plugin)
+        # the product type metadata are given to the search plugin with the search
+        # criteria, as the plugin may be used by other searches at the same time
+        product_type_config = self._get_product_type_config(
+            search_plugin.provider, product_type
+        )
+
+        return dict(
+            search_plugin=search_plugin,
+            auth=auth_plugin,
+            product_type_config=product_type_config,
+            **kwargs,
+        )
+
+    def _get_product_type_config(self, provider, product_type):
+        """Internal method that gets the metadata of a product type on a provider.
+        This dict contains product type metadata that will also be stored in each
+        product's properties.
+
+        :param provider: The provider on which the product type will be searched
+        :type provider: str
+        :param product_type: The product type that will be searched
+        :type product_type: str
+        :returns: The product type metadata
+        :rtype: dict
+        """
         try:
-            search_plugin.config.product_type_config = dict(
+            product_type_config = dict(
                 [
                     p
-                    for p in self.list_product_types(
-                        search_plugin.provider, fetch_providers=False
-                    )
+                    for p in self.list_product_types(provider, fetch_providers=False)
                     if p["ID"] == product_type
                 ][0],
                 **{"productType": product_type},
@@ -1349,14 +2149,24 @@ class EODataAccessGateway(object):
         # If the product isn't in the catalog, it's a generic product type.
         except IndexError:
             # Construct the GENERIC_PRODUCT_TYPE metadata
-            search_plugin.config.product_type_config = dict(
+            product_type_config = dict(
                 ID=GENERIC_PRODUCT_TYPE,
                 **self.product_types_config[GENERIC_PRODUCT_TYPE],
                 productType=product_type,
             )
         # Remove the ID since this is equal to productType.
-        search_plugin.config.product_type_config.pop("ID", None)
+        product_type_config.pop("ID", None)
+        return product_type_config
+
+    def _setup_search_plugin(self, search_plugin):
+        """Internal method that attaches the authentication needed for a search to
+        the given search plugin.
 
+        :param search_plugin: The search plugin to set up
+        :type search_plugin: eodag.plugins.base.Search
+        :returns: The authentication plugin of the search plugin provider
+        :rtype: :class:`~eodag.plugins.authentication.Authentication`
+        """
         logger.debug(
             "Using plugin class for search: %s", search_plugin.__class__.__name__
         )
@@ -1368,7 +2178,7 @@ class EODataAccessGateway(object):
         ):
             search_plugin.auth = auth_plugin.authenticate()
 
-        return dict(search_plugin=search_plugin, auth=auth_plugin, **kwargs)
+        return auth_plugin
 
     def _do_search(self, search_plugin, count=True, raise_errors=False, **kwargs):
         """Internal method that performs a search on a given provider.
@@ -1400,6 +2210,13 @@ class EODataAccessGateway(object):
                 max_items_per_page,
             )
 
+        product_type_config = kwargs.pop("product_type_config", None)
+        refresh_cache = kwargs.pop("refresh_cache", False)
+        if hasattr(search_plugin, "search_context"):
+            if product_type_config is not None:
+                search_plugin.search_context.product_type_config = product_type_config
+            search_plugin.search_context.refresh_cache = refresh_cache
+
         results = SearchResult([])
         total_results = 0
         try:
@@ -1449,15 +2266,11 @@ class EODataAccessGateway(object):
                     "results, got {} instead".format(type(res))
                 )
 
-            # Filter and attach to each eoproduct in the result the plugin capable of
+            # Attach to each eoproduct in the result the plugin capable of
             # downloading it (this is done to enable the eo_product to download itself
-            # doing: eo_product.download()). The filtering is done by keeping only
-            # those eo_products that intersects the search extent (if there was no
-            # search extent, search_intersection contains the geometry of the
-            # eo_product)
-            # WARNING: this means an eo_product that has an invalid geometry can still
-            # be returned as a search result if there was no search extent (because we
-            # will not try to do an intersection)
+            # doing: eo_product.download()). The intersection with the search extent
+            # is not computed here: it is only done when search_intersection is
+            # first accessed, so that it costs nothing to callers not using it
             for eo_product in res:
                 # if product_type is not defined, try to guess using properties
                 if eo_product.product_type is None:
@@ -1484,13 +2297,14 @@ class EODataAccessGateway(object):
                         pass
                     else:
                         eo_product.product_type = guesses[0]
-                if eo_product.search_intersection is not None:
-                    download_plugin = self._plugins_manager.get_download_plugin(
-                        eo_product
-                    )
-                    eo_product.register_downloader(
-                        download_plugin, kwargs.get("auth", None)
-                    )
+                download_plugin = self._plugins_manager.get_download_plugin(eo_product)
+                if eo_product.provider == search_plugin.provider:
+                    auth = kwargs.get("auth", None)
+                else:
+                    # products found in a local catalog are downloaded from the
+                    # provider they were found on
+                    auth = self._plugins_manager.get_auth_plugin(eo_product.provider)
+                eo_product.register_downloader(download_plugin, auth)
 
             results.extend(res)
             total_results = None if nb_res is None else total_results + nb_res
@@ -1531,6 +2345,147 @@ class EODataAccessGateway(object):
                 )
         return SearchResult(results), total_results
 
+    def _search_providers(
+        self, providers, max_workers=None, timeout=None, raise_errors=False, **kwargs
+    ):
+        """Internal method that performs the same search concurrently on several
+        providers and merges their results.
+
+        :param providers: ``"all"`` to search on every provider supporting the
+                          searched product type, or a list of provider names
+        :type providers: Union[str, list]
+        :param max_workers: (optional) Maximum number of concurrent provider searches
+        :type max_workers: int
+        :param timeout: (optional) Maximum time in seconds to wait for each provider,
+                        counted from the start of its search
+        :type timeout: float
+        :param raise_errors: (optional) If True, the first error that occurred on a
+                             provider is raised once all the searches are over
+        :type raise_errors: bool
+        :param kwargs: Some other criteria that will be used to do the search
+        :type kwargs: Any
+        :returns: A collection of EO products matching the criteria, with the errors
+                  that occurred per provider, and the total number of results found
+        :rtype: tuple(:class:`~eodag.api.search_result.SearchResult`, int or None)
+        """
+        product_type = kwargs.get("productType", None)
+        if providers == "all":
+            search_plugins = list(
+                self._plugins_manager.get_search_plugins(product_type=product_type)
+            )
+        else:
+            if isinstance(providers, str):
+                providers = [providers]
+            search_plugins = [
+                next(self._plugins_manager.get_search_plugins(provider=provider))
+                for provider in providers
+            ]
+        if not search_plugins:
+            return SearchResult([]), 0
+
+        # plugins set up is done sequentially, only the searches are run concurrently
+        search_auths = {}
+        product_type_configs = {}
+        for search_plugin in search_plugins:
+            search_auths[search_plugin.provider] = self._setup_search_plugin(
+                search_plugin
+            )
+            product_type_configs[
+                search_plugin.provider
+            ] = self._get_product_type_config(search_plugin.provider, product_type)
+            search_plugin.clear()
+
+        logger.info(
+            "Searching product type '%s' on providers: %s",
+            product_type,
+            ", ".join(p.provider for p in search_plugins),
+        )
+        # the searches notify their start and end, each provider timeout being
+        # counted from the start of its search and not from its submission
+        progress = threading.Condition()
+        started = {}
+
+        def search_provider(search_plugin):
+            with progress:
+                started[search_plugin.provider] = time.monotonic()
+                progress.notify_all()
+            return self._do_search(
+                search_plugin,
+                count=True,
+                raise_errors=True,
+                **dict(
+                    kwargs,
+                    auth=search_auths[search_plugin.provider],
+                    product_type_config=product_type_configs[search_plugin.provider],
+                ),
+            )
+
+        def notify_progress(future):
+            with progress:
+                progress.notify_all()
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers or len(search_plugins)
+        )
+        futures = [
+            executor.submit(search_provider, search_plugin)
+            for search_plugin in search_plugins
+        ]
+        for future in futures:
+            future.add_done_callback(notify_progress)
+
+        not_done = set()
+        with progress:
+            while True:
+                now = time.monotonic()
+                next_deadline = None
+                waiting = False
+                for search_plugin, future in zip(search_plugins, futures):
+                    if future.done() or future in not_done:
+                        continue
+                    start = started.get(search_plugin.provider, None)
+                    if timeout is None or start is None:
+                        # wait for the search to end, or to start
+                        waiting = True
+                    elif now - start >= timeout:
+                        not_done.add(future)
+                    else:
+                        waiting = True
+                        deadline = start + timeout
+                        if next_deadline is None or deadline < next_deadline:
+                            next_deadline = deadline
+                if not waiting:
+                    break
+                progress.wait(None if next_deadline is None else next_deadline - now)
+        # do not wait for the timed out searches
+        executor.shutdown(wait=False)
+
+        results = SearchResult([])
+        total_results = 0
+        for search_plugin, future in zip(search_plugins, futures):
+            if future in not_done:
+                error = concurrent.futures.TimeoutError(
+                    "Search on provider '%s' timed out after %s seconds"
+                    % (search_plugin.provider, timeout)
+                )
+            else:
+                error = future.exception()
+            if error is not None:
+                logger.warning(
+                    "No result from provider '%s' due to an error during search: %s",
+                    search_plugin.provider,
+                    error,
+                )
+                results.errors.append((search_plugin.provider, error))
+                continue
+            provider_results, nb_res = future.result()
+            results.data.extend(provider_results.data)
+            total_results += nb_res or len(provider_results)
+
+        if raise_errors and results.errors:
+            raise results.errors[0][1]
+        return results, total_results
+
     def crunch(self, results, **kwargs):
         """Apply the filters given through the keyword arguments to the results
 
@@ -1633,52 +2588,193 @@ class EODataAccessGateway(object):
         return paths
 
     @staticmethod
-    def serialize(search_result, filename="search_results.geojson"):
-        """Registers results of a search into a geojson file.
+    def serialize(search_result, filename="search_results.geojson", format=None):
+        """Registers results of a search into a file.
+
+        Besides GeoJSON, the results can be written to GeoJSON text sequences (one
+        feature by line, see :meth:`serialize_iter`), or to GeoParquet or FlatGeobuf
+        files, which need the optional ``columnar`` dependencies. These last formats
+        keep the properties in columns and are spatially indexed, allowing to read
+        only some of the products with :meth:`deserialize`.
 
         :param search_result: A collection of EO products resulting from a search
         :type search_result: :class:`~eodag.api.search_result.SearchResult`
         :param filename: (optional) The name of the file to generate
         :type filename: str
+        :param format: (optional) The format of the file, one of ``geojson``,
+                       ``geojsonseq``, ``parquet`` or ``fgb``. Guessed from the file
+                       extension if not given, ``geojson`` by default
+        :type format: str
         :returns: The name of the created file
         :rtype: str
         """
-        with open(filename, "w") as fh:
-            geojson.dump(search_result, fh)
+        format = get_serialization_format(filename, format)
+        if format == "parquet":
+            search_result.to_columnar().to_parquet(filename)
+        elif format == "fgb":
+            search_result.to_columnar().to_flatgeobuf(filename)
+        elif format == "geojsonseq":
+            EODataAccessGateway.serialize_iter([search_result], filename)
+        else:
+            with open(filename, "wb") as fh:
+                fh.write(search_result.to_geojson_bytes())
         return filename
 
     @staticmethod
-    def deserialize(filename):
-        """Loads results of a search from a geojson file.
+    def deserialize(filename, format=None, bbox=None, filters=None):
+        """Loads results of a search from a file.
 
-        :param filename: A filename containing a search result encoded as a geojson
+        GeoParquet and FlatGeobuf files are only partially read when a bounding box
+        or filters are given: the products not matching them are skipped by the
+        readers using the files indexes and statistics.
+
+        :param filename: A filename containing a search result encoded as a geojson,
+                         geojson text sequence, geoparquet or flatgeobuf
         :type filename: str
+        :param format: (optional) The format of the file, one of ``geojson``,
+                       ``geojsonseq``, ``parquet`` or ``fgb``. Guessed from the file
+                       extension if not given, ``geojson`` by default
+        :type format: str
+        :param bbox: (optional) Only load the products intersecting this bounding box,
+                     given as ``(lonmin, latmin, lonmax, latmax)``
+        :type bbox: tuple
+        :param filters: (optional) Only load the products matching these filters on
+                        their properties, given as ``(property, operator, value)``
+                        tuples, e.g. ``[("cloudCover", "<", 20)]``
+        :type filters: list(tuple)
         :returns: The search results encoded in `filename`
         :rtype: :class:`~eodag.api.search_result.SearchResult`
         """
-        with open(filename, "r") as fh:
-            return SearchResult.from_geojson(geojson.load(fh))
+        format = get_serialization_format(filename, format)
+        if format == "parquet":
+            columnar = ColumnarSearchResult.from_parquet(
+                filename, bbox=bbox, filters=filters
+            )
+            return columnar.to_search_result()
+        elif format == "fgb":
+            columnar = ColumnarSearchResult.from_flatgeobuf(
+                filename, bbox=bbox, filters=filters
+            )
+            return columnar.to_search_result()
+        elif format == "geojsonseq":
+            return SearchResult(
+                EODataAccessGateway.deserialize_iter(
+                    filename, bbox=bbox, filters=filters
+                )
+            )
+        with open(filename, "rb") as fh:
+            search_result = SearchResult.from_geojson(orjson.loads(fh.read()))
+        if bbox is None and not filters:
+            return search_result
+        return SearchResult(
+            [p for p in search_result if match_product(p, bbox=bbox, filters=filters)]
+        )
 
-    def deserialize_and_register(self, filename):
-        """Loads results of a search from a geojson file and register
+    def deserialize_and_register(self, filename, **kwargs):
+        """Loads results of a search from a file and register
         products with the information needed to download itself
 
-        :param filename: A filename containing a search result encoded as a geojson
+        :param filename: A filename containing a search result encoded as a geojson,
+                         geojson text sequence, geoparquet or flatgeobuf
         :type filename: str
+        :param kwargs: (optional) The ``format``, ``bbox`` and ``filters`` of the
+                       products to load (see :meth:`deserialize`)
+        :type kwargs: Union[str, tuple, list]
         :returns: The search results encoded in `filename`
         :rtype: :class:`~eodag.api.search_result.SearchResult`
         """
-        products = self.deserialize(filename)
-        for i, product in enumerate(products):
-            if product.downloader is None:
-                auth = product.downloader_auth
-                if auth is None:
-                    auth = self._plugins_manager.get_auth_plugin(product.provider)
-                products[i].register_downloader(
-                    self._plugins_manager.get_download_plugin(product), auth
-                )
+        products = self.deserialize(filename, **kwargs)
+        for product in products:
+            self._register_deserialized_product(product)
         return products
 
+    def deserialize_and_register_iter(self, filename, bbox=None, filters=None):
+        """Lazily loads results of a search from a GeoJSON text sequence file (see
+        :meth:`deserialize_iter`) and register products with the information needed
+        to download itself
+
+        :param filename: A filename containing a search result encoded as a GeoJSON
+                         text sequence
+        :type filename: str
+        :param bbox: (optional) Only load the products intersecting this bounding box,
+                     given as ``(lonmin, latmin, lonmax, latmax)``
+        :type bbox: tuple
+        :param filters: (optional) Only load the products matching these filters on
+                        their properties (see :meth:`deserialize`)
+        :type filters: list(tuple)
+        :returns: An iterator over the products encoded in `filename`
+        :rtype: Iterator[:class:`~eodag.api.product._product.EOProduct`]
+        """
+        for product in self.deserialize_iter(filename, bbox=bbox, filters=filters):
+            self._register_deserialized_product(product)
+            yield product
+
+    def _register_deserialized_product(self, product):
+        """Register the download plugin of a deserialized product if needed"""
+        if product.downloader is None:
+            auth = product.downloader_auth
+            if auth is None:
+                auth = self._plugins_manager.get_auth_plugin(product.provider)
+            product.register_downloader(
+                self._plugins_manager.get_download_plugin(product), auth
+            )
+
+    @staticmethod
+    def serialize_iter(results, filename="search_results.geojsonl", append=False):
+        """Streams results of a search into a GeoJSON text sequence file, one feature
+        by line.
+
+        Each page or product is written as soon as it is given, so that results of
+        :meth:`search_iter_page` can be saved as they arrive while the memory used
+        stays the same whatever the number of products:
+
+        >>> dag.serialize_iter(
+        ...     dag.search_iter_page(productType="S2_MSI_L1C"), "s2.geojsonl"
+        ... ) # doctest: +SKIP
+
+        :param results: The pages of results, or the products, to write
+        :type results: Iterable[:class:`~eodag.api.search_result.SearchResult`]
+        :param filename: (optional) The name of the file to generate
+        :type filename: str
+        :param append: (optional) Append the products to an existing file
+        :type append: bool
+        :returns: The name of the created file
+        :rtype: str
+        """
+        with open(filename, "ab" if append else "wb") as fh:
+            for page in results:
+                products = page if isinstance(page, (list, UserList)) else [page]
+                for feature in SearchResult(products).geojson_features_bytes():
+                    fh.write(feature + b"\n")
+        return filename
+
+    @staticmethod
+    def deserialize_iter(filename, bbox=None, filters=None):
+        """Lazily loads results of a search from a GeoJSON text sequence file, one
+        product at a time, such as the ones written by :meth:`serialize_iter`.
+
+        :param filename: A filename containing a search result encoded as a GeoJSON
+                         text sequence
+        :type filename: str
+        :param bbox: (optional) Only load the products intersecting this bounding box,
+                     given as ``(lonmin, latmin, lonmax, latmax)``
+        :type bbox: tuple
+        :param filters: (optional) Only load the products matching these filters on
+                        their properties (see :meth:`deserialize`)
+        :type filters: list(tuple)
+        :returns: An iterator over the products encoded in `filename`
+        :rtype: Iterator[:class:`~eodag.api.product._product.EOProduct`]
+        """
+        with open(filename, "rb") as fh:
+            for line in fh:
+                # RFC 8142 sequences start each feature with a record separator
+                line = line.strip(b"\x1e \t\r\n")
+                if not line:
+                    continue
+                product = EOProduct.from_geojson(orjson.loads(line))
+                if match_product(product, bbox=bbox, filters=filters):
+                    yield product
+
     @_deprecated(
         reason="Use the StaticStacSearch search plugin instead", version="2.2.1"
     )
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local catalog of the products already found, indexed to be searched again"""
+import datetime
+import logging
+import os
+import sqlite3
+import threading
+
+import dateutil.parser
+import orjson
+import shapely
+from dateutil import tz
+
+from eodag.api.product import EOProduct
+from eodag.api.search_result import GEOJSON_OPTIONS
+from eodag.utils import get_prepared_geometry
+
+logger = logging.getLogger("eodag.api.local_catalog")
+
+#: Version of the catalog database schema
+CATALOG_SCHEMA_VERSION = 1
+
+CATALOG_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS products ("
+    "rowid INTEGER PRIMARY KEY, provider TEXT NOT NULL, id TEXT NOT NULL, "
+    "product_type TEXT, start_datetime REAL, end_datetime REAL, cloud_cover REAL, "
+    "minx REAL, maxx REAL, miny REAL, maxy REAL, geometry BLOB, properties BLOB, "
+    "UNIQUE (provider, id))",
+    "CREATE INDEX IF NOT EXISTS products_start_datetime "
+    "ON products (start_datetime)",
+    "CREATE INDEX IF NOT EXISTS products_product_type_start_datetime "
+    "ON products (product_type, start_datetime)",
+    "CREATE INDEX IF NOT EXISTS products_id ON products (id)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS products_rtree "
+    "USING rtree(rowid, minx, maxx, miny, maxy)",
+    # the spatial index is kept up to date by triggers, products with an empty
+    # geometry are not indexed
+    "CREATE TRIGGER IF NOT EXISTS products_rtree_insert AFTER INSERT ON products "
+    "WHEN NEW.minx IS NOT NULL BEGIN "
+    "INSERT OR REPLACE INTO products_rtree "
+    "VALUES (NEW.rowid, NEW.minx, NEW.maxx, NEW.miny, NEW.maxy); END",
+    "CREATE TRIGGER IF NOT EXISTS products_rtree_update AFTER UPDATE ON products "
+    "BEGIN DELETE FROM products_rtree WHERE rowid = OLD.rowid; "
+    "INSERT INTO products_rtree SELECT NEW.rowid, NEW.minx, NEW.maxx, NEW.miny, "
+    "NEW.maxy WHERE NEW.minx IS NOT NULL; END",
+    "CREATE TRIGGER IF NOT EXISTS products_rtree_delete AFTER DELETE ON products "
+    "BEGIN DELETE FROM products_rtree WHERE rowid = OLD.rowid; END",
+)
+
+
+def _timestamp(date_str):
+    """Parse an iso date as a UTC timestamp, naive dates being UTC"""
+    if not date_str:
+        return None
+    try:
+        # much faster than dateutil for the usual iso dates of the providers
+        date = datetime.datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except ValueError:
+        date = dateutil.parser.parse(date_str)
+    if not date.tzinfo:
+        date = date.replace(tzinfo=tz.UTC)
+    return date.timestamp()
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class LocalCatalog:
+    """Catalog of products stored in a local SQLite database, to search again the
+    products already harvested without sending any request to the providers.
+
+    Products are identified by their provider and id: adding a product already in
+    the catalog updates it. Their footprints are indexed in an R-tree and their start
+    dates and product types in regular indexes, so that searching a catalog of
+    millions of products by area and date takes milliseconds. The catalog can be
+    searched through the :meth:`search` method, or by configuring a provider using
+    the :class:`~eodag.plugins.search.local_catalog.LocalCatalogSearch` plugin.
+
+    >>> from eodag.api.search_result import SearchResult
+    >>> catalog = LocalCatalog(":memory:")
+    >>> catalog.upsert(SearchResult([
+    ...     EOProduct("peps", {"id": "foo", "geometry": "POINT (0 0)"}),
+    ...     EOProduct("peps", {"id": "bar", "geometry": "POINT (5 5)"}),
+    ... ]))
+    2
+    >>> catalog.search(geometry=shapely.box(-1, -1, 1, 1))
+    ([EOProduct(id=foo, provider=peps)], 1)
+
+    :param path: The path of the SQLite database file, created if needed
+    :type path: str
+    """
+
+    def __init__(self, path):
+        self.path = path
+        if path != ":memory:":
+            dirname = os.path.dirname(os.path.abspath(path))
+            os.makedirs(dirname, exist_ok=True)
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            for statement in CATALOG_SCHEMA:
+                self._connection.execute(statement)
+            self._connection.execute(
+                "PRAGMA user_version = {}".format(CATALOG_SCHEMA_VERSION)
+            )
+
+    def close(self):
+        """Close the connection to the database"""
+        self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM products"
+            ).fetchone()
+        return count
+
+    def upsert(self, products):
+        """Add products to the catalog, updating the ones already in it
+
+        :param products: The products to add, e.g. a search result
+        :type products: :class:`~eodag.api.search_result.SearchResult` or
+                        list(:class:`~eodag.api.product._product.EOProduct`)
+        :returns: The number of products added or updated, the products without an
+                  id being skipped
+        :rtype: int
+        """
+        products = list(products)
+        identified_products = [
+            product for product in products if product.properties.get("id") is not None
+        ]
+        if len(identified_products) < len(products):
+            logger.warning(
+                "%s product(s) without id skipped, they cannot be stored in local "
+                "catalog %s",
+                len(products) - len(identified_products),
+                self.path,
+            )
+            products = identified_products
+        geometries = [product.geometry for product in products]
+        wkbs = shapely.to_wkb(geometries).tolist()
+        bounds = shapely.bounds(geometries).tolist()
+        rows = []
+        for product, wkb, (minx, miny, maxx, maxy) in zip(products, wkbs, bounds):
+            properties = {
+                key: value
+                for key, value in product.properties.items()
+                if key != "geometry"
+            }
+            if minx != minx:
+                # NaN bounds of an empty geometry
+                minx = miny = maxx = maxy = None
+            rows.append(
+                (
+                    product.provider,
+                    str(properties["id"]),
+                    product.product_type,
+                    _timestamp(properties.get("startTimeFromAscendingNode")),
+                    _timestamp(properties.get("completionTimeFromAscendingNode")),
+                    _to_float(properties.get("cloudCover")),
+                    minx,
+                    maxx,
+                    miny,
+                    maxy,
+                    wkb,
+                    orjson.dumps(properties, option=GEOJSON_OPTIONS, default=str),
+                )
+            )
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO products (provider, id, product_type, start_datetime, "
+                "end_datetime, cloud_cover, minx, maxx, miny, maxy, geometry, "
+                "properties) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (provider, id) DO UPDATE SET "
+                "product_type = excluded.product_type, "
+                "start_datetime = excluded.start_datetime, "
+                "end_datetime = excluded.end_datetime, "
+                "cloud_cover = excluded.cloud_cover, minx = excluded.minx, "
+                "maxx = excluded.maxx, miny = excluded.miny, maxy = excluded.maxy, "
+                "geometry = excluded.geometry, properties = excluded.properties",
+                rows,
+            )
+        logger.debug("%s product(s) upserted in local catalog %s", len(rows), self.path)
+        return len(rows)
+
+    def remove(self, provider, ids):
+        """Remove products from the catalog
+
+        :param provider: The provider of the products to remove
+        :type provider: str
+        :param ids: The ids of the products to remove
+        :type ids: list(str)
+        :returns: The number of products removed
+        :rtype: int
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.executemany(
+                "DELETE FROM products WHERE provider = ? AND id = ?",
+                [(provider, str(product_id)) for product_id in ids],
+            )
+        return cursor.rowcount
+
+    def search(
+        self,
+        product_type=None,
+        geometry=None,
+        start=None,
+        end=None,
+        cloud_cover=None,
+        provider=None,
+        id=None,
+        properties=None,
+        items_per_page=None,
+        page=1,
+        count=True,
+        search_kwargs=None,
+    ):
+        """Search the catalog.
+
+        Products are matched as by
+        :class:`~eodag.plugins.crunch.filter_date.FilterDate` on dates: they must
+        start after ``start``, and start and end before ``end``, products without
+        dates matching any dates. They are sorted by start date.
+
+        :param product_type: (optional) The product type of the products
+        :type product_type: str
+        :param geometry: (optional) The geometry the products must intersect
+        :type geometry: :class:`shapely.geometry.base.BaseGeometry`
+        :param start: (optional) The start date of the products, as an iso date
+        :type start: str
+        :param end: (optional) The end date of the products, as an iso date
+        :type end: str
+        :param cloud_cover: (optional) The maximum cloud cover of the products
+        :type cloud_cover: float
+        :param provider: (optional) The provider the products were found on
+        :type provider: str
+        :param id: (optional) The id of the product
+        :type id: str
+        :param properties: (optional) Other properties the products must be equal to
+        :type properties: dict
+        :param items_per_page: (optional) The number of products per page, all the
+                               products matching being returned if not set
+        :type items_per_page: int
+        :param page: (optional) The page to return, starting at 1
+        :type page: int
+        :param count: (optional) Whether to count the products matching or not
+        :type count: bool
+        :param search_kwargs: (optional) The search kwargs given to the built
+                              products, the search geometry being used to compute
+                              their search intersection
+        :type search_kwargs: dict
+        :returns: The products and their total number if ``count`` is True else None
+        :rtype: tuple(list(:class:`~eodag.api.product._product.EOProduct`), int or None)
+        """
+        tables = "products"
+        conditions = []
+        params = []
+        if geometry is not None:
+            minx, miny, maxx, maxy = geometry.bounds
+            tables += " JOIN products_rtree USING (rowid)"
+            conditions.append(
+                "products_rtree.minx <= ? AND products_rtree.maxx >= ? AND "
+                "products_rtree.miny <= ? AND products_rtree.maxy >= ?"
+            )
+            params.extend([maxx, minx, maxy, miny])
+        for column, value in (
+            ("product_type", product_type),
+            ("provider", provider),
+            ("id", id),
+        ):
+            if value is not None:
+                conditions.append("{} = ?".format(column))
+                params.append(str(value))
+        start_timestamp, end_timestamp = _timestamp(start), _timestamp(end)
+        if start_timestamp is not None:
+            conditions.append("(start_datetime IS NULL OR start_datetime >= ?)")
+            params.append(start_timestamp)
+        if end_timestamp is not None:
+            conditions.append(
+                "(start_datetime IS NULL OR start_datetime <= ?) AND "
+                "(end_datetime IS NULL OR end_datetime <= ?)"
+            )
+            params.extend([end_timestamp, end_timestamp])
+        if cloud_cover is not None:
+            conditions.append("(cloud_cover IS NULL OR cloud_cover <= ?)")
+            params.append(float(cloud_cover))
+        for key, value in (properties or {}).items():
+            # non scalar values are compared with their json representation
+            if not isinstance(value, (str, int, float)):
+                value = orjson.dumps(value, option=GEOJSON_OPTIONS).decode()
+            conditions.append("json_extract(properties, ?) = ?")
+            params.extend(['$."{}"'.format(key.replace('"', '\\"')), value])
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        order = " ORDER BY start_datetime, products.rowid"
+
+        with self._lock:
+            if geometry is None:
+                total = None
+                if count:
+                    total = self._connection.execute(
+                        "SELECT COUNT(*) FROM " + tables + where, params
+                    ).fetchone()[0]
+                limit = ""
+                if items_per_page is not None:
+                    limit = " LIMIT {:d} OFFSET {:d}".format(
+                        items_per_page, items_per_page * (page - 1)
+                    )
+                rows = self._connection.execute(
+                    "SELECT provider, product_type, geometry, properties FROM "
+                    + tables
+                    + where
+                    + order
+                    + limit,
+                    params,
+                ).fetchall()
+            else:
+                # the R-tree gives the products whose bounding boxes intersect the
+                # search one, their actual geometries are then checked all at once
+                candidates = self._connection.execute(
+                    "SELECT products.rowid, geometry FROM " + tables + where + order,
+                    params,
+                ).fetchall()
+                geometry = get_prepared_geometry(geometry)
+                intersects = shapely.intersects(
+                    geometry, shapely.from_wkb([wkb for _, wkb in candidates])
+                )
+                rowids = [
+                    rowid
+                    for (rowid, _), intersect in zip(candidates, intersects)
+                    if intersect
+                ]
+                total = len(rowids) if count else None
+                if items_per_page is not None:
+                    rowids = rowids[items_per_page * (page - 1) : items_per_page * page]
+                rows = []
+                # rowids are selected by chunks not to reach the SQLite variables
+                # number limit
+                for i in range(0, len(rowids), 500):
+                    chunk = rowids[i : i + 500]
+                    rows_by_id = {
+                        row[0]: row[1:]
+                        for row in self._connection.execute(
+                            "SELECT rowid, provider, product_type, geometry, "
+                            "properties FROM products WHERE rowid IN ({})".format(
+                                ", ".join("?" * len(chunk))
+                            ),
+                            chunk,
+                        )
+                    }
+                    rows.extend(rows_by_id[rowid] for rowid in chunk)
+
+        search_kwargs = dict(search_kwargs or {})
+        if geometry is not None:
+            search_kwargs["geometry"] = geometry
+        products = []
+        for provider_name, product_type_name, wkb, properties_json in rows:
+            product_properties = orjson.loads(properties_json)
+            product_properties["geometry"] = shapely.from_wkb(wkb)
+            products.append(
+                EOProduct(
+                    provider_name,
+                    product_properties,
+                    **dict(search_kwargs, productType=product_type_name),
+                )
+            )
+        return products, total
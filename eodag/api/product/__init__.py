@@ -20,3 +20,5 @@ try:
     from eodag_cube.api.product import EOProduct  # noqa
 except ImportError:
     from ._product import EOProduct  # noqa
+
+from ._compact import CompactEOProduct  # noqa
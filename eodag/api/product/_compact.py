@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import sys
+from collections.abc import Mapping
+
+import shapely
+
+from eodag.api.product import EOProduct
+
+#: Properties whose string values are repeated among products and are interned
+INTERNED_PROPERTIES = frozenset(
+    [
+        "productType",
+        "providerProductType",
+        "platform",
+        "platformSerialIdentifier",
+        "instrument",
+        "processingLevel",
+        "sensorType",
+        "storageStatus",
+    ]
+)
+
+
+def _intern_value(key, value):
+    if isinstance(value, str) and key in INTERNED_PROPERTIES:
+        return sys.intern(value)
+    return value
+
+
+class CompactProperties(Mapping):
+    """A read-only view of the properties of a
+    :class:`~eodag.api.product._product.CompactEOProduct`, looking up its keys and
+    values tuples without building any dict
+
+    :param keys: The properties keys
+    :type keys: tuple(str)
+    :param values: The properties values, in the order of their keys
+    :type values: tuple
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, keys, values):
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key):
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return repr(dict(zip(self._keys, self._values)))
+
+
+class CompactEOProduct(object):
+    """A memory efficient, read-only representation of an
+    :class:`~eodag.api.product._product.EOProduct`, intended to hold millions of
+    search results.
+
+    Its attributes are stored in slots, the keys of its properties are interned and
+    shared with the other products having the same ones, as well as the repeated
+    values of the :data:`INTERNED_PROPERTIES`. Its properties are read through a
+    :class:`CompactProperties` view, no dict being built or kept for them. Its
+    geometry is stored as WKB and decoded on demand, and
+    its search kwargs are shared with the products of the same search. It can be
+    turned back into a full product with :meth:`to_eoproduct`.
+
+    :param provider: The provider from which the product originates
+    :type provider: str
+    :param properties: The metadata of the product, without its geometry
+    :type properties: dict
+    :param wkb: The geometry of the product as WKB
+    :type wkb: bytes
+    :param product_type: (optional) The product type
+    :type product_type: str
+    :param search_kwargs: (optional) The search kwargs used by eodag to search for the
+                          product, not copied so that they can be shared
+    :type search_kwargs: dict
+    :param keys_cache: (optional) The properties keys already known, to share them
+                       between products
+    :type keys_cache: dict
+    """
+
+    __slots__ = (
+        "provider",
+        "product_type",
+        "location",
+        "remote_location",
+        "search_kwargs",
+        "downloader",
+        "downloader_auth",
+        "_keys",
+        "_values",
+        "_wkb",
+    )
+
+    def __init__(
+        self,
+        provider,
+        properties,
+        wkb,
+        product_type=None,
+        search_kwargs=None,
+        keys_cache=None,
+    ):
+        self.provider = sys.intern(provider) if isinstance(provider, str) else provider
+        self.product_type = _intern_value("productType", product_type)
+        self.location = self.remote_location = properties.get("downloadLink", "")
+        self.search_kwargs = search_kwargs if search_kwargs is not None else {}
+        self.downloader = None
+        self.downloader_auth = None
+        keys = tuple(sys.intern(str(key)) for key in properties)
+        if keys_cache is not None:
+            keys = keys_cache.setdefault(keys, keys)
+        self._keys = keys
+        self._values = tuple(
+            _intern_value(key, value) for key, value in zip(keys, properties.values())
+        )
+        self._wkb = wkb
+
+    @classmethod
+    def from_products(cls, products):
+        """Build compact products from the given ones, sharing their properties keys
+        and search kwargs
+
+        :param products: The products to compact. Already compact ones are kept as is
+        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+        :returns: The compact products
+        :rtype: list(:class:`~eodag.api.product._compact.CompactEOProduct`)
+        """
+        products = list(products)
+        to_compact = [p for p in products if not isinstance(p, cls)]
+        wkbs = iter(shapely.to_wkb([p.geometry for p in to_compact]).tolist())
+        keys_cache = {}
+        search_kwargs = None
+        compact_products = []
+        for product in products:
+            if isinstance(product, cls):
+                compact_products.append(product)
+                continue
+            # products of a same search have equal search kwargs
+            if search_kwargs is None or product.search_kwargs != search_kwargs:
+                search_kwargs = product.search_kwargs
+            compact_product = cls(
+                product.provider,
+                product.properties,
+                next(wkbs),
+                product_type=product.product_type,
+                search_kwargs=search_kwargs,
+                keys_cache=keys_cache,
+            )
+            compact_product.location = product.location
+            compact_product.remote_location = product.remote_location
+            compact_product.downloader = product.downloader
+            compact_product.downloader_auth = product.downloader_auth
+            compact_products.append(compact_product)
+        return compact_products
+
+    @property
+    def properties(self):
+        """A read-only view of the product's metadata"""
+        return CompactProperties(self._keys, self._values)
+
+    @property
+    def geometry(self):
+        """The geometry of the product, decoded on each access"""
+        return shapely.from_wkb(self._wkb)
+
+    @property
+    def search_intersection(self):
+        """The intersection between the product's geometry and the search area,
+        computed on each access
+        """
+        return EOProduct._intersect_search_geometry(self)
+
+    # same geojson representation as the full products
+    as_dict = EOProduct.as_dict
+    __geo_interface__ = property(as_dict)
+
+    def to_eoproduct(self):
+        """Build the full :class:`~eodag.api.product._product.EOProduct` from this
+        compact one
+
+        :returns: The full product
+        :rtype: :class:`~eodag.api.product._product.EOProduct`
+        """
+        properties = dict(self.properties, geometry=self.geometry)
+        product = EOProduct(self.provider, properties, **self.search_kwargs)
+        product.product_type = self.product_type
+        product.location = self.location
+        product.remote_location = self.remote_location
+        # locations and properties were already resolved by register_downloader
+        product.downloader = self.downloader
+        product.downloader_auth = self.downloader_auth
+        return product
+
+    def __repr__(self):
+        product_id = (
+            self._values[self._keys.index("id")] if "id" in self._keys else None
+        )
+        return "{}(id={}, provider={})".format(
+            self.__class__.__name__, product_id, self.provider
+        )
@@ -24,6 +24,7 @@ import urllib.parse
 import requests
 from requests import RequestException
 from shapely import geometry, geos, wkb, wkt
+from shapely.geometry.base import BaseGeometry
 
 from eodag.api.product.drivers import DRIVERS, NoDriver
 from eodag.api.product.metadata_mapping import NOT_AVAILABLE, NOT_MAPPED
@@ -44,6 +45,8 @@ except ImportError:
 
 logger = logging.getLogger("eodag.api.product")
 
+BBOX_PATTERN = re.compile(r"^(-?\d+\.?\d*) (-?\d+\.?\d*) (-?\d+\.?\d*) (-?\d+\.?\d*)$")
+
 
 class EOProduct(object):
     """A wrapper around an Earth Observation Product originating from a search.
@@ -106,54 +109,81 @@ class EOProduct(object):
             product_geometry = properties["defaultGeometry"]
         else:
             product_geometry = properties["geometry"]
+        self.geometry = self._build_geometry(product_geometry)
+        # search_intersection is computed from search_kwargs when first accessed
+        self.search_kwargs = kwargs
+        self.driver = self.get_driver()
+        self.downloader = None
+        self.downloader_auth = None
+
+    @property
+    def search_intersection(self):
+        """The intersection between the product's geometry and the search area,
+        computed on first access. It is the geometry of the product if there was no
+        search area, and None if the intersection could not be computed
+        """
+        # not set until computed, None being a valid search intersection
+        if "_search_intersection" not in self.__dict__:
+            self._search_intersection = self._intersect_search_geometry()
+        return self._search_intersection
+
+    @search_intersection.setter
+    def search_intersection(self, value):
+        self._search_intersection = value
+
+    @staticmethod
+    def _build_geometry(product_geometry):
+        """Best effort to build a shapely geometry from the provider specific one"""
+        if isinstance(product_geometry, BaseGeometry):
+            # already built, e.g. in bulk by the search plugin
+            return product_geometry
         # Let's try 'latmin lonmin latmax lonmax'
         if isinstance(product_geometry, str):
-            bbox_pattern = re.compile(
-                r"^(-?\d+\.?\d*) (-?\d+\.?\d*) (-?\d+\.?\d*) (-?\d+\.?\d*)$"
-            )
-            found_bbox = bbox_pattern.match(product_geometry)
+            found_bbox = BBOX_PATTERN.match(product_geometry)
             if found_bbox:
                 coords = found_bbox.groups()
-                if len(coords) == 4:
-                    product_geometry = geometry.box(
-                        float(coords[1]),
-                        float(coords[0]),
-                        float(coords[3]),
-                        float(coords[2]),
-                    )
+                return geometry.box(
+                    float(coords[1]),
+                    float(coords[0]),
+                    float(coords[3]),
+                    float(coords[2]),
+                )
         # Best effort to understand provider specific geometry (the default is to
         # assume an object implementing the Geo Interface: see
         # https://gist.github.com/2217756)
         if isinstance(product_geometry, str):
             try:
-                product_geometry = wkt.loads(product_geometry)
+                return wkt.loads(product_geometry)
             except geos.WKTReadingError:
                 try:
-                    product_geometry = wkb.loads(product_geometry)
+                    return wkb.loads(product_geometry)
                 # Also catching TypeError because product_geometry can be a
                 # string and not a bytes string
                 except (geos.WKBReadingError, TypeError):
                     # Giv up!
                     raise
-        self.geometry = self.search_intersection = geometry.shape(product_geometry)
-        self.search_kwargs = kwargs
-        if self.search_kwargs.get("geometry") is not None:
-            searched_geom = get_geometry_from_various(
-                **{"geometry": self.search_kwargs["geometry"]}
+        return geometry.shape(product_geometry)
+
+    def _intersect_search_geometry(self):
+        """Intersect the product's geometry with the search one. The search geometry
+        is usually the shapely geometry parsed and prepared once for the whole query
+        and shared by all its products, so that it is not parsed again here
+        """
+        if self.search_kwargs.get("geometry") is None:
+            return self.geometry
+        searched_geom = get_geometry_from_various(
+            **{"geometry": self.search_kwargs["geometry"]}
+        )
+        try:
+            return self.geometry.intersection(searched_geom)
+        except GEOSException:
+            logger.warning(
+                "Unable to intersect the requested extent: %s with the product "
+                "geometry: %s",
+                searched_geom,
+                self.geometry,
             )
-            try:
-                self.search_intersection = self.geometry.intersection(searched_geom)
-            except GEOSException:
-                logger.warning(
-                    "Unable to intersect the requested extent: %s with the product "
-                    "geometry: %s",
-                    searched_geom,
-                    product_geometry,
-                )
-                self.search_intersection = None
-        self.driver = self.get_driver()
-        self.downloader = None
-        self.downloader_auth = None
+            return None
 
     def as_dict(self):
         """Builds a representation of EOProduct as a dictionary to enable its geojson
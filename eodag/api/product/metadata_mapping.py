@@ -17,6 +17,7 @@
 # limitations under the License.
 import ast
 import logging
+import math
 import re
 from datetime import datetime, timedelta
 from string import Formatter
@@ -26,9 +27,9 @@ import orjson
 import pyproj
 from dateutil.parser import isoparse
 from dateutil.tz import UTC, tzutc
-from jsonpath_ng.jsonpath import Child
+from jsonpath_ng.jsonpath import Child, Fields
 from lxml import etree
-from lxml.etree import XPathEvalError
+from lxml.etree import XPathEvalError, XPathSyntaxError
 from shapely import wkt
 from shapely.geometry import MultiPolygon, Polygon
 from shapely.ops import transform
@@ -37,7 +38,9 @@ from eodag.utils import (
     DEFAULT_PROJ,
     deepcopy,
     dict_items_recursive_apply,
+    get_jsonpath_keys,
     get_timestamp,
+    get_value_from_keys,
     items_recursive_apply,
     nested_pairs2dict,
     string_to_jsonpath,
@@ -58,6 +61,14 @@ OFFLINE_STATUS = "OFFLINE"
 COORDS_ROUNDING_PRECISION = 4
 WKT_MAX_LEN = 1600
 COMPLEX_QS_REGEX = re.compile(r"^(.+=)?([^=]*)({.+})+([^=&]*)$")
+# returned when a value is not found in a json result
+_NOT_FOUND = object()
+TEMPLATE_REGEX = re.compile(r"({[^{}]+})+")
+ABSOLUTE_XPATH_REGEX = re.compile(r"(^|[(,|\[])\s*/")
+# first characters of the strings that may be evaluated as python literals
+LITERAL_FIRST_CHARS = frozenset("0123456789+-.([{'\"")
+LITERAL_PREFIX_CHARS = frozenset("bBrRuU")
+LITERAL_PREFIX_REGEX = re.compile(r"^[bBrRuU]{1,2}['\"]")
 
 
 def get_metadata_path(map_value):
@@ -128,6 +139,440 @@ def get_search_param(map_value):
     return map_value[0]
 
 
+class MetadataFormatter(Formatter):
+    """Formatter of the strings of form ``{<field_name>#<conversion_function>}``, see
+    :func:`~eodag.api.product.metadata_mapping.format_metadata`"""
+
+    CONVERSION_REGEX = re.compile(
+        r"^(?P<field_name>.+)" + SEP + r"(?P<converter>[^\d\W]\w*)(\((?P<args>.*)\))*$"
+    )
+
+    def __init__(self):
+        self.custom_converter = None
+        self.custom_args = None
+
+    def get_field(self, field_name, args, kwargs):
+        conversion_func_spec = self.CONVERSION_REGEX.match(field_name)
+        # Register a custom converter if any for later use (see convert_field)
+        # This is done because we don't have the value associated to field_name at
+        # this stage
+        if conversion_func_spec:
+            field_name = conversion_func_spec.groupdict()["field_name"]
+            converter = conversion_func_spec.groupdict()["converter"]
+            self.custom_args = conversion_func_spec.groupdict()["args"]
+            self.custom_converter = getattr(self, "convert_{}".format(converter))
+
+        return super(MetadataFormatter, self).get_field(field_name, args, kwargs)
+
+    def convert_field(self, value, conversion):
+        # Do custom conversion if any (see get_field)
+        if self.custom_converter is not None:
+            if self.custom_args is not None and value is not None:
+                converted = self.custom_converter(value, self.custom_args)
+            elif value is not None:
+                converted = self.custom_converter(value)
+            else:
+                converted = ""
+            # Clear this state variable in case the same converter is used to
+            # resolve other named arguments
+            self.custom_converter = None
+            self.custom_args = None
+            return converted
+        return super(MetadataFormatter, self).convert_field(value, conversion)
+
+    @staticmethod
+    def convert_datetime_to_timestamp_milliseconds(date_time):
+        """Convert a date_time (str) to a Unix timestamp in milliseconds
+
+        "2021-04-21T18:27:19.123Z" => "1619029639123"
+        "2021-04-21" => "1618963200000"
+        "2021-04-21T00:00:00+02:00" => "1618956000000"
+        """
+        return int(1e3 * get_timestamp(date_time))
+
+    @staticmethod
+    def convert_to_iso_utc_datetime_from_milliseconds(timestamp):
+        """Convert a timestamp in milliseconds (int) to its ISO8601 UTC format
+
+        1619029639123 => "2021-04-21T18:27:19.123Z"
+        """
+        try:
+            return (
+                datetime.fromtimestamp(timestamp / 1e3, tzutc())
+                .isoformat(timespec="milliseconds")
+                .replace("+00:00", "Z")
+            )
+        except TypeError:
+            return timestamp
+
+    @staticmethod
+    def convert_to_iso_utc_datetime(date_time, timespec="milliseconds"):
+        """Convert a date_time (str) to its ISO 8601 representation in UTC
+
+        "2021-04-21" => "2021-04-21T00:00:00.000Z"
+        "2021-04-21T00:00:00.000+02:00" => "2021-04-20T22:00:00.000Z"
+
+        The optional argument timespec specifies the number of additional
+        terms of the time to include. Valid options are 'auto', 'hours',
+        'minutes', 'seconds', 'milliseconds' and 'microseconds'.
+        """
+        try:
+            dt = isoparse(date_time)
+        except ValueError:
+            return date_time
+        if not dt.tzinfo:
+            dt = dt.replace(tzinfo=UTC)
+        elif dt.tzinfo is not UTC:
+            dt = dt.astimezone(UTC)
+        return dt.isoformat(timespec=timespec).replace("+00:00", "Z")
+
+    @staticmethod
+    def convert_to_iso_date(datetime_string, time_delta_args_str="0,0,0,0,0,0,0"):
+        """Convert an ISO8601 datetime (str) to its ISO8601 date format
+
+        "2021-04-21T18:27:19.123Z" => "2021-04-21"
+        "2021-04-21" => "2021-04-21"
+        "2021-04-21T00:00:00+06:00" => "2021-04-20" !
+        """
+        dt = isoparse(datetime_string)
+        if not dt.tzinfo:
+            dt = dt.replace(tzinfo=UTC)
+        elif dt.tzinfo is not UTC:
+            dt = dt.astimezone(UTC)
+        time_delta_args = ast.literal_eval(time_delta_args_str)
+        dt += timedelta(*time_delta_args)
+        return dt.isoformat()[:10]
+
+    @staticmethod
+    def convert_to_rounded_wkt(value):
+        wkt_value = wkt.dumps(value, rounding_precision=COORDS_ROUNDING_PRECISION)
+        # If needed, simplify WKT to prevent too long request failure
+        tolerance = 0.1
+        while len(wkt_value) > WKT_MAX_LEN and tolerance <= 1:
+            logger.debug(
+                "Geometry WKT is too long (%s), trying to simplify it with tolerance %s",
+                len(wkt_value),
+                tolerance,
+            )
+            wkt_value = wkt.dumps(
+                value.simplify(tolerance),
+                rounding_precision=COORDS_ROUNDING_PRECISION,
+            )
+            tolerance += 0.1
+        if len(wkt_value) > WKT_MAX_LEN and tolerance > 1:
+            logger.warning("Failed to reduce WKT length lower than %s", WKT_MAX_LEN)
+        return wkt_value
+
+    @staticmethod
+    def convert_to_bounds_lists(input_geom):
+        if isinstance(input_geom, MultiPolygon):
+            geoms = [geom for geom in input_geom.geoms]
+            # sort with larger one at first (stac-browser only plots first one)
+            geoms.sort(key=lambda x: x.area, reverse=True)
+            return [list(x.bounds[0:4]) for x in geoms]
+        else:
+            return [list(input_geom.bounds[0:4])]
+
+    @staticmethod
+    def convert_to_nwse_bounds(input_geom):
+        return list(input_geom.bounds[-1:] + input_geom.bounds[:-1])
+
+    @staticmethod
+    def convert_to_nwse_bounds_str(input_geom, separator=","):
+        return separator.join(
+            str(x) for x in MetadataFormatter.convert_to_nwse_bounds(input_geom)
+        )
+
+    @staticmethod
+    def convert_to_geojson(string):
+        return geojson.dumps(string)
+
+    @staticmethod
+    def convert_from_ewkt(ewkt_string):
+        """Convert EWKT (Extended Well-Known text) to shapely geometry"""
+
+        ewkt_regex = re.compile(r"^(?P<proj>[A-Za-z]+=[0-9]+);(?P<wkt>.*)$")
+        ewkt_match = ewkt_regex.match(ewkt_string)
+        if ewkt_match:
+            g = ewkt_match.groupdict()
+            from_proj = g["proj"].replace("SRID", "EPSG").replace("=", ":")
+            input_geom = wkt.loads(g["wkt"])
+
+            from_proj = pyproj.CRS(from_proj)
+            to_proj = pyproj.CRS(DEFAULT_PROJ)
+
+            if from_proj != to_proj:
+                # reproject
+                project = pyproj.Transformer.from_crs(
+                    from_proj, to_proj, always_xy=True
+                ).transform
+                return transform(project, input_geom)
+            else:
+                return input_geom
+        else:
+            logger.warning(f"Could not read {ewkt_string} as EWKT")
+            return ewkt_string
+
+    @staticmethod
+    def convert_to_ewkt(input_geom):
+        """Convert shapely geometry to EWKT (Extended Well-Known text)"""
+
+        proj = DEFAULT_PROJ.upper().replace("EPSG", "SRID").replace(":", "=")
+        wkt_geom = MetadataFormatter.convert_to_rounded_wkt(input_geom)
+
+        return f"{proj};{wkt_geom}"
+
+    @staticmethod
+    def convert_from_georss(georss):
+        """Convert GeoRSS to shapely geometry"""
+
+        if "polygon" in georss.tag:
+            # Polygon
+            coords_list = georss.text.split()
+            polygon_args = [
+                (float(coords_list[2 * i]), float(coords_list[2 * i + 1]))
+                for i in range(int(len(coords_list) / 2))
+            ]
+            return Polygon(polygon_args)
+        elif len(georss) == 1 and "multisurface" in georss[0].tag.lower():
+            # Multipolygon
+            from_proj = getattr(georss[0], "attrib", {}).get("srsName", None)
+            if from_proj:
+                from_proj = pyproj.CRS(from_proj)
+                to_proj = pyproj.CRS(DEFAULT_PROJ)
+                project = pyproj.Transformer.from_crs(
+                    from_proj, to_proj, always_xy=True
+                ).transform
+
+            # function to get deepest elements
+            def flatten_elements(nested):
+
+                for e in nested:
+                    if len(e) > 0:
+                        yield from flatten_elements(e)
+                    else:
+                        yield e
+
+            polygons_list = []
+            for elem in flatten_elements(georss[0]):
+                coords_list = elem.text.split()
+                polygon_args = [
+                    (float(coords_list[2 * i]), float(coords_list[2 * i + 1]))
+                    for i in range(int(len(coords_list) / 2))
+                ]
+                polygon = Polygon(polygon_args)
+                # reproject if needed
+                if from_proj and from_proj != to_proj:
+                    polygons_list.append(transform(project, polygon))
+                else:
+                    polygons_list.append(polygon)
+
+            return MultiPolygon(polygons_list)
+
+        else:
+            logger.warning(f"Incoming GeoRSS format not supported yet: {str(georss)}")
+            return georss
+
+    @staticmethod
+    def convert_csv_list(values_list):
+        if isinstance(values_list, list):
+            return ",".join([str(x) for x in values_list])
+        else:
+            return values_list
+
+    @staticmethod
+    def convert_remove_extension(string):
+        parts = string.split(".")
+        if parts:
+            return parts[0]
+        return ""
+
+    @staticmethod
+    def convert_get_group_name(string, pattern):
+        try:
+            return re.search(pattern, str(string)).lastgroup
+        except AttributeError:
+            logger.warning(
+                "Could not extract property from %s using %s", string, pattern
+            )
+            return NOT_AVAILABLE
+
+    @staticmethod
+    def convert_replace_str(string, args):
+        old, new = ast.literal_eval(args)
+        return re.sub(old, new, string)
+
+    @staticmethod
+    def convert_recursive_sub_str(input_obj, args):
+        old, new = ast.literal_eval(args)
+        return items_recursive_apply(
+            input_obj,
+            lambda k, v, x, y: re.sub(x, y, v) if isinstance(v, str) else v,
+            **{"x": old, "y": new},
+        )
+
+    @staticmethod
+    def convert_dict_update(input_dict, args):
+        """Converts"""
+        new_items_list = ast.literal_eval(args)
+
+        new_items_dict = nested_pairs2dict(new_items_list)
+
+        return dict(input_dict, **new_items_dict)
+
+    @staticmethod
+    def convert_slice_str(string, args):
+        cmin, cmax, cstep = [x.strip() for x in args.split(",")]
+        return string[int(cmin) : int(cmax) : int(cstep)]
+
+    @staticmethod
+    def convert_fake_l2a_title_from_l1c(string):
+        id_regex = re.compile(
+            r"^(?P<id1>\w+)_(?P<id2>\w+)_(?P<id3>\w+)_(?P<id4>\w+)_(?P<id5>\w+)_(?P<id6>\w+)_(?P<id7>\w+)$"
+        )
+        id_match = id_regex.match(string)
+        if id_match:
+            id_dict = id_match.groupdict()
+            return "%s_MSIL2A_%s____________%s________________" % (
+                id_dict["id1"],
+                id_dict["id3"],
+                id_dict["id6"],
+            )
+        else:
+            logger.error("Could not extract fake title from %s" % string)
+            return NOT_AVAILABLE
+
+    @staticmethod
+    def convert_s2msil2a_title_to_aws_productinfo(string):
+        id_regex = re.compile(
+            r"^(?P<id1>\w+)_(?P<id2>\w+)_(?P<year>[0-9]{4})(?P<month>[0-9]{2})(?P<day>[0-9]{2})T[0-9]+_"
+            + r"(?P<id4>[A-Z0-9_]+)_(?P<id5>[A-Z0-9_]+)_T(?P<tile1>[0-9]{2})(?P<tile2>[A-Z])(?P<tile3>[A-Z]{2})_"
+            + r"(?P<id7>[A-Z0-9_]+)$"
+        )
+        id_match = id_regex.match(string)
+        if id_match:
+            id_dict = id_match.groupdict()
+            return (
+                "https://roda.sentinel-hub.com/sentinel-s2-l2a/tiles/%s/%s/%s/%s/%s/%s/0/{collection}.json"
+                % (
+                    id_dict["tile1"],
+                    id_dict["tile2"],
+                    id_dict["tile3"],
+                    id_dict["year"],
+                    int(id_dict["month"]),
+                    int(id_dict["day"]),
+                )
+            )
+        else:
+            logger.error("Could not extract title infos from %s" % string)
+            return NOT_AVAILABLE
+
+    @staticmethod
+    def convert_split_id_into_s1_params(product_id):
+        parts = re.split(r"_(?!_)", product_id)
+        if len(parts) < 9:
+            logger.error(
+                "id %s does not match expected Sentinel-1 id format", product_id
+            )
+            raise ValueError
+        params = {"sensorMode": parts[1]}
+        level = "LEVEL" + parts[3][0]
+        params["processingLevel"] = level
+        start_date = datetime.strptime(parts[4], "%Y%m%dT%H%M%S") - timedelta(seconds=1)
+        params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_date = datetime.strptime(parts[5], "%Y%m%dT%H%M%S") + timedelta(seconds=1)
+        params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        product_type = parts[2][:3]
+        if product_type == "GRD" and parts[-1] == "COG":
+            product_type = "GRD-COG"
+        elif product_type == "GRD" and parts[-2] == "CARD" and parts[-1] == "BS":
+            product_type = "CARD-BS"
+        params["productType"] = product_type
+        polarisation_mapping = {
+            "SV": "VV",
+            "SH": "HH",
+            "DH": "HH+HV",
+            "DV": "VV+VH",
+        }
+        polarisation = polarisation_mapping[parts[3][2:]]
+        params["polarisation"] = polarisation
+        return params
+
+    @staticmethod
+    def convert_split_id_into_s3_params(product_id):
+        parts = re.split(r"_(?!_)", product_id)
+        params = {"productType": product_id[4:15]}
+        start_date = datetime.strptime(product_id[16:31], "%Y%m%dT%H%M%S") - timedelta(
+            seconds=1
+        )
+        params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_date = datetime.strptime(product_id[32:47], "%Y%m%dT%H%M%S") + timedelta(
+            seconds=1
+        )
+        params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        params["timeliness"] = parts[-2]
+        params["sat"] = "Sentinel-" + parts[0][1:]
+        return params
+
+    @staticmethod
+    def convert_split_id_into_s5p_params(product_id):
+        parts = re.split(r"_(?!_)", product_id)
+        params = {
+            "productType": product_id[9:19],
+            "processingMode": parts[1],
+            "processingLevel": parts[2].replace("_", ""),
+        }
+        start_date = datetime.strptime(parts[-6], "%Y%m%dT%H%M%S") - timedelta(
+            seconds=10
+        )
+        params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_date = datetime.strptime(parts[-5], "%Y%m%dT%H%M%S") + timedelta(seconds=10)
+        params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return params
+
+    @staticmethod
+    def convert_split_cop_dem_id(product_id):
+        parts = product_id.split("_")
+        lattitude = parts[3]
+        longitude = parts[5]
+        if lattitude[0] == "N":
+            lat_num = int(lattitude[1:])
+        else:
+            lat_num = -1 * int(lattitude[1:])
+        if longitude[0] == "E":
+            long_num = int(longitude[1:])
+        else:
+            long_num = -1 * int(longitude[1:])
+        bbox = [long_num - 1, lat_num - 1, long_num + 1, lat_num + 1]
+        return bbox
+
+    # @staticmethod
+    # def convert_get_corine_product_type(start_date, end_date):
+    #     start_year = start_date[:4]
+    #     end_year = end_date[:4]
+    #     print(start_year, end_year)
+    #     years = [1990, 2000, 2006, 2012, 2018]
+    #     if start_year == end_year and int(start_year) in years:
+    #         product_type = "Corine Land Cover " + start_year
+    #     else:
+    #         max_interception = 0
+    #         sel_years = [1990, 2000]
+    #         for i, year in enumerate(years[:-1]):
+    #             if int(end_year) < years[i+1] and i == 0:
+    #                 sel_years = [year, years[i+1]]
+    #                 break
+    #             elif int(start_year) > years[i+1]:
+    #                 continue
+    #             else:
+    #                 interception = min(years[i+1], int(end_year)) - max(year, int(start_year))
+    #                 if interception > max_interception:
+    #                     max_interception = interception
+    #                     sel_years = [year, years[i+1]]
+    #         product_type = "Corine Land Change " + str(sel_years[0]) + " " + str(sel_years[1])
+    #
+    #     return product_type
+
+
 def format_metadata(search_param, *args, **kwargs):
     """Format a string of form {<field_name>#<conversion_function>}
 
@@ -167,461 +612,362 @@ def format_metadata(search_param, *args, **kwargs):
     :returns: The formatted string
     :rtype: str
     """
-
-    class MetadataFormatter(Formatter):
-        CONVERSION_REGEX = re.compile(
-            r"^(?P<field_name>.+)"
-            + SEP
-            + r"(?P<converter>[^\d\W]\w*)(\((?P<args>.*)\))*$"
+    # if stac extension colon separator `:` is in search params, parse it to prevent issues with vformat
+    if re.search(r"{[a-zA-Z0-9_-]*:[a-zA-Z0-9_-]*}", search_param):
+        search_param = re.sub(
+            r"{([a-zA-Z0-9_-]*):([a-zA-Z0-9_-]*)}", r"{\1_COLON_\2}", search_param
         )
+        kwargs = {k.replace(":", "_COLON_"): v for k, v in kwargs.items()}
+    # if re.search(r"\([a-zA-Z0-9_-]*:[a-zA-Z0-9_-]*", search_param):
+    #     search_param = search_param.replace(":", "_COLON_")
+    return MetadataFormatter().vformat(search_param, args, kwargs)
 
-        def __init__(self):
-            self.custom_converter = None
-            self.custom_args = None
-
-        def get_field(self, field_name, args, kwargs):
-            conversion_func_spec = self.CONVERSION_REGEX.match(field_name)
-            # Register a custom converter if any for later use (see convert_field)
-            # This is done because we don't have the value associated to field_name at
-            # this stage
-            if conversion_func_spec:
-                field_name = conversion_func_spec.groupdict()["field_name"]
-                converter = conversion_func_spec.groupdict()["converter"]
-                self.custom_args = conversion_func_spec.groupdict()["args"]
-                self.custom_converter = getattr(self, "convert_{}".format(converter))
-
-            return super(MetadataFormatter, self).get_field(field_name, args, kwargs)
-
-        def convert_field(self, value, conversion):
-            # Do custom conversion if any (see get_field)
-            if self.custom_converter is not None:
-                if self.custom_args is not None and value is not None:
-                    converted = self.custom_converter(value, self.custom_args)
-                elif value is not None:
-                    converted = self.custom_converter(value)
-                else:
-                    converted = ""
-                # Clear this state variable in case the same converter is used to
-                # resolve other named arguments
-                self.custom_converter = None
-                self.custom_args = None
-                return converted
-            return super(MetadataFormatter, self).convert_field(value, conversion)
-
-        @staticmethod
-        def convert_datetime_to_timestamp_milliseconds(date_time):
-            """Convert a date_time (str) to a Unix timestamp in milliseconds
-
-            "2021-04-21T18:27:19.123Z" => "1619029639123"
-            "2021-04-21" => "1618963200000"
-            "2021-04-21T00:00:00+02:00" => "1618956000000"
-            """
-            return int(1e3 * get_timestamp(date_time))
-
-        @staticmethod
-        def convert_to_iso_utc_datetime_from_milliseconds(timestamp):
-            """Convert a timestamp in milliseconds (int) to its ISO8601 UTC format
 
-            1619029639123 => "2021-04-21T18:27:19.123Z"
-            """
-            try:
-                return (
-                    datetime.fromtimestamp(timestamp / 1e3, tzutc())
-                    .isoformat(timespec="milliseconds")
-                    .replace("+00:00", "Z")
-                )
-            except TypeError:
-                return timestamp
+def _literal_eval(value):
+    """Evaluate a string as a python literal when possible, or return it as is.
 
-        @staticmethod
-        def convert_to_iso_utc_datetime(date_time, timespec="milliseconds"):
-            """Convert a date_time (str) to its ISO 8601 representation in UTC
+    Strings that cannot be python literals are filtered out before calling the costly
+    :func:`ast.literal_eval`.
 
-            "2021-04-21" => "2021-04-21T00:00:00.000Z"
-            "2021-04-21T00:00:00.000+02:00" => "2021-04-20T22:00:00.000Z"
+    >>> _literal_eval("[1, 2]")
+    [1, 2]
+    >>> _literal_eval("S2A_MSIL1C")
+    'S2A_MSIL1C'
+    """
+    stripped = value.lstrip()
+    if not stripped:
+        return value
+    first_char = stripped[0]
+    if first_char not in LITERAL_FIRST_CHARS and not (
+        stripped.rstrip() in ("None", "True", "False", "set()")
+        or (first_char in LITERAL_PREFIX_CHARS and LITERAL_PREFIX_REGEX.match(stripped))
+    ):
+        return value
+    try:
+        return ast.literal_eval(value)
+    except Exception:
+        return value
+
+
+def _is_literal(value):
+    """Check if a python object would be unchanged once formatted as a string and then
+    evaluated as a literal"""
+    if value is None or isinstance(value, (str, bool, int)):
+        return True
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, (list, tuple)):
+        return all(_is_literal(v) for v in value)
+    if isinstance(value, dict):
+        return all(_is_literal(k) and _is_literal(v) for k, v in value.items())
+    return False
+
+
+def _get_conversion(conversion_or_none):
+    """Get the conversion of a compiled metadata mapping as a ``converter(args)`` or
+    ``converter`` string"""
+    if (
+        len(conversion_or_none) > 1
+        and isinstance(conversion_or_none, list)
+        and conversion_or_none[1] is not None
+    ):
+        return "%s(%s)" % (conversion_or_none[0], conversion_or_none[1])
+    elif isinstance(conversion_or_none, list):
+        return conversion_or_none[0]
+    return conversion_or_none
+
+
+def _get_converter(metadata, conversion):
+    """Get the :class:`~eodag.api.product.metadata_mapping.MetadataFormatter` method
+    doing the given conversion of a metadata value, with its arguments bound
+
+    :param metadata: The converted metadata
+    :type metadata: str
+    :param conversion: The conversion, as a ``converter(args)`` or ``converter`` string
+    :type conversion: str
+    :returns: A function converting a value, or None if the conversion must be done
+              by :func:`~eodag.api.product.metadata_mapping.format_metadata`
+    :rtype: Callable
+    """
+    if TEMPLATE_REGEX.search(conversion) or not re.match(r"^[\w-]+$", metadata):
+        return None
+    conversion_func_spec = MetadataFormatter.CONVERSION_REGEX.match(
+        "%s%s%s" % (metadata, SEP, conversion)
+    )
+    if not conversion_func_spec:
+        return None
+    converter = getattr(
+        MetadataFormatter, "convert_%s" % conversion_func_spec.group("converter"), None
+    )
+    if converter is None:
+        return None
+    args = conversion_func_spec.group("args")
+    if args is None:
+        return converter
+    return lambda value: converter(value, args)
+
+
+class JsonMetadataExtractor:
+    """Extractor of the properties of provider json results, built from a metadata
+    mapping.
+
+    The mapping is compiled once: constant values are evaluated, templates are
+    detected and the converters are resolved to the
+    :class:`~eodag.api.product.metadata_mapping.MetadataFormatter` methods, so that
+    extracting the properties of each result of a search only consists in finding the
+    values and calling the converters. The extracted properties are the same as the
+    ones returned by :func:`~eodag.api.product.metadata_mapping.properties_from_json`.
+
+    Values pointed by simple jsonpaths, made only of fields and integer indexes, are
+    directly read in the json result. The other jsonpaths (filters, wildcards, ...)
+    are evaluated using ``jsonpath_ng``.
+
+    The extractor can be pickled to extract properties in other processes, where it
+    is compiled again from its mapping.
+
+    :param mapping: A mapping between :class:`~eodag.api.product._product.EOProduct`'s
+                    metadata keys and the location of the values of these properties
+                    in the json representation (see
+                    :func:`~eodag.api.product.metadata_mapping.mtd_cfg_as_conversion_and_querypath`)
+    :type mapping: dict
+    :param discovery_config: (optional) metadata discovery configuration dict (see
+                             :func:`~eodag.api.product.metadata_mapping.properties_from_json`)
+    :type discovery_config: dict
+    """
 
-            The optional argument timespec specifies the number of additional
-            terms of the time to include. Valid options are 'auto', 'hours',
-            'minutes', 'seconds', 'milliseconds' and 'microseconds'.
-            """
-            try:
-                dt = isoparse(date_time)
-            except ValueError:
-                return date_time
-            if not dt.tzinfo:
-                dt = dt.replace(tzinfo=UTC)
-            elif dt.tzinfo is not UTC:
-                dt = dt.astimezone(UTC)
-            return dt.isoformat(timespec=timespec).replace("+00:00", "Z")
-
-        @staticmethod
-        def convert_to_iso_date(datetime_string, time_delta_args_str="0,0,0,0,0,0,0"):
-            """Convert an ISO8601 datetime (str) to its ISO8601 date format
-
-            "2021-04-21T18:27:19.123Z" => "2021-04-21"
-            "2021-04-21" => "2021-04-21"
-            "2021-04-21T00:00:00+06:00" => "2021-04-20" !
-            """
-            dt = isoparse(datetime_string)
-            if not dt.tzinfo:
-                dt = dt.replace(tzinfo=UTC)
-            elif dt.tzinfo is not UTC:
-                dt = dt.astimezone(UTC)
-            time_delta_args = ast.literal_eval(time_delta_args_str)
-            dt += timedelta(*time_delta_args)
-            return dt.isoformat()[:10]
-
-        @staticmethod
-        def convert_to_rounded_wkt(value):
-            wkt_value = wkt.dumps(value, rounding_precision=COORDS_ROUNDING_PRECISION)
-            # If needed, simplify WKT to prevent too long request failure
-            tolerance = 0.1
-            while len(wkt_value) > WKT_MAX_LEN and tolerance <= 1:
-                logger.debug(
-                    "Geometry WKT is too long (%s), trying to simplify it with tolerance %s",
-                    len(wkt_value),
-                    tolerance,
-                )
-                wkt_value = wkt.dumps(
-                    value.simplify(tolerance),
-                    rounding_precision=COORDS_ROUNDING_PRECISION,
-                )
-                tolerance += 0.1
-            if len(wkt_value) > WKT_MAX_LEN and tolerance > 1:
-                logger.warning("Failed to reduce WKT length lower than %s", WKT_MAX_LEN)
-            return wkt_value
-
-        @staticmethod
-        def convert_to_bounds_lists(input_geom):
-            if isinstance(input_geom, MultiPolygon):
-                geoms = [geom for geom in input_geom.geoms]
-                # sort with larger one at first (stac-browser only plots first one)
-                geoms.sort(key=lambda x: x.area, reverse=True)
-                return [list(x.bounds[0:4]) for x in geoms]
+    def __init__(self, mapping, discovery_config=None):
+        self.mapping = mapping
+        self.discovery_config = discovery_config
+        # (metadata, jsonpath or None, jsonpath keys, converter or constant value)
+        self.fields = []
+        self.templates = {}
+        for metadata, value in mapping.items():
+            # Treat the case when the value is from a queryable metadata
+            if isinstance(value, list):
+                conversion_or_none, path_or_text = value[1]
             else:
-                return [list(input_geom.bounds[0:4])]
-
-        @staticmethod
-        def convert_to_nwse_bounds(input_geom):
-            return list(input_geom.bounds[-1:] + input_geom.bounds[:-1])
-
-        @staticmethod
-        def convert_to_nwse_bounds_str(input_geom, separator=","):
-            return separator.join(
-                str(x) for x in MetadataFormatter.convert_to_nwse_bounds(input_geom)
-            )
-
-        @staticmethod
-        def convert_to_geojson(string):
-            return geojson.dumps(string)
-
-        @staticmethod
-        def convert_from_ewkt(ewkt_string):
-            """Convert EWKT (Extended Well-Known text) to shapely geometry"""
-
-            ewkt_regex = re.compile(r"^(?P<proj>[A-Za-z]+=[0-9]+);(?P<wkt>.*)$")
-            ewkt_match = ewkt_regex.match(ewkt_string)
-            if ewkt_match:
-                g = ewkt_match.groupdict()
-                from_proj = g["proj"].replace("SRID", "EPSG").replace("=", ":")
-                input_geom = wkt.loads(g["wkt"])
-
-                from_proj = pyproj.CRS(from_proj)
-                to_proj = pyproj.CRS(DEFAULT_PROJ)
-
-                if from_proj != to_proj:
-                    # reproject
-                    project = pyproj.Transformer.from_crs(
-                        from_proj, to_proj, always_xy=True
-                    ).transform
-                    return transform(project, input_geom)
+                conversion_or_none, path_or_text = value
+            if isinstance(path_or_text, str):
+                if TEMPLATE_REGEX.search(path_or_text):
+                    self.templates[metadata] = path_or_text
                 else:
-                    return input_geom
+                    self.fields.append(
+                        (metadata, None, None, _literal_eval(path_or_text))
+                    )
             else:
-                logger.warning(f"Could not read {ewkt_string} as EWKT")
-                return ewkt_string
-
-        @staticmethod
-        def convert_to_ewkt(input_geom):
-            """Convert shapely geometry to EWKT (Extended Well-Known text)"""
-
-            proj = DEFAULT_PROJ.upper().replace("EPSG", "SRID").replace(":", "=")
-            wkt_geom = MetadataFormatter.convert_to_rounded_wkt(input_geom)
-
-            return f"{proj};{wkt_geom}"
-
-        @staticmethod
-        def convert_from_georss(georss):
-            """Convert GeoRSS to shapely geometry"""
+                self.fields.append(
+                    (
+                        metadata,
+                        path_or_text,
+                        get_jsonpath_keys(path_or_text),
+                        self._compile_conversion(metadata, conversion_or_none),
+                    )
+                )
 
-            if "polygon" in georss.tag:
-                # Polygon
-                coords_list = georss.text.split()
-                polygon_args = [
-                    (float(coords_list[2 * i]), float(coords_list[2 * i + 1]))
-                    for i in range(int(len(coords_list) / 2))
-                ]
-                return Polygon(polygon_args)
-            elif len(georss) == 1 and "multisurface" in georss[0].tag.lower():
-                # Multipolygon
-                from_proj = getattr(georss[0], "attrib", {}).get("srsName", None)
-                if from_proj:
-                    from_proj = pyproj.CRS(from_proj)
-                    to_proj = pyproj.CRS(DEFAULT_PROJ)
-                    project = pyproj.Transformer.from_crs(
-                        from_proj, to_proj, always_xy=True
-                    ).transform
-
-                # function to get deepest elements
-                def flatten_elements(nested):
-
-                    for e in nested:
-                        if len(e) > 0:
-                            yield from flatten_elements(e)
-                        else:
-                            yield e
-
-                polygons_list = []
-                for elem in flatten_elements(georss[0]):
-                    coords_list = elem.text.split()
-                    polygon_args = [
-                        (float(coords_list[2 * i]), float(coords_list[2 * i + 1]))
-                        for i in range(int(len(coords_list) / 2))
-                    ]
-                    polygon = Polygon(polygon_args)
-                    # reproject if needed
-                    if from_proj and from_proj != to_proj:
-                        polygons_list.append(transform(project, polygon))
-                    else:
-                        polygons_list.append(polygon)
+        if not discovery_config:
+            discovery_config = {}
+        discovery_pattern = discovery_config.get("metadata_pattern", None)
+        discovery_path = discovery_config.get("metadata_path", None)
+        if discovery_pattern and discovery_path:
+            self.discovery_pattern = re.compile(discovery_pattern)
+            self.discovery_path = string_to_jsonpath(discovery_path)
+            self.discovery_path_id = (
+                string_to_jsonpath(discovery_config["metadata_path_id"], force=True)
+                if "metadata_path_id" in discovery_config
+                else None
+            )
+            self.discovery_path_value = (
+                string_to_jsonpath(discovery_config["metadata_path_value"], force=True)
+                if "metadata_path_value" in discovery_config
+                else None
+            )
+            # keys of the object whose items are all discovered, if it can be
+            # directly read in the json result (e.g. $.properties.*)
+            self.discovery_keys = (
+                get_jsonpath_keys(self.discovery_path.left)
+                if type(self.discovery_path) is Child
+                and type(self.discovery_path.right) is Fields
+                and self.discovery_path.right.fields == ("*",)
+                and self.discovery_path_id is None
+                and self.discovery_path_value is None
+                else None
+            )
+        else:
+            self.discovery_pattern = self.discovery_path = None
+
+    def __reduce__(self):
+        # converters are not picklable, the mapping is compiled again when unpickled
+        return self.__class__, (self.mapping, self.discovery_config)
+
+    @staticmethod
+    def _compile_conversion(metadata, conversion_or_none):
+        """Get the function converting an extracted value of the given metadata"""
+        if conversion_or_none is None:
+            return None
+        conversion = _get_conversion(conversion_or_none)
+        converter = _get_converter(metadata, conversion)
+        if converter is None:
+            # conversion using variables to format, or not understood by the fast path
+            dynamic_conversion = TEMPLATE_REGEX.search(conversion) is not None
+
+            def convert(value, properties):
+                return _literal_eval(
+                    format_metadata(
+                        "{%s%s%s}"
+                        % (
+                            metadata,
+                            SEP,
+                            conversion.format(**properties)
+                            if dynamic_conversion
+                            else conversion,
+                        ),
+                        **{metadata: value},
+                    )
+                )
 
-                return MultiPolygon(polygons_list)
+            return convert
 
+        def convert(value, properties):
+            converted = converter(value)
+            if isinstance(converted, str):
+                return _literal_eval(converted)
+            if _is_literal(converted):
+                return converted
+            # the converted value as it would have been formatted in a string
+            return _literal_eval(format(converted, ""))
+
+        return convert
+
+    def __call__(self, json):
+        """Extract the properties of a provider json result
+
+        :param json: The representation of a provider result as a json object
+        :type json: dict
+        :returns: The metadata of the :class:`~eodag.api.product._product.EOProduct`
+        :rtype: dict
+        """
+        properties = {}
+        # paths of the extracted values, as keys when possible
+        used_jsonpaths = []
+        for metadata, path, keys, converter in self.fields:
+            if path is None:
+                # constant value, copied as it may be updated afterwards
+                properties[metadata] = (
+                    deepcopy(converter)
+                    if isinstance(converter, (list, dict, set))
+                    else converter
+                )
+                continue
+            if keys is not None:
+                extracted_value = get_value_from_keys(json, keys, _NOT_FOUND)
+                if extracted_value is _NOT_FOUND:
+                    extracted_value = NOT_AVAILABLE
+                else:
+                    used_jsonpaths.append(keys)
             else:
-                logger.warning(
-                    f"Incoming GeoRSS format not supported yet: {str(georss)}"
+                match = path.find(json)
+                if len(match) == 1:
+                    extracted_value = match[0].value
+                    full_path = match[0].full_path
+                    full_path_keys = get_jsonpath_keys(full_path)
+                    used_jsonpaths.append(
+                        full_path if full_path_keys is None else full_path_keys
+                    )
+                else:
+                    extracted_value = NOT_AVAILABLE
+            if extracted_value is None:
+                properties[metadata] = None
+            elif converter is None:
+                # properties as python objects when possible
+                properties[metadata] = (
+                    _literal_eval(extracted_value)
+                    if isinstance(extracted_value, str)
+                    else extracted_value
                 )
-                return georss
-
-        @staticmethod
-        def convert_csv_list(values_list):
-            if isinstance(values_list, list):
-                return ",".join([str(x) for x in values_list])
             else:
-                return values_list
+                properties[metadata] = converter(extracted_value, properties)
 
-        @staticmethod
-        def convert_remove_extension(string):
-            parts = string.split(".")
-            if parts:
-                return parts[0]
-            return ""
-
-        @staticmethod
-        def convert_get_group_name(string, pattern):
+        # Resolve templates
+        for metadata, template in self.templates.items():
             try:
-                return re.search(pattern, str(string)).lastgroup
-            except AttributeError:
+                properties[metadata] = template.format(**properties)
+            except ValueError:
                 logger.warning(
-                    "Could not extract property from %s using %s", string, pattern
+                    f"Could not parse {metadata} ({template}) using product properties"
                 )
-                return NOT_AVAILABLE
-
-        @staticmethod
-        def convert_replace_str(string, args):
-            old, new = ast.literal_eval(args)
-            return re.sub(old, new, string)
-
-        @staticmethod
-        def convert_recursive_sub_str(input_obj, args):
-            old, new = ast.literal_eval(args)
-            return items_recursive_apply(
-                input_obj,
-                lambda k, v, x, y: re.sub(x, y, v) if isinstance(v, str) else v,
-                **{"x": old, "y": new},
-            )
-
-        @staticmethod
-        def convert_dict_update(input_dict, args):
-            """Converts"""
-            new_items_list = ast.literal_eval(args)
-
-            new_items_dict = nested_pairs2dict(new_items_list)
-
-            return dict(input_dict, **new_items_dict)
-
-        @staticmethod
-        def convert_slice_str(string, args):
-            cmin, cmax, cstep = [x.strip() for x in args.split(",")]
-            return string[int(cmin) : int(cmax) : int(cstep)]
+                logger.debug(f"available properties: {properties}")
+                properties[metadata] = NOT_AVAILABLE
+
+        # adds missing discovered properties
+        if self.discovery_pattern is not None:
+            self._discover_properties(json, properties, used_jsonpaths)
+
+        return properties
+
+    def _discover_properties(self, json, properties, used_jsonpaths):
+        """Add to the properties the ones discovered in the json result"""
+        if self.discovery_keys is not None:
+            found_object = get_value_from_keys(json, self.discovery_keys)
+            if not isinstance(found_object, dict):
+                return
+            used_keys = set(p for p in used_jsonpaths if isinstance(p, tuple))
+            for found_key, found_value in found_object.items():
+                if (
+                    self.discovery_pattern.match(found_key)
+                    and found_key not in properties
+                    and self.discovery_keys + (found_key,) not in used_keys
+                ):
+                    # properties as python objects when possible
+                    properties[found_key] = (
+                        _literal_eval(found_value)
+                        if isinstance(found_value, str)
+                        else found_value
+                    )
+            return
 
-        @staticmethod
-        def convert_fake_l2a_title_from_l1c(string):
-            id_regex = re.compile(
-                r"^(?P<id1>\w+)_(?P<id2>\w+)_(?P<id3>\w+)_(?P<id4>\w+)_(?P<id5>\w+)_(?P<id6>\w+)_(?P<id7>\w+)$"
-            )
-            id_match = id_regex.match(string)
-            if id_match:
-                id_dict = id_match.groupdict()
-                return "%s_MSIL2A_%s____________%s________________" % (
-                    id_dict["id1"],
-                    id_dict["id3"],
-                    id_dict["id6"],
+        for found_jsonpath in self.discovery_path.find(json):
+            if self.discovery_path_id is not None:
+                found_key_paths = self.discovery_path_id.find(found_jsonpath.value)
+                if not found_key_paths:
+                    continue
+                found_key = found_key_paths[0].value
+                used_jsonpath = Child(
+                    found_jsonpath.full_path, self.discovery_path_value
                 )
             else:
-                logger.error("Could not extract fake title from %s" % string)
-                return NOT_AVAILABLE
-
-        @staticmethod
-        def convert_s2msil2a_title_to_aws_productinfo(string):
-            id_regex = re.compile(
-                r"^(?P<id1>\w+)_(?P<id2>\w+)_(?P<year>[0-9]{4})(?P<month>[0-9]{2})(?P<day>[0-9]{2})T[0-9]+_"
-                + r"(?P<id4>[A-Z0-9_]+)_(?P<id5>[A-Z0-9_]+)_T(?P<tile1>[0-9]{2})(?P<tile2>[A-Z])(?P<tile3>[A-Z]{2})_"
-                + r"(?P<id7>[A-Z0-9_]+)$"
-            )
-            id_match = id_regex.match(string)
-            if id_match:
-                id_dict = id_match.groupdict()
-                return (
-                    "https://roda.sentinel-hub.com/sentinel-s2-l2a/tiles/%s/%s/%s/%s/%s/%s/0/{collection}.json"
-                    % (
-                        id_dict["tile1"],
-                        id_dict["tile2"],
-                        id_dict["tile3"],
-                        id_dict["year"],
-                        int(id_dict["month"]),
-                        int(id_dict["day"]),
+                # default key got from metadata_path
+                found_key = found_jsonpath.path.fields[-1]
+                used_jsonpath = found_jsonpath.full_path
+            used_jsonpath_keys = get_jsonpath_keys(used_jsonpath)
+            if used_jsonpath_keys is not None:
+                used_jsonpath = used_jsonpath_keys
+            if (
+                self.discovery_pattern.match(found_key)
+                and found_key not in properties.keys()
+                and used_jsonpath not in used_jsonpaths
+            ):
+                if self.discovery_path_value is not None:
+                    found_value_path = self.discovery_path_value.find(
+                        found_jsonpath.value
                     )
-                )
-            else:
-                logger.error("Could not extract title infos from %s" % string)
-                return NOT_AVAILABLE
-
-        @staticmethod
-        def convert_split_id_into_s1_params(product_id):
-            parts = re.split(r"_(?!_)", product_id)
-            if len(parts) < 9:
-                logger.error(
-                    "id %s does not match expected Sentinel-1 id format", product_id
-                )
-                raise ValueError
-            params = {"sensorMode": parts[1]}
-            level = "LEVEL" + parts[3][0]
-            params["processingLevel"] = level
-            start_date = datetime.strptime(parts[4], "%Y%m%dT%H%M%S") - timedelta(
-                seconds=1
-            )
-            params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date = datetime.strptime(parts[5], "%Y%m%dT%H%M%S") + timedelta(
-                seconds=1
-            )
-            params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            product_type = parts[2][:3]
-            if product_type == "GRD" and parts[-1] == "COG":
-                product_type = "GRD-COG"
-            elif product_type == "GRD" and parts[-2] == "CARD" and parts[-1] == "BS":
-                product_type = "CARD-BS"
-            params["productType"] = product_type
-            polarisation_mapping = {
-                "SV": "VV",
-                "SH": "HH",
-                "DH": "HH+HV",
-                "DV": "VV+VH",
-            }
-            polarisation = polarisation_mapping[parts[3][2:]]
-            params["polarisation"] = polarisation
-            return params
-
-        @staticmethod
-        def convert_split_id_into_s3_params(product_id):
-            parts = re.split(r"_(?!_)", product_id)
-            params = {"productType": product_id[4:15]}
-            start_date = datetime.strptime(
-                product_id[16:31], "%Y%m%dT%H%M%S"
-            ) - timedelta(seconds=1)
-            params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date = datetime.strptime(
-                product_id[32:47], "%Y%m%dT%H%M%S"
-            ) + timedelta(seconds=1)
-            params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            params["timeliness"] = parts[-2]
-            params["sat"] = "Sentinel-" + parts[0][1:]
-            return params
-
-        @staticmethod
-        def convert_split_id_into_s5p_params(product_id):
-            parts = re.split(r"_(?!_)", product_id)
-            params = {
-                "productType": product_id[9:19],
-                "processingMode": parts[1],
-                "processingLevel": parts[2].replace("_", ""),
-            }
-            start_date = datetime.strptime(parts[-6], "%Y%m%dT%H%M%S") - timedelta(
-                seconds=10
-            )
-            params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date = datetime.strptime(parts[-5], "%Y%m%dT%H%M%S") + timedelta(
-                seconds=10
-            )
-            params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            return params
-
-        @staticmethod
-        def convert_split_cop_dem_id(product_id):
-            parts = product_id.split("_")
-            lattitude = parts[3]
-            longitude = parts[5]
-            if lattitude[0] == "N":
-                lat_num = int(lattitude[1:])
-            else:
-                lat_num = -1 * int(lattitude[1:])
-            if longitude[0] == "E":
-                long_num = int(longitude[1:])
-            else:
-                long_num = -1 * int(longitude[1:])
-            bbox = [long_num - 1, lat_num - 1, long_num + 1, lat_num + 1]
-            return bbox
-
-        # @staticmethod
-        # def convert_get_corine_product_type(start_date, end_date):
-        #     start_year = start_date[:4]
-        #     end_year = end_date[:4]
-        #     print(start_year, end_year)
-        #     years = [1990, 2000, 2006, 2012, 2018]
-        #     if start_year == end_year and int(start_year) in years:
-        #         product_type = "Corine Land Cover " + start_year
-        #     else:
-        #         max_interception = 0
-        #         sel_years = [1990, 2000]
-        #         for i, year in enumerate(years[:-1]):
-        #             if int(end_year) < years[i+1] and i == 0:
-        #                 sel_years = [year, years[i+1]]
-        #                 break
-        #             elif int(start_year) > years[i+1]:
-        #                 continue
-        #             else:
-        #                 interception = min(years[i+1], int(end_year)) - max(year, int(start_year))
-        #                 if interception > max_interception:
-        #                     max_interception = interception
-        #                     sel_years = [year, years[i+1]]
-        #         product_type = "Corine Land Change " + str(sel_years[0]) + " " + str(sel_years[1])
-        #
-        #     return product_type
+                    properties[found_key] = (
+                        found_value_path[0].value if found_value_path else NOT_AVAILABLE
+                    )
+                else:
+                    # default value got from metadata_path
+                    properties[found_key] = found_jsonpath.value
 
-    # if stac extension colon separator `:` is in search params, parse it to prevent issues with vformat
-    if re.search(r"{[a-zA-Z0-9_-]*:[a-zA-Z0-9_-]*}", search_param):
-        search_param = re.sub(
-            r"{([a-zA-Z0-9_-]*):([a-zA-Z0-9_-]*)}", r"{\1_COLON_\2}", search_param
-        )
-        kwargs = {k.replace(":", "_COLON_"): v for k, v in kwargs.items()}
-    # if re.search(r"\([a-zA-Z0-9_-]*:[a-zA-Z0-9_-]*", search_param):
-    #     search_param = search_param.replace(":", "_COLON_")
-    return MetadataFormatter().vformat(search_param, args, kwargs)
+                # properties as python objects when possible
+                if isinstance(properties[found_key], str):
+                    properties[found_key] = _literal_eval(properties[found_key])
 
 
 def properties_from_json(json, mapping, discovery_config=None):
     """Extract properties from a provider json result.
 
+    To extract the properties of many results using the same mapping, build a
+    :class:`~eodag.api.product.metadata_mapping.JsonMetadataExtractor` once instead.
+
     :param json: The representation of a provider result as a json object
     :type json: dict
     :param mapping: A mapping between :class:`~eodag.api.product._product.EOProduct`'s metadata
@@ -635,120 +981,213 @@ def properties_from_json(json, mapping, discovery_config=None):
     :returns: The metadata of the :class:`~eodag.api.product._product.EOProduct`
     :rtype: dict
     """
-    properties = {}
-    templates = {}
-    used_jsonpaths = []
-    for metadata, value in mapping.items():
-        # Treat the case when the value is from a queryable metadata
-        if isinstance(value, list):
-            conversion_or_none, path_or_text = value[1]
-        else:
-            conversion_or_none, path_or_text = value
-        if isinstance(path_or_text, str):
-            if re.search(r"({[^{}]+})+", path_or_text):
-                templates[metadata] = path_or_text
-            else:
-                properties[metadata] = path_or_text
-        else:
-            match = path_or_text.find(json)
-            if len(match) == 1:
-                extracted_value = match[0].value
-                used_jsonpaths.append(match[0].full_path)
+    return JsonMetadataExtractor(mapping, discovery_config=discovery_config)(json)
+
+
+class XmlMetadataExtractor:
+    """Extractor of the properties of provider xml results, built from a metadata
+    mapping.
+
+    The xpaths of the mapping are compiled once for each set of namespaces of the
+    results (usually the same for all the results of a provider), and the converters
+    are resolved to the :class:`~eodag.api.product.metadata_mapping.MetadataFormatter`
+    methods. The extracted properties are the same as the ones returned by
+    :func:`~eodag.api.product.metadata_mapping.properties_from_xml`.
+
+    :param mapping: A mapping between :class:`~eodag.api.product._product.EOProduct`'s
+                    metadata keys and the location of the values of these properties
+                    in the xml representation, expressed as a
+                    `xpath <https://www.w3schools.com/xml/xml_xpath.asp>`_
+    :type mapping: dict
+    :param empty_ns_prefix: (optional) The name to give to the default namespace of the
+                            results (see
+                            :func:`~eodag.api.product.metadata_mapping.properties_from_xml`)
+    :type empty_ns_prefix: str
+    :param discovery_config: (optional) metadata discovery configuration dict (see
+                             :func:`~eodag.api.product.metadata_mapping.properties_from_xml`)
+    :type discovery_config: dict
+    """
+
+    def __init__(self, mapping, empty_ns_prefix="ns", discovery_config=None):
+        self.empty_ns_prefix = empty_ns_prefix
+        # (metadata, xpath or text, conversion, converter)
+        self.fields = []
+        for metadata, value in mapping.items():
+            # Treat the case when the value is from a queryable metadata
+            if isinstance(value, list):
+                conversion_or_none, path_or_text = value[1]
             else:
-                extracted_value = NOT_AVAILABLE
-            if extracted_value is None:
-                properties[metadata] = None
+                conversion_or_none, path_or_text = value
+            if conversion_or_none is None:
+                conversion = converter = None
             else:
-                if conversion_or_none is None:
-                    properties[metadata] = extracted_value
-                else:
-                    # reformat conversion_or_none as metadata#converter(args) or metadata#converter
-                    if (
-                        len(conversion_or_none) > 1
-                        and isinstance(conversion_or_none, list)
-                        and conversion_or_none[1] is not None
-                    ):
-                        conversion_or_none = "%s(%s)" % (
-                            conversion_or_none[0],
-                            conversion_or_none[1],
-                        )
-                    elif isinstance(conversion_or_none, list):
-                        conversion_or_none = conversion_or_none[0]
+                conversion = _get_conversion(conversion_or_none)
+                converter = _get_converter(metadata, conversion)
+            self.fields.append((metadata, path_or_text, conversion, converter))
+
+        if not discovery_config:
+            discovery_config = {}
+        discovery_pattern = discovery_config.get("metadata_pattern", None)
+        discovery_path = discovery_config.get("metadata_path", None)
+        if discovery_pattern and discovery_path:
+            self.discovery_pattern = re.compile(discovery_pattern)
+            self.discovery_path = discovery_path
+        else:
+            self.discovery_pattern = self.discovery_path = None
 
-                    # check if conversion uses variables to format
-                    if re.search(r"({[^{}]+})+", conversion_or_none):
-                        conversion_or_none = conversion_or_none.format(**properties)
+        # absolute xpaths must be evaluated on a document made of the result only
+        self.absolute_paths = any(
+            ABSOLUTE_XPATH_REGEX.search(path)
+            for path in [f[1] for f in self.fields] + [self.discovery_path]
+            if isinstance(path, str)
+        )
+        # compiled xpaths, per namespaces
+        self._xpaths = {}
 
-                    properties[metadata] = format_metadata(
-                        "{%s%s%s}" % (metadata, SEP, conversion_or_none),
-                        **{metadata: extracted_value},
-                    )
-        # properties as python objects when possible (format_metadata returns only strings)
+    def _get_xpaths(self, namespaces):
+        """Get the xpaths of the mapping compiled with the given namespaces"""
+        namespaces_key = tuple(sorted(namespaces.items()))
         try:
-            properties[metadata] = ast.literal_eval(properties[metadata])
-        except Exception:
+            return self._xpaths[namespaces_key]
+        except KeyError:
             pass
-
-    # Resolve templates
-    for metadata, template in templates.items():
-        try:
-            properties[metadata] = template.format(**properties)
-        except ValueError:
-            logger.warning(
-                f"Could not parse {metadata} ({template}) using product properties"
-            )
-            logger.debug(f"available properties: {properties}")
-            properties[metadata] = NOT_AVAILABLE
-
-    # adds missing discovered properties
-    if not discovery_config:
-        discovery_config = {}
-
-    discovery_pattern = discovery_config.get("metadata_pattern", None)
-    discovery_path = discovery_config.get("metadata_path", None)
-    if discovery_pattern and discovery_path:
-        discovered_properties = string_to_jsonpath(discovery_path).find(json)
-        for found_jsonpath in discovered_properties:
-            if "metadata_path_id" in discovery_config.keys():
-                found_key_paths = string_to_jsonpath(
-                    discovery_config["metadata_path_id"], force=True
-                ).find(found_jsonpath.value)
-                if not found_key_paths:
-                    continue
-                found_key = found_key_paths[0].value
-                used_jsonpath = Child(
-                    found_jsonpath.full_path,
-                    string_to_jsonpath(
-                        discovery_config["metadata_path_value"], force=True
-                    ),
+        xpaths = []
+        for metadata, path_or_text, conversion, converter in self.fields:
+            try:
+                xpath = etree.XPath(path_or_text, namespaces=namespaces)
+            except XPathSyntaxError:
+                # not a xpath, see __call__
+                xpaths.append((None, None))
+                continue
+            try:
+                # path of the element whose tag is stored in the used xpaths
+                tag_xpath = etree.XPath(
+                    path_or_text.replace("/text()", ""), namespaces=namespaces
                 )
-            else:
-                # default key got from metadata_path
-                found_key = found_jsonpath.path.fields[-1]
-                used_jsonpath = found_jsonpath.full_path
-            if (
-                re.compile(discovery_pattern).match(found_key)
-                and found_key not in properties.keys()
-                and used_jsonpath not in used_jsonpaths
-            ):
-                if "metadata_path_value" in discovery_config.keys():
-                    found_value_path = string_to_jsonpath(
-                        discovery_config["metadata_path_value"], force=True
-                    ).find(found_jsonpath.value)
-                    properties[found_key] = (
-                        found_value_path[0].value if found_value_path else NOT_AVAILABLE
-                    )
-                else:
-                    # default value got from metadata_path
-                    properties[found_key] = found_jsonpath.value
+            except XPathSyntaxError:
+                tag_xpath = None
+            xpaths.append((xpath, tag_xpath))
+        discovery_xpath = (
+            etree.XPath(self.discovery_path, namespaces=namespaces)
+            if self.discovery_path is not None
+            else None
+        )
+        self._xpaths[namespaces_key] = xpaths, discovery_xpath
+        return xpaths, discovery_xpath
+
+    def __call__(self, xml):
+        """Extract the properties of a provider xml result
+
+        :param xml: The representation of a provider result as xml, or its element
+        :type xml: str or bytes or :class:`lxml.etree._Element`
+        :returns: The metadata of the :class:`~eodag.api.product._product.EOProduct`
+        :rtype: dict
+        """
+        if isinstance(xml, (str, bytes)):
+            root = etree.XML(xml)
+        elif self.absolute_paths and xml.getparent() is not None:
+            root = etree.XML(etree.tostring(xml))
+        else:
+            root = xml
+        xpaths, discovery_xpath = self._get_xpaths(
+            {k or self.empty_ns_prefix: v for k, v in root.nsmap.items()}
+        )
 
-                # properties as python objects when possible (format_metadata returns only strings)
+        properties = {}
+        templates = {}
+        used_xpaths = []
+        for (metadata, path_or_text, conversion, converter), (
+            xpath,
+            tag_xpath,
+        ) in zip(self.fields, xpaths):
+            if xpath is not None:
                 try:
-                    properties[found_key] = ast.literal_eval(properties[found_key])
-                except Exception:
+                    properties[metadata] = self._extract_value(
+                        root,
+                        metadata,
+                        xpath,
+                        tag_xpath,
+                        conversion,
+                        converter,
+                        properties,
+                        used_xpaths,
+                    )
+                    continue
+                except XPathEvalError:
                     pass
+            # Assume the mapping is to be passed as is, in which case we readily
+            # register it, or is a template, in which case we register it for later
+            # formatting resolution using previously successfully resolved properties
+            # Ignore any transformation specified. If a value is to be passed as is,
+            # we don't want to transform it further
+            if TEMPLATE_REGEX.search(path_or_text):
+                templates[metadata] = path_or_text
+            else:
+                properties[metadata] = path_or_text
+
+        # Resolve templates
+        for metadata, template in templates.items():
+            properties[metadata] = template.format(**properties)
 
-    return properties
+        # adds missing discovered properties
+        if discovery_xpath is not None:
+            for found_xpath in discovery_xpath(root):
+                found_key = found_xpath.tag.rpartition("}")[-1]
+                if (
+                    self.discovery_pattern.match(found_key)
+                    and found_key not in properties.keys()
+                    and found_xpath.tag not in used_xpaths
+                ):
+                    properties[found_key] = found_xpath.text
+
+        return properties
+
+    @staticmethod
+    def _extract_value(
+        root,
+        metadata,
+        xpath,
+        tag_xpath,
+        conversion,
+        converter,
+        properties,
+        used_xpaths,
+    ):
+        """Extract and convert the value of a metadata"""
+        extracted_value = xpath(root)
+        if len(extracted_value) <= 1:
+            if len(extracted_value) < 1:
+                # If there is no matched value (empty list), mark the metadata as not
+                # available
+                extracted_value = [NOT_AVAILABLE]
+            elif tag_xpath is not None:
+                # store element tag in used_xpaths
+                used_xpaths.append(getattr(tag_xpath(root)[0], "tag", None))
+            if conversion is None:
+                return extracted_value[0]
+            elif converter is not None:
+                return format(converter(extracted_value[0]), "")
+            return format_metadata(
+                "{%s%s%s}" % (metadata, SEP, conversion),
+                **{metadata: extracted_value[0]},
+            )
+
+        # If there are multiple matches, consider the result as a list, doing a
+        # formatting if any
+        if conversion is None:
+            return extracted_value
+        elif converter is not None:
+            return [format(converter(item), "") for item in extracted_value]
+        # check if conversion uses variables to format
+        if TEMPLATE_REGEX.search(conversion):
+            conversion = conversion.format(**properties)
+        return [
+            format_metadata(
+                "{%s%s%s}" % (metadata, SEP, conversion),
+                **{metadata: extracted_value_item},
+            )
+            for extracted_value_item in extracted_value
+        ]
 
 
 def properties_from_xml(
@@ -759,8 +1198,11 @@ def properties_from_xml(
 ):
     """Extract properties from a provider xml result.
 
-    :param xml_as_text: The representation of a provider result as xml
-    :type xml_as_text: str
+    To extract the properties of many results using the same mapping, build a
+    :class:`~eodag.api.product.metadata_mapping.XmlMetadataExtractor` once instead.
+
+    :param xml_as_text: The representation of a provider result as xml, or its element
+    :type xml_as_text: str or bytes or :class:`lxml.etree._Element`
     :param mapping: A mapping between :class:`~eodag.api.product._product.EOProduct`'s metadata
                     keys and the location of the values of these properties in the xml
                     representation, expressed as a
@@ -778,132 +1220,9 @@ def properties_from_xml(
     :returns: the metadata of the :class:`~eodag.api.product._product.EOProduct`
     :rtype: dict
     """
-    properties = {}
-    templates = {}
-    used_xpaths = []
-    root = etree.XML(xml_as_text)
-    for metadata, value in mapping.items():
-        # Treat the case when the value is from a queryable metadata
-        if isinstance(value, list):
-            conversion_or_none, path_or_text = value[1]
-        else:
-            conversion_or_none, path_or_text = value
-        try:
-            extracted_value = root.xpath(
-                path_or_text,
-                namespaces={k or empty_ns_prefix: v for k, v in root.nsmap.items()},
-            )
-            if len(extracted_value) <= 1:
-                if len(extracted_value) < 1:
-                    # If there is no matched value (empty list), mark the metadata as not
-                    # available
-                    extracted_value = [NOT_AVAILABLE]
-                else:
-                    # store element tag in used_xpaths
-                    used_xpaths.append(
-                        getattr(
-                            root.xpath(
-                                path_or_text.replace("/text()", ""),
-                                namespaces={
-                                    k or empty_ns_prefix: v
-                                    for k, v in root.nsmap.items()
-                                },
-                            )[0],
-                            "tag",
-                            None,
-                        )
-                    )
-                if conversion_or_none is None:
-                    properties[metadata] = extracted_value[0]
-                else:
-                    # reformat conversion_or_none as metadata#converter(args) or metadata#converter
-                    if (
-                        len(conversion_or_none) > 1
-                        and isinstance(conversion_or_none, list)
-                        and conversion_or_none[1] is not None
-                    ):
-                        conversion_or_none = "%s(%s)" % (
-                            conversion_or_none[0],
-                            conversion_or_none[1],
-                        )
-                    elif isinstance(conversion_or_none, list):
-                        conversion_or_none = conversion_or_none[0]
-                    properties[metadata] = format_metadata(
-                        "{%s%s%s}" % (metadata, SEP, conversion_or_none),
-                        **{metadata: extracted_value[0]},
-                    )
-
-            # If there are multiple matches, consider the result as a list, doing a
-            # formatting if any
-            else:
-                if conversion_or_none is None:
-                    properties[metadata] = extracted_value
-                else:
-                    # reformat conversion_or_none as metadata#converter(args) or metadata#converter
-                    if (
-                        len(conversion_or_none) > 1
-                        and isinstance(conversion_or_none, list)
-                        and conversion_or_none[1] is not None
-                    ):
-                        conversion_or_none = "%s(%s)" % (
-                            conversion_or_none[0],
-                            conversion_or_none[1],
-                        )
-                    elif isinstance(conversion_or_none, list):
-                        conversion_or_none = conversion_or_none[0]
-
-                    # check if conversion uses variables to format
-                    if re.search(r"({[^{}]+})+", conversion_or_none):
-                        conversion_or_none = conversion_or_none.format(**properties)
-
-                    properties[metadata] = [
-                        format_metadata(
-                            "{%s%s%s}"
-                            % (
-                                metadata,
-                                SEP,
-                                conversion_or_none,
-                            ),  # Re-build conversion format identifier
-                            **{metadata: extracted_value_item},
-                        )
-                        for extracted_value_item in extracted_value
-                    ]
-
-        except XPathEvalError:
-            # Assume the mapping is to be passed as is, in which case we readily
-            # register it, or is a template, in which case we register it for later
-            # formatting resolution using previously successfully resolved properties
-            # Ignore any transformation specified. If a value is to be passed as is,
-            # we don't want to transform it further
-            if re.search(r"({[^{}]+})+", path_or_text):
-                templates[metadata] = path_or_text
-            else:
-                properties[metadata] = path_or_text
-    # Resolve templates
-    for metadata, template in templates.items():
-        properties[metadata] = template.format(**properties)
-
-    # adds missing discovered properties
-    if not discovery_config:
-        discovery_config = {}
-    discovery_pattern = discovery_config.get("metadata_pattern", None)
-    discovery_path = discovery_config.get("metadata_path", None)
-    if discovery_pattern and discovery_path:
-        # discovered_properties = discovery_path.find(json)
-        discovered_properties = root.xpath(
-            discovery_path,
-            namespaces={k or empty_ns_prefix: v for k, v in root.nsmap.items()},
-        )
-        for found_xpath in discovered_properties:
-            found_key = found_xpath.tag.rpartition("}")[-1]
-            if (
-                re.compile(discovery_pattern).match(found_key)
-                and found_key not in properties.keys()
-                and found_xpath.tag not in used_xpaths
-            ):
-                properties[found_key] = found_xpath.text
-
-    return properties
+    return XmlMetadataExtractor(
+        mapping, empty_ns_prefix=empty_ns_prefix, discovery_config=discovery_config
+    )(xml_as_text)
 
 
 def mtd_cfg_as_conversion_and_querypath(src_dict, dest_dict={}, result_type="json"):
@@ -16,15 +16,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from collections import UserList
+from itertools import islice
 
-from shapely.geometry import GeometryCollection, shape
+import numpy
+import orjson
+import shapely
+from shapely.geometry import GeometryCollection, mapping, shape
 
-from eodag.api.product import EOProduct
+from eodag.api.product import CompactEOProduct, EOProduct
 from eodag.plugins.crunch.filter_date import FilterDate
+from eodag.plugins.crunch.filter_duplicates import FilterDuplicates
 from eodag.plugins.crunch.filter_latest_intersect import FilterLatestIntersect
 from eodag.plugins.crunch.filter_latest_tpl_name import FilterLatestByName
+from eodag.plugins.crunch.filter_minimal_cover import FilterMinimalCover
 from eodag.plugins.crunch.filter_overlap import FilterOverlap
 from eodag.plugins.crunch.filter_property import FilterProperty
+from eodag.utils import get_geometry_from_various
+
+#: Properties of the products not written with the other ones in their GeoJSON
+#: representation
+GEOJSON_RESERVED_PROPERTIES = frozenset(
+    [
+        "geometry",
+        "id",
+        "eodag_product_type",
+        "eodag_provider",
+        "eodag_search_intersection",
+    ]
+)
+
+GEOJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+#: Number of products filtered at once by a crunch pipeline
+DEFAULT_CRUNCH_CHUNK_SIZE = 1000
+
+
+def _to_geojson(geometries):
+    """Serialize geometries to GeoJSON at once, as :func:`shapely.geometry.mapping`
+    would do for the empty ones
+    """
+    geometries_array = numpy.empty(len(geometries), dtype=object)
+    geometries_array[:] = geometries
+    serialized = shapely.to_geojson(geometries_array)
+    for i in numpy.flatnonzero(shapely.is_empty(geometries_array)):
+        serialized[i] = orjson.dumps(mapping(geometries_array[i])).decode()
+    return serialized
 
 
 class SearchResult(UserList):
@@ -32,10 +68,16 @@ class SearchResult(UserList):
 
     :param products: A list of products resulting from a search
     :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+    :param errors: (optional) Errors that occurred on some providers while searching,
+                   as a list of ``(provider, exception)`` tuples
+    :type errors: list(tuple(str, Exception))
+    :ivar errors: Errors that occurred on some providers while searching
+    :vartype errors: list(tuple(str, Exception))
     """
 
-    def __init__(self, products):
+    def __init__(self, products, errors=None):
         super(SearchResult, self).__init__(products)
+        self.errors = errors if errors is not None else []
 
     def crunch(self, cruncher, **search_params):
         """Do some crunching with the underlying EO products.
@@ -50,6 +92,36 @@ class SearchResult(UserList):
         crunched_results = cruncher.proceed(self, **search_params)
         return SearchResult(crunched_results)
 
+    def crunch_pipeline(
+        self, crunchers, chunk_size=DEFAULT_CRUNCH_CHUNK_SIZE, **search_params
+    ):
+        """Crunch the EO products with several crunchers in a single pass.
+
+        The crunchers are applied lazily, when iterating over the returned
+        :class:`~eodag.api.search_result.CrunchPipeline`. The consecutive ones
+        filtering each product independently of the other ones are fused: the
+        products go through them by chunks, the cheapest first. Use
+        :meth:`CrunchPipeline.collect` to get the crunched products as a
+        :class:`~eodag.api.search_result.SearchResult`.
+
+        :param crunchers: The plugin instances to use to work on the products, in
+                          order
+        :type crunchers: list(subclass of :class:`~eodag.plugins.crunch.base.Crunch`)
+        :param chunk_size: (optional) The number of products filtered at once
+        :type chunk_size: int
+        :param search_params: The criteria that have been used to produce this result
+        :type search_params: dict
+        :returns: The lazily crunched products
+        :rtype: :class:`~eodag.api.search_result.CrunchPipeline`
+        """
+        return CrunchPipeline(
+            self.data,
+            crunchers,
+            chunk_size=chunk_size,
+            errors=self.errors,
+            **search_params
+        )
+
     def filter_date(self, start=None, end=None):
         """
         Apply :class:`~eodag.plugins.crunch.filter_date.FilterDate` crunch,
@@ -57,6 +129,20 @@ class SearchResult(UserList):
         """
         return self.crunch(FilterDate(dict(start=start, end=end)))
 
+    def filter_duplicates(self, preferred_providers=None, prefer_online=True):
+        """
+        Apply :class:`~eodag.plugins.crunch.filter_duplicates.FilterDuplicates` crunch,
+        check its documentation to know more.
+        """
+        return self.crunch(
+            FilterDuplicates(
+                dict(
+                    preferred_providers=preferred_providers,
+                    prefer_online=prefer_online,
+                )
+            )
+        )
+
     def filter_latest_intersect(self, geometry):
         """
         Apply :class:`~eodag.plugins.crunch.filter_latest_intersect.FilterLatestIntersect` crunch,
@@ -71,6 +157,30 @@ class SearchResult(UserList):
         """
         return self.crunch(FilterLatestByName(dict(name_pattern=name_pattern)))
 
+    def filter_minimal_cover(
+        self,
+        geometry,
+        minimum_coverage=100,
+        weight_by=None,
+        reference_date=None,
+        weight_factor=1,
+    ):
+        """
+        Apply :class:`~eodag.plugins.crunch.filter_minimal_cover.FilterMinimalCover` crunch,
+        check its documentation to know more.
+        """
+        return self.crunch(
+            FilterMinimalCover(
+                dict(
+                    minimum_coverage=minimum_coverage,
+                    weight_by=weight_by,
+                    reference_date=reference_date,
+                    weight_factor=weight_factor,
+                )
+            ),
+            geometry=geometry,
+        )
+
     def filter_overlap(
         self,
         geometry,
@@ -109,6 +219,45 @@ class SearchResult(UserList):
         """
         return self.filter_property(storageStatus="ONLINE")
 
+    def compact(self):
+        """Build a memory efficient version of this search result, made of
+        :class:`~eodag.api.product._compact.CompactEOProduct`. Intended to hold very
+        large result sets, its products are read-only and can be crunched and
+        serialized, but :meth:`expand` must be used to download them
+
+        :returns: The search result made of compact products
+        :rtype: :class:`~eodag.api.search_result.SearchResult`
+        """
+        return SearchResult(CompactEOProduct.from_products(self), errors=self.errors)
+
+    def expand(self):
+        """Build back the full :class:`~eodag.api.product._product.EOProduct` of a
+        search result made of compact products (see :meth:`compact`)
+
+        :returns: The search result made of full products
+        :rtype: :class:`~eodag.api.search_result.SearchResult`
+        """
+        return SearchResult(
+            [
+                product.to_eoproduct()
+                if isinstance(product, CompactEOProduct)
+                else product
+                for product in self
+            ],
+            errors=self.errors,
+        )
+
+    def to_columnar(self):
+        """Build a column-oriented version of this search result, to filter, sort and
+        analyse large result sets, or to export them to Arrow and GeoPandas
+
+        :returns: The columnar search result
+        :rtype: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        """
+        from eodag.api.columnar import ColumnarSearchResult
+
+        return ColumnarSearchResult.from_search_result(self)
+
     @staticmethod
     def from_geojson(feature_collection):
         """Builds an :class:`~eodag.api.search_result.SearchResult` object from its representation as geojson
@@ -130,6 +279,72 @@ class SearchResult(UserList):
             "features": [product.as_dict() for product in self],
         }
 
+    def geojson_features_bytes(self):
+        """GeoJSON representations of the products, serialized as bytes.
+
+        They are the same as the ones of
+        :meth:`~eodag.api.product._product.EOProduct.as_dict`, but are directly
+        written with orjson, the geometries being serialized at once by GEOS, without
+        building any intermediate dict.
+
+        :returns: The serialized GeoJSON features
+        :rtype: list(bytes)
+        """
+        geometries = _to_geojson([product.geometry for product in self])
+        intersections = _to_geojson([product.search_intersection for product in self])
+        features = []
+        for product, geometry, intersection in zip(self, geometries, intersections):
+            properties = product.properties
+            eodag_properties = {
+                "eodag_product_type": product.product_type,
+                "eodag_provider": product.provider,
+            }
+            # as in as_dict(), the product's properties win over the eodag ones
+            for key in eodag_properties:
+                if key in properties:
+                    eodag_properties[key] = properties[key]
+            if "eodag_search_intersection" in properties:
+                intersection = orjson.dumps(properties["eodag_search_intersection"])
+            elif intersection is None:
+                intersection = b"null"
+            else:
+                intersection = intersection.encode()
+            other_properties = orjson.dumps(
+                {
+                    key: value
+                    for key, value in properties.items()
+                    if key not in GEOJSON_RESERVED_PROPERTIES
+                },
+                option=GEOJSON_OPTIONS,
+            )
+            features.append(
+                b'{"type":"Feature","geometry":'
+                + geometry.encode()
+                + b',"id":'
+                + orjson.dumps(properties["id"], option=GEOJSON_OPTIONS)
+                + b',"properties":'
+                + orjson.dumps(eodag_properties, option=GEOJSON_OPTIONS)[:-1]
+                + b',"eodag_search_intersection":'
+                + intersection
+                + (b"," + other_properties[1:] if other_properties != b"{}" else b"}")
+                + b"}"
+            )
+        return features
+
+    def to_geojson_bytes(self):
+        """GeoJSON FeatureCollection representation of SearchResult, serialized as
+        bytes. Much faster than serializing :meth:`as_geojson_object`, see
+        :meth:`geojson_features_bytes`
+
+        :returns: The serialized FeatureCollection
+        :rtype: bytes
+        """
+        return (
+            b'{"type":"FeatureCollection","features":['
+            + b",".join(self.geojson_features_bytes())
+            + b"]}"
+        )
+
     def as_shapely_geometry_object(self):
         """:class:`shapely.geometry.GeometryCollection` representation of SearchResult"""
         return GeometryCollection(
@@ -150,3 +365,106 @@ class SearchResult(UserList):
         See https://gist.github.com/sgillies/2217756
         """
         return self.as_geojson_object()
+
+
+class CrunchPipeline(object):
+    """Products of a search crunched lazily by a sequence of crunchers, as built
+    by :meth:`~eodag.api.search_result.SearchResult.crunch_pipeline`.
+
+    The consecutive crunchers having a
+    :attr:`~eodag.plugins.crunch.base.Crunch.filter_cost` form a stage where the
+    products are filtered by chunks, so that the first ones are available before
+    the last ones are filtered. Within a stage, the cheapest filters are applied
+    first and the next ones only get the products still kept. The other crunchers
+    need all the products of the previous stage at once.
+
+    :param products: The products to crunch
+    :type products: iterable(:class:`~eodag.api.product._product.EOProduct`)
+    :param crunchers: The crunchers to apply, in order
+    :type crunchers: list(subclass of :class:`~eodag.plugins.crunch.base.Crunch`)
+    :param chunk_size: (optional) The number of products filtered at once
+    :type chunk_size: int
+    :param errors: (optional) Errors of the search, kept by the collected result
+    :type errors: list(tuple(str, Exception))
+    :param search_params: The criteria that have been used to produce the products
+    :type search_params: dict
+    """
+
+    def __init__(
+        self,
+        products,
+        crunchers,
+        chunk_size=DEFAULT_CRUNCH_CHUNK_SIZE,
+        errors=None,
+        **search_params
+    ):
+        self.products = products
+        self.crunchers = list(crunchers)
+        self.chunk_size = chunk_size
+        self.errors = errors if errors is not None else []
+        # the search geometry is parsed once, not for each chunk
+        if search_params.get("geometry") is not None:
+            search_params["geometry"] = get_geometry_from_various(
+                geometry=search_params["geometry"]
+            )
+        self.search_params = search_params
+
+    @property
+    def stages(self):
+        """The crunchers grouped in stages: lists of filters sorted by cost, or
+        single crunchers needing all the products
+
+        :rtype: list(list(subclass of :class:`~eodag.plugins.crunch.base.Crunch`))
+        """
+        stages = []
+        filters = []
+        for cruncher in self.crunchers:
+            if cruncher.filter_cost is not None:
+                filters.append(cruncher)
+                continue
+            if filters:
+                stages.append(sorted(filters, key=lambda f: f.filter_cost))
+                filters = []
+            stages.append([cruncher])
+        if filters:
+            stages.append(sorted(filters, key=lambda f: f.filter_cost))
+        return stages
+
+    def __iter__(self):
+        products = iter(self.products)
+        for stage in self.stages:
+            if stage[0].filter_cost is None:
+                products = self._crunch(products, stage[0])
+            else:
+                products = self._filter(products, stage)
+        return products
+
+    def _crunch(self, products, cruncher):
+        """Crunch all the products at once, when they are iterated over"""
+        yield from cruncher.proceed(list(products), **self.search_params)
+
+    def _filter(self, products, filters):
+        """Filter the products by chunks, each filter only getting the products
+        kept by the previous ones"""
+        while True:
+            chunk = list(islice(products, self.chunk_size))
+            if not chunk:
+                return
+            remaining = numpy.arange(len(chunk))
+            for crunch_filter in filters:
+                kept = crunch_filter.filter_products(
+                    [chunk[i] for i in remaining], **self.search_params
+                )
+                remaining = remaining[numpy.asarray(kept, dtype=bool)]
+                if not len(remaining):
+                    break
+            for i in remaining:
+                yield chunk[i]
+
+    def collect(self):
+        """Crunch all the products
+
+        :returns: The crunched products
+        :rtype: :class:`~eodag.api.search_result.SearchResult`
+        """
+        return SearchResult(list(self), errors=self.errors)
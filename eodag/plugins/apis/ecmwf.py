@@ -85,18 +85,14 @@ class EcmwfApi(Download, Api, BuildPostSearchResult):
         # start date
         if "startTimeFromAscendingNode" not in kwargs:
             kwargs["startTimeFromAscendingNode"] = (
-                getattr(self.config, "product_type_config", {}).get(
-                    "missionStartDate", None
-                )
+                self.product_type_config.get("missionStartDate", None)
                 or DEFAULT_MISSION_START_DATE
             )
         # end date
         if "completionTimeFromAscendingNode" not in kwargs:
-            kwargs["completionTimeFromAscendingNode"] = getattr(
-                self.config, "product_type_config", {}
-            ).get("missionEndDate", None) or datetime.utcnow().isoformat(
-                timespec="seconds"
-            )
+            kwargs["completionTimeFromAscendingNode"] = self.product_type_config.get(
+                "missionEndDate", None
+            ) or datetime.utcnow().isoformat(timespec="seconds")
         # geometry
         if not kwargs.get("geometry", None):
             kwargs["geometry"] = [
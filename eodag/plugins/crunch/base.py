@@ -16,15 +16,80 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
+import shapely
+
 from eodag.plugins.base import PluginTopic
 
 
 class Crunch(PluginTopic):
     """Base cruncher"""
 
+    #: Relative cost of :meth:`filter_products` for the crunchers keeping or not each
+    #: product independently of the other ones, used to run the cheapest ones first
+    #: in a :class:`~eodag.api.search_result.CrunchPipeline`. None for the crunchers
+    #: needing all the products at once
+    filter_cost = None
+
     def __init__(self, config):
         self.config = config if config is not None else {}
 
     def proceed(self, product_list, **search_params):
         """Implementation of how the results must be crunched"""
         raise NotImplementedError
+
+    def filter_products(self, products, **search_params):
+        """Tell which products are kept by the cruncher, for the crunchers having a
+        :attr:`filter_cost`
+
+        :param products: The products to filter
+        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+        :param search_params: Search criteria
+        :type search_params: dict
+        :returns: Whether each product is kept
+        :rtype: :class:`numpy.ndarray`
+        """
+        raise NotImplementedError
+
+    def proceed_columnar(self, results, **search_params):
+        """Crunch a column-oriented search result. Crunchers having a vectorized
+        implementation override it, the default one crunches the products built from
+        the columns
+
+        :param results: The columnar search result
+        :type results: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        :param search_params: Search criteria
+        :type search_params: dict
+        :returns: The positions of the kept products
+        :rtype: :class:`numpy.ndarray`
+        """
+        products = [results[i] for i in range(len(results))]
+        positions = {id(product): i for i, product in enumerate(products)}
+        kept = self.proceed(products, **search_params)
+        return numpy.array([positions[id(product)] for product in kept], dtype=int)
+
+    @staticmethod
+    def found_with_geometry(products, search_geom):
+        """Tell which products were found by a search using the given geometry,
+        their search intersection being their intersection with it
+
+        :param products: The products to check
+        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+        :param search_geom: The geometry used by the cruncher
+        :type search_geom: :class:`shapely.geometry.base.BaseGeometry`
+        :returns: Whether each product was found with this geometry
+        :rtype: list(bool)
+        """
+        # the products of a same search share their search geometry
+        same_geometry = {}
+        found_with = []
+        for product in products:
+            product_search_geom = product.search_kwargs.get("geometry")
+            key = id(product_search_geom)
+            if key not in same_geometry:
+                same_geometry[key] = product_search_geom is search_geom or (
+                    product_search_geom is not None
+                    and shapely.equals(product_search_geom, search_geom)
+                )
+            found_with.append(same_geometry[key])
+        return found_with
@@ -17,10 +17,12 @@
 # limitations under the License.
 
 import datetime
+import functools
 import logging
 import time
 
 import dateutil.parser
+import numpy
 from dateutil import tz
 
 from eodag.plugins.crunch.base import Crunch
@@ -39,6 +41,8 @@ class FilterDate(Crunch):
     :type config: dict
     """
 
+    filter_cost = 2
+
     @staticmethod
     def sort_product_by_start_date(product):
         """Get product start date"""
@@ -49,6 +53,41 @@ class FilterDate(Crunch):
             start_date = datetime.datetime(*epoch).isoformat()
         return dateutil.parser.parse(start_date)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_date(date_str):
+        """Parse an iso date, as UTC if it has no timezone. The parsed dates are
+        cached, the same ones being parsed again by the successive crunches"""
+        if not date_str:
+            return None
+        try:
+            # much faster than dateutil for the usual iso dates of the providers
+            date = datetime.datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        except ValueError:
+            date = dateutil.parser.parse(date_str)
+        if not date.tzinfo:
+            date = date.replace(tzinfo=tz.UTC)
+        return date
+
+    def _get_filter_dates(self):
+        """Get the start and end dates to filter on from the configuration"""
+        return (
+            self._parse_date(self.config.get("start", None)),
+            self._parse_date(self.config.get("end", None)),
+        )
+
+    def _timestamps_column(self, column, length):
+        """Parse a column of iso dates as timestamps, each distinct date only once,
+        missing ones being NaN
+        """
+        if column is None:
+            return numpy.full(length, numpy.nan)
+        timestamps = {}
+        for date_str in set(column.tolist()):
+            date = self._parse_date(date_str)
+            timestamps[date_str] = numpy.nan if date is None else date.timestamp()
+        return numpy.array([timestamps[date_str] for date_str in column.tolist()])
+
     def proceed(self, products, **search_params):
         """Execute crunch: Filter products between start and end dates.
 
@@ -61,59 +100,75 @@ class FilterDate(Crunch):
         if not products:
             return []
 
-        # filter start date
-        filter_start_str = self.config.get("start", None)
-        if filter_start_str:
-            filter_start = dateutil.parser.parse(filter_start_str)
-            if not filter_start.tzinfo:
-                filter_start = filter_start.replace(tzinfo=tz.UTC)
-        else:
-            filter_start = None
-
-        # filter end date
-        filter_end_str = self.config.get("end", None)
-        if filter_end_str:
-            filter_end = dateutil.parser.parse(filter_end_str)
-            if not filter_end.tzinfo:
-                filter_end = filter_end.replace(tzinfo=tz.UTC)
-        else:
-            filter_end = None
-
+        filter_start, filter_end = self._get_filter_dates()
         if not filter_start and not filter_end:
             return products
 
-        filtered = []
-        for product in products:
+        kept = self.filter_products(products)
+        filtered = [product for product, keep in zip(products, kept) if keep]
+        logger.info("Finished filtering products. %s resulting products", len(filtered))
+        return filtered
+
+    def filter_products(self, products, **search_params):
+        """Tell which products are between start and end dates
+
+        :param products: The products to filter
+        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+        :returns: Whether each product is kept
+        :rtype: :class:`numpy.ndarray`
+        """
+        kept = numpy.ones(len(products), dtype=bool)
+        filter_start, filter_end = self._get_filter_dates()
+        if not filter_start and not filter_end:
+            return kept
+
+        for i, product in enumerate(products):
 
             # product start date
-            product_start_str = product.properties.get(
-                "startTimeFromAscendingNode", None
+            product_start = self._parse_date(
+                product.properties.get("startTimeFromAscendingNode", None)
             )
-            if product_start_str:
-                product_start = dateutil.parser.parse(product_start_str)
-                if not product_start.tzinfo:
-                    product_start = product_start.replace(tzinfo=tz.UTC)
-            else:
-                product_start = None
 
             # product end date
-            product_end_str = product.properties.get(
-                "completionTimeFromAscendingNode", None
+            product_end = self._parse_date(
+                product.properties.get("completionTimeFromAscendingNode", None)
             )
-            if product_end_str:
-                product_end = dateutil.parser.parse(product_end_str)
-                if not product_end.tzinfo:
-                    product_end = product_end.replace(tzinfo=tz.UTC)
-            else:
-                product_end = None
 
             if filter_start and product_start and product_start < filter_start:
-                continue
-            if filter_end and product_end and product_end > filter_end:
-                continue
-            if filter_end and product_start and product_start > filter_end:
-                continue
-
-            filtered.append(product)
-        logger.info("Finished filtering products. %s resulting products", len(filtered))
-        return filtered
+                kept[i] = False
+            elif filter_end and product_end and product_end > filter_end:
+                kept[i] = False
+            elif filter_end and product_start and product_start > filter_end:
+                kept[i] = False
+        return kept
+
+    def proceed_columnar(self, results, **search_params):
+        """Execute crunch on a columnar search result, comparing the whole dates
+        columns at once
+
+        :param results: The columnar search result
+        :type results: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        :returns: The positions of the products between start and end dates
+        :rtype: :class:`numpy.ndarray`
+        """
+        logger.debug("Start filtering by date")
+        filter_start, filter_end = self._get_filter_dates()
+        if not filter_start and not filter_end:
+            return numpy.arange(len(results))
+
+        product_starts = self._timestamps_column(
+            results.columns.get("startTimeFromAscendingNode", None), len(results)
+        )
+        product_ends = self._timestamps_column(
+            results.columns.get("completionTimeFromAscendingNode", None), len(results)
+        )
+        # comparisons with missing dates (NaN) are false and do not filter products
+        excluded = numpy.zeros(len(results), dtype=bool)
+        if filter_start:
+            excluded |= product_starts < filter_start.timestamp()
+        if filter_end:
+            excluded |= product_ends > filter_end.timestamp()
+            excluded |= product_starts > filter_end.timestamp()
+        kept = numpy.flatnonzero(~excluded)
+        logger.info("Finished filtering products. %s resulting products", len(kept))
+        return kept
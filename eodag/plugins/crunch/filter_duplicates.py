@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import itertools
+import logging
+import math
+import re
+
+from eodag.plugins.crunch.base import Crunch
+from eodag.plugins.crunch.filter_date import FilterDate
+
+logger = logging.getLogger("eodag.plugins.crunch.filter_duplicates")
+
+
+class FilterDuplicates(Crunch):
+    """FilterDuplicates cruncher
+
+    Keep a single copy of the products found several times, e.g. on several
+    providers using different ids and titles for the same acquisition.
+
+    Two products are the same if they have the same title stem (their upper-cased
+    title without file extensions like ``.SAFE`` or ``.zip``), or the same platform
+    and product type, and acquisition times and footprints (the bounds of their
+    geometry) close to each other. Close acquisitions are looked up in a hash map of
+    grid cells twice as large as the allowed differences, the products sharing a key
+    or close to another one being grouped with it. In each group, the kept product
+    is the first one online if `prefer_online` is set, then the first one of the most
+    preferred provider.
+
+    :param config: Crunch configuration, may contain :
+
+                   - `preferred_providers` : (optional) providers from the most to
+                     the least preferred. The other ones come after them
+                   - `prefer_online` : prefer the products having an ``ONLINE``
+                     `storageStatus` over the preferred providers. Defaults to True
+                   - `time_precision` : maximum difference in seconds between the
+                     acquisition times of two same products. Defaults to 1
+                   - `footprint_precision` : number of decimals to which the
+                     footprint bounds of two same products are equal, i.e. their
+                     maximum difference is ``10 ** -footprint_precision``. Defaults
+                     to 1
+
+    :type config: dict
+    """
+
+    EXTENSIONS_PATTERN = re.compile(
+        r"(\.(SAFE|SEN3|ZIP|TAR|GZ|TGZ|NC|TIFF?|JP2|H5|HDF|JSON|XML))+$"
+    )
+    SENTINEL_PATTERN = re.compile(r"^SENTINEL(\d)")
+    SEPARATORS_PATTERN = re.compile(r"[\s_-]")
+
+    def _title_key(self, product):
+        """Get the title stem of a product, None if it has no title"""
+        title = product.properties.get("title", None)
+        if not title:
+            return None
+        return self.EXTENSIONS_PATTERN.sub("", str(title).strip().upper())
+
+    def _platform_key(self, platform):
+        """Normalize a platform name: "Sentinel-2A" and "S2A" are the same platform"""
+        platform = self.SEPARATORS_PATTERN.sub("", str(platform).upper())
+        return self.SENTINEL_PATTERN.sub(r"S\1", platform)
+
+    def _acquisition(self, product, platforms):
+        """Get the platform and product type, acquisition timestamp and footprint
+        bounds of a product, None if one of them is missing"""
+        platform = product.properties.get("platformSerialIdentifier", None)
+        start_date = FilterDate._parse_date(
+            product.properties.get("startTimeFromAscendingNode", None)
+        )
+        if not platform or start_date is None:
+            return None
+        if product.geometry is None or product.geometry.is_empty:
+            return None
+        if platform not in platforms:
+            platforms[platform] = self._platform_key(platform)
+        # the levels of a same acquisition are different products
+        product_type = product.product_type or product.properties.get(
+            "processingLevel", None
+        )
+        return (
+            (platforms[platform], product_type),
+            start_date.timestamp(),
+            product.geometry.bounds,
+        )
+
+    @staticmethod
+    def _cells(value, tolerance):
+        """Get the cell of a value in a grid of cells twice as large as the tolerance,
+        and the neighbouring cell where values within the tolerance may also be"""
+        position = value / (2 * tolerance)
+        cell = math.floor(position)
+        return cell, cell - 1 if position - cell < 0.5 else cell + 1
+
+    def _preference(self, product, providers_ranks):
+        """Get the sort key of a product among its duplicates, the lowest being kept"""
+        online_rank = 0
+        if self.config.get("prefer_online", True):
+            online_rank = int(product.properties.get("storageStatus", None) != "ONLINE")
+        return online_rank, providers_ranks.get(product.provider, len(providers_ranks))
+
+    def proceed(self, products, **search_params):
+        """Execute crunch: Keep a single copy of the duplicated products
+
+        :param products: A list of products resulting from a search
+        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+        :returns: The products without duplicates, in their initial order
+        :rtype: list(:class:`~eodag.api.product._product.EOProduct`)
+        """
+        logger.debug("Start filtering duplicated products")
+        providers_ranks = {}
+        for provider in self.config.get("preferred_providers", None) or []:
+            providers_ranks.setdefault(provider, len(providers_ranks))
+
+        time_tolerance = float(self.config.get("time_precision", 1))
+        footprint_tolerance = 10.0 ** -int(self.config.get("footprint_precision", 1))
+        # normalized names of the platforms
+        platforms = {}
+
+        # union-find of the products sharing an identity key
+        parents = list(range(len(products)))
+
+        def find(i):
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        first_with_title = {}
+        # acquisitions per platform, product type, time and footprint lower left cell
+        acquisitions = {}
+        for i, product in enumerate(products):
+            title = self._title_key(product)
+            if title is not None:
+                first = first_with_title.setdefault(title, i)
+                if first != i:
+                    parents[find(i)] = find(first)
+
+            acquisition = self._acquisition(product, platforms)
+            if acquisition is None:
+                continue
+            key, timestamp, bounds = acquisition
+            cells = (
+                self._cells(timestamp, time_tolerance),
+                self._cells(bounds[0], footprint_tolerance),
+                self._cells(bounds[1], footprint_tolerance),
+            )
+            for cell in itertools.product(*cells):
+                for j, other_timestamp, other_bounds in acquisitions.get(
+                    (key, cell), ()
+                ):
+                    if abs(timestamp - other_timestamp) <= time_tolerance and all(
+                        abs(coordinate - other_coordinate) <= footprint_tolerance
+                        for coordinate, other_coordinate in zip(bounds, other_bounds)
+                    ):
+                        parents[find(i)] = find(j)
+            own_cell = tuple(cell for cell, _ in cells)
+            acquisitions.setdefault((key, own_cell), []).append((i, timestamp, bounds))
+
+        kept = {}
+        preferences = {}
+        for i, product in enumerate(products):
+            group = find(i)
+            preference = self._preference(product, providers_ranks)
+            if group not in kept or preference < preferences[group]:
+                kept[group] = i
+                preferences[group] = preference
+
+        filtered = [products[i] for i in sorted(kept.values())]
+        logger.info(
+            "Finished filtering products. %s duplicates removed, %s resulting products",
+            len(products) - len(filtered),
+            len(filtered),
+        )
+        return filtered
@@ -21,17 +21,99 @@ import logging
 import time
 
 import dateutil.parser
+import numpy
+import shapely
 from shapely import geometry
 
 from eodag.plugins.crunch.base import Crunch
+from eodag.utils import get_prepared_geometry
 
 logger = logging.getLogger("eodag.plugins.crunch.filter_latest_intersect")
 
+#: Default number of products whose geometries are merged at once
+DEFAULT_UNION_WINDOW = 32
+
+
+def first_covering_index(
+    search_extent, geometries, tolerance=0.0, window=DEFAULT_UNION_WINDOW
+):
+    """Get the position of the geometry completing the coverage of the search
+    extent, the geometries being added in the given order.
+
+    Geometries not intersecting the search extent are skipped using an STRtree. The
+    other ones are merged with ``unary_union`` by windows growing twice as large
+    until they cover the search extent, the geometry completing the coverage being
+    then found by bisection in the last window. This avoids removing the geometries
+    one by one from an uncovered extent getting more and more complex.
+
+    >>> from shapely.geometry import box
+    >>> first_covering_index(box(0, 0, 2, 1), [box(0, 0, 1, 1), box(5, 5, 6, 6),
+    ...     box(1, 0, 2, 1), box(0, 0, 2, 1)])
+    2
+
+    :param search_extent: The extent to cover
+    :type search_extent: :class:`shapely.geometry.base.BaseGeometry`
+    :param geometries: The geometries covering the extent, in the order they are added
+    :type geometries: list(:class:`shapely.geometry.base.BaseGeometry`)
+    :param tolerance: (optional) The uncovered part of the search extent area under
+                      which it is considered covered, between 0 and 1
+    :type tolerance: float
+    :param window: (optional) The number of geometries merged in the first window
+    :type window: int
+    :returns: The position of the geometry completing the coverage, None if the
+              geometries do not cover the search extent
+    :rtype: int
+    """
+    # the tolerance is only relevant for search extents having an area
+    uncovered_area_limit = search_extent.area * tolerance if tolerance > 0 else 0
+
+    def covers(union):
+        uncovered = search_extent.difference(union)
+        return uncovered.is_empty or uncovered.area < uncovered_area_limit
+
+    if not len(geometries):
+        return None
+    if covers(shapely.Polygon()):
+        return 0
+    geometries = numpy.asarray(geometries, dtype=object)
+    tree = shapely.STRtree(geometries)
+    positions = numpy.sort(tree.query(search_extent, predicate="intersects"))
+    candidates = geometries[positions]
+
+    # union of the first `covered_count` candidates, not covering the extent
+    union, covered_count = shapely.Polygon(), 0
+    count = min(window, len(candidates))
+    while True:
+        window_union = shapely.union_all([union, *candidates[covered_count:count]])
+        if covers(window_union):
+            break
+        if count == len(candidates):
+            return None
+        union, covered_count = window_union, count
+        count = min(2 * count, len(candidates))
+    # bisection between the candidates not covering the extent and the ones covering
+    # it
+    while count - covered_count > 1:
+        middle = (covered_count + count) // 2
+        middle_union = shapely.union_all([union, *candidates[covered_count:middle]])
+        if covers(middle_union):
+            count = middle
+        else:
+            union, covered_count = middle_union, middle
+    return int(positions[count - 1])
+
 
 class FilterLatestIntersect(Crunch):
     """FilterLatestIntersect cruncher
 
     Filter latest products (the ones with a the highest start date) that intersect search extent
+
+    :param config: Crunch configuration, may contain :
+
+                   - `coverage_tolerance` : the uncovered part of the search extent
+                     area under which it is considered covered, between 0 and 1.
+                     Defaults to 0
+    :type config: dict
     """
 
     @staticmethod
@@ -48,6 +130,9 @@ class FilterLatestIntersect(Crunch):
         """Execute crunch:
         Filter latest products (the ones with a the highest start date) that intersect search extent.
 
+        The products are taken from the latest one until the search extent is
+        covered, see :func:`first_covering_index`.
+
         :param products: A list of products resulting from a search
         :type products: list(:class:`~eodag.api.product._product.EOProduct`)
         :param search_params: Search criteria that must contain `geometry` (dict)
@@ -61,8 +146,6 @@ class FilterLatestIntersect(Crunch):
             return []
         # Warning: May crash if startTimeFromAscendingNode is not in the appropriate format
         products.sort(key=self.sort_product_by_start_date, reverse=True)
-        filtered = []
-        add_to_filtered = filtered.append
         footprint = search_params.get("geometry") or search_params.get("geom")
         if not footprint:
             logger.warning(
@@ -84,19 +167,32 @@ class FilterLatestIntersect(Crunch):
         else:
             search_extent = footprint
         logger.debug("Initial requested extent area: %s", search_extent.area)
-        for product in products:
-            logger.debug("Uncovered extent area: %s", search_extent.area)
-            if product.search_intersection:
-                logger.debug(
-                    "Product %r intersects the requested extent. Adding it to the final result",
-                    product,
-                )
-                add_to_filtered(product)
-            search_extent = search_extent.difference(product.geometry)
-            if search_extent.is_empty:
-                logger.debug(
-                    "The requested extent is now entirely covered by the search result"
-                )
-                break
+
+        geometries = [product.geometry for product in products]
+        covering_index = first_covering_index(
+            search_extent,
+            geometries,
+            tolerance=float(self.config.get("coverage_tolerance", 0)),
+        )
+        if covering_index is not None:
+            logger.debug(
+                "The requested extent is now entirely covered by the search result"
+            )
+            products = products[: covering_index + 1]
+            geometries = geometries[: covering_index + 1]
+
+        # the search intersection of the products found with the search extent is
+        # not empty if they intersect it
+        search_extent = get_prepared_geometry(search_extent)
+        intersects = shapely.intersects(search_extent, geometries)
+        filtered = [
+            product
+            for product, found_with, intersect in zip(
+                products,
+                self.found_with_geometry(products, search_extent),
+                intersects,
+            )
+            if (intersect if found_with else product.search_intersection)
+        ]
         logger.info("Finished filtering products. %s resulting products", len(filtered))
         return filtered
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright 2018, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import numpy
+import shapely
+
+from eodag.plugins.crunch.base import Crunch
+from eodag.plugins.crunch.filter_date import FilterDate
+from eodag.utils import get_geometry_from_various
+
+logger = logging.getLogger("eodag.plugins.crunch.filter_minimal_cover")
+
+
+class FilterMinimalCover(Crunch):
+    """FilterMinimalCover cruncher
+
+    Select the smallest set of products covering the search extent, e.g. to download
+    as few products as possible to build a mosaic.
+
+    Products are selected greedily, each time taking the one covering the largest
+    area of the extent not yet covered relatively to its cost. The cost of a product
+    is ``1 + weight_factor * weight``, its weight being its ``weight_by`` value
+    divided by the largest one among the products, so that all the products cost 1
+    if no ``weight_by`` is set. When a product is selected, only the products
+    intersecting the newly covered area, found with an STRtree, have their
+    uncovered area updated.
+
+    :param config: Crunch configuration, may contain :
+
+                   - `minimum_coverage` : the percentage of the search extent area
+                     to cover. Defaults to 100
+                   - `weight_by` : the weight of the products, `cloudCover`, `date`
+                     for the time between their start date and `reference_date`, or
+                     any numeric property. Products without this property get the
+                     highest weight
+                   - `reference_date` : (optional) iso date to which products dates
+                     are compared, defaults to the latest start date of the products
+                   - `weight_factor` : how much the weight counts compared to the
+                     covered area. Defaults to 1
+
+    :type config: dict
+    """
+
+    def _get_weights(self, products):
+        """Get the weights of the products, between 0 and 1"""
+        weight_by = self.config.get("weight_by", None)
+        if not weight_by:
+            return numpy.zeros(len(products))
+        if weight_by == "date":
+            timestamps = numpy.array(
+                [self._start_timestamp(product) for product in products]
+            )
+            reference_date = FilterDate._parse_date(
+                self.config.get("reference_date", None)
+            )
+            if reference_date is not None:
+                reference = reference_date.timestamp()
+            elif numpy.isnan(timestamps).all():
+                reference = numpy.nan
+            else:
+                reference = numpy.nanmax(timestamps)
+            values = numpy.abs(timestamps - reference)
+        else:
+            values = numpy.array(
+                [
+                    self._to_float(product.properties.get(weight_by, None))
+                    for product in products
+                ]
+            )
+        known = ~numpy.isnan(values)
+        weights = numpy.ones(len(products))
+        if known.any():
+            highest = numpy.abs(values[known]).max()
+            if highest > 0:
+                weights[known] = values[known] / highest
+            else:
+                weights[known] = 0
+        # negative values do not lower the cost under 1
+        return numpy.clip(weights, 0, 1)
+
+    @staticmethod
+    def _start_timestamp(product):
+        start_date = FilterDate._parse_date(
+            product.properties.get("startTimeFromAscendingNode", None)
+        )
+        return numpy.nan if start_date is None else start_date.timestamp()
+
+    @staticmethod
+    def _to_float(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return numpy.nan
+
+    def proceed(self, products, **search_params):
+        """Execute crunch: select the products covering the search extent at the
+        lowest cost, in the order they are selected
+
+        :param products: A list of products resulting from a search
+        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+        :param search_params: Search criteria that must contain `geometry`
+        :type search_params: dict
+        :returns: The selected products
+        :rtype: list(:class:`~eodag.api.product._product.EOProduct`)
+        """
+        logger.debug("Start selecting the products covering the search extent")
+        search_geom = get_geometry_from_various(**search_params)
+        if not search_geom:
+            logger.warning(
+                "geometry not found in cruncher arguments, filtering disabled."
+            )
+            return products
+        if not products:
+            return []
+        search_area = search_geom.area
+        if search_area == 0:
+            logger.debug(
+                "No product can cover a requested extent that is not a polygon (i.e with area=0)"
+            )
+            return []
+        target_area = (
+            search_area * float(self.config.get("minimum_coverage", 100)) / 100
+        )
+        costs = 1 + float(self.config.get("weight_factor", 1)) * self._get_weights(
+            products
+        )
+
+        geometries = numpy.asarray([product.geometry for product in products])
+        invalid = ~shapely.is_valid(geometries)
+        if invalid.any():
+            geometries[invalid] = shapely.make_valid(geometries[invalid])
+        tree = shapely.STRtree(geometries)
+        # uncovered area of the search extent covered by each product
+        gains = numpy.zeros(len(products))
+        candidates = tree.query(search_geom, predicate="intersects")
+        gains[candidates] = shapely.area(
+            shapely.intersection(geometries[candidates], search_geom)
+        )
+
+        covered_area = 0.0
+        selected = []
+        # stop when the target is reached, with a margin for the rounding errors
+        while covered_area < target_area * (1 - 1e-9):
+            best = int(numpy.argmax(gains / costs))
+            if gains[best] <= search_area * 1e-12:
+                logger.debug("The products do not cover the requested extent")
+                break
+            # the area newly covered is computed locally, from the selected products
+            # intersecting this one, instead of keeping the whole uncovered extent
+            selected_geometries = geometries[selected]
+            overlapping = selected_geometries[
+                shapely.intersects(geometries[best], selected_geometries)
+            ]
+            newly_covered = shapely.difference(
+                shapely.intersection(geometries[best], search_geom),
+                shapely.union_all(overlapping),
+            )
+            covered_area += shapely.area(newly_covered)
+            selected.append(best)
+            # only the products intersecting the newly covered area lose some of
+            # their gain
+            affected = tree.query(newly_covered, predicate="intersects")
+            gains[affected] -= shapely.area(
+                shapely.intersection(geometries[affected], newly_covered)
+            )
+            gains[best] = 0
+            numpy.maximum(gains, 0, out=gains)
+            logger.debug(
+                "Product %r selected, %.2f%% of the requested extent covered",
+                products[best],
+                covered_area / search_area * 100,
+            )
+
+        filtered = [products[i] for i in selected]
+        logger.info("Finished filtering products. %s resulting products", len(filtered))
+        return filtered
@@ -18,8 +18,11 @@
 
 import logging
 
+import numpy
+import shapely
+
 from eodag.plugins.crunch.base import Crunch
-from eodag.utils import get_geometry_from_various
+from eodag.utils import get_geometry_from_various, get_prepared_geometry
 
 try:
     from shapely.errors import GEOSException
@@ -31,6 +34,21 @@ except ImportError:
 logger = logging.getLogger("eodag.plugins.crunch.filter_overlap")
 
 
+def _intersection_areas(search_geom, geometries):
+    """Areas of the intersections of the geometries with the search one, NaN where
+    it could not be computed"""
+    try:
+        return shapely.area(shapely.intersection(geometries, search_geom))
+    except GEOSException:
+        areas = numpy.full(len(geometries), numpy.nan)
+        for i, product_geometry in enumerate(geometries):
+            try:
+                areas[i] = search_geom.intersection(product_geometry).area
+            except GEOSException:
+                pass
+        return areas
+
+
 class FilterOverlap(Crunch):
     """FilterOverlap cruncher
 
@@ -47,6 +65,8 @@ class FilterOverlap(Crunch):
     :type config: dict
     """
 
+    filter_cost = 3
+
     def proceed(self, products, **search_params):
         """Execute crunch: Filter products, retaining only those that are overlapping with the search_extent
 
@@ -57,16 +77,84 @@ class FilterOverlap(Crunch):
         :returns: The filtered products
         :rtype: list(:class:`~eodag.api.product._product.EOProduct`)
         """
-        logger.debug("Start filtering for overlapping products")
-        filtered = []
-        add_to_filtered = filtered.append
+        kept = self.filter_products(products, **search_params)
+        filtered = [product for product, keep in zip(products, kept) if keep]
+        logger.info("Finished filtering products. %s resulting products", len(filtered))
+        return filtered
+
+    def filter_products(self, products, **search_params):
+        """Tell which products are overlapping with the search_extent
+
+        :param products: The products to filter
+        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+        :param search_params: Search criteria that must contain `geometry`
+        :type search_params: dict
+        :returns: Whether each product is kept
+        :rtype: :class:`numpy.ndarray`
+        """
+        search_geom = get_geometry_from_various(**search_params)
+        if not search_geom:
+            logger.warning(
+                "geometry not found in cruncher arguments, filtering disabled."
+            )
+            return numpy.ones(len(products), dtype=bool)
+
+        # the intersection of the products found by a search using another geometry
+        # than the cruncher one (or none) is the one computed for this search
+        own_intersections = [
+            None if found_with else product.search_intersection
+            for product, found_with in zip(
+                products, self.found_with_geometry(products, search_geom)
+            )
+        ]
 
+        kept = self._overlapping(
+            search_geom, [product.geometry for product in products], own_intersections
+        )
+        if kept is None:
+            return numpy.ones(len(products), dtype=bool)
+        return kept
+
+    def proceed_columnar(self, results, **search_params):
+        """Execute crunch on a columnar search result, testing all the geometries at
+        once
+
+        :param results: The columnar search result
+        :type results: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        :param search_params: Search criteria that must contain `geometry`
+        :type search_params: dict
+        :returns: The positions of the products overlapping the search extent
+        :rtype: :class:`numpy.ndarray`
+        """
         search_geom = get_geometry_from_various(**search_params)
         if not search_geom:
             logger.warning(
                 "geometry not found in cruncher arguments, filtering disabled."
             )
-            return products
+            return numpy.arange(len(results))
+        # as for products without search geometry, their intersection is their
+        # whole geometry
+        kept = self._overlapping(search_geom, results.geometries, results.geometries)
+        if kept is None:
+            return numpy.arange(len(results))
+        kept = numpy.flatnonzero(kept)
+        logger.info("Finished filtering products. %s resulting products", len(kept))
+        return kept
+
+    def _overlapping(self, search_geom, geometries, own_intersections):
+        """Test which geometries overlap the search one, all at once.
+
+        :param search_geom: The search geometry
+        :type search_geom: :class:`shapely.geometry.base.BaseGeometry`
+        :param geometries: The products geometries
+        :type geometries: list(:class:`shapely.geometry.base.BaseGeometry`)
+        :param own_intersections: The intersections already computed by the searches
+                                  of the products, None to compute them
+        :type own_intersections: list(:class:`shapely.geometry.base.BaseGeometry`)
+        :returns: Which products are kept, None if the filtering is disabled
+        :rtype: :class:`numpy.ndarray`
+        """
+        logger.debug("Start filtering for overlapping products")
         minimum_overlap = float(self.config.get("minimum_overlap", "0"))
         contains = self.config.get("contains", False)
         intersects = self.config.get("intersects", False)
@@ -76,7 +164,7 @@ class FilterOverlap(Crunch):
             logger.warning(
                 "contains, intersects and within parameters are mutually exclusive"
             )
-            return products
+            return None
         elif (
             minimum_overlap > 0
             and minimum_overlap < 100
@@ -88,80 +176,62 @@ class FilterOverlap(Crunch):
         elif not contains and not within and not intersects:
             logger.debug("Minimum overlap is: {} %".format(minimum_overlap))
 
-        logger.debug("Initial requested extent area: %s", search_geom.area)
-        if search_geom.area == 0:
+        search_area = search_geom.area
+        logger.debug("Initial requested extent area: %s", search_area)
+        if search_area == 0:
             logger.debug(
                 "No product can overlap a requested extent that is not a polygon (i.e with area=0)"
             )
-        else:
-            for product in products:
-                logger.debug("Uncovered extent area: %s", search_geom.area)
-                if product.search_intersection:
-                    intersection = product.search_intersection
-                    product_geometry = product.geometry
-                else:  # Product geometry may be invalid
-                    if not product.geometry.is_valid:
-                        logger.debug(
-                            "Trying our best to deal with invalid geometry on product: %r",
-                            product,
-                        )
-                        product_geometry = product.geometry.buffer(0)
-                        try:
-                            intersection = search_geom.intersection(product_geometry)
-                        except GEOSException:
-                            logger.debug(
-                                "Product geometry still invalid. Overlap test restricted to containment"
-                            )
-                            if search_geom.contains(product_geometry):
-                                logger.debug(
-                                    "Product %r overlaps the search extent. Adding it to filtered results"
-                                )
-                                add_to_filtered(product)
-                            continue
-                    else:
-                        product_geometry = product.geometry
-                        intersection = search_geom.intersection(product_geometry)
-
-                if (
-                    (contains and product_geometry.contains(search_geom))
-                    or (within and product_geometry.within(search_geom))
-                    or (intersects and product_geometry.intersects(search_geom))
-                ):
-                    add_to_filtered(product)
-                    continue
-                elif contains or within or intersects:
-                    continue
-
-                ipos = (intersection.area / search_geom.area) * 100
-                ipop = (intersection.area / product_geometry.area) * 100
-                logger.debug(
-                    "Intersection of product extent and search extent covers %f percent of the search extent "
-                    "area",
-                    ipos,
-                )
-                logger.debug(
-                    "Intersection of product extent and search extent covers %f percent of the product extent "
-                    "area",
-                    ipop,
-                )
-                if any(
-                    (
-                        search_geom.contains(product.geometry),
-                        ipos >= minimum_overlap,
-                        ipop >= minimum_overlap,
-                    )
-                ):
-                    logger.debug(
-                        "Product %r overlaps the search extent by the specified constraint. Adding it to "
-                        "filtered results",
-                        product,
-                    )
-                    add_to_filtered(product)
-                else:
-                    logger.debug(
-                        "Product %r does not overlaps the search extent by the specified constraint. "
-                        "Skipping it",
-                        product,
-                    )
-        logger.info("Finished filtering products. %s resulting products", len(filtered))
-        return filtered
+            return numpy.zeros(len(geometries), dtype=bool)
+
+        geometries = numpy.asarray(geometries, dtype=object)
+        own_intersections = numpy.asarray(own_intersections, dtype=object)
+        # the products keep their geometry when an intersection was already
+        # computed, the invalid ones are repaired otherwise
+        has_own_intersection = ~shapely.is_missing(own_intersections)
+        has_own_intersection[has_own_intersection] = ~shapely.is_empty(
+            own_intersections[has_own_intersection]
+        )
+        product_geometries = geometries.copy()
+        invalid = ~has_own_intersection & ~shapely.is_valid(geometries)
+        if invalid.any():
+            logger.debug(
+                "Trying our best to deal with %s invalid geometries", invalid.sum()
+            )
+            product_geometries[invalid] = shapely.make_valid(geometries[invalid])
+
+        search_geom = get_prepared_geometry(search_geom)
+        if contains:
+            return shapely.within(search_geom, product_geometries)
+        if within:
+            return shapely.contains(search_geom, product_geometries)
+        if intersects:
+            return shapely.intersects(search_geom, product_geometries)
+
+        areas = numpy.zeros(len(geometries))
+        areas[has_own_intersection] = shapely.area(
+            own_intersections[has_own_intersection]
+        )
+        product_areas = shapely.area(product_geometries)
+        # only the intersections with the geometries partly covered by the search
+        # extent are computed, the other ones being empty or the geometries
+        to_intersect = ~has_own_intersection & shapely.intersects(
+            search_geom, product_geometries
+        )
+        covered = to_intersect.copy()
+        covered[to_intersect] = shapely.covers(
+            search_geom, product_geometries[to_intersect]
+        )
+        areas[covered] = product_areas[covered]
+        to_intersect &= ~covered
+        areas[to_intersect] = _intersection_areas(
+            search_geom, product_geometries[to_intersect]
+        )
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            ipos = areas / search_area * 100
+            ipop = areas / product_areas * 100
+        # products whose intersection could not be computed are only kept if they
+        # are contained in the search extent
+        kept = (ipos >= minimum_overlap) | (ipop >= minimum_overlap)
+        kept[~kept] = shapely.contains(search_geom, geometries[~kept])
+        return kept
@@ -19,6 +19,8 @@
 import logging
 import operator
 
+import numpy
+
 from eodag.plugins.crunch.base import Crunch
 
 logger = logging.getLogger("eodag.plugins.crunch.filter_property")
@@ -27,7 +29,10 @@ logger = logging.getLogger("eodag.plugins.crunch.filter_property")
 class FilterProperty(Crunch):
     """FilterProperty cruncher
 
-    Filter products, retaining only those whose property match criteria
+    Filter products, retaining only those whose property match criteria. The filtering
+    is disabled if one of the products does not have the property: this cruncher
+    needs all the products at once in a
+    :meth:`~eodag.api.search_result.SearchResult.crunch_pipeline`.
 
     :param config: Crunch configuration, should contain :
 
@@ -37,15 +42,15 @@ class FilterProperty(Crunch):
     :type config: dict
     """
 
-    def proceed(self, products, **search_params):
-        """Execute crunch: Filter products, retaining only those that match property filtering
+    def _get_filter(self):
+        """Get the operator method, the property key and the value to filter on from
+        the configuration
 
-        :param products: A list of products resulting from a search
-        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
-        :returns: The filtered products
-        :rtype: list(:class:`~eodag.api.product._product.EOProduct`)
+        :returns: The operator method, property key and value, or None if the
+                  configuration is invalid
+        :rtype: tuple
         """
-        operator_name = self.config.pop("operator", "eq")
+        operator_name = self.config.get("operator", "eq")
         try:
             operator_method = getattr(operator, operator_name)
         except AttributeError:
@@ -53,18 +58,36 @@ class FilterProperty(Crunch):
                 "Unknown operator `%s`, should be one of `lt,le,eq,ne,ge,gt`",
                 operator_name,
             )
-            return products
+            return None
 
-        if len(self.config.keys()) != 1:
+        # the configuration is only read, the filter being got at each crunch
+        properties = [key for key in self.config if key != "operator"]
+        if len(properties) != 1:
             logger.warning("One property is needed for filtering, filtering disabled.")
-            return products
+            return None
 
-        property_key = next(iter(self.config))
+        property_key = properties[0]
         property_value = self.config.get(property_key, None)
 
+        return operator_method, property_key, property_value
+
+    def proceed(self, products, **search_params):
+        """Execute crunch: Filter products, retaining only those that match property filtering.
+        They are all kept if one of them does not have the property
+
+        :param products: A list of products resulting from a search
+        :type products: list(:class:`~eodag.api.product._product.EOProduct`)
+        :returns: The filtered products
+        :rtype: list(:class:`~eodag.api.product._product.EOProduct`)
+        """
+        crunch_filter = self._get_filter()
+        if crunch_filter is None:
+            return products
+        operator_method, property_key, property_value = crunch_filter
+
         logger.debug(
             "Start filtering for products matching operator.%s(product.properties['%s'], %s)",
-            operator_name,
+            operator_method.__name__,
             property_key,
             property_value,
         )
@@ -72,7 +95,7 @@ class FilterProperty(Crunch):
         add_to_filtered = filtered.append
 
         for product in products:
-            if property_key not in product.properties.keys():
+            if property_key not in product.properties:
                 logger.warning(
                     "%s not found in product.properties, filtering disabled.",
                     property_key,
@@ -83,3 +106,31 @@ class FilterProperty(Crunch):
 
         logger.info("Finished filtering products. %s resulting products", len(filtered))
         return filtered
+
+    def proceed_columnar(self, results, **search_params):
+        """Execute crunch on a columnar search result, comparing the whole property
+        column at once
+
+        :param results: The columnar search result
+        :type results: :class:`~eodag.api.columnar.ColumnarSearchResult`
+        :returns: The positions of the products matching property filtering
+        :rtype: :class:`numpy.ndarray`
+        """
+        crunch_filter = self._get_filter()
+        if crunch_filter is None:
+            return numpy.arange(len(results))
+        operator_method, property_key, property_value = crunch_filter
+
+        column = results.columns.get(property_key, None)
+        # missing values are None in the columns
+        if column is None or (column.dtype == object and None in column):
+            logger.warning(
+                "%s not found in product.properties, filtering disabled.",
+                property_key,
+            )
+            return numpy.arange(len(results))
+        kept = numpy.flatnonzero(
+            numpy.asarray(operator_method(column, property_value), dtype=bool)
+        )
+        logger.info("Finished filtering products. %s resulting products", len(kept))
+        return kept
@@ -286,13 +286,10 @@ class HTTPDownload(Download):
                     ):
                         root_node = etree.fromstring(response.content)
                         namespaces = {k or "ns": v for k, v in root_node.nsmap.items()}
-                        results = [
-                            etree.tostring(entry)
-                            for entry in root_node.xpath(
-                                self.config.order_status_on_success["results_entry"],
-                                namespaces=namespaces,
-                            )
-                        ]
+                        results = root_node.xpath(
+                            self.config.order_status_on_success["results_entry"],
+                            namespaces=namespaces,
+                        )
                         if isinstance(results, list) and len(results) != 1:
                             raise DownloadError(
                                 "Could not get a single result after order success for "
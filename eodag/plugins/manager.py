@@ -97,6 +97,8 @@ class PluginManager(object):
 
         self.build_product_type_to_provider_config_map()
         self._built_plugins_cache = {}
+        # search responses cache shared by the search plugins
+        self.search_cache = None
 
     def build_product_type_to_provider_config_map(self):
         """Build mapping conf between product types and providers"""
@@ -124,6 +126,11 @@ class PluginManager(object):
                 product_type_providers.append(provider_config)
                 product_type_providers.sort(key=attrgetter("priority"), reverse=True)
 
+        # product types configurations may have been updated
+        for plugin in getattr(self, "_built_plugins_cache", {}).values():
+            if isinstance(plugin, Search):
+                plugin.reset_metadata_mapping_cache()
+
     def get_search_plugins(self, product_type=None, provider=None):
         """Build and return all the search plugins supporting the given product type,
         ordered by highest priority, or the search plugin of the given provider
@@ -145,6 +152,7 @@ class PluginManager(object):
                 config.search.products = config.products
                 config.search.priority = config.priority
                 plugin = self._build_plugin(config.name, config.search, Search)
+                plugin.search_cache = self.search_cache
             except AttributeError:
                 config.api.products = config.products
                 config.api.priority = config.priority
@@ -15,24 +15,87 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
+from contextlib import contextmanager
 
 from eodag.api.product.metadata_mapping import (
     DEFAULT_METADATA_MAPPING,
+    JsonMetadataExtractor,
     mtd_cfg_as_conversion_and_querypath,
 )
 from eodag.plugins.base import PluginTopic
 
 
+class SearchContext:
+    """State of a search performed by a search plugin.
+
+    Search plugins are built once per provider and shared between all the searches
+    sent to this provider. The state of a search (query parameters, search urls,
+    pagination, ...) is kept in a search context instead, one per thread, so that a
+    plugin can be used by several searches at the same time.
+    """
+
+    def __init__(self):
+        self.search_urls = []
+        self.query_params = {}
+        self.query_string = ""
+        self.next_page_url = None
+        self.next_page_query_obj = None
+        self.next_page_merge = None
+        # pagination configuration updated by the search, e.g. with the next page
+        # url returned by the provider
+        self.pagination = {}
+        # metadata of the searched product type
+        self.product_type_config = None
+        # send the requests even if their responses are cached, and cache the new ones
+        self.refresh_cache = False
+
+
+def _search_context_attribute(name):
+    """Search plugin attribute stored in the search context of the current thread"""
+
+    def getter(self):
+        return getattr(self.search_context, name)
+
+    def setter(self, value):
+        setattr(self.search_context, name, value)
+
+    def deleter(self):
+        delattr(self.search_context, name)
+
+    return property(getter, setter, deleter, doc=f"Search context {name}")
+
+
 class Search(PluginTopic):
     """Base Search Plugin.
 
+    The state of the search being performed is stored in a
+    :class:`~eodag.plugins.search.base.SearchContext`, specific to each thread.
+
     :param provider: An eodag providers configuration dictionary
     :type provider: dict
     :param config: Path to the user configuration file
     :type config: str
     """
 
+    search_urls = _search_context_attribute("search_urls")
+    query_params = _search_context_attribute("query_params")
+    query_string = _search_context_attribute("query_string")
+    next_page_url = _search_context_attribute("next_page_url")
+    next_page_query_obj = _search_context_attribute("next_page_query_obj")
+    next_page_merge = _search_context_attribute("next_page_merge")
+    total_items_nb = _search_context_attribute("total_items_nb")
+    need_count = _search_context_attribute("need_count")
+    product_type_def_params = _search_context_attribute("product_type_def_params")
+
     def __init__(self, provider, config):
+        # keep the running searches contexts if the plugin is initialized again
+        if "_search_contexts" not in self.__dict__:
+            self._search_contexts = threading.local()
+        # metadata mappings updated with the product types specific ones, and the
+        # properties extractors built from them
+        self._product_type_metadata_mappings = {}
+        self._product_type_metadata_extractors = {}
         super(Search, self).__init__(provider, config)
         # Prepare the metadata mapping
         # Do a shallow copy, the structure is flat enough for this to be sufficient
@@ -46,9 +109,132 @@ class Search(PluginTopic):
             result_type=getattr(self.config, "result_type", "json"),
         )
 
+    @property
+    def search_context(self):
+        """The context of the search performed by the current thread"""
+        context = getattr(self._search_contexts, "context", None)
+        if context is None:
+            context = self._search_contexts.context = SearchContext()
+        return context
+
+    @search_context.setter
+    def search_context(self, context):
+        self._search_contexts.context = context
+
+    @contextmanager
+    def use_search_context(self, context):
+        """Use the given search context in the current thread until exiting the
+        ``with`` block.
+
+        This allows to keep the state of a search between several calls, e.g. when
+        iterating over its pages, while the plugin is used by other searches in the
+        meantime.
+
+        :param context: The search context to use
+        :type context: :class:`~eodag.plugins.search.base.SearchContext`
+        """
+        previous_context = getattr(self._search_contexts, "context", None)
+        self._search_contexts.context = context
+        try:
+            yield context
+        finally:
+            self._search_contexts.context = previous_context
+
+    @property
+    def pagination(self):
+        """The pagination configuration of the current search: the plugin one,
+        updated with the search specific values like the next page url template"""
+        return dict(
+            getattr(self.config, "pagination", {}), **self.search_context.pagination
+        )
+
+    @property
+    def product_type_config(self):
+        """The metadata of the product type searched by the current search, or the
+        ones of the plugin configuration"""
+        product_type_config = self.search_context.product_type_config
+        if product_type_config is None:
+            product_type_config = getattr(self.config, "product_type_config", {})
+        return product_type_config
+
+    @property
+    def metadata_mapping(self):
+        """The metadata mapping of the current search, that may have been updated
+        using the searched product type configuration, or the plugin one"""
+        return getattr(self.search_context, "metadata_mapping", None) or (
+            self.config.metadata_mapping
+        )
+
+    @metadata_mapping.setter
+    def metadata_mapping(self, metadata_mapping):
+        self.search_context.metadata_mapping = metadata_mapping
+        # not the cached mapping of a product type anymore
+        self.search_context.metadata_mapping_product_type = None
+
+    def use_product_type_metadata_mapping(self, product_type, metadata_mapping):
+        """Use the metadata mapping built for the given product type by the current
+        search, so that the properties extractors built from it can be reused by the
+        next searches of this product type.
+
+        :param product_type: The searched product type
+        :type product_type: str
+        :param metadata_mapping: The metadata mapping of the product type
+        :type metadata_mapping: dict
+        """
+        self.metadata_mapping = metadata_mapping
+        if product_type in self._product_type_metadata_mappings:
+            self.search_context.metadata_mapping_product_type = product_type
+
+    def get_metadata_extractor(
+        self, extractor_class=JsonMetadataExtractor, discovery_config=None
+    ):
+        """Get the extractor of the properties of the current search results, built
+        from its metadata mapping. The extractors of the mappings cached per product
+        type are built once and reused by the next searches of the same product type.
+
+        :param extractor_class: (optional) The class of the extractor
+        :type extractor_class: :class:`~eodag.api.product.metadata_mapping.JsonMetadataExtractor`
+                               or :class:`~eodag.api.product.metadata_mapping.XmlMetadataExtractor`
+        :param discovery_config: (optional) metadata discovery configuration dict
+        :type discovery_config: dict
+        :returns: The properties extractor
+        :rtype: :class:`~eodag.api.product.metadata_mapping.JsonMetadataExtractor`
+                or :class:`~eodag.api.product.metadata_mapping.XmlMetadataExtractor`
+        """
+        product_type = getattr(
+            self.search_context, "metadata_mapping_product_type", None
+        )
+        if product_type is None:
+            return extractor_class(
+                self.metadata_mapping, discovery_config=discovery_config
+            )
+        key = (product_type, extractor_class, bool(discovery_config))
+        extractor = self._product_type_metadata_extractors.get(key, None)
+        if extractor is None:
+            extractor = extractor_class(
+                dict(self.metadata_mapping), discovery_config=discovery_config
+            )
+            self._product_type_metadata_extractors[key] = extractor
+        return extractor
+
+    def reset_metadata_mapping_cache(self):
+        """Reset the metadata mappings built per product type, and their properties
+        extractors. Must be called when the plugin or product types configurations
+        have been updated."""
+        self._product_type_metadata_mappings = {}
+        self._product_type_metadata_extractors = {}
+
     def clear(self):
         """Method used to clear a search context between two searches."""
-        pass
+        self.search_context = SearchContext()
+
+    def __copy__(self):
+        """Copy of the plugin sharing its configuration, but with its own search
+        contexts, so that it can be used to search concurrently with this plugin"""
+        plugin = self.__class__.__new__(self.__class__)
+        plugin.__dict__.update(self.__dict__)
+        plugin._search_contexts = threading.local()
+        return plugin
 
     def query(self, *args, count=True, **kwargs):
         """Implementation of how the products must be searched goes here.
@@ -75,7 +75,7 @@ class BuildPostSearchResult(PostJsonSearch):
     def do_search(self, *args, **kwargs):
         """Perform the actual search request, and return result in a single element."""
         search_url = self.search_urls[0]
-        response = self._request(
+        response = self._cached_request(
             search_url,
             info_message=f"Sending search request: {search_url}",
             exception_message=f"Skipping error while searching for {self.provider} "
@@ -98,13 +98,13 @@ class BuildPostSearchResult(PostJsonSearch):
         result = results[0]
 
         # update result with query parameters without pagination (or search-only params)
-        if isinstance(self.config.pagination["next_page_query_obj"], str) and hasattr(
+        if isinstance(self.pagination["next_page_query_obj"], str) and hasattr(
             self, "query_params_unpaginated"
         ):
             unpaginated_query_params = self.query_params_unpaginated
-        elif isinstance(self.config.pagination["next_page_query_obj"], str):
+        elif isinstance(self.pagination["next_page_query_obj"], str):
             next_page_query_obj = orjson.loads(
-                self.config.pagination["next_page_query_obj"].format()
+                self.pagination["next_page_query_obj"].format()
             )
             unpaginated_query_params = {
                 k: v
@@ -122,7 +122,7 @@ class BuildPostSearchResult(PostJsonSearch):
         # parse porperties
         parsed_properties = properties_from_json(
             result,
-            self.config.metadata_mapping,
+            self.metadata_mapping,
             discovery_config=getattr(self.config, "discover_metadata", {}),
         )
 
@@ -160,7 +160,7 @@ class BuildPostSearchResult(PostJsonSearch):
         product_available_properties["downloadLink"] += f"?{qs}"
 
         # parse metadata needing downloadLink
-        for param, mapping in self.config.metadata_mapping.items():
+        for param, mapping in self.metadata_mapping.items():
             if Fields("downloadLink") in mapping:
                 product_available_properties.update(
                     properties_from_json(product_available_properties, {param: mapping})
@@ -168,7 +168,7 @@ class BuildPostSearchResult(PostJsonSearch):
 
         # use product_type_config as default properties
         product_available_properties = dict(
-            getattr(self.config, "product_type_config", {}),
+            self.product_type_config,
             **product_available_properties,
         )
 
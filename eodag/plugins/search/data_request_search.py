@@ -5,9 +5,9 @@ import requests
 
 from eodag import EOProduct
 from eodag.api.product.metadata_mapping import (
+    JsonMetadataExtractor,
     format_query_params,
     mtd_cfg_as_conversion_and_querypath,
-    properties_from_json,
 )
 from eodag.plugins.search.base import Search
 from eodag.utils import GENERIC_PRODUCT_TYPE, string_to_jsonpath
@@ -29,7 +29,6 @@ class DataRequestSearch(Search):
         self.config.__dict__.setdefault("results_entry", "content")
         self.config.__dict__.setdefault("pagination", {})
         self.config.__dict__.setdefault("free_text_search_operations", {})
-        self.next_page_url = None
         for product_type in self.config.products.keys():
             if "metadata_mapping" in self.config.products[product_type].keys():
                 self.config.products[product_type][
@@ -53,11 +52,6 @@ class DataRequestSearch(Search):
         """
         return {}
 
-    def clear(self):
-        """Clear search context"""
-        super().clear()
-        self.next_page_url = None
-
     def query(self, *args, count=True, **kwargs):
         """
         performs the search for a provider where several steps are required to fetch the data
@@ -159,21 +153,15 @@ class DataRequestSearch(Search):
             "Adapting %s plugin results to eodag product representation"
             % normalize_remaining_count
         )
+        extract_properties = JsonMetadataExtractor(
+            self.metadata_mapping,
+            discovery_config=getattr(self.config, "discover_metadata", {}),
+        )
         products = []
         for result in results:
-            product = EOProduct(
-                self.provider,
-                properties_from_json(
-                    result,
-                    self.config.metadata_mapping,
-                    discovery_config=getattr(self.config, "discover_metadata", {}),
-                ),
-                **kwargs,
-            )
+            product = EOProduct(self.provider, extract_properties(result), **kwargs)
             # use product_type_config as default properties
-            product.properties = dict(
-                getattr(self.config, "product_type_config", {}), **product.properties
-            )
+            product.properties = dict(self.product_type_config, **product.properties)
             products.append(product)
         total_items_nb_key_path = string_to_jsonpath(
             self.config.pagination["total_items_nb_key_path"]
@@ -222,11 +210,7 @@ class DataRequestSearch(Search):
         )
 
     def _add_product_type_metadata(self, product_type):
-        if (
-            product_type in self.config.products
-            and "metadata_mapping" in self.config.products[product_type]
-        ):
-            for key, mapping in self.config.products[product_type][
-                "metadata_mapping"
-            ].items():
-                self.config.metadata_mapping[key] = mapping
+        self.metadata_mapping = dict(
+            self.config.metadata_mapping,
+            **self.config.products.get(product_type, {}).get("metadata_mapping", {}),
+        )
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import sys
+import threading
+
+from eodag.api.local_catalog import LocalCatalog
+from eodag.plugins.search.base import Search
+from eodag.utils import GENERIC_PRODUCT_TYPE
+
+logger = logging.getLogger("eodag.plugins.search.local_catalog")
+
+
+class LocalCatalogSearch(Search):
+    """Local catalog search plugin
+
+    The available configuration parameters for this plugin are
+    (to be set in provider configuration):
+
+        - **api_endpoint**: (mandatory) path to the SQLite database of the
+          :class:`~eodag.api.local_catalog.LocalCatalog`, created if needed
+
+        - **pagination**: (optional) The pagination configuration. Its
+          ``max_items_per_page`` is not limited by default, so that
+          :meth:`~eodag.api.core.EODataAccessGateway.search_all` gets all the
+          products at once
+
+    Unlike :class:`~eodag.plugins.search.static_stac_search.StaticStacSearch`, the
+    products are not all loaded to be filtered by crunchers: the search is done by
+    the catalog, using its spatial and temporal indexes. The products returned keep
+    the provider they were found on, and are downloaded using it.
+
+    Example of provider configuration, to be loaded with
+    :meth:`~eodag.api.core.EODataAccessGateway.update_providers_config`::
+
+        local:
+            search:
+                type: LocalCatalogSearch
+                api_endpoint: /path/to/catalog.db
+            products:
+                GENERIC_PRODUCT_TYPE:
+                    productType: '{productType}'
+
+    :param provider: An eodag providers configuration dictionary
+    :type provider: dict
+    :param config: Path to the user configuration file
+    :type config: str
+    """
+
+    #: Search parameters used by eodag, not to be matched with products properties
+    internal_parameters = (
+        "auth",
+        "raise_errors",
+        "locations",
+        "geom",
+        "search_tiles",
+    )
+
+    def __init__(self, provider, config):
+        config.__dict__.setdefault("metadata_mapping", {})
+        config.__dict__.setdefault("pagination", {})
+        config.pagination.setdefault("max_items_per_page", sys.maxsize)
+        super(LocalCatalogSearch, self).__init__(provider, config)
+        # the catalog is opened on first search
+        self._catalog = None
+        self._catalog_lock = threading.Lock()
+
+    @property
+    def catalog(self):
+        """The local catalog searched"""
+        with self._catalog_lock:
+            if self._catalog is None or self._catalog.path != self.config.api_endpoint:
+                self._catalog = LocalCatalog(self.config.api_endpoint)
+        return self._catalog
+
+    def discover_product_types(self):
+        """Fetch product types is disabled for `LocalCatalogSearch`
+
+        :returns: empty dict
+        :rtype: dict
+        """
+        return {}
+
+    def query(self, items_per_page=None, page=None, count=True, **kwargs):
+        """Perform a search on the local catalog"""
+        search_kwargs = dict(kwargs)
+        product_type = kwargs.pop("productType", None)
+        if product_type == GENERIC_PRODUCT_TYPE:
+            product_type = None
+        geometry = kwargs.pop("geometry", None)
+        start = kwargs.pop("startTimeFromAscendingNode", None)
+        end = kwargs.pop("completionTimeFromAscendingNode", None)
+        cloud_cover = kwargs.pop("cloudCover", None)
+        product_id = kwargs.pop("id", None)
+        properties = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in self.internal_parameters and value is not None
+        }
+        for key in ("auth", "raise_errors"):
+            search_kwargs.pop(key, None)
+
+        return self.catalog.search(
+            product_type=product_type,
+            geometry=geometry,
+            start=start,
+            end=end,
+            cloud_cover=cloud_cover,
+            id=product_id,
+            properties=properties,
+            items_per_page=items_per_page,
+            page=page or 1,
+            count=count,
+            search_kwargs=search_kwargs,
+        )
@@ -16,11 +16,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import logging
+import multiprocessing
 import re
+import threading
+from functools import partial
 from urllib.error import URLError
 from urllib.request import Request, urlopen
 
+import concurrent.futures
 import orjson
 import requests
 from lxml import etree
@@ -28,6 +33,8 @@ from lxml import etree
 from eodag.api.product import EOProduct
 from eodag.api.product.metadata_mapping import (
     NOT_AVAILABLE,
+    JsonMetadataExtractor,
+    XmlMetadataExtractor,
     format_query_params,
     mtd_cfg_as_conversion_and_querypath,
     properties_from_json,
@@ -38,18 +45,56 @@ from eodag.utils import (
     GENERIC_PRODUCT_TYPE,
     USER_AGENT,
     _deprecated,
+    cached_xpath,
     dict_items_recursive_apply,
     format_dict_items,
+    parse_geometries,
     quote,
     string_to_jsonpath,
     update_nested_dict,
     urlencode,
 )
+from eodag.utils.cache import search_cache_key
 from eodag.utils.exceptions import AuthenticationError, MisconfiguredError, RequestError
 from eodag.utils.stac_reader import HTTP_REQ_TIMEOUT
 
 logger = logging.getLogger("eodag.plugins.search.qssearch")
 
+#: Default number of results whose properties are extracted by the same process
+DEFAULT_NORMALIZE_CHUNK_SIZE = 250
+
+
+#: Pools of processes extracting results properties, per number of workers
+_properties_executors = {}
+_properties_executors_lock = threading.Lock()
+
+
+def _extract_properties_chunk(extract_properties, results):
+    """Extract the properties of a chunk of results, in the current process"""
+    return [extract_properties(result) for result in results]
+
+
+def _get_properties_executor(workers):
+    """Get the pool of processes extracting results properties, shared by all the
+    searches. Its processes are spawned and not forked, searches being run in threads
+    whose locks a forked process could inherit in a locked state."""
+    with _properties_executors_lock:
+        executor = _properties_executors.get(workers, None)
+        if executor is None:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _properties_executors[workers] = executor
+        return executor
+
+
+def _drop_properties_executor(workers, executor):
+    """Forget a broken pool of processes extracting results properties"""
+    with _properties_executors_lock:
+        if _properties_executors.get(workers, None) is executor:
+            del _properties_executors[workers]
+    executor.shutdown(wait=False)
+
 
 class QueryStringSearch(Search):
     """A plugin that helps implementing any kind of search protocol that relies on
@@ -95,6 +140,26 @@ class QueryStringSearch(Search):
           - *next_page_url_key_path*: (optional) A JSONPATH expression used to retrieve
             the URL of the next page in the response of the current page.
 
+          - *max_total_items*: (optional) The maximum number of results a single query
+            can page through on the provider. If set, ``search_all`` splits the searched
+            time interval into windows matching less results than this limit.
+
+        - **cache_ttl**: (optional) Time to live in seconds of the provider responses
+          stored in the search responses cache, if one has been set using
+          :meth:`~eodag.api.core.EODataAccessGateway.set_search_cache`. 0 disables the
+          cache for this provider.
+
+        - **geometry_tile_size**: (optional) Size in degrees of the tiles ``search_all``
+          splits huge search geometries into before sending them to the provider.
+
+        - **normalize_workers**: (optional) Number of processes used to extract the
+          properties of big json results pages. Pages are processed sequentially by
+          default.
+
+        - **normalize_chunk_size**: (optional) Number of results whose properties are
+          extracted by the same process when ``normalize_workers`` is set. Defaults to
+          ``250``.
+
         - **free_text_search_operations**: (optional) A tree structure of the form::
 
             <search-param>:     # e.g: $search
@@ -157,12 +222,6 @@ class QueryStringSearch(Search):
         self.config.__dict__.setdefault("results_entry", "features")
         self.config.__dict__.setdefault("pagination", {})
         self.config.__dict__.setdefault("free_text_search_operations", {})
-        self.search_urls = []
-        self.query_params = dict()
-        self.query_string = ""
-        self.next_page_url = None
-        self.next_page_query_obj = None
-        self.next_page_merge = None
         # parse jsonpath on init: pagination
         if (
             self.config.result_type == "json"
@@ -237,16 +296,6 @@ class QueryStringSearch(Search):
                     self.config.products[product_type]["metadata_mapping"]
                 )
 
-    def clear(self):
-        """Clear search context"""
-        super().clear()
-        self.search_urls.clear()
-        self.query_params.clear()
-        self.query_string = ""
-        self.next_page_url = None
-        self.next_page_query_obj = None
-        self.next_page_merge = None
-
     def discover_product_types(self):
         """Fetch product types list from provider using `discover_product_types` conf
 
@@ -404,23 +453,8 @@ class QueryStringSearch(Search):
         self.product_type_def_params = self.get_product_type_def_params(
             product_type, **kwargs
         )
-
-        # update config using provider product type definition metadata_mapping
-        # from another product
-        other_product_for_mapping = self.product_type_def_params.get(
-            "metadata_mapping_from_product", ""
-        )
-        if other_product_for_mapping:
-            other_product_type_def_params = self.get_product_type_def_params(
-                other_product_for_mapping, **kwargs
-            )
-            self.config.metadata_mapping.update(
-                other_product_type_def_params.get("metadata_mapping", {})
-            )
-        # from current product
-        self.config.metadata_mapping.update(
-            self.product_type_def_params.get("metadata_mapping", {})
-        )
+        metadata_mapping = self.get_metadata_mapping(product_type, **kwargs)
+        self.use_product_type_metadata_mapping(product_type, metadata_mapping)
 
         # if product_type_def_params is set, remove product_type as it may conflict with this conf
         if self.product_type_def_params:
@@ -430,8 +464,8 @@ class QueryStringSearch(Search):
                 k: v
                 for k, v in self.product_type_def_params.items()
                 if k not in keywords.keys()
-                and k in self.config.metadata_mapping.keys()
-                and isinstance(self.config.metadata_mapping[k], list)
+                and k in metadata_mapping.keys()
+                and isinstance(metadata_mapping[k], list)
             }
         )
 
@@ -454,18 +488,73 @@ class QueryStringSearch(Search):
         total_items = len(eo_products) if total_items == 0 else total_items
         return eo_products, total_items
 
+    def get_metadata_mapping(self, product_type=None, **kwargs):
+        """Get the plugin metadata mapping updated with the provider product type
+        definition one, and the one of the product type it may be taken from (see
+        ``metadata_mapping_from_product``).
+
+        The mapping of a product type configured for the provider is built once and
+        then reused by the next searches of this product type, each search getting its
+        own copy of it.
+
+        :param product_type: (optional) The searched product type
+        :type product_type: str
+        :param kwargs: The search arguments, used to format the generic product type
+                       definition
+        :type kwargs: Any
+        :returns: The metadata mapping to use for the search
+        :rtype: dict
+        """
+        try:
+            return dict(self._product_type_metadata_mappings[product_type])
+        except KeyError:
+            pass
+        product_type_def_params = self.get_product_type_def_params(
+            product_type, **kwargs
+        )
+        metadata_mapping = dict(self.config.metadata_mapping)
+        # from another product
+        other_product_for_mapping = product_type_def_params.get(
+            "metadata_mapping_from_product", ""
+        )
+        if other_product_for_mapping:
+            other_product_type_def_params = self.get_product_type_def_params(
+                other_product_for_mapping, **kwargs
+            )
+            metadata_mapping.update(
+                other_product_type_def_params.get("metadata_mapping", {})
+            )
+        # from current product
+        metadata_mapping.update(product_type_def_params.get("metadata_mapping", {}))
+        # the generic product type definition depends on the search arguments
+        if (
+            product_type in self.config.products
+            and product_type != GENERIC_PRODUCT_TYPE
+        ):
+            self._product_type_metadata_mappings[product_type] = dict(metadata_mapping)
+        return metadata_mapping
+
     @_deprecated(
-        reason="Simply run `self.config.metadata_mapping.update(metadata_mapping)` instead",
+        reason=(
+            "Use `EODataAccessGateway.update_providers_config()` instead, or run "
+            "`self.config.metadata_mapping.update(metadata_mapping)` followed by "
+            "`self.reset_metadata_mapping_cache()`"
+        ),
         version="2.10.0",
     )
     def update_metadata_mapping(self, metadata_mapping):
         """Update plugin metadata_mapping with input metadata_mapping configuration"""
         self.config.metadata_mapping.update(metadata_mapping)
+        self.reset_metadata_mapping_cache()
 
     def build_query_string(self, product_type, **kwargs):
         """Build The query string using the search parameters"""
         logger.debug("Building the query string that will be used for search")
-        query_params = format_query_params(product_type, self.config, **kwargs)
+        # the configuration is not updated with the metadata mapping of the search, as
+        # it is shared with the other searches running on this plugin
+        config = copy.copy(self.config)
+        config.metadata_mapping = self.metadata_mapping
+        query_params = format_query_params(product_type, config, **kwargs)
 
         # Build the final query string, in one go without quoting it
         # (some providers do not operate well with urlencoded and quoted query strings)
@@ -508,7 +597,7 @@ class QueryStringSearch(Search):
                             total_results = _total_results or 0
                         else:
                             total_results += _total_results or 0
-                next_url = self.config.pagination["next_page_url_tpl"].format(
+                next_url = self.pagination["next_page_url_tpl"].format(
                     url=search_endpoint,
                     search=self.query_string,
                     items_per_page=items_per_page,
@@ -540,7 +629,7 @@ class QueryStringSearch(Search):
 
         results = []
         for search_url in self.search_urls:
-            response = self._request(
+            response = self._cached_request(
                 search_url,
                 info_message="Sending search request: {}".format(search_url),
                 exception_message="Skipping error while searching for {} {} "
@@ -557,13 +646,9 @@ class QueryStringSearch(Search):
             )
             if self.config.result_type == "xml":
                 root_node = etree.fromstring(response.content)
-                namespaces = {k or "ns": v for k, v in root_node.nsmap.items()}
-                result = [
-                    etree.tostring(entry)
-                    for entry in root_node.xpath(
-                        self.config.results_entry, namespaces=namespaces
-                    )
-                ]
+                namespaces = tuple((k or "ns", v) for k, v in root_node.nsmap.items())
+                # entries elements are directly used to extract the properties
+                result = cached_xpath(self.config.results_entry, namespaces)(root_node)
                 if next_page_url_key_path or next_page_query_obj_key_path:
                     raise NotImplementedError(
                         "Setting the next page url from an XML response has not "
@@ -572,12 +657,10 @@ class QueryStringSearch(Search):
                 if getattr(self, "need_count", False):
                     # extract total_items_nb from search results
                     try:
-                        total_nb_results = root_node.xpath(
+                        total_nb_results = cached_xpath(
                             self.config.pagination["total_items_nb_key_path"],
-                            namespaces={
-                                k or "ns": v for k, v in root_node.nsmap.items()
-                            },
-                        )[0]
+                            namespaces,
+                        )(root_node)[0]
                         _total_items_nb = int(total_nb_results)
 
                         if getattr(self.config, "merge_responses", False):
@@ -658,29 +741,91 @@ class QueryStringSearch(Search):
             "Adapting %s plugin results to eodag product representation"
             % normalize_remaining_count
         )
+        # mapping compiled once for all the results, and reused by the next searches
+        # of the same product type
+        extract_properties = self.get_metadata_extractor(
+            XmlMetadataExtractor
+            if self.config.result_type == "xml"
+            else JsonMetadataExtractor,
+            discovery_config=getattr(self.config, "discover_metadata", {}),
+        )
+        results_properties = self.extract_results_properties(
+            extract_properties, results
+        )
+        # geometries built in bulk
+        for properties, geometry in zip(
+            results_properties,
+            parse_geometries(p.get("geometry") for p in results_properties),
+        ):
+            if "geometry" in properties:
+                properties["geometry"] = geometry
         products = []
-        for result in results:
-            product = EOProduct(
-                self.provider,
-                QueryStringSearch.extract_properties[self.config.result_type](
-                    result,
-                    self.config.metadata_mapping,
-                    discovery_config=getattr(self.config, "discover_metadata", {}),
-                ),
-                **kwargs,
-            )
+        for properties in results_properties:
+            product = EOProduct(self.provider, properties, **kwargs)
             # use product_type_config as default properties
-            product.properties = dict(
-                getattr(self.config, "product_type_config", {}), **product.properties
-            )
+            product.properties = dict(self.product_type_config, **product.properties)
             products.append(product)
         return products
 
+    def extract_results_properties(self, extract_properties, results):
+        """Extract the properties of the given provider results.
+
+        If the ``normalize_workers`` search configuration parameter is greater than 1,
+        json results pages bigger than ``normalize_chunk_size`` are split into chunks
+        whose properties are extracted in parallel in a pool of processes, shared by
+        all the searches. The extracted properties are the same as when extracted
+        sequentially.
+
+        :param extract_properties: The properties extractor built from the metadata
+                                   mapping
+        :type extract_properties: :class:`~eodag.api.product.metadata_mapping.JsonMetadataExtractor`
+                                  or :class:`~eodag.api.product.metadata_mapping.XmlMetadataExtractor`
+        :param results: The provider results
+        :type results: list
+        :returns: The properties of each result
+        :rtype: list(dict)
+        """
+        workers = getattr(self.config, "normalize_workers", None) or 1
+        chunk_size = getattr(
+            self.config, "normalize_chunk_size", DEFAULT_NORMALIZE_CHUNK_SIZE
+        )
+        if (
+            workers < 2
+            or len(results) <= chunk_size
+            or not isinstance(extract_properties, JsonMetadataExtractor)
+        ):
+            return _extract_properties_chunk(extract_properties, results)
+        chunks = [
+            results[i : i + chunk_size] for i in range(0, len(results), chunk_size)
+        ]
+        logger.debug(
+            "Extracting the properties of %s results in %s processes",
+            len(results),
+            min(workers, len(chunks)),
+        )
+        executor = _get_properties_executor(workers)
+        try:
+            return [
+                properties
+                for chunk_properties in executor.map(
+                    partial(_extract_properties_chunk, extract_properties), chunks
+                )
+                for properties in chunk_properties
+            ]
+        except concurrent.futures.process.BrokenProcessPool as e:
+            logger.warning(
+                "Extracting the properties of %s results sequentially: %s",
+                len(results),
+                e,
+            )
+            _drop_properties_executor(workers, executor)
+            return _extract_properties_chunk(extract_properties, results)
+
     def count_hits(self, count_url, result_type="json"):
         """Count the number of results satisfying some criteria"""
         # Handle a very annoying special case :'(
         url = count_url.replace("$format=json&", "")
-        response = self._request(
+        response = self._cached_request(
             url,
             info_message="Sending count request: {}".format(url),
             exception_message="Skipping error while counting results for {} {} "
@@ -688,10 +833,10 @@ class QueryStringSearch(Search):
         )
         if result_type == "xml":
             root_node = etree.fromstring(response.content)
-            total_nb_results = root_node.xpath(
+            total_nb_results = cached_xpath(
                 self.config.pagination["total_items_nb_key_path"],
-                namespaces={k or "ns": v for k, v in root_node.nsmap.items()},
-            )[0]
+                tuple((k or "ns", v) for k, v in root_node.nsmap.items()),
+            )(root_node)[0]
             total_results = int(total_nb_results)
         else:
             count_results = response.json()
@@ -771,16 +916,56 @@ class QueryStringSearch(Search):
         else:
             return {}
 
+    def _get_request_auth(self):
+        """Get the authentication of the search requests, None if not needed"""
+        if (
+            getattr(self.config, "need_auth", False)
+            and hasattr(self, "auth")
+            and callable(self.auth)
+        ):
+            return self.auth
+        return None
+
+    def _search_cache_key(self, url):
+        """Build the key of the given request in the search responses cache"""
+        return search_cache_key(self.provider, url, auth=self._get_request_auth())
+
+    def _cached_request(self, url, info_message=None, exception_message=None):
+        """Send the given search request, or get its response from the search responses
+        cache if one is set and the response has already been received and has not
+        expired yet.
+
+        The cache time to live can be overridden per provider using the ``cache_ttl``
+        search configuration parameter, 0 disabling the cache for the provider. The
+        ``refresh_cache`` search parameter sends the request even if its response is
+        cached, the new response replacing the cached one.
+        """
+        cache = getattr(self, "search_cache", None)
+        ttl = getattr(self.config, "cache_ttl", None)
+        if cache is None or ttl == 0:
+            return self._request(
+                url, info_message=info_message, exception_message=exception_message
+            )
+        key = self._search_cache_key(url)
+        response = None
+        if not self.search_context.refresh_cache:
+            response = cache.get(key)
+        if response is not None:
+            logger.debug("Search response found in cache for %s", url)
+            return response
+        response = self._request(
+            url, info_message=info_message, exception_message=exception_message
+        )
+        cache.set(key, response, ttl=ttl)
+        return response
+
     def _request(self, url, info_message=None, exception_message=None):
         try:
             # auth if needed
             kwargs = {}
-            if (
-                getattr(self.config, "need_auth", False)
-                and hasattr(self, "auth")
-                and callable(self.auth)
-            ):
-                kwargs["auth"] = self.auth
+            auth = self._get_request_auth()
+            if auth is not None:
+                kwargs["auth"] = auth
             # requests auto quote url params, without any option to prevent it
             # use urllib instead of requests if req must be sent unquoted
             if hasattr(self.config, "dont_quote"):
@@ -842,15 +1027,14 @@ class AwsSearch(QueryStringSearch):
         """Transform metadata from provider representation to eodag representation"""
         normalized = []
         logger.debug("Adapting plugin results to eodag product representation")
+        extract_properties = self.get_metadata_extractor()
         for result in results:
             ref = result["properties"]["title"].split("_")[5]
             year = result["properties"]["completionDate"][0:4]
             month = str(int(result["properties"]["completionDate"][5:7]))
             day = str(int(result["properties"]["completionDate"][8:10]))
 
-            properties = QueryStringSearch.extract_properties[self.config.result_type](
-                result, self.config.metadata_mapping
-            )
+            properties = extract_properties(result)
 
             properties["downloadLink"] = (
                 "s3://tiles/{ref[1]}{ref[2]}/{ref[3]}/{ref[4]}{ref[5]}/{year}/"
@@ -945,6 +1129,77 @@ class ODataV4Search(QueryStringSearch):
 class PostJsonSearch(QueryStringSearch):
     """A specialisation of a QueryStringSearch that uses POST method"""
 
+    def __init__(self, provider, config):
+        super(PostJsonSearch, self).__init__(provider, config)
+        # QueryStringSearch plugins used for the product types parameters having a
+        # specific_qssearch configuration, per product type and endpoint
+        self._specific_qssearch_plugins = {}
+        self._specific_qssearch_lock = threading.Lock()
+
+    def reset_metadata_mapping_cache(self):
+        """Reset the metadata mappings built per product type, and the plugins built
+        from the product types specific_qssearch configurations."""
+        super(PostJsonSearch, self).reset_metadata_mapping_cache()
+        self._specific_qssearch_plugins = {}
+
+    def get_specific_qssearch_plugin(self, product_type, api_endpoint):
+        """Get a :class:`QueryStringSearch` plugin searching with the
+        ``specific_qssearch`` configuration of the given product type.
+
+        The plugin is built once from a copy of this plugin configuration, which is
+        left untouched, and each call gets its own copy of it sharing this plugin
+        authentication and search cache.
+
+        :param product_type: The searched product type
+        :type product_type: str
+        :param api_endpoint: The endpoint of the specific search
+        :type api_endpoint: str
+        :returns: The plugin to search with
+        :rtype: :class:`QueryStringSearch`
+        """
+        key = (product_type, api_endpoint)
+        with self._specific_qssearch_lock:
+            plugin = self._specific_qssearch_plugins.get(key, None)
+            if plugin is None:
+                specific_qssearch = self.config.products[product_type][
+                    "specific_qssearch"
+                ]
+                config = copy.copy(self.config)
+                # copies of the nested configurations parsed by the plugin
+                # initialization, without the already parsed ones
+                config.pagination = dict(self.config.pagination)
+                config.products = {
+                    other_product_type: {
+                        k: v
+                        for k, v in product_type_config.items()
+                        if k != "metadata_mapping"
+                    }
+                    for other_product_type, product_type_config in (
+                        self.config.products.items()
+                    )
+                }
+                config.discover_product_types = {}
+                config.api_endpoint = api_endpoint
+                config.metadata_mapping = specific_qssearch["metadata_mapping"]
+                config.results_entry = specific_qssearch["results_entry"]
+                config.collection = specific_qssearch.get("collection", None)
+                config.merge_responses = specific_qssearch.get("merge_responses", None)
+                plugin = QueryStringSearch(self.provider, config)
+                for (
+                    other_product_type,
+                    product_type_config,
+                ) in self.config.products.items():
+                    if "metadata_mapping" in product_type_config:
+                        config.products[other_product_type][
+                            "metadata_mapping"
+                        ] = product_type_config["metadata_mapping"]
+                self._specific_qssearch_plugins[key] = plugin
+        plugin = copy.copy(plugin)
+        plugin.search_cache = getattr(self, "search_cache", None)
+        if hasattr(self, "auth"):
+            plugin.auth = self.auth
+        return plugin
+
     def query(self, items_per_page=None, page=None, count=True, **kwargs):
         """Perform a search on an OpenSearch-like interface"""
         product_type = kwargs.get("productType", None)
@@ -962,23 +1217,8 @@ class PostJsonSearch(QueryStringSearch):
         self.product_type_def_params = self.get_product_type_def_params(
             product_type, **kwargs
         )
-
-        # update config using provider product type definition metadata_mapping
-        # from another product
-        other_product_for_mapping = self.product_type_def_params.get(
-            "metadata_mapping_from_product", ""
-        )
-        if other_product_for_mapping:
-            other_product_type_def_params = self.get_product_type_def_params(
-                other_product_for_mapping, **kwargs
-            )
-            self.config.metadata_mapping.update(
-                other_product_type_def_params.get("metadata_mapping", {})
-            )
-        # from current product
-        self.config.metadata_mapping.update(
-            self.product_type_def_params.get("metadata_mapping", {})
-        )
+        metadata_mapping = self.get_metadata_mapping(product_type, **kwargs)
+        self.use_product_type_metadata_mapping(product_type, metadata_mapping)
 
         # Add to the query, the queryable parameters set in the provider product type definition
         keywords.update(
@@ -986,41 +1226,25 @@ class PostJsonSearch(QueryStringSearch):
                 k: v
                 for k, v in self.product_type_def_params.items()
                 if k not in keywords.keys()
-                and k in self.config.metadata_mapping.keys()
-                and isinstance(self.config.metadata_mapping[k], list)
+                and k in metadata_mapping.keys()
+                and isinstance(metadata_mapping[k], list)
             }
         )
 
         qp, _ = self.build_query_string(product_type, **keywords)
 
+        specific_parameters = (
+            self.config.products.get(product_type, {})
+            .get("specific_qssearch", {})
+            .get("parameters", [])
+        )
         for query_param, query_value in qp.items():
-            if (
-                query_param
-                in self.config.products.get(product_type, {}).get(
-                    "specific_qssearch", {"parameters": []}
-                )["parameters"]
-            ):
-                self.config.api_endpoint = query_value
-                self.config.metadata_mapping = self.config.products[product_type][
-                    "specific_qssearch"
-                ]["metadata_mapping"]
-                self.config.results_entry = self.config.products[product_type][
-                    "specific_qssearch"
-                ]["results_entry"]
-                self.config.collection = self.config.products[product_type][
-                    "specific_qssearch"
-                ].get("collection", None)
-                self.config.merge_responses = self.config.products[product_type][
-                    "specific_qssearch"
-                ].get("merge_responses", None)
-                super(PostJsonSearch, self).__init__(
-                    provider=self.provider, config=self.config
-                )
-                self.count_hits = lambda *x, **y: 1
-                self._request = super(PostJsonSearch, self)._request
-                return super(PostJsonSearch, self).query(
-                    items_per_page=items_per_page, page=page, **kwargs
-                )
+            if query_param in specific_parameters:
+                # the specific search results are not counted
+                products, _ = self.get_specific_qssearch_plugin(
+                    product_type, query_value
+                ).query(items_per_page=items_per_page, page=page, count=False, **kwargs)
+                return products, len(products) if count else None
 
         # If we were not able to build query params but have queryable search criteria,
         # this means the provider does not support the search criteria given. If so,
@@ -1028,7 +1252,7 @@ class PostJsonSearch(QueryStringSearch):
         if not qp and any(
             k
             for k in keywords.keys()
-            if isinstance(self.config.metadata_mapping.get(k, []), list)
+            if isinstance(self.metadata_mapping.get(k, []), list)
         ):
             return [], 0
         self.query_params = qp
@@ -1084,11 +1308,9 @@ class PostJsonSearch(QueryStringSearch):
                             total_results = _total_results or 0
                         else:
                             total_results += _total_results or 0
-                if isinstance(self.config.pagination["next_page_query_obj"], str):
+                if isinstance(self.pagination["next_page_query_obj"], str):
                     # next_page_query_obj needs to be parsed
-                    next_page_query_obj = self.config.pagination[
-                        "next_page_query_obj"
-                    ].format(
+                    next_page_query_obj = self.pagination["next_page_query_obj"].format(
                         items_per_page=items_per_page,
                         page=page,
                         skip=(page - 1) * items_per_page,
@@ -1101,16 +1323,28 @@ class PostJsonSearch(QueryStringSearch):
             urls.append(search_endpoint)
         return urls, total_results
 
+    def _search_cache_key(self, url):
+        """Build the key of the given request in the search responses cache, including
+        the query parameters sent in the body of the request"""
+        return search_cache_key(
+            self.provider, url, self.query_params, auth=self._get_request_auth()
+        )
+
+    def _cached_request(self, url, info_message=None, exception_message=None):
+        # the next page arguments are used whether the response is cached or not
+        if getattr(self, "next_page_query_obj", None):
+            self.query_params = self.next_page_query_obj
+        return super(PostJsonSearch, self)._cached_request(
+            url, info_message=info_message, exception_message=exception_message
+        )
+
     def _request(self, url, info_message=None, exception_message=None):
         try:
             # auth if needed
             kwargs = {}
-            if (
-                getattr(self.config, "need_auth", False)
-                and hasattr(self, "auth")
-                and callable(self.auth)
-            ):
-                kwargs["auth"] = self.auth
+            auth = self._get_request_auth()
+            if auth is not None:
+                kwargs["auth"] = auth
 
             # perform the request using the next page arguments if they are defined
             if getattr(self, "next_page_query_obj", None):
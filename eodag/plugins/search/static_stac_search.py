@@ -59,6 +59,8 @@ class StaticStacSearch(StacSearch):
         super(StaticStacSearch, self).__init__(provider, config)
         self.config.__dict__.setdefault("max_connections", 100)
         self.config.__dict__.setdefault("timeout", HTTP_REQ_TIMEOUT)
+        # static catalogs are loaded locally, their results are not cached
+        self.config.__dict__.setdefault("cache_ttl", 0)
 
     def discover_product_types(self):
         """Fetch product types is disabled for `StaticStacSearch`
@@ -85,13 +87,8 @@ class StaticStacSearch(StacSearch):
             "returned": nb_features,
         }
 
-        # save StaticStacSearch._request and mock it to make return loaded static results
-        stacapi_request = self._request
-        self._request = (
-            lambda url, info_message=None, exception_message=None: MockResponse(
-                feature_collection, 200
-            )
-        )
+        # loaded static results, returned by _request to the StacSearch query
+        self.search_context.feature_collection = feature_collection
 
         # query on mocked StacSearch
         eo_products, _ = super(StaticStacSearch, self).query(
@@ -139,7 +136,9 @@ class StaticStacSearch(StacSearch):
                     FilterProperty({property_key: property_value, "operator": "eq"})
                 )
 
-        # restore plugin._request
-        self._request = stacapi_request
-
         return search_result.data, len(search_result)
+
+    def _request(self, url, info_message=None, exception_message=None):
+        """Mock StacSearch._request to return the static results loaded for the
+        current search"""
+        return MockResponse(self.search_context.feature_collection, 200)
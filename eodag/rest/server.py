@@ -24,6 +24,7 @@ from distutils import dist
 from json.decoder import JSONDecodeError
 from typing import List, Union
 
+import orjson
 import pkg_resources
 from fastapi import APIRouter as FastAPIRouter
 from fastapi import FastAPI, HTTPException, Request
@@ -36,6 +37,7 @@ from pydantic import BaseModel
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from eodag.config import load_stac_api_config
+from eodag.rest.stac import to_json_serializable
 from eodag.rest.utils import (
     download_stac_item_by_id_stream,
     eodag_api_init,
@@ -93,6 +95,20 @@ class APIRouter(FastAPIRouter):
         return decorator
 
 
+class GeoJSONResponse(ORJSONResponse):
+    """GeoJSON response, directly serialized with orjson"""
+
+    media_type = "application/geo+json"
+
+    def render(self, content: Any) -> bytes:
+        """Serializes the content, converting its geometries to GeoJSON"""
+        return orjson.dumps(
+            content,
+            default=to_json_serializable,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
 router = APIRouter()
 
 
@@ -305,10 +321,7 @@ def stac_search(request: Request, search_body: SearchBody = None):
     response = search_stac_items(
         url=url, arguments=arguments, root=url_root, provider=provider
     )
-    resp = ORJSONResponse(
-        content=response, status_code=200, media_type="application/json"
-    )
-    return resp
+    return GeoJSONResponse(content=response, status_code=200)
 
 
 @router.get("/collections", tags=["Capabilities"])
@@ -350,7 +363,7 @@ def stac_collections_items(collection_id, request: Request):
         provider=provider,
         catalogs=[collection_id],
     )
-    return jsonable_encoder(response)
+    return GeoJSONResponse(content=response)
 
 
 @router.get("/collections/{collection_id}", tags=["Capabilities"])
@@ -468,7 +481,7 @@ async def stac_catalogs_items(catalogs, request: Request):
         catalogs=catalogs,
         provider=provider,
     )
-    return jsonable_encoder(response)
+    return GeoJSONResponse(content=response)
 
 
 @router.get("/catalogs/{catalogs:path}/items/{item_id}", tags=["Data"])
@@ -594,7 +607,7 @@ async def stac_catalogs(catalogs, request: Request):
         catalogs=catalogs,
         provider=provider,
     )
-    return jsonable_encoder(response)
+    return GeoJSONResponse(content=response)
 
 
 app.include_router(router)
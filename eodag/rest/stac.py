@@ -23,7 +23,7 @@ from collections import defaultdict
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import dateutil.parser
-import geojson
+import orjson
 import shapefile
 from dateutil import tz
 from dateutil.relativedelta import relativedelta
@@ -57,6 +57,21 @@ DEFAULT_MISSION_START_DATE = "2015-01-01T00:00:00Z"
 STAC_CATALOGS_PREFIX = "catalogs"
 
 
+def to_json_serializable(obj):
+    """Default orjson conversion of the objects it cannot serialize natively, such
+    as the geometries implementing the geo-interface
+
+    :param obj: The object to serialize
+    :type obj: Any
+    :returns: A serializable representation of the object
+    :rtype: Any
+    :raises: :class:`TypeError`
+    """
+    if hasattr(obj, "__geo_interface__"):
+        return obj.__geo_interface__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class StacCommon(object):
     """Stac common object
 
@@ -143,13 +158,21 @@ class StacCommon(object):
 
         return extension
 
+    def as_json_bytes(self):
+        """Returns object data serialized as JSON bytes
+
+        :returns: Serialized STAC data
+        :rtype: bytes
+        """
+        return orjson.dumps(self.data, default=to_json_serializable)
+
     def as_dict(self):
         """Returns object data as dictionnary
 
         :returns: STAC data dictionnary
         :rtype: dict
         """
-        return geojson.loads(geojson.dumps(self.data))
+        return orjson.loads(self.as_json_bytes())
 
     __geo_interface__ = property(as_dict)
 
@@ -274,7 +297,8 @@ class StacItem(StacCommon):
         :type search_results: :class:`~eodag.api.search_result.SearchResult`
         :param catalog: STAC catalog dict used for parsing item metadata
         :type catalog: dict
-        :returns: Items dictionnary
+        :returns: Items dictionnary, whose geometries are serialized by
+                  :func:`to_json_serializable`
         :rtype: dict
         """
         items_model = deepcopy(self.stac_config["items"])
@@ -341,7 +365,7 @@ class StacItem(StacCommon):
         items["features"] = self.__get_item_list(search_results, catalog)
 
         self.update_data(items)
-        return geojson.loads(geojson.dumps(self.data))
+        return self.data
 
     def __filter_item_model_properties(self, item_model, product_type):
         """Filter item model depending on product type metadata and its extensions.
@@ -9,10 +9,12 @@ import os
 import re
 from collections import namedtuple
 from shutil import make_archive, rmtree
+from urllib.error import HTTPError
 
 import dateutil.parser
+import orjson
 from dateutil import tz
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from shapely.geometry import Polygon, shape
 
 import eodag
@@ -31,7 +33,6 @@ from eodag.utils.exceptions import (
     UnsupportedProductType,
     ValidationError,
 )
-from urllib.error import HTTPError
 
 logger = logging.getLogger("eodag.rest.utils")
 
@@ -393,7 +394,8 @@ def search_products(product_type, arguments, stac_formatted=True):
     :param stac_formatted: Whether input is STAC-formatted or not
     :type stac_formatted: bool
     :returns: A search result
-    :rtype serialized GeoJSON response"""
+    :rtype: :class:`~fastapi.responses.Response` serializing the GeoJSON results, or
+            :class:`~eodag.api.search_result.SearchResult` if ``unserialized``"""
 
     try:
         arg_product_type = arguments.pop("product_type", None)
@@ -431,15 +433,18 @@ def search_products(product_type, arguments, stac_formatted=True):
         products = filter_products(products, arguments, **criterias)
 
         if not unserialized:
-            response = SearchResult(products).as_geojson_object()
-            response.update(
-                {
-                    "properties": {
-                        "page": page,
-                        "itemsPerPage": items_per_page,
-                        "totalResults": total,
-                    }
-                }
+            properties = {
+                "page": page,
+                "itemsPerPage": items_per_page,
+                "totalResults": total,
+            }
+            response = Response(
+                content=b'{"type":"FeatureCollection","features":['
+                + b",".join(SearchResult(products).geojson_features_bytes())
+                + b'],"properties":'
+                + orjson.dumps(properties)
+                + b"}",
+                media_type="application/geo+json",
             )
         else:
             response = SearchResult(products)
@@ -21,12 +21,14 @@ Everything that does not fit into one of the specialised categories of utilities
 this package should go here
 """
 import ast
+import copy
 import datetime
 import errno
 import functools
 import hashlib
 import inspect
 import logging as py_logging
+import math
 import os
 import re
 import shutil
@@ -59,6 +61,7 @@ from urllib.request import url2pathname
 import click
 import orjson
 import shapefile
+import shapely
 import shapely.wkt
 import yaml
 from dateutil.parser import isoparse
@@ -66,9 +69,11 @@ from dateutil.tz import UTC
 from jsonpath_ng import jsonpath
 from jsonpath_ng.ext import parse
 from jsonpath_ng.jsonpath import Child, Fields, Index, Root, Slice
+from lxml import etree
 from requests.auth import AuthBase
-from shapely.geometry import Polygon, shape
+from shapely.geometry import Polygon, box, shape
 from shapely.geometry.base import BaseGeometry
+from shapely.prepared import prep
 from tqdm.auto import tqdm
 
 from eodag.utils import logging as eodag_logging
@@ -92,6 +97,18 @@ JSONPATH_MATCH = re.compile(r"^[\{\(]*\$(\..*)*$")
 WORKABLE_JSONPATH_MATCH = re.compile(r"^\$(\.[a-zA-Z0-9-_:\.\[\]\"\(\)=\?\*]+)*$")
 ARRAY_FIELD_MATCH = re.compile(r"^[a-zA-Z0-9-_:]+(\[[0-9\*]+\])+$")
 
+GEOJSON_GEOMETRY_TYPES = frozenset(
+    (
+        "Point",
+        "MultiPoint",
+        "LineString",
+        "MultiLineString",
+        "Polygon",
+        "MultiPolygon",
+        "GeometryCollection",
+    )
+)
+
 
 def _deprecated(reason="", version=None):
     """Simple decorator to mark functions/methods/classes as deprecated.
@@ -970,6 +987,79 @@ def string_to_jsonpath(*args, force=False):
         return path_str
 
 
+def get_jsonpath_keys(path):
+    """Get the keys and indexes giving a direct access to the value pointed by a
+    simple jsonpath, made only of fields and integer indexes
+
+    >>> get_jsonpath_keys(string_to_jsonpath("$.foo.bar"))
+    ('foo', 'bar')
+    >>> get_jsonpath_keys(Child(Child(Root(), Fields("foo")), Index(0)))
+    ('foo', 0)
+    >>> get_jsonpath_keys(string_to_jsonpath("$.foo[?(@.bar=='baz')]")) is None
+    True
+
+    :param path: The parsed jsonpath
+    :type path: :class:`jsonpath_ng.JSONPath`
+    :returns: The keys and indexes to follow from the root of the json document, or
+              None if the path needs to be evaluated with its ``find`` method
+    :rtype: tuple
+    """
+    if type(path) in (Root, jsonpath.This):
+        return ()
+    elif type(path) is Child:
+        left_keys = get_jsonpath_keys(path.left)
+        right_keys = get_jsonpath_keys(path.right)
+        if left_keys is None or right_keys is None:
+            return None
+        return left_keys + right_keys
+    elif type(path) is Fields:
+        if len(path.fields) == 1 and path.fields[0] != "*":
+            return tuple(path.fields)
+    elif type(path) is Index:
+        # Index(index) in older jsonpath_ng versions, Index(*indices) in newer ones
+        indices = getattr(path, "indices", None) or [getattr(path, "index", None)]
+        if len(indices) == 1 and isinstance(indices[0], int):
+            return tuple(indices)
+    return None
+
+
+def get_value_from_keys(json, keys, default=None):
+    """Get the value found in a json document following the given keys and indexes,
+    as the ``find`` method of the equivalent jsonpath would do (see
+    :func:`~eodag.utils.get_jsonpath_keys`)
+
+    >>> get_value_from_keys({"foo": [{"bar": 1}]}, ("foo", 0, "bar"))
+    1
+    >>> get_value_from_keys({"foo": [{"bar": 1}]}, ("foo", 1, "bar"), "missing")
+    'missing'
+
+    :param json: The json document
+    :type json: dict
+    :param keys: The keys and indexes to follow
+    :type keys: tuple
+    :param default: (optional) The value returned if nothing is found
+    :type default: Any
+    :returns: The found value or the default one
+    :rtype: Any
+    """
+    value = json
+    for key in keys:
+        if isinstance(key, int):
+            if not isinstance(value, (list, tuple, str)):
+                return default
+            try:
+                value = value[key]
+            except IndexError:
+                return default
+        elif isinstance(value, dict):
+            value = value.get(key, default)
+            if value is default:
+                return default
+        else:
+            return default
+    return value
+
+
 def format_string(key, str_to_format, **format_variables):
     """Format "{foo}" like string
 
@@ -1139,6 +1229,121 @@ def get_geometry_from_various(locations_config=[], **query_args):
     return geom
 
 
+def parse_geometries(values):
+    """Parse in bulk the geometries given as WKT strings or GeoJSON-like dicts, using
+    the vectorized :func:`shapely.from_wkt` and :func:`shapely.from_geojson`.
+
+    Values that cannot be parsed this way are returned as is, to be parsed one by one
+    by the caller.
+
+    >>> parse_geometries(["POINT (1 2)", {"type": "Point", "coordinates": [3, 4]}, 5])
+    [<POINT (1 2)>, <POINT (3 4)>, 5]
+
+    :param values: The geometries to parse
+    :type values: list
+    :returns: The parsed geometries, or the input values that could not be parsed
+    :rtype: list
+    """
+    values = list(values)
+    wkt_indexes = [i for i, v in enumerate(values) if isinstance(v, str)]
+    geojson_indexes = []
+    geojson_strings = []
+    for i, v in enumerate(values):
+        if isinstance(v, dict) and v.get("type") in GEOJSON_GEOMETRY_TYPES:
+            try:
+                geojson_strings.append(orjson.dumps(v))
+            except TypeError:
+                # not serializable as json, leave it to geometry.shape()
+                continue
+            geojson_indexes.append(i)
+    for indexes, strings, from_strings in (
+        (wkt_indexes, [values[i] for i in wkt_indexes], shapely.from_wkt),
+        (geojson_indexes, geojson_strings, shapely.from_geojson),
+    ):
+        if not strings:
+            continue
+        try:
+            geometries = from_strings(strings, on_invalid="ignore")
+        except Exception:
+            # leave them to be parsed one by one
+            continue
+        for i, geom in zip(indexes, geometries):
+            if geom is not None:
+                values[i] = geom
+    return values
+
+
+def get_prepared_geometry(geom):
+    """Get a prepared version of a geometry, to speed up the repeated spatial
+    predicates computed with it.
+
+    Shapely prepares geometries in place: the given geometry is not modified, a
+    prepared copy of it is returned unless it is already prepared.
+
+    >>> from shapely.geometry import box
+    >>> geom = box(0, 0, 1, 1)
+    >>> bool(shapely.is_prepared(get_prepared_geometry(geom)))
+    True
+    >>> bool(shapely.is_prepared(geom))
+    False
+
+    :param geom: The geometry to prepare
+    :type geom: :class:`shapely.geometry.base.BaseGeometry`
+    :returns: The prepared geometry
+    :rtype: :class:`shapely.geometry.base.BaseGeometry`
+    """
+    if not shapely.is_prepared(geom):
+        geom = copy.copy(geom)
+        shapely.prepare(geom)
+    return geom
+
+
+def get_geometry_tiles(geom, tile_size):
+    """Split a geometry into a grid of bounding boxes covering it.
+
+    The bounding box of the geometry is divided into square cells of ``tile_size``
+    degrees. Cells not intersecting the geometry are dropped, and each remaining cell
+    is shrunk to the bounding box of its intersection with the geometry, giving a list
+    of simple rectangles that can replace a huge or complex search geometry.
+
+    >>> from shapely.geometry import box
+    >>> [tile.bounds for tile in get_geometry_tiles(box(0, 0, 15, 5), 10)]
+    [(0.0, 0.0, 10.0, 5.0), (10.0, 0.0, 15.0, 5.0)]
+
+    :param geom: The geometry to split
+    :type geom: :class:`shapely.geometry.base.BaseGeometry`
+    :param tile_size: The size of the grid cells, in degrees
+    :type tile_size: float
+    :returns: The tiles covering the geometry
+    :rtype: list[:class:`shapely.geometry.Polygon`]
+    """
+    if tile_size <= 0:
+        raise ValueError(f"Invalid tile size: {tile_size}")
+    minx, miny, maxx, maxy = geom.bounds
+    nb_cols = max(1, math.ceil((maxx - minx) / tile_size))
+    nb_rows = max(1, math.ceil((maxy - miny) / tile_size))
+    prepared_geom = prep(geom)
+    tiles = []
+    for row in range(nb_rows):
+        for col in range(nb_cols):
+            cell = box(
+                minx + col * tile_size,
+                miny + row * tile_size,
+                min(minx + (col + 1) * tile_size, maxx),
+                min(miny + (row + 1) * tile_size, maxy),
+            )
+            if not prepared_geom.intersects(cell):
+                continue
+            if prepared_geom.contains(cell):
+                tiles.append(cell)
+            else:
+                part = cell.intersection(geom)
+                tile = box(*part.bounds)
+                # degenerated boxes (points, straight lines) are kept as they are
+                tiles.append(tile if tile.area else part)
+    return tiles
+
+
 class MockResponse(object):
     """Fake requests response"""
 
@@ -1211,6 +1416,23 @@ def cached_parse(str_to_parse):
     return parse(str_to_parse)
 
 
+@functools.lru_cache(maxsize=512)
+def cached_xpath(path, namespaces=()):
+    """Cached lxml.etree.XPath
+
+    >>> cached_xpath("//ns:entry", (("ns", "http://www.w3.org/2005/Atom"),)).path
+    '//ns:entry'
+
+    :param path: xpath to compile
+    :type path: str
+    :param namespaces: (optional) namespaces prefixes and URIs used in the xpath
+    :type namespaces: tuple(tuple(str, str))
+    :returns: compiled xpath
+    :rtype: :class:`lxml.etree.XPath`
+    """
+    return etree.XPath(path, namespaces=dict(namespaces))
+
+
 @functools.lru_cache()
 def _mutable_cached_yaml_load(config_path):
     with open(os.path.abspath(os.path.realpath(config_path)), "r") as fh:
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Caches of the raw responses returned by the providers to search requests"""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import orjson
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from eodag.utils import parse_qsl, urlencode, urlsplit, urlunparse
+
+#: Default time to live of the cached responses, in seconds
+DEFAULT_SEARCH_CACHE_TTL = 3600
+
+CACHE_CONTROL_MAX_AGE_MATCH = re.compile(r"max-age=(\d+)")
+
+
+def search_cache_key(provider, url, query_params=None, auth=None):
+    """Build the cache key of a search request.
+
+    The query string parameters are sorted, as well as the keys of the optional
+    parameters sent in the body of the request, so that the same query gives the same
+    key whatever the order of its parameters. The credentials of the authenticated
+    requests are part of the key, so that users having different rights on the
+    provider do not share their responses.
+
+    >>> search_cache_key("foo", "https://foo.bar/search?b=2&a=1") == search_cache_key(
+    ...     "foo", "https://foo.bar/search?a=1&b=2"
+    ... )
+    True
+
+    :param provider: The provider the request is sent to
+    :type provider: str
+    :param url: The URL of the request, including its query string
+    :type url: str
+    :param query_params: (optional) The parameters sent in the body of the request
+    :type query_params: dict
+    :param auth: (optional) The authentication of the request
+    :type auth: :class:`requests.auth.AuthBase`
+    :returns: The key of the request in the cache
+    :rtype: str
+    """
+    parts = urlsplit(url)
+    normalized_url = urlunparse(
+        (
+            parts.scheme,
+            parts.netloc,
+            parts.path,
+            "",
+            urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True))),
+            "",
+        )
+    )
+    key = f"{provider}|{normalized_url}"
+    if query_params:
+        key += "|" + orjson.dumps(
+            query_params, option=orjson.OPT_SORT_KEYS, default=str
+        ).decode("utf-8")
+    if auth is not None:
+        # only the hash of the key is stored, not the credentials themselves
+        key += "|" + orjson.dumps(
+            getattr(auth, "__dict__", auth), option=orjson.OPT_SORT_KEYS, default=str
+        ).decode("utf-8")
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def get_response_ttl(response, ttl):
+    """Get how long a response can be cached, lowering the given time to live if the
+    ``Cache-Control`` header of the response asks for it.
+
+    :param response: The response of the provider
+    :type response: :class:`requests.Response`
+    :param ttl: The configured time to live, in seconds
+    :type ttl: int
+    :returns: The time to live of the response, 0 if it must not be cached
+    :rtype: int
+    """
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    max_age = CACHE_CONTROL_MAX_AGE_MATCH.search(cache_control)
+    if max_age:
+        return min(ttl, int(max_age.group(1)))
+    return ttl
+
+
+class SearchCache:
+    """Base class of the search responses caches.
+
+    The raw content of the responses is stored, allowing to build the search results
+    again without sending any request to the provider. Subclasses implement the
+    storage through the ``_get``, ``_set`` and ``_clear`` methods, expiration and
+    statistics are handled here.
+
+    :param ttl: (optional) The default time to live of the cached responses, in
+                seconds. Can be overridden per provider with the ``cache_ttl`` search
+                configuration parameter
+    :type ttl: int
+    """
+
+    def __init__(self, ttl=DEFAULT_SEARCH_CACHE_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def stats(self):
+        """The number of cache hits and misses since the cache creation"""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def get(self, key):
+        """Get the response stored with the given key if it has not expired
+
+        :param key: The key of the search request (see :func:`search_cache_key`)
+        :type key: str
+        :returns: The cached response or None
+        :rtype: :class:`requests.Response`
+        """
+        with self._lock:
+            entry = self._get(key)
+            if entry is not None and entry["expires"] < time.time():
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.url = entry["url"]
+        response.encoding = entry["encoding"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["content"]
+        return response
+
+    def set(self, key, response, ttl=None):
+        """Store the given response
+
+        :param key: The key of the search request (see :func:`search_cache_key`)
+        :type key: str
+        :param response: The response of the provider
+        :type response: :class:`requests.Response`
+        :param ttl: (optional) The time to live of the response, in seconds. The cache
+                    default one is used if not given
+        :type ttl: int
+        """
+        ttl = get_response_ttl(response, self.ttl if ttl is None else ttl)
+        if ttl <= 0:
+            return
+        entry = {
+            "expires": time.time() + ttl,
+            "status_code": response.status_code,
+            "url": response.url,
+            "encoding": response.encoding,
+            "headers": dict(response.headers),
+            "content": response.content,
+        }
+        with self._lock:
+            self._set(key, entry)
+
+    def clear(self):
+        """Remove all the cached responses and reset the statistics"""
+        with self._lock:
+            self._clear()
+            self.hits = self.misses = 0
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def _set(self, key, entry):
+        raise NotImplementedError
+
+    def _clear(self):
+        raise NotImplementedError
+
+
+class MemorySearchCache(SearchCache):
+    """In-memory least recently used search responses cache
+
+    :param max_size: (optional) The maximum number of cached responses
+    :type max_size: int
+    :param ttl: (optional) The default time to live of the cached responses, in seconds
+    :type ttl: int
+    """
+
+    def __init__(self, max_size=256, ttl=DEFAULT_SEARCH_CACHE_TTL):
+        super(MemorySearchCache, self).__init__(ttl=ttl)
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    def _get(self, key):
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _set(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _clear(self):
+        self._entries.clear()
+
+
+class SQLiteSearchCache(SearchCache):
+    """On-disk search responses cache, stored in a SQLite database that can be shared
+    between processes and kept between sessions
+
+    :param path: The path of the SQLite database file
+    :type path: str
+    :param ttl: (optional) The default time to live of the cached responses, in seconds
+    :type ttl: int
+    """
+
+    def __init__(self, path, ttl=DEFAULT_SEARCH_CACHE_TTL):
+        super(SQLiteSearchCache, self).__init__(ttl=ttl)
+        self.path = path
+        dirname = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dirname, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_responses ("
+                "key TEXT PRIMARY KEY, expires REAL, status_code INTEGER, url TEXT, "
+                "encoding TEXT, headers BLOB, content BLOB)"
+            )
+
+    def close(self):
+        """Close the connection to the database"""
+        self._connection.close()
+
+    def _get(self, key):
+        row = self._connection.execute(
+            "SELECT expires, status_code, url, encoding, headers, content "
+            "FROM search_responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        expires, status_code, url, encoding, headers, content = row
+        return {
+            "expires": expires,
+            "status_code": status_code,
+            "url": url,
+            "encoding": encoding,
+            "headers": orjson.loads(headers),
+            "content": content,
+        }
+
+    def _set(self, key, entry):
+        with self._connection:
+            # expired responses are purged on write
+            self._connection.execute(
+                "DELETE FROM search_responses WHERE expires < ?", (time.time(),)
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO search_responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry["expires"],
+                    entry["status_code"],
+                    entry["url"],
+                    entry["encoding"],
+                    orjson.dumps(entry["headers"]),
+                    entry["content"],
+                ),
+            )
+
+    def _clear(self):
+        with self._connection:
+            self._connection.execute("DELETE FROM search_responses")
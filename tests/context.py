@@ -26,17 +26,23 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..",
 
 from eodag import EODataAccessGateway, api, config, setup_logging
 from eodag.api.core import DEFAULT_ITEMS_PER_PAGE, DEFAULT_MAX_ITEMS_PER_PAGE
-from eodag.api.product import EOProduct
+from eodag.api.product import CompactEOProduct, EOProduct
 from eodag.api.product.drivers import DRIVERS
 from eodag.api.product.drivers.base import DatasetDriver
 from eodag.api.product.metadata_mapping import (
     format_metadata,
+    JsonMetadataExtractor,
+    mtd_cfg_as_conversion_and_querypath,
+    properties_from_xml,
+    XmlMetadataExtractor,
     OFFLINE_STATUS,
     ONLINE_STATUS,
     properties_from_json,
     NOT_AVAILABLE,
 )
-from eodag.api.search_result import SearchResult
+from eodag.api.columnar import ColumnarSearchResult
+from eodag.api.local_catalog import LocalCatalog
+from eodag.api.search_result import CrunchPipeline, SearchResult
 from eodag.cli import download, eodag, list_pt, search_crunch
 from eodag.config import (
     load_default_config,
@@ -51,7 +57,13 @@ from eodag.plugins.apis.ecmwf import EcmwfApi
 from eodag.plugins.authentication.base import Authentication
 from eodag.plugins.authentication.header import HeaderAuth
 from eodag.plugins.crunch.filter_date import FilterDate
+from eodag.plugins.crunch.filter_duplicates import FilterDuplicates
+from eodag.plugins.crunch.filter_latest_intersect import (
+    FilterLatestIntersect,
+    first_covering_index,
+)
 from eodag.plugins.crunch.filter_latest_tpl_name import FilterLatestByName
+from eodag.plugins.crunch.filter_minimal_cover import FilterMinimalCover
 from eodag.plugins.crunch.filter_property import FilterProperty
 from eodag.plugins.crunch.filter_overlap import FilterOverlap
 from eodag.plugins.download.aws import AwsDownload
@@ -63,14 +75,19 @@ from eodag.plugins.download.base import (
 from eodag.plugins.download.http import HTTPDownload
 from eodag.plugins.manager import PluginManager
 from eodag.plugins.search.base import Search
+from eodag.plugins.search.local_catalog import LocalCatalogSearch
+from eodag.plugins.search.qssearch import QueryStringSearch
 from eodag.rest.stac import DEFAULT_MISSION_START_DATE
 from eodag.utils import (
     USER_AGENT,
     get_bucket_name_and_prefix,
     get_geometry_from_various,
+    get_jsonpath_keys,
     get_timestamp,
+    get_value_from_keys,
     makedirs,
     merge_mappings,
+    parse_geometries,
     path_to_uri,
     ProgressCallback,
     uri_to_path,
@@ -84,6 +101,7 @@ from eodag.utils import (
     sanitize,
     parse_header,
 )
+from eodag.utils.cache import MemorySearchCache, SQLiteSearchCache, search_cache_key
 from eodag.utils.exceptions import (
     AddressNotFound,
     AuthenticationError,
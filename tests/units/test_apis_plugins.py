@@ -148,8 +148,9 @@ class TestApisPluginEcmwfApi(BaseApisPluginTest):
             datetime.utcnow().isoformat(),
         )
 
-        # missing start & stop and plugin.product_type_config set (set in core._prepare_search)
-        self.api_plugin.config.product_type_config = {
+        # missing start & stop and product_type_config set in the search context
+        # (given by core._prepare_search)
+        self.api_plugin.search_context.product_type_config = {
             "productType": self.product_type,
             "missionStartDate": "1985-10-26",
             "missionEndDate": "2015-10-21",
@@ -722,8 +723,9 @@ class TestApisPluginCdsApi(BaseApisPluginTest):
             datetime.utcnow().isoformat(),
         )
 
-        # missing start & stop and plugin.product_type_config set (set in core._prepare_search)
-        self.api_plugin.config.product_type_config = {
+        # missing start & stop and product_type_config set in the search context
+        # (given by core._prepare_search)
+        self.api_plugin.search_context.product_type_config = {
             "productType": self.product_type,
             "missionStartDate": "1985-10-26",
             "missionEndDate": "2015-10-21",
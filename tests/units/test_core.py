@@ -18,34 +18,47 @@
 
 import copy
 import glob
+import importlib
+import importlib.util
 import json
 import os
+import re
 import shutil
+import threading
+import time
+import types
 import unittest
 import uuid
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import concurrent.futures
+import shapely
 from pkg_resources import resource_filename
 from shapely import wkt
-from shapely.geometry import LineString, MultiPolygon, Polygon
+from shapely.geometry import LineString, MultiPolygon, Polygon, box, mapping
 
 from eodag import __version__ as eodag_version
 from eodag.utils import GENERIC_PRODUCT_TYPE
 from tests import TEST_RESOURCES_PATH
 from tests.context import (
     DEFAULT_MAX_ITEMS_PER_PAGE,
+    ColumnarSearchResult,
     EODataAccessGateway,
     EOProduct,
+    MemorySearchCache,
     NoMatchingProductType,
     PluginImplementationError,
     ProviderConfig,
     RequestError,
     SearchResult,
     UnsupportedProvider,
+    ValidationError,
     get_geometry_from_various,
     load_default_config,
     makedirs,
+    parse_qsl,
+    urlsplit,
 )
 from tests.utils import mock, write_eodag_conf_with_fake_credentials
 
@@ -1193,7 +1206,9 @@ class TestCoreSearch(TestCoreBase):
             "geometry": None,
             "productType": None,
         }
-        expected = set(["geometry", "productType", "auth", "search_plugin"])
+        expected = set(
+            ["geometry", "productType", "auth", "search_plugin", "product_type_config"]
+        )
         self.assertSetEqual(expected, set(prepared_search))
 
     @mock.patch(
@@ -1239,6 +1254,12 @@ class TestCoreSearch(TestCoreBase):
         self.assertNotIn("bbox", prepared_search)
         self.assertNotIn("bbox", prepared_search)
         self.assertIsInstance(prepared_search["geometry"], Polygon)
+        # the geometry given is prepared in a copy
+        geom = box(0, 50, 2, 52)
+        prepared_search = self.dag._prepare_search(geom=geom)
+        self.assertTrue(shapely.is_prepared(prepared_search["geometry"]))
+        self.assertTrue(prepared_search["geometry"].equals(geom))
+        self.assertFalse(shapely.is_prepared(geom))
 
     @mock.patch(
         "eodag.api.core.EODataAccessGateway.fetch_product_types_list", autospec=True
@@ -1305,8 +1326,24 @@ class TestCoreSearch(TestCoreBase):
         self.assertEqual(prepared_search["productType"], base["productType"])
         self.assertEqual(prepared_search["cloudCover"], base["cloudCover"])
 
+    def test__prepare_search_on_given_provider(self):
+        """_prepare_search must use the search plugin of the given provider"""
+        prev_fav_provider = self.dag.get_preferred_provider()[0]
+        try:
+            self.dag.set_preferred_provider("peps")
+            prepared_search = self.dag._prepare_search(
+                productType="S2_MSI_L1C", provider="creodias"
+            )
+            self.assertEqual(prepared_search["search_plugin"].provider, "creodias")
+            self.assertNotIn("provider", prepared_search)
+            # the provider is kept for a search by id
+            prepared_search = self.dag._prepare_search(id="foo", provider="creodias")
+            self.assertEqual(prepared_search["provider"], "creodias")
+        finally:
+            self.dag.set_preferred_provider(prev_fav_provider)
+
     def test__prepare_search_search_plugin_has_known_product_properties(self):
-        """_prepare_search must attach the product properties to the search plugin"""
+        """_prepare_search must return the product properties for the search plugin"""
         prev_fav_provider = self.dag.get_preferred_provider()[0]
         try:
             self.dag.set_preferred_provider("peps")
@@ -1316,7 +1353,7 @@ class TestCoreSearch(TestCoreBase):
             # abstract, platform, etc.) but this is sufficient to check that the
             # product_type_config dict has been created and populated.
             self.assertEqual(
-                prepared_search["search_plugin"].config.product_type_config["title"],
+                prepared_search["product_type_config"]["title"],
                 "SENTINEL2 Level-1C",
             )
         finally:
@@ -1328,7 +1365,7 @@ class TestCoreSearch(TestCoreBase):
     def test__prepare_search_search_plugin_has_generic_product_properties(
         self, mock_fetch_product_types_list
     ):
-        """_prepare_search must be able to attach the generic product properties to the search plugin"""
+        """_prepare_search must be able to return the generic product properties"""
         prev_fav_provider = self.dag.get_preferred_provider()[0]
         try:
             self.dag.set_preferred_provider("peps")
@@ -1337,7 +1374,7 @@ class TestCoreSearch(TestCoreBase):
             # product_type_config is still created if the product is not known to eodag
             # however it contains no data.
             self.assertIsNone(
-                prepared_search["search_plugin"].config.product_type_config["title"],
+                prepared_search["product_type_config"]["title"],
             )
         finally:
             self.dag.set_preferred_provider(prev_fav_provider)
@@ -1436,6 +1473,154 @@ class TestCoreSearch(TestCoreBase):
             self.assertEqual(found, (SearchResult([]), 0))
             self.assertIn("Several products found for this id", str(cm.output))
 
+    @mock.patch("eodag.api.core.EODataAccessGateway._do_search", autospec=True)
+    def test__search_by_id_race(self, mock__do_search):
+        """_search_by_id in race mode must return the first single-match result"""
+        release = threading.Event()
+        product = self.search_results[0]
+
+        def do_search(dag, search_plugin, **kwargs):
+            if search_plugin.provider == "peps":
+                # slow provider, that would be requested first in sequential mode
+                release.wait(5)
+            if search_plugin.provider == "creodias":
+                return SearchResult([product]), 1
+            return SearchResult([]), 0
+
+        mock__do_search.side_effect = do_search
+        try:
+            found, count = self.dag._search_by_id(
+                uid="foo",
+                provider=["peps", "onda", "creodias"],
+                race=True,
+                productType="S2_MSI_L1C",
+            )
+        finally:
+            release.set()
+        self.assertEqual(count, 1)
+        self.assertEqual(len(found), 1)
+        self.assertIs(found[0], product)
+        for call in mock__do_search.call_args_list:
+            self.assertEqual(call[1]["id"], "foo")
+
+        # nothing found
+        mock__do_search.side_effect = None
+        mock__do_search.return_value = (SearchResult([]), 0)
+        found = self.dag._search_by_id(
+            uid="foo", provider=["peps", "onda"], race=True, productType="S2_MSI_L1C"
+        )
+        self.assertEqual(found, (SearchResult([]), 0))
+
+    @mock.patch("eodag.api.core.EODataAccessGateway._search_by_id", autospec=True)
+    def test_search_by_id_providers_race(self, mock__search_by_id):
+        """search by id with providers must race them"""
+        mock__search_by_id.return_value = (SearchResult([]), 0)
+        self.dag.search(id="foo", productType="S2_MSI_L1C", providers=["peps", "onda"])
+        mock__search_by_id.assert_called_once()
+        self.assertEqual(mock__search_by_id.call_args[0][1], "foo")
+        self.assertTrue(mock__search_by_id.call_args[1]["race"])
+        self.assertEqual(mock__search_by_id.call_args[1]["provider"], ["peps", "onda"])
+
+    @mock.patch("eodag.api.core.EODataAccessGateway._do_search", autospec=True)
+    def test_search_providers(self, mock__do_search):
+        """search on several providers must merge their results and collect their errors"""
+
+        def do_search(dag, search_plugin, **kwargs):
+            if search_plugin.provider == "onda":
+                raise RequestError("onda is down")
+            return SearchResult([self.search_results[0]]), 1
+
+        mock__do_search.side_effect = do_search
+
+        results, count = self.dag.search(
+            productType="S2_MSI_L1C", providers=["peps", "onda", "creodias"]
+        )
+        self.assertEqual(mock__do_search.call_count, 3)
+        self.assertEqual(
+            {c[0][1].provider for c in mock__do_search.call_args_list},
+            {"peps", "onda", "creodias"},
+        )
+        for call in mock__do_search.call_args_list:
+            self.assertTrue(call[1]["raise_errors"])
+            self.assertEqual(call[1]["productType"], "S2_MSI_L1C")
+        self.assertEqual(len(results), 2)
+        self.assertEqual(count, 2)
+        self.assertEqual(len(results.errors), 1)
+        self.assertEqual(results.errors[0][0], "onda")
+        self.assertIsInstance(results.errors[0][1], RequestError)
+
+        # errors can be raised
+        with self.assertRaises(RequestError):
+            self.dag.search(
+                productType="S2_MSI_L1C",
+                providers=["peps", "onda"],
+                raise_errors=True,
+            )
+
+    @mock.patch("eodag.api.core.EODataAccessGateway._do_search", autospec=True)
+    def test_search_all_providers(self, mock__do_search):
+        """search with providers="all" must search on every provider supporting the product type"""
+        mock__do_search.return_value = (SearchResult([]), 0)
+        self.dag.search(productType="S2_MSI_L1C", providers="all")
+        expected_providers = [
+            p.provider
+            for p in self.dag._plugins_manager.get_search_plugins(
+                product_type="S2_MSI_L1C"
+            )
+        ]
+        self.assertEqual(mock__do_search.call_count, len(expected_providers))
+        self.assertEqual(
+            sorted(c[0][1].provider for c in mock__do_search.call_args_list),
+            sorted(expected_providers),
+        )
+
+    @mock.patch("eodag.api.core.EODataAccessGateway._do_search", autospec=True)
+    def test_search_providers_timeout(self, mock__do_search):
+        """search on several providers must not wait for providers that timed out"""
+        release = threading.Event()
+
+        def do_search(dag, search_plugin, **kwargs):
+            if search_plugin.provider == "onda":
+                release.wait(5)
+            return SearchResult([self.search_results[0]]), 1
+
+        mock__do_search.side_effect = do_search
+        try:
+            results, count = self.dag.search(
+                productType="S2_MSI_L1C",
+                providers=["peps", "onda"],
+                provider_timeout=0.2,
+            )
+        finally:
+            release.set()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(count, 1)
+        self.assertEqual(results.errors[0][0], "onda")
+        self.assertIsInstance(results.errors[0][1], concurrent.futures.TimeoutError)
+
+    @mock.patch("eodag.api.core.EODataAccessGateway._do_search", autospec=True)
+    def test_search_providers_timeout_per_provider(self, mock__do_search):
+        """The timeout of each provider must be counted from the start of its search"""
+        searches = []
+
+        def do_search(dag, search_plugin, **kwargs):
+            searches.append(search_plugin.provider)
+            time.sleep(0.3)
+            return SearchResult([self.search_results[0]]), 1
+
+        mock__do_search.side_effect = do_search
+        # the second search is queued while the first one runs
+        results, count = self.dag.search(
+            productType="S2_MSI_L1C",
+            providers=["peps", "onda"],
+            max_workers=1,
+            provider_timeout=0.5,
+        )
+        self.assertEqual(searches, ["peps", "onda"])
+        self.assertEqual(results.errors, [])
+        self.assertEqual(len(results), 2)
+        self.assertEqual(count, 2)
+
     @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
     def test__do_search_support_itemsperpage_higher_than_maximum(self, search_plugin):
         """_do_search must create a count query by default"""
@@ -1632,23 +1817,36 @@ class TestCoreSearch(TestCoreBase):
             self.assertIsNotNone(product.downloader)
 
     @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
-    def test__do_search_doest_not_register_downloader_if_no_search_intersection(
-        self, search_plugin
-    ):
-        """_do_search must not register downloaders if search_intersection is None"""
-
-        class DummyProduct:
-            seach_intersecion = None
+    def test__do_search_does_not_compute_search_intersection(self, search_plugin):
+        """_do_search must leave the products search intersection to be computed lazily"""
+        search_geometry = box(0, 0, 1, 1)
+        products = [
+            EOProduct(
+                "peps",
+                dict(geometry="POLYGON ((0 0, 2 0, 2 2, 0 0))", id=str(i)),
+                geometry=search_geometry,
+            )
+            for i in range(2)
+        ]
+        search_plugin.provider = "peps"
+        search_plugin.query.return_value = (products, 2)
 
         class DummyConfig:
             pagination = {}
 
         search_plugin.config = DummyConfig()
-        search_plugin.provider = "peps"
-        search_plugin.query.return_value = ([DummyProduct(), DummyProduct()], 2)
+
         sr, _ = self.dag._do_search(search_plugin=search_plugin)
+        self.assertEqual(len(sr), 2)
         for product in sr:
-            self.assertIsNone(product.downloader)
+            self.assertIsNotNone(product.downloader)
+            self.assertNotIn("_search_intersection", product.__dict__)
+            self.assertTrue(
+                product.search_intersection.equals(
+                    Polygon([(0, 0), (1, 0), (1, 1), (0, 0)])
+                )
+            )
+            self.assertIn("_search_intersection", product.__dict__)
 
     @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
     @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
@@ -1718,6 +1916,150 @@ class TestCoreSearch(TestCoreBase):
         self.assertEqual(len(all_page_results), 2)
         self.assertIsInstance(all_page_results[0], SearchResult)
 
+    @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
+    def test_search_iter_page_prefetch(self, search_plugin, prepare_seach):
+        """search_iter_page with prefetch must request next pages in advance"""
+        search_plugin.provider = "peps"
+        second_page_requested = threading.Event()
+
+        def query(*args, **kwargs):
+            if kwargs["page"] == 1:
+                return self.search_results.data, None
+            second_page_requested.set()
+            return [self.search_results_2.data[0]], None
+
+        search_plugin.query.side_effect = query
+
+        class DummyConfig:
+            pagination = {}
+
+        search_plugin.config = DummyConfig()
+        prepare_seach.return_value = dict(search_plugin=search_plugin)
+        page_iterator = self.dag.search_iter_page(items_per_page=2, prefetch=1)
+        first_result_page = next(page_iterator)
+        self.assertEqual(len(first_result_page), self.search_results_size)
+        # the second page is requested while the first one is processed
+        self.assertTrue(second_page_requested.wait(5))
+        all_page_results = [first_result_page] + list(page_iterator)
+        self.assertEqual(len(all_page_results), 2)
+        self.assertIsInstance(all_page_results[1], SearchResult)
+        self.assertEqual(search_plugin.query.call_count, 2)
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_search_iter_page_prefetch_offset_pagination(self, mocked_request):
+        """search_iter_page with prefetch must request next pages concurrently on
+        page/offset paginated providers"""
+        dag = EODataAccessGateway()
+        dummy_provider_config = """
+        dummy_provider:
+            search:
+                type: QueryStringSearch
+                api_endpoint: https://api.my_new_provider/search
+                pagination:
+                    next_page_url_tpl: '{url}?{search}&maxRecords={items_per_page}&page={page}'
+                    total_items_nb_key_path: '$.totalResults'
+                metadata_mapping:
+                    id: '$.id'
+                    geometry: '$.geometry'
+            products:
+                S2_MSI_L1C:
+                    productType: '{productType}'
+            download:
+                type: HTTPDownload
+                base_uri: https://api.my_new_provider/download
+        """
+        dag.update_providers_config(dummy_provider_config)
+        dag.set_preferred_provider("dummy_provider")
+        # pages 2 and 3 are only returned once both are requested
+        next_pages_requested = threading.Barrier(2, timeout=5)
+        requested_pages = []
+
+        def request(plugin, url, *args, **kwargs):
+            page = int(re.search(r"page=(\d+)", url).group(1))
+            requested_pages.append(page)
+            if page in (2, 3):
+                next_pages_requested.wait()
+            response = mock.Mock()
+            response.json.return_value = {
+                "totalResults": 9,
+                "features": [
+                    {"id": i, "geometry": {"type": "Point", "coordinates": [0, 0]}}
+                    for i in [
+                        "p%s" % i for i in range((page - 1) * 2, min(page * 2, 5))
+                    ]
+                ],
+            }
+            return response
+
+        mocked_request.side_effect = request
+        pages = list(
+            dag.search_iter_page(productType="S2_MSI_L1C", items_per_page=2, prefetch=2)
+        )
+        self.assertEqual(
+            [[p.properties["id"] for p in page] for page in pages],
+            [["p0", "p1"], ["p2", "p3"], ["p4"]],
+        )
+        self.assertFalse(next_pages_requested.broken)
+        self.assertEqual(sorted(requested_pages)[:3], [1, 2, 3])
+
+    @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
+    def test_search_iter_page_prefetch_stopped_early(
+        self, search_plugin, prepare_seach
+    ):
+        """search_iter_page with prefetch must end the pages iteration when the caller
+        stops early"""
+        search_plugin.provider = "peps"
+        # endless pages, not having the same first product one after the other
+        search_plugin.query.side_effect = lambda *args, **kwargs: (
+            [self.search_results.data, self.search_results_2.data][kwargs["page"] % 2],
+            None,
+        )
+
+        class DummyConfig:
+            pagination = {}
+
+        search_plugin.config = DummyConfig()
+        prepare_seach.return_value = dict(search_plugin=search_plugin)
+        pages_closed = threading.Event()
+        # the pages iterators are kept referenced, not to be closed when collected
+        pages_iterators = []
+        search_iter_page_plugin = self.dag._search_iter_page_plugin
+
+        def pages_iterator(*args, **kwargs):
+            try:
+                yield from search_iter_page_plugin(*args, **kwargs)
+            finally:
+                pages_closed.set()
+
+        def get_pages_iterator(*args, **kwargs):
+            pages_iterators.append(pages_iterator(*args, **kwargs))
+            return pages_iterators[-1]
+
+        with mock.patch.object(
+            self.dag, "_search_iter_page_plugin", side_effect=get_pages_iterator
+        ):
+            page_iterator = self.dag.search_iter_page(items_per_page=2, prefetch=1)
+            next(page_iterator)
+            page_iterator.close()
+            self.assertTrue(pages_closed.wait(5))
+
+    @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
+    def test_search_iter_page_prefetch_propagates_errors(
+        self, search_plugin, prepare_seach
+    ):
+        """search_iter_page with prefetch must propagate errors"""
+        search_plugin.provider = "peps"
+        search_plugin.query.side_effect = AttributeError()
+        prepare_seach.return_value = dict(search_plugin=search_plugin)
+        page_iterator = self.dag.search_iter_page(prefetch=2)
+        with self.assertRaises(AttributeError):
+            next(page_iterator)
+
     @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
     @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
     def test_search_iter_page_does_not_handle_query_errors(
@@ -1749,10 +2091,8 @@ class TestCoreSearch(TestCoreBase):
             "links": [{"rel": "next", "href": "url/to/next/page"}],
         }
 
-        p1 = EOProduct("dummy", dict(geometry="POINT (0 0)", id="1"))
-        p1.search_intersection = None
-        p2 = EOProduct("dummy", dict(geometry="POINT (0 0)", id="2"))
-        p2.search_intersection = None
+        p1 = EOProduct("peps", dict(geometry="POINT (0 0)", id="1"))
+        p2 = EOProduct("peps", dict(geometry="POINT (0 0)", id="2"))
         normalize_results.side_effect = [[p1], [p2]]
         dag = EODataAccessGateway()
         dummy_provider_config = """
@@ -1783,6 +2123,97 @@ class TestCoreSearch(TestCoreBase):
             "dummy_next_page_url_tpl",
         )
 
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch.normalize_results",
+        autospec=True,
+    )
+    def test_search_iter_page_next_mechanism_concurrent_searches(
+        self, normalize_results, _request
+    ):
+        """search_iter_page must follow the next pages urls of each search when several
+        searches use the same plugin at the same time"""
+        # each request waits for the one of the other search, so that the pages of the
+        # two searches are requested in turn
+        barrier = threading.Barrier(2, timeout=5)
+
+        def mock_request(plugin, url, info_message=None, exception_message=None):
+            if "productType=" in url:
+                search, page = url.split("productType=")[1].split("&")[0], 1
+            else:
+                search, page = url.split("/")[-2], int(url.split("/")[-1])
+            barrier.wait()
+            response = mock.MagicMock()
+            response.json.return_value = {
+                "features": [
+                    {"id": f"{search}-{page}-{i}"} for i in range(2 if page < 3 else 1)
+                ],
+                "links": [
+                    {
+                        "rel": "next",
+                        "href": f"https://api.my_new_provider/next/{search}/{page + 1}",
+                    }
+                ],
+            }
+            return response
+
+        _request.side_effect = mock_request
+        normalize_results.side_effect = lambda plugin, results, **kwargs: [
+            EOProduct("peps", dict(geometry="POINT (0 0)", id=r["id"])) for r in results
+        ]
+        dag = EODataAccessGateway()
+        dummy_provider_config = """
+        dummy_provider:
+            search:
+                type: QueryStringSearch
+                api_endpoint: https://api.my_new_provider/search
+                pagination:
+                    next_page_url_tpl: '{url}?{search}&page={page}'
+                    next_page_url_key_path: '$.links[?(@.rel="next")].href'
+                metadata_mapping:
+                    productType:
+                        - 'productType'
+                        - '$.properties.productType'
+            products:
+                S2_MSI_L1C:
+                    productType: L1C
+                S2_MSI_L2A:
+                    productType: L2A
+        """
+        dag.update_providers_config(dummy_provider_config)
+        dag.set_preferred_provider("dummy_provider")
+        search_plugin = next(
+            dag._plugins_manager.get_search_plugins(product_type="S2_MSI_L1C")
+        )
+
+        def search_ids(product_type):
+            return [
+                [product.properties["id"] for product in page]
+                for page in dag.search_iter_page(
+                    productType=product_type, items_per_page=2
+                )
+            ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            l1c_pages, l2a_pages = executor.map(
+                search_ids, ["S2_MSI_L1C", "S2_MSI_L2A"]
+            )
+
+        self.assertListEqual(
+            l1c_pages, [["L1C-1-0", "L1C-1-1"], ["L1C-2-0", "L1C-2-1"], ["L1C-3-0"]]
+        )
+        self.assertListEqual(
+            l2a_pages, [["L2A-1-0", "L2A-1-1"], ["L2A-2-0", "L2A-2-1"], ["L2A-3-0"]]
+        )
+        # the plugin configuration is left unchanged
+        self.assertEqual(
+            search_plugin.config.pagination["next_page_url_tpl"],
+            "{url}?{search}&page={page}",
+        )
+        self.assertFalse(hasattr(search_plugin.config, "product_type_config"))
+
     @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
     @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
     def test_search_all_must_collect_them_all(self, search_plugin, prepare_seach):
@@ -1811,6 +2242,421 @@ class TestCoreSearch(TestCoreBase):
         self.assertIsInstance(all_results, SearchResult)
         self.assertEqual(len(all_results), 3)
 
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_search_all_parallel_offset_pagination(self, mocked_request):
+        """search_all with workers must request the pages concurrently and keep their order"""
+        dag = EODataAccessGateway()
+        dummy_provider_config = """
+        dummy_provider:
+            search:
+                type: QueryStringSearch
+                api_endpoint: https://api.my_new_provider/search
+                pagination:
+                    next_page_url_tpl: '{url}?{search}&maxRecords={items_per_page}&page={page}'
+                    total_items_nb_key_path: '$.totalResults'
+                    max_items_per_page: 2
+                metadata_mapping:
+                    id: '$.id'
+                    geometry: '$.geometry'
+            products:
+                S2_MSI_L1C:
+                    productType: '{productType}'
+            download:
+                type: HTTPDownload
+                base_uri: https://api.my_new_provider/download
+        """
+        dag.update_providers_config(dummy_provider_config)
+        dag.set_preferred_provider("dummy_provider")
+
+        def request(plugin, url, *args, **kwargs):
+            page = int(re.search(r"page=(\d+)", url).group(1))
+            ids = ["p%s" % i for i in range((page - 1) * 2, min(page * 2, 5))]
+            response = mock.Mock()
+            response.json.return_value = {
+                "totalResults": 5,
+                "features": [
+                    {"id": i, "geometry": {"type": "Point", "coordinates": [0, 0]}}
+                    for i in ids
+                ],
+            }
+            return response
+
+        mocked_request.side_effect = request
+        results = dag.search_all(productType="S2_MSI_L1C", workers=3)
+        self.assertEqual(
+            [p.properties["id"] for p in results], ["p0", "p1", "p2", "p3", "p4"]
+        )
+        self.assertEqual(mocked_request.call_count, 3)
+        # the plugin used by the main thread must not be modified by the page searches
+        search_plugin = next(
+            dag._plugins_manager.get_search_plugins(provider="dummy_provider")
+        )
+        self.assertIn("page=1", search_plugin.search_urls[0])
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_search_all_parallel_page_error(self, mocked_request):
+        """search_all with workers must report the pages it could not get"""
+        dag = EODataAccessGateway()
+        dummy_provider_config = """
+        dummy_provider:
+            search:
+                type: QueryStringSearch
+                api_endpoint: https://api.my_new_provider/search
+                pagination:
+                    next_page_url_tpl: '{url}?{search}&maxRecords={items_per_page}&page={page}'
+                    total_items_nb_key_path: '$.totalResults'
+                    max_items_per_page: 2
+                metadata_mapping:
+                    id: '$.id'
+                    geometry: '$.geometry'
+            products:
+                S2_MSI_L1C:
+                    productType: '{productType}'
+            download:
+                type: HTTPDownload
+                base_uri: https://api.my_new_provider/download
+        """
+        dag.update_providers_config(dummy_provider_config)
+        dag.set_preferred_provider("dummy_provider")
+        page_error = RequestError("page 3 failed")
+
+        def request(plugin, url, *args, **kwargs):
+            page = int(re.search(r"page=(\d+)", url).group(1))
+            if page == 3:
+                raise page_error
+            response = mock.Mock()
+            response.json.return_value = {
+                "totalResults": 10,
+                "features": [
+                    {"id": i, "geometry": {"type": "Point", "coordinates": [0, 0]}}
+                    for i in ["p%s" % i for i in range((page - 1) * 2, page * 2)]
+                ],
+            }
+            return response
+
+        mocked_request.side_effect = request
+        with self.assertLogs("eodag.core", level="WARNING") as cm:
+            results = dag.search_all(productType="S2_MSI_L1C", workers=3)
+        self.assertIn("Could not get page 3", "\n".join(cm.output))
+        self.assertEqual(
+            [p.properties["id"] for p in results],
+            ["p0", "p1", "p2", "p3", "p6", "p7", "p8", "p9"],
+        )
+        self.assertEqual(results.errors, [("dummy_provider", page_error)])
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_search_all_time_windows(self, mocked_request):
+        """search_all must split the time interval of searches exceeding the provider limit"""
+        dag = EODataAccessGateway()
+        dummy_provider_config = """
+        dummy_provider:
+            search:
+                type: QueryStringSearch
+                api_endpoint: https://api.my_new_provider/search
+                pagination:
+                    next_page_url_tpl: '{url}?{search}&maxRecords={items_per_page}&page={page}'
+                    total_items_nb_key_path: '$.totalResults'
+                    max_items_per_page: 2
+                    max_total_items: 3
+                metadata_mapping:
+                    id: '$.id'
+                    geometry: '$.geometry'
+                    startTimeFromAscendingNode:
+                        - 'start={startTimeFromAscendingNode}'
+                        - '$.date'
+                    completionTimeFromAscendingNode:
+                        - 'end={completionTimeFromAscendingNode}'
+                        - '$.date'
+            products:
+                S2_MSI_L1C:
+                    productType: '{productType}'
+            download:
+                type: HTTPDownload
+                base_uri: https://api.my_new_provider/download
+        """
+        dag.update_providers_config(dummy_provider_config)
+        dag.set_preferred_provider("dummy_provider")
+        # one product per day
+        dates = ["2020-01-%02dT00:00:00.000000Z" % day for day in range(1, 11)]
+        counts = []
+
+        def request(plugin, url, *args, **kwargs):
+            query = dict(parse_qsl(urlsplit(url).query))
+            page, items_per_page = int(query["page"]), int(query["maxRecords"])
+            # boundaries are inclusive: products may be returned by 2 windows
+            matching = [d for d in dates if query["start"] <= d <= query["end"]]
+            if items_per_page == 1:
+                counts.append(len(matching))
+            response = mock.Mock()
+            response.json.return_value = {
+                "totalResults": len(matching),
+                "features": [
+                    {
+                        "id": "p%s" % dates.index(d),
+                        "date": d,
+                        "geometry": {"type": "Point", "coordinates": [0, 0]},
+                    }
+                    for d in matching[
+                        (page - 1) * items_per_page : page * items_per_page
+                    ]
+                ],
+            }
+            return response
+
+        mocked_request.side_effect = request
+        results = dag.search_all(
+            productType="S2_MSI_L1C",
+            start="2020-01-01T00:00:00Z",
+            end="2020-01-10T00:00:00Z",
+        )
+        self.assertEqual(
+            [p.properties["id"] for p in results], ["p%s" % i for i in range(10)]
+        )
+        # the whole interval has been counted then split
+        self.assertEqual(counts[0], 10)
+        self.assertGreater(len(counts), 1)
+
+        # same results with concurrent windows
+        results = dag.search_all(
+            productType="S2_MSI_L1C",
+            start="2020-01-01T00:00:00Z",
+            end="2020-01-10T00:00:00Z",
+            workers=4,
+        )
+        self.assertEqual(
+            [p.properties["id"] for p in results], ["p%s" % i for i in range(10)]
+        )
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_search_all_time_windows_count_error(self, mocked_request):
+        """search_all must report the time windows it could not count"""
+        dag = EODataAccessGateway()
+        dummy_provider_config = """
+        dummy_provider:
+            search:
+                type: QueryStringSearch
+                api_endpoint: https://api.my_new_provider/search
+                pagination:
+                    next_page_url_tpl: '{url}?{search}&maxRecords={items_per_page}&page={page}'
+                    total_items_nb_key_path: '$.totalResults'
+                    max_items_per_page: 5
+                    max_total_items: 3
+                metadata_mapping:
+                    id: '$.id'
+                    geometry: '$.geometry'
+            products:
+                S2_MSI_L1C:
+                    productType: '{productType}'
+            download:
+                type: HTTPDownload
+                base_uri: https://api.my_new_provider/download
+        """
+        dag.update_providers_config(dummy_provider_config)
+        dag.set_preferred_provider("dummy_provider")
+        count_error = RequestError("count failed")
+
+        def request(plugin, url, *args, **kwargs):
+            query = dict(parse_qsl(urlsplit(url).query))
+            if query["maxRecords"] == "1":
+                raise count_error
+            response = mock.Mock()
+            response.json.return_value = {
+                "totalResults": 3,
+                # products without id
+                "features": [{"geometry": {"type": "Point", "coordinates": [0, 0]}}]
+                * 3,
+            }
+            return response
+
+        mocked_request.side_effect = request
+        with self.assertLogs("eodag.core", level="WARNING") as cm:
+            results = dag.search_all(
+                productType="S2_MSI_L1C",
+                start="2020-01-01T00:00:00Z",
+                end="2020-01-10T00:00:00Z",
+            )
+        self.assertIn("Could not count the results", cm.output[0])
+        # the products without id are not collapsed
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results.errors, [("dummy_provider", count_error)])
+
+    @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch.query", autospec=True)
+    def test_search_refresh_cache(self, mock_query):
+        """search must tell the search plugin to refresh the cached responses if asked to"""  # noqa
+        dag = EODataAccessGateway()
+        dag.set_preferred_provider("peps")
+        refreshed = []
+        mock_query.side_effect = lambda plugin, *args, **kwargs: (
+            refreshed.append(plugin.search_context.refresh_cache) or ([], 0)
+        )
+        dag.search(productType="S2_MSI_L1C", refresh_cache=True)
+        self.assertNotIn("refresh_cache", mock_query.call_args[1])
+        dag.search(productType="S2_MSI_L1C")
+        self.assertEqual(refreshed, [True, False])
+
+    def test_set_search_cache(self):
+        """set_search_cache must share the given cache between the search plugins"""
+        dag = EODataAccessGateway()
+        cache = MemorySearchCache()
+        dag.set_search_cache(cache)
+        for provider in ("peps", "creodias"):
+            search_plugin = next(
+                dag._plugins_manager.get_search_plugins(provider=provider)
+            )
+            self.assertIs(search_plugin.search_cache, cache)
+        dag.set_search_cache(None)
+        self.assertIsNone(
+            next(dag._plugins_manager.get_search_plugins(provider="peps")).search_cache
+        )
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_search_all_tiles(self, mocked_request):
+        """search_all must split the search geometry into tiles if asked to"""
+        dag = EODataAccessGateway()
+        dummy_provider_config = """
+        dummy_provider:
+            search:
+                type: QueryStringSearch
+                api_endpoint: https://api.my_new_provider/search
+                geometry_tile_size: 5
+                pagination:
+                    next_page_url_tpl: '{url}?{search}&maxRecords={items_per_page}&page={page}'
+                    total_items_nb_key_path: '$.totalResults'
+                metadata_mapping:
+                    id: '$.id'
+                    geometry:
+                        - 'geom={geometry#to_rounded_wkt}'
+                        - '$.geometry'
+            products:
+                S2_MSI_L1C:
+                    productType: '{productType}'
+            download:
+                type: HTTPDownload
+                base_uri: https://api.my_new_provider/download
+        """
+        dag.update_providers_config(dummy_provider_config)
+        dag.set_preferred_provider("dummy_provider")
+        products = {
+            "inside": box(10, 0, 10.5, 0.5),
+            # overlaps 2 tiles
+            "on_tiles_border": box(4, 0, 6, 0.5),
+            # intersects the bounding box of a tile but not the searched geometry
+            "in_tile_bbox": box(3, 3, 3.5, 3.5),
+            "outside": box(10, 10, 10.5, 10.5),
+        }
+        searched_geometries = []
+
+        def request(plugin, url, *args, **kwargs):
+            query = dict(parse_qsl(urlsplit(url).query))
+            searched_geometry = wkt.loads(query["geom"])
+            searched_geometries.append(searched_geometry)
+            matching = [
+                {"id": product_id, "geometry": mapping(product_geometry)}
+                for product_id, product_geometry in products.items()
+                if product_geometry.intersects(searched_geometry)
+            ]
+            response = mock.Mock()
+            response.json.return_value = {
+                "totalResults": len(matching),
+                "features": matching,
+            }
+            return response
+
+        mocked_request.side_effect = request
+        # L-shaped search area
+        geometry = box(0, 0, 20, 1).union(box(0, 0, 1, 20))
+        for workers in (None, 4):
+            searched_geometries.clear()
+            results = dag.search_all(
+                productType="S2_MSI_L1C", geom=geometry, workers=workers
+            )
+            self.assertCountEqual(
+                [p.properties["id"] for p in results], ["inside", "on_tiles_border"]
+            )
+            # 4 tiles along each branch of the L
+            self.assertEqual(len(searched_geometries), 7)
+            for searched_geometry in searched_geometries:
+                self.assertTrue(
+                    searched_geometry.equals(box(*searched_geometry.bounds))
+                )
+            for product in results:
+                self.assertTrue(
+                    product.search_intersection.equals(
+                        product.geometry.intersection(geometry)
+                    )
+                )
+
+        # tiling disabled
+        searched_geometries.clear()
+        results = dag.search_all(productType="S2_MSI_L1C", geom=geometry, tile_size=0)
+        self.assertEqual(len(searched_geometries), 1)
+        self.assertCountEqual(
+            [p.properties["id"] for p in results], ["inside", "on_tiles_border"]
+        )
+
+    @mock.patch(
+        "eodag.api.core.EODataAccessGateway._search_all_time_windows", autospec=True
+    )
+    def test__search_all_tiles_time_windows(self, mock__search_all_time_windows):
+        """_search_all_tiles must split the time interval of each tile with the same workers"""  # noqa
+        dag = EODataAccessGateway()
+        search_plugin = next(dag._plugins_manager.get_search_plugins(provider="peps"))
+        tiles_errors = [
+            ("peps", RequestError("first tile count failed")),
+            ("peps", RequestError("second tile count failed")),
+        ]
+        mock__search_all_time_windows.side_effect = [
+            SearchResult([], errors=[error]) for error in tiles_errors
+        ]
+        results = dag._search_all_tiles(
+            search_plugin,
+            [box(0, 0, 1, 1), box(1, 0, 2, 1)],
+            max_total_items=3,
+            workers=2,
+            geometry=box(0, 0, 2, 1),
+            productType="S2_MSI_L1C",
+        )
+        self.assertEqual(mock__search_all_time_windows.call_count, 2)
+        for call in mock__search_all_time_windows.call_args_list:
+            self.assertEqual(call[1]["workers"], 2)
+            self.assertEqual(call[1]["max_total_items"], 3)
+        self.assertCountEqual(results.errors, tiles_errors)
+
+    @mock.patch("eodag.api.core.EODataAccessGateway.search_iter_page", autospec=True)
+    def test_search_all_parallel_cursor_pagination(self, mocked_search_iter_page):
+        """search_all with workers must iterate sequentially over cursor paginated providers"""
+        dag = EODataAccessGateway()
+        dummy_provider_config = """
+        dummy_provider:
+            search:
+                type: QueryStringSearch
+                api_endpoint: https://api.my_new_provider/search
+                pagination:
+                    next_page_url_tpl: '{url}?{search}&maxRecords={items_per_page}&page={page}'
+                    next_page_url_key_path: '$.links[?(@.rel="next")].href'
+                metadata_mapping:
+                    dummy: 'dummy'
+            products:
+                S2_MSI_L1C:
+                    productType: '{productType}'
+        """
+        mocked_search_iter_page.return_value = (self.search_results for _ in range(1))
+        dag.update_providers_config(dummy_provider_config)
+        dag.set_preferred_provider("dummy_provider")
+        results = dag.search_all(productType="S2_MSI_L1C", workers=3)
+        mocked_search_iter_page.assert_called_once()
+        self.assertEqual(len(results), self.search_results_size)
+
     @mock.patch("eodag.api.core.EODataAccessGateway.search_iter_page", autospec=True)
     def test_search_all_use_max_items_per_page(self, mocked_search_iter_page):
         """search_all must use the configured parameter max_items_per_page if available"""
@@ -1947,3 +2793,169 @@ class TestCoreDownload(TestCoreBase):
         with self.assertLogs(level="INFO") as cm:
             self.dag.download(product)
             self.assertIn("Local product detected. Download skipped", str(cm.output))
+
+
+class TestCoreSerialize(TestCoreBase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestCoreSerialize, cls).setUpClass()
+        cls.dag = EODataAccessGateway()
+        cls.search_result = SearchResult(
+            [
+                EOProduct(
+                    "peps",
+                    dict(
+                        geometry=box(i, 0, i + 1, 1).wkt,
+                        id=str(i),
+                        cloudCover=10 * i,
+                    ),
+                    productType="S2_MSI_L1C",
+                )
+                for i in range(4)
+            ]
+        )
+
+    def setUp(self):
+        super(TestCoreSerialize, self).setUp()
+        self.tmp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        super(TestCoreSerialize, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_serialize_deserialize_geojson(self):
+        """deserialize must load the serialized products matching bbox and filters"""
+        filename = self.dag.serialize(
+            self.search_result, os.path.join(self.tmp_dir.name, "results.geojson")
+        )
+        same_results = self.dag.deserialize(filename)
+        self.assertEqual(len(same_results), len(self.search_result))
+        for product, same_product in zip(self.search_result, same_results):
+            self.assertEqual(
+                {k: same_product.properties[k] for k in product.properties},
+                product.properties,
+            )
+            self.assertTrue(product.geometry.equals(same_product.geometry))
+        some_results = self.dag.deserialize(
+            filename, bbox=(1.5, 0, 10, 1), filters=[("cloudCover", "<", 30)]
+        )
+        self.assertListEqual([p.properties["id"] for p in some_results], ["1", "2"])
+
+        with self.assertRaises(ValidationError):
+            self.dag.serialize(self.search_result, filename, format="csv")
+
+    # the columnar formats writers and readers expand the files paths
+    @mock.patch("os.path.expanduser", side_effect=lambda path: path)
+    def test_serialize_columnar_formats(self, mock_expanduser):
+        """serialize must guess the format from the file extension"""
+        for extension, module in ((".parquet", "pyarrow"), (".fgb", "geopandas")):
+            filename = os.path.join(self.tmp_dir.name, "results" + extension)
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                with self.assertRaisesRegex(NotImplementedError, module):
+                    self.dag.serialize(self.search_result, filename)
+                continue
+            self.dag.serialize(self.search_result, filename)
+            # the products are stored in a spatial order
+            some_results = self.dag.deserialize(
+                filename, bbox=(1.5, 0, 10, 1), filters=[("cloudCover", "<", 30)]
+            )
+            self.assertListEqual(
+                sorted(p.properties["id"] for p in some_results), ["1", "2"]
+            )
+
+    @unittest.skipIf(
+        importlib.util.find_spec("pyarrow") is None
+        or importlib.util.find_spec("geopandas") is None,
+        "pyarrow and geopandas needed",
+    )
+    @mock.patch("os.path.expanduser", side_effect=lambda path: path)
+    def test_serialize_columnar_formats_properties(self, mock_expanduser):
+        """Columnar formats must keep the properties whatever their types"""
+        search_result = SearchResult([])
+        for filename in sorted(
+            glob.glob(
+                os.path.join(TEST_RESOURCES_PATH, "eodag_search_result_*.geojson")
+            )
+        ):
+            search_result.extend(self.dag.deserialize(filename))
+        # values of several types, and booleans with missing values
+        search_result[0].properties.update(orbit=12, online=True)
+        search_result[1].properties.update(orbit="12A")
+
+        all_same_results = [
+            ColumnarSearchResult.from_arrow(
+                search_result.to_columnar().to_arrow()
+            ).to_search_result()
+        ]
+        for extension in (".parquet", ".fgb"):
+            filename = self.dag.serialize(
+                search_result, os.path.join(self.tmp_dir.name, "results" + extension)
+            )
+            all_same_results.append(self.dag.deserialize(filename))
+            # filters on properties missing from the file match no products
+            self.assertListEqual(
+                list(self.dag.deserialize(filename, filters=[("foo", "=", 1)])), []
+            )
+            self.assertListEqual(
+                [
+                    p.properties["id"]
+                    for p in self.dag.deserialize(
+                        filename, filters=[("online", "=", True)]
+                    )
+                ],
+                [search_result[0].properties["id"]],
+            )
+
+        for same_results in all_same_results:
+            same_products = {p.properties["id"]: p for p in same_results}
+            self.assertEqual(len(same_products), len(search_result))
+            for product in search_result:
+                same_product = same_products[product.properties["id"]]
+                self.assertEqual(same_product.provider, product.provider)
+                self.assertEqual(same_product.product_type, product.product_type)
+                # missing and None values are the same in columns
+                self.assertDictEqual(
+                    {
+                        k: v
+                        for k, v in same_product.properties.items()
+                        if k != "geometry"
+                    },
+                    {
+                        k: v
+                        for k, v in product.properties.items()
+                        if k != "geometry" and v is not None
+                    },
+                )
+                self.assertTrue(same_product.geometry.equals(product.geometry))
+
+    def test_serialize_deserialize_iter(self):
+        """serialize_iter and deserialize_iter must stream products"""
+        filename = os.path.join(self.tmp_dir.name, "results.geojsonl")
+        pages = (SearchResult(self.search_result[i : i + 2]) for i in (0, 2))
+        self.assertEqual(self.dag.serialize_iter(pages, filename), filename)
+        with open(filename) as fh:
+            self.assertEqual(len(fh.readlines()), 4)
+        # products can be appended
+        self.dag.serialize_iter(self.search_result[:1], filename, append=True)
+
+        products = self.dag.deserialize_iter(filename)
+        self.assertIsInstance(products, types.GeneratorType)
+        self.assertListEqual(
+            [p.properties["id"] for p in products], ["0", "1", "2", "3", "0"]
+        )
+        self.assertListEqual(
+            [
+                p.properties["id"]
+                for p in self.dag.deserialize(
+                    filename, filters=[("cloudCover", ">=", 10)]
+                )
+            ],
+            ["1", "2", "3"],
+        )
+        for product in self.dag.deserialize_and_register_iter(
+            filename, bbox=(0, 0, 0.5, 0.5)
+        ):
+            self.assertEqual(product.properties["id"], "0")
+            self.assertIsNotNone(product.downloader)
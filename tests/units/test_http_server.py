@@ -552,6 +552,18 @@ class RequestTestCase(unittest.TestCase):
         self.assertIn("matched", response["context"])
         self.assertIn("returned", response["context"])
 
+    def test_search_response_geojson(self):
+        """Responses to valid search requests must be GeoJSON serialized at once"""
+        for url in (
+            f"search?collections={self.tested_product_type}",
+            f"collections/{self.tested_product_type}/items",
+            f"catalogs/{self.tested_product_type}/items",
+        ):
+            response = self._request_valid_raw(url)
+            self.assertEqual("application/geo+json", response.headers["content-type"])
+            feature = geojson.loads(response.content.decode("utf-8"))["features"][0]
+            self.assertTrue(geojson.GeoJSON.to_instance(feature["geometry"]).is_valid)
+
     def test_search_provider_in_downloadlink(self):
         """Search through eodag server and check that specified provider appears in downloadLink"""
         # with provider (get)
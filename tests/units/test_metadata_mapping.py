@@ -23,9 +23,13 @@ from shapely import wkt
 
 from tests.context import (
     NOT_AVAILABLE,
+    JsonMetadataExtractor,
+    XmlMetadataExtractor,
     format_metadata,
     get_geometry_from_various,
+    mtd_cfg_as_conversion_and_querypath,
     properties_from_json,
+    properties_from_xml,
 )
 
 
@@ -335,6 +339,106 @@ class TestMetadataFormatter(unittest.TestCase):
             },
         )
 
+    def test_json_metadata_extractor(self):
+        """JsonMetadataExtractor must extract typed properties like properties_from_json"""
+        mapping = mtd_cfg_as_conversion_and_querypath(
+            {
+                "id": "$.id",
+                "cloudCover": "$.cloud",
+                "orbitNumber": "$.orbit",
+                "startTimeFromAscendingNode": "{$.date#to_iso_utc_datetime}",
+                "bbox": "{$.geometry#from_ewkt}",
+                "keywords": "{$.keywords#replace_str(r'^(.*)$',r'[\\1]')}",
+                "title": "$.missing",
+                "platform": "S2A",
+                "resolution": "100",
+                "polarizationChannels": "['HH']",
+                "uid": "{id}-{platform}",
+            }
+        )
+        json = {
+            "id": "foo",
+            "cloud": "12.5",
+            "orbit": 3,
+            "date": "2021-04-21",
+            "geometry": "SRID=4326;POINT (1 2)",
+            "keywords": "1, 2",
+        }
+        extractor = JsonMetadataExtractor(mapping)
+        properties = extractor(json)
+        self.assertEqual(properties, properties_from_json(json, mapping))
+        self.assertEqual(
+            properties,
+            {
+                "id": "foo",
+                "cloudCover": 12.5,
+                "orbitNumber": 3,
+                "startTimeFromAscendingNode": "2021-04-21T00:00:00.000Z",
+                "bbox": "POINT (1 2)",
+                "keywords": [1, 2],
+                "title": NOT_AVAILABLE,
+                "platform": "S2A",
+                "resolution": 100,
+                "polarizationChannels": ["HH"],
+                "uid": "foo-S2A",
+            },
+        )
+        # extracted values are not shared between the products
+        properties["polarizationChannels"].append("VV")
+        self.assertEqual(extractor(json)["polarizationChannels"], ["HH"])
+
+    def test_xml_metadata_extractor(self):
+        """XmlMetadataExtractor must extract properties from xml entries elements"""
+        feed = etree.XML(
+            b'<feed xmlns="http://www.w3.org/2005/Atom" xmlns:eo="http://a9.com/eo">'
+            b"<entry><id>foo</id><eo:cloudCover>12</eo:cloudCover>"
+            b"<published>2021-04-21</published><category>a</category>"
+            b"<category>b</category><eo:orbit>3</eo:orbit></entry>"
+            b"<entry><id>bar</id><eo:cloudCover>5</eo:cloudCover>"
+            b"<published>2021-04-22</published></entry>"
+            b"</feed>"
+        )
+        mapping = mtd_cfg_as_conversion_and_querypath(
+            {
+                "id": "ns:id/text()",
+                "cloudCover": "eo:cloudCover/text()",
+                "publicationDate": "{ns:published/text()#to_iso_utc_datetime}",
+                "keywords": "ns:category/text()",
+                "title": "/ns:entry/ns:id/text()",
+                "platform": "Sentinel 2A",
+                "uid": "{id}-{platform}",
+            },
+            result_type="xml",
+        )
+        discovery_config = {"metadata_pattern": "^[a-zA-Z]+$", "metadata_path": "*"}
+        extractor = XmlMetadataExtractor(mapping, discovery_config=discovery_config)
+        entries = feed.findall("{http://www.w3.org/2005/Atom}entry")
+        properties = extractor(entries[0])
+        self.assertEqual(
+            properties,
+            properties_from_xml(
+                etree.tostring(entries[0]), mapping, discovery_config=discovery_config
+            ),
+        )
+        self.assertEqual(
+            properties,
+            {
+                "id": "foo",
+                "cloudCover": "12",
+                "publicationDate": "2021-04-21T00:00:00.000Z",
+                "keywords": ["a", "b"],
+                "title": "foo",
+                "platform": "Sentinel 2A",
+                "uid": "foo-Sentinel 2A",
+                # discovered
+                "orbit": "3",
+                "category": "a",
+            },
+        )
+        properties = extractor(entries[1])
+        self.assertEqual(properties["title"], "bar")
+        self.assertEqual(properties["keywords"], NOT_AVAILABLE)
+
     def test_convert_split_id_into_s1_params(self):
         to_format = "{id#split_id_into_s1_params}"
         expected = {
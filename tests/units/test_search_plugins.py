@@ -17,22 +17,36 @@
 # limitations under the License.
 
 import json
+import os
 import re
+import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest import mock
 
+import concurrent.futures
 import requests
 import responses
 from requests import RequestException
+from requests.auth import HTTPBasicAuth
+from shapely import geometry
 
 from tests.context import (
+    DEFAULT_MAX_ITEMS_PER_PAGE,
     HTTP_REQ_TIMEOUT,
     TEST_RESOURCES_PATH,
     USER_AGENT,
     AuthenticationError,
+    EODataAccessGateway,
     EOProduct,
+    JsonMetadataExtractor,
+    LocalCatalog,
+    LocalCatalogSearch,
+    MemorySearchCache,
+    PluginConfig,
     PluginManager,
+    QueryStringSearch,
     RequestError,
     cached_parse,
     get_geometry_from_various,
@@ -267,6 +281,179 @@ class TestSearchPluginQueryStringSearch(BaseSearchPluginTest):
         mock__request.assert_called()
         self.assertNotIn("cloudCover", mock__request.call_args_list[-1][0][1])
 
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_plugins_search_querystringseach_product_type_metadata_mapping(
+        self, mock__request
+    ):
+        """A query with a QueryStringSearch must not update the plugin metadata mapping with the product type one"""  # noqa
+        cloud_cover_mapping = self.peps_search_plugin.config.metadata_mapping[
+            "cloudCover"
+        ]
+        self.peps_search_plugin.query(productType="S1_SAR_GRD", cloudCover=50)
+        self.assertNotIn("cloudCover", mock__request.call_args_list[-1][0][1])
+        self.assertEqual(
+            self.peps_search_plugin.config.metadata_mapping["cloudCover"],
+            cloud_cover_mapping,
+        )
+
+        self.peps_search_plugin.query(productType="S2_MSI_L1C", cloudCover=50)
+        self.assertIn("cloudCover", mock__request.call_args_list[-1][0][1])
+
+    def test_plugins_search_querystringseach_normalize_workers(self):
+        """Results properties extracted in a pool of processes must be the same as sequentially extracted ones"""  # noqa
+        with open(self.provider_resp_dir / "peps_search.json") as f:
+            results = json.load(f)["features"] * 3
+        search_plugin = self.get_search_plugin(self.product_type, "peps")
+        search_plugin.metadata_mapping = search_plugin.get_metadata_mapping(
+            self.product_type
+        )
+        products = search_plugin.normalize_results(results)
+
+        with mock.patch.object(
+            search_plugin.config, "normalize_workers", 2, create=True
+        ), mock.patch.object(
+            search_plugin.config, "normalize_chunk_size", 2, create=True
+        ), mock.patch(
+            "concurrent.futures.ProcessPoolExecutor",
+            wraps=concurrent.futures.ProcessPoolExecutor,
+        ) as mock_executor, mock.patch.dict(
+            "eodag.plugins.search.qssearch._properties_executors", clear=True
+        ) as executors:
+            parallel_products = search_plugin.normalize_results(results)
+            # the pool of spawned processes is reused by the next searches
+            self.assertEqual(
+                [p.properties for p in search_plugin.normalize_results(results)],
+                [p.properties for p in parallel_products],
+            )
+            mock_executor.assert_called_once_with(max_workers=2, mp_context=mock.ANY)
+            self.assertEqual(
+                mock_executor.call_args[1]["mp_context"].get_start_method(), "spawn"
+            )
+            executors[2].shutdown()
+
+        self.assertEqual(len(parallel_products), 6)
+        for product, parallel_product in zip(products, parallel_products):
+            self.assertEqual(product.properties, parallel_product.properties)
+            self.assertTrue(product.geometry.equals_exact(parallel_product.geometry, 0))
+        self.assertEqual(products[0].geometry, geometry.shape(results[0]["geometry"]))
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_plugins_search_querystringseach_metadata_mapping_cache(
+        self, mock__request
+    ):
+        """QueryStringSearch must build the product type metadata mapping only once"""
+        search_plugin = self.get_search_plugin(provider="peps")
+        search_plugin.query(productType="S1_SAR_GRD")
+        s1_metadata_mapping = search_plugin.metadata_mapping
+        # product type specific mapping not merged in the plugin configuration
+        self.assertNotEqual(
+            s1_metadata_mapping["cloudCover"],
+            search_plugin.config.metadata_mapping["cloudCover"],
+        )
+
+        with mock.patch.object(
+            search_plugin,
+            "get_product_type_def_params",
+            wraps=search_plugin.get_product_type_def_params,
+        ) as mock_get_product_type_def_params:
+            search_plugin.query(productType="S1_SAR_GRD")
+            # only called once for the search, not to build the mapping again
+            mock_get_product_type_def_params.assert_called_once()
+        self.assertEqual(search_plugin.metadata_mapping, s1_metadata_mapping)
+        # each search gets its own copy of the cached mapping
+        self.assertIsNot(search_plugin.metadata_mapping, s1_metadata_mapping)
+        search_plugin.metadata_mapping["cloudCover"] = "dummy"
+        search_plugin.query(productType="S1_SAR_GRD")
+        self.assertEqual(search_plugin.metadata_mapping, s1_metadata_mapping)
+
+        search_plugin.query(productType="S2_MSI_L1C")
+        self.assertNotEqual(search_plugin.metadata_mapping, s1_metadata_mapping)
+
+        # mappings are built again once the configuration has been updated
+        self.plugins_manager.build_product_type_to_provider_config_map()
+        with mock.patch.object(
+            search_plugin,
+            "get_product_type_def_params",
+            wraps=search_plugin.get_product_type_def_params,
+        ) as mock_get_product_type_def_params:
+            search_plugin.query(productType="S1_SAR_GRD")
+            self.assertEqual(mock_get_product_type_def_params.call_count, 2)
+        self.assertEqual(search_plugin.metadata_mapping, s1_metadata_mapping)
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_plugins_search_querystringseach_metadata_extractor_cache(
+        self, mock__request
+    ):
+        """QueryStringSearch must build the properties extractor of a product type only once"""  # noqa
+        with open(self.provider_resp_dir / "peps_search.json") as f:
+            mock__request.return_value.json.return_value = json.load(f)
+        search_plugin = self.get_search_plugin(provider="peps")
+
+        with mock.patch(
+            "eodag.plugins.search.base.JsonMetadataExtractor",
+            wraps=JsonMetadataExtractor,
+        ) as mock_extractor, mock.patch(
+            "eodag.plugins.search.qssearch.JsonMetadataExtractor", mock_extractor
+        ):
+            products, _ = search_plugin.query(productType="S2_MSI_L1C", count=False)
+            same_products, _ = search_plugin.query(
+                productType="S2_MSI_L1C", count=False
+            )
+            self.assertEqual(mock_extractor.call_count, 1)
+            self.assertEqual(
+                [p.properties for p in products], [p.properties for p in same_products]
+            )
+
+            # the extractor of another product type has its own mapping
+            search_plugin.query(productType="S1_SAR_GRD", count=False)
+            self.assertEqual(mock_extractor.call_count, 2)
+
+            # extractors are built again once the configuration has been updated
+            self.plugins_manager.build_product_type_to_provider_config_map()
+            search_plugin.query(productType="S2_MSI_L1C", count=False)
+            self.assertEqual(mock_extractor.call_count, 3)
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_plugins_search_querystringseach_concurrent_searches(self, mock__request):
+        """Concurrent queries with the same QueryStringSearch must not share their search context"""  # noqa
+        with open(self.provider_resp_dir / "peps_search.json") as f:
+            peps_resp_search = json.load(f)
+        # both searches wait for each other once their search urls have been built
+        barrier = threading.Barrier(2, timeout=5)
+
+        def request(plugin, url, *args, **kwargs):
+            barrier.wait()
+            response = mock.Mock()
+            response.json.return_value = peps_resp_search
+            return response
+
+        mock__request.side_effect = request
+
+        def search(page):
+            self.peps_search_plugin.query(
+                page=page, items_per_page=2, **self.search_criteria_s2_msi_l1c
+            )
+            return (
+                self.peps_search_plugin.search_urls,
+                self.peps_search_plugin.total_items_nb,
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(search, [1, 2]))
+
+        for page, (search_urls, total_items_nb) in zip([1, 2], results):
+            self.assertEqual(len(search_urls), 1)
+            self.assertIn(f"page={page}", search_urls[0])
+            self.assertEqual(total_items_nb, 47)
+
     @mock.patch(
         "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
     )
@@ -360,6 +547,77 @@ class TestSearchPluginQueryStringSearch(BaseSearchPluginTest):
             keywords_list,
         )
 
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_plugins_search_querystringseach_search_cache(self, mock__request):
+        """A QueryStringSearch must get the responses of identical searches from its search cache"""  # noqa
+        with open(self.provider_resp_dir / "peps_search.json", "rb") as f:
+            peps_resp_search = f.read()
+
+        def request(*args, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = peps_resp_search
+            return response
+
+        mock__request.side_effect = request
+        self.peps_search_plugin.search_cache = MemorySearchCache()
+        try:
+            products, estimate = self.peps_search_plugin.query(
+                page=1, items_per_page=2, **self.search_criteria_s2_msi_l1c
+            )
+            cached_products, cached_estimate = self.peps_search_plugin.query(
+                page=1, items_per_page=2, **self.search_criteria_s2_msi_l1c
+            )
+            mock__request.assert_called_once()
+            self.assertEqual(self.peps_search_plugin.search_cache.stats["hits"], 1)
+            self.assertEqual(cached_estimate, estimate)
+            self.assertEqual(
+                [p.properties for p in cached_products],
+                [p.properties for p in products],
+            )
+
+            # another page is not cached
+            self.peps_search_plugin.query(
+                page=2, items_per_page=2, **self.search_criteria_s2_msi_l1c
+            )
+            self.assertEqual(mock__request.call_count, 2)
+
+            # the cached response is replaced with a new one
+            self.peps_search_plugin.search_context.refresh_cache = True
+            self.peps_search_plugin.query(
+                page=1, items_per_page=2, **self.search_criteria_s2_msi_l1c
+            )
+            self.assertEqual(mock__request.call_count, 3)
+            self.peps_search_plugin.search_context.refresh_cache = False
+            self.peps_search_plugin.query(
+                page=1, items_per_page=2, **self.search_criteria_s2_msi_l1c
+            )
+            self.assertEqual(mock__request.call_count, 3)
+
+            # the responses are cached per credentials
+            self.peps_search_plugin.config.need_auth = True
+            for username, call_count in (("foo", 4), ("bar", 5), ("foo", 5)):
+                self.peps_search_plugin.auth = HTTPBasicAuth(username, "password")
+                self.peps_search_plugin.query(
+                    page=1, items_per_page=2, **self.search_criteria_s2_msi_l1c
+                )
+                self.assertEqual(mock__request.call_count, call_count)
+
+            # cache disabled for the provider
+            self.peps_search_plugin.config.cache_ttl = 0
+            self.peps_search_plugin.query(
+                page=1, items_per_page=2, **self.search_criteria_s2_msi_l1c
+            )
+            self.assertEqual(mock__request.call_count, 6)
+        finally:
+            self.peps_search_plugin.search_cache = None
+            self.peps_search_plugin.search_context.refresh_cache = False
+            self.peps_search_plugin.config.need_auth = False
+            del self.peps_search_plugin.auth
+            del self.peps_search_plugin.config.cache_ttl
+
 
 class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
     def setUp(self):
@@ -454,6 +712,46 @@ class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
             self.awseos_search_plugin.total_items_nb, awseos_products_count
         )
 
+    @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch.query", autospec=True)
+    def test_plugins_search_postjsonsearch_specific_qssearch(self, mock_query):
+        """A PostJsonSearch must search with specific_qssearch parameters without updating its own configuration"""  # noqa
+        search_plugin = self.get_search_plugin("S2_MSI_L2A", "aws_eos")
+        config = dict(search_plugin.config.__dict__)
+        pagination = dict(search_plugin.config.pagination)
+        specific_plugins = []
+
+        def query(plugin, *args, **kwargs):
+            specific_plugins.append(plugin)
+            return [mock.sentinel.product], None
+
+        mock_query.side_effect = query
+        product_id = "S2A_MSIL2A_20200815T005251_N0214_R002_T55PCR_20200815T023440"
+        products, count = search_plugin.query(
+            productType="S2_MSI_L2A", id=product_id, auth=self.awseos_auth_plugin
+        )
+        self.assertEqual((products, count), ([mock.sentinel.product], 1))
+        specific_plugin = specific_plugins[0]
+        self.assertIs(type(specific_plugin), QueryStringSearch)
+        self.assertEqual(
+            specific_plugin.config.api_endpoint,
+            "https://roda.sentinel-hub.com/sentinel-s2-l2a/tiles/55/P/CR/2020/8/15/0/"
+            "{collection}.json",
+        )
+        self.assertEqual(specific_plugin.config.results_entry, "")
+        self.assertIn("awsPathL2A", specific_plugin.config.metadata_mapping)
+        self.assertFalse(mock_query.call_args[1]["count"])
+
+        # the plugin is left untouched for the next searches
+        self.assertEqual(search_plugin.config.__dict__, config)
+        self.assertEqual(search_plugin.config.pagination, pagination)
+        self.assertNotIn("_request", search_plugin.__dict__)
+        self.assertNotIn("count_hits", search_plugin.__dict__)
+
+        # the specific plugin is built once, each search using its own copy
+        search_plugin.query(productType="S2_MSI_L2A", id=product_id)
+        self.assertIsNot(specific_plugins[1], specific_plugin)
+        self.assertIs(specific_plugins[1].config, specific_plugin.config)
+
     @mock.patch(
         "eodag.plugins.search.qssearch.QueryStringSearch.count_hits", autospec=True
     )
@@ -983,3 +1281,175 @@ class TestSearchPluginDataRequestSearch(BaseSearchPluginTest):
             self.search_plugin.config.result_url.format(jobId="123"),
             headers=getattr(self.search_plugin.auth, "headers", ""),
         )
+
+
+class TestSearchPluginLocalCatalogSearch(BaseSearchPluginTest):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.catalog_path = os.path.join(self.tmp_dir.name, "catalog.db")
+        self.catalog = LocalCatalog(self.catalog_path)
+        self.catalog.upsert(
+            [
+                EOProduct(
+                    "peps",
+                    {
+                        "id": "product_%s" % i,
+                        "geometry": geometry.box(i, 0, i + 1, 1),
+                        "startTimeFromAscendingNode": "2020-08-%02dT10:00:00Z" % i,
+                        "completionTimeFromAscendingNode": "2020-08-%02dT10:00:05Z" % i,
+                        "cloudCover": 10 * i,
+                        "orbitDirection": "ascending" if i % 2 else "descending",
+                    },
+                    productType=self.product_type,
+                )
+                for i in range(1, 10)
+            ]
+        )
+        self.search_plugin = LocalCatalogSearch(
+            "local",
+            PluginConfig.from_mapping(
+                {
+                    "type": "LocalCatalogSearch",
+                    "api_endpoint": self.catalog_path,
+                    "priority": 0,
+                }
+            ),
+        )
+
+    def tearDown(self):
+        self.catalog.close()
+        self.search_plugin.catalog.close()
+        self.tmp_dir.cleanup()
+
+    def assertProductsIds(self, products, ids):
+        self.assertListEqual(
+            [product.properties["id"] for product in products],
+            ["product_%s" % i for i in ids],
+        )
+
+    def test_plugins_search_local_catalog_query(self):
+        """A LocalCatalogSearch query must filter the products of the catalog"""
+        products, count = self.search_plugin.query(productType=self.product_type)
+        self.assertEqual(count, 9)
+        self.assertProductsIds(products, range(1, 10))
+        self.assertEqual(products[0].provider, "peps")
+        self.assertEqual(products[0].product_type, self.product_type)
+        self.assertEqual(products[0].properties["cloudCover"], 10)
+
+        # other product types
+        products, count = self.search_plugin.query(productType="S1_SAR_GRD")
+        self.assertEqual((products, count), ([], 0))
+
+        # geometry, whose bounding box also intersects product_5 and product_6
+        search_geometry = geometry.Polygon([(3.5, 0.5), (3.5, 2.5), (6.5, 2.5)])
+        products, count = self.search_plugin.query(
+            productType=self.product_type, geometry=search_geometry
+        )
+        self.assertProductsIds(products, [3, 4])
+        self.assertTrue(
+            products[0].search_intersection.equals(
+                search_geometry.intersection(geometry.box(3, 0, 4, 1))
+            )
+        )
+
+        # dates, as FilterDate
+        products, count = self.search_plugin.query(
+            startTimeFromAscendingNode="2020-08-03",
+            completionTimeFromAscendingNode="2020-08-05T10:00:05Z",
+        )
+        self.assertProductsIds(products, [3, 4, 5])
+
+        # cloud cover and other properties
+        products, count = self.search_plugin.query(
+            cloudCover=50, orbitDirection="ascending"
+        )
+        self.assertProductsIds(products, [1, 3, 5])
+
+        # id
+        products, count = self.search_plugin.query(id="product_7")
+        self.assertProductsIds(products, [7])
+
+        # pagination
+        products, count = self.search_plugin.query(
+            items_per_page=2, page=2, count=False
+        )
+        self.assertProductsIds(products, [3, 4])
+        self.assertIsNone(count)
+        products, count = self.search_plugin.query(
+            geometry=geometry.box(0, 0, 20, 1), items_per_page=4, page=3
+        )
+        self.assertProductsIds(products, [9])
+        self.assertEqual(count, 9)
+
+    def test_plugins_search_local_catalog_pagination(self):
+        """The number of products per page of a LocalCatalogSearch must not be limited"""  # noqa
+        max_items_per_page = self.search_plugin.config.pagination["max_items_per_page"]
+        self.assertGreater(max_items_per_page, DEFAULT_MAX_ITEMS_PER_PAGE)
+        products, count = self.search_plugin.query(
+            items_per_page=max_items_per_page, page=1
+        )
+        self.assertProductsIds(products, range(1, 10))
+        products, _ = self.search_plugin.query(
+            items_per_page=max_items_per_page, page=2, count=False
+        )
+        self.assertListEqual(products, [])
+
+        # no warning about the number of products requested per page
+        with self.assertNoLogs("eodag.core", level="WARNING"):
+            products, count = EODataAccessGateway()._do_search(
+                self.search_plugin, items_per_page=500, page=1
+            )
+        self.assertEqual(count, 9)
+
+    def test_plugins_search_local_catalog_upsert(self):
+        """Products must be updated in a LocalCatalog using their provider and id"""
+        self.assertEqual(len(self.catalog), 9)
+        updated_product = EOProduct(
+            "peps",
+            {
+                "id": "product_1",
+                "geometry": geometry.box(50, 50, 51, 51),
+                "startTimeFromAscendingNode": "2021-01-01T00:00:00Z",
+            },
+            productType=self.product_type,
+        )
+        other_provider_product = EOProduct(
+            "creodias",
+            {"id": "product_1", "geometry": geometry.box(1, 0, 2, 1)},
+            productType=self.product_type,
+        )
+        self.assertEqual(
+            self.catalog.upsert([updated_product, other_provider_product]), 2
+        )
+        self.assertEqual(len(self.catalog), 10)
+
+        # the spatial index is updated too
+        products, _ = self.search_plugin.query(geometry=geometry.box(1.2, 0, 1.8, 1))
+        self.assertListEqual([p.provider for p in products], ["creodias"])
+        products, _ = self.search_plugin.query(geometry=geometry.box(50, 50, 51, 51))
+        self.assertEqual(len(products), 1)
+        self.assertEqual(
+            products[0].properties["startTimeFromAscendingNode"],
+            "2021-01-01T00:00:00Z",
+        )
+        self.assertNotIn("cloudCover", products[0].properties)
+
+        self.assertEqual(self.catalog.remove("peps", ["product_1", "product_2"]), 2)
+        self.assertEqual(len(self.catalog), 8)
+        products, _ = self.search_plugin.query(geometry=geometry.box(50, 50, 51, 51))
+        self.assertListEqual(products, [])
+
+    def test_plugins_search_local_catalog_upsert_without_id(self):
+        """Products without id must be skipped by LocalCatalog.upsert"""
+        catalog = LocalCatalog(":memory:")
+        with self.assertLogs("eodag.api.local_catalog", level="WARNING") as cm:
+            stored = catalog.upsert(
+                [
+                    EOProduct("peps", {"geometry": "POINT (0 0)", "title": "x"}),
+                    EOProduct("peps", {"geometry": "POINT (0 0)", "id": "y"}),
+                ]
+            )
+        self.assertIn("1 product(s) without id skipped", "\n".join(cm.output))
+        self.assertEqual(stored, 1)
+        self.assertEqual(len(catalog), 1)
+        catalog.close()
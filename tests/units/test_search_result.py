@@ -16,13 +16,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import gc
+import tracemalloc
 import unittest
 from collections import UserList
 
 import geojson
+import numpy
+from shapely.geometry import Polygon, box
 from shapely.geometry.collection import GeometryCollection
 
-from tests.context import EOProduct, SearchResult
+from tests.context import (
+    ColumnarSearchResult,
+    CompactEOProduct,
+    CrunchPipeline,
+    EOProduct,
+    FilterDate,
+    FilterDuplicates,
+    FilterLatestIntersect,
+    FilterMinimalCover,
+    FilterOverlap,
+    FilterProperty,
+    SearchResult,
+    first_covering_index,
+)
 
 
 class TestSearchResult(unittest.TestCase):
@@ -82,3 +100,550 @@ class TestSearchResult(unittest.TestCase):
             geojson.loads(geojson.dumps(self.search_result))
         )
         self.assertEqual(len(same_search_result), len(self.search_result))
+
+    def test_search_result_compact(self):
+        """SearchResult must be convertible to and from compact products"""
+        search_result = SearchResult(
+            [
+                EOProduct(
+                    provider="peps",
+                    properties={
+                        "id": str(i),
+                        "geometry": "POINT (0 0)",
+                        "storageStatus": status,
+                    },
+                    productType="S2_MSI_L1C",
+                )
+                for i, status in enumerate(["ONLINE", "OFFLINE"])
+            ]
+        )
+        compact_result = search_result.compact()
+        self.assertIsInstance(compact_result, SearchResult)
+        self.assertEqual(len(compact_result), len(search_result))
+        for product, compact_product in zip(search_result, compact_result):
+            self.assertIsInstance(compact_product, CompactEOProduct)
+            self.assertFalse(hasattr(compact_product, "__dict__"))
+            self.assertEqual(compact_product.properties, product.properties)
+            self.assertTrue(compact_product.geometry.equals(product.geometry))
+            self.assertEqual(compact_product.as_dict(), product.as_dict())
+        # properties are a view that cannot be updated
+        self.assertEqual(compact_result[0].properties["id"], "0")
+        self.assertNotIn("foo", compact_result[0].properties)
+        with self.assertRaises(KeyError):
+            compact_result[0].properties["foo"]
+        with self.assertRaises(TypeError):
+            compact_result[0].properties["id"] = "2"
+        self.assertEqual(
+            repr(compact_result[0]), "CompactEOProduct(id=0, provider=peps)"
+        )
+        # properties keys and search kwargs are shared between products
+        self.assertIs(compact_result[0]._keys, compact_result[1]._keys)
+        self.assertIs(compact_result[0].search_kwargs, compact_result[1].search_kwargs)
+        # crunchers work with compact products
+        self.assertEqual(len(compact_result.filter_online()), 1)
+
+        expanded_result = compact_result.expand()
+        for product, expanded_product in zip(search_result, expanded_result):
+            self.assertIsInstance(expanded_product, EOProduct)
+            self.assertEqual(expanded_product.as_dict(), product.as_dict())
+
+    def test_search_result_compact_memory(self):
+        """Compact products must stay compact once their properties have been read"""
+        compact_result = SearchResult(
+            [
+                EOProduct(
+                    provider="peps",
+                    properties={
+                        "id": str(i),
+                        "geometry": "POINT (0 0)",
+                        "storageStatus": "ONLINE" if i % 2 else "OFFLINE",
+                        **{"property%s" % j: j for j in range(20)},
+                    },
+                    productType="S2_MSI_L1C",
+                )
+                for i in range(1000)
+            ]
+        ).compact()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            online_result = compact_result.filter_online()
+            del online_result
+            [p.properties.get("id") for p in compact_result]
+            [repr(p) for p in compact_result]
+            gc.collect()
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # a dict kept per product would take more than 1 kB each
+        self.assertLess(after - before, 100000)
+
+    def test_search_result_columnar(self):
+        """SearchResult must be convertible to a columnar search result and crunched"""
+        search_result = SearchResult(
+            [
+                EOProduct(
+                    provider="peps",
+                    properties={
+                        "id": str(i),
+                        "geometry": box(i, 0, i + 1, 1).wkt,
+                        "cloudCover": float(10 * i),
+                        "storageStatus": "ONLINE" if i % 2 else "OFFLINE",
+                        "startTimeFromAscendingNode": f"2023-01-0{i + 1}T00:00:00Z",
+                        "completionTimeFromAscendingNode": f"2023-01-0{i + 1}T00:01:00Z",
+                    },
+                    productType="S2_MSI_L1C",
+                )
+                for i in range(4)
+            ]
+        )
+        columnar = search_result.to_columnar()
+        self.assertIsInstance(columnar, ColumnarSearchResult)
+        self.assertEqual(len(columnar), 4)
+        # numeric properties are held in native arrays
+        self.assertEqual(columnar.columns["cloudCover"].dtype, numpy.float64)
+        self.assertListEqual(columnar.columns["eodag_provider"].tolist(), ["peps"] * 4)
+        for product, same_product in zip(search_result, columnar.to_search_result()):
+            self.assertEqual(product.as_dict(), same_product.as_dict())
+
+        # vectorized crunchers and the ones going through products give the same ids
+        def ids(results):
+            return [p.properties["id"] for p in results]
+
+        for cruncher, search_params in (
+            (FilterProperty(dict(cloudCover=15, operator="gt")), {}),
+            (FilterProperty(dict(storageStatus="ONLINE")), {}),
+            (FilterDate(dict(start="2023-01-02", end="2023-01-03T12:00:00")), {}),
+            (FilterOverlap(dict(minimum_overlap=50)), {"geometry": box(0, 0, 2.2, 1)}),
+        ):
+            expected = ids(
+                search_result.crunch(copy.deepcopy(cruncher), **search_params)
+            )
+            self.assertListEqual(
+                ids(columnar.crunch(cruncher, **search_params).to_search_result()),
+                expected,
+            )
+        self.assertListEqual(
+            ids(columnar.filter_online().to_search_result()), ["1", "3"]
+        )
+        self.assertListEqual(
+            columnar.sort("cloudCover", reverse=True).columns["id"].tolist(),
+            ["3", "2", "1", "0"],
+        )
+
+        try:
+            import pyarrow  # noqa
+        except ImportError:
+            with self.assertRaisesRegex(NotImplementedError, "pyarrow needed"):
+                columnar.to_arrow()
+        else:
+            same_columnar = ColumnarSearchResult.from_arrow(columnar.to_arrow())
+            self.assertListEqual(
+                ids(same_columnar.to_search_result()), ids(search_result)
+            )
+
+    def test_search_result_to_geojson_bytes(self):
+        """SearchResult.to_geojson_bytes must serialize the same GeoJSON as as_geojson_object"""
+        search_result = SearchResult(
+            [
+                EOProduct(
+                    provider="peps",
+                    properties={
+                        "id": str(i),
+                        "geometry": box(i, 0, i + 1.5, 1).wkt,
+                        "cloudCover": 10 * i,
+                        "keywords": ["foo", "bar"],
+                    },
+                    productType="S2_MSI_L1C",
+                    # no intersection with the last product
+                    geometry=box(0, 0, 2.5, 0.5),
+                )
+                for i in range(3)
+            ]
+        )
+        # properties of a deserialized product
+        search_result.append(
+            EOProduct.from_geojson(geojson.loads(geojson.dumps(search_result[0])))
+        )
+        geojson_bytes = search_result.to_geojson_bytes()
+        self.assertIsInstance(geojson_bytes, bytes)
+        self.assertEqual(
+            geojson.loads(geojson_bytes),
+            geojson.loads(geojson.dumps(search_result.as_geojson_object())),
+        )
+        self.assertEqual(
+            SearchResult([]).to_geojson_bytes(),
+            b'{"type":"FeatureCollection","features":[]}',
+        )
+
+    def test_search_result_filter_overlap(self):
+        """SearchResult.filter_overlap must filter the products all at once"""
+        search_geometry = box(0, 0, 4, 4)
+        geometries = [
+            # within
+            box(1, 1, 2, 2),
+            # 25% of the product in the search extent
+            box(3, 3, 5, 5),
+            # 75% of the product in the search extent
+            box(1, 3, 3, 13 / 3),
+            # contains
+            box(-1, -1, 5, 5),
+            # outside
+            box(10, 10, 11, 11),
+            # invalid bowtie, repaired into two triangles, an eighth of it being in
+            # the search extent
+            Polygon([(3, 3), (5, 5), (5, 3), (3, 5)]),
+        ]
+        search_result = SearchResult(
+            [
+                EOProduct(
+                    "peps",
+                    {"id": str(i), "geometry": product_geometry},
+                    geometry=search_geometry,
+                )
+                for i, product_geometry in enumerate(geometries)
+            ]
+        )
+
+        def ids(results):
+            return [p.properties["id"] for p in results]
+
+        for crunch_params, expected_ids in (
+            (dict(minimum_overlap=0), ["0", "1", "2", "3", "4", "5"]),
+            (dict(minimum_overlap=10), ["0", "1", "2", "3", "5"]),
+            (dict(minimum_overlap=50), ["0", "2", "3"]),
+            (dict(minimum_overlap=80), ["0", "3"]),
+            (dict(within=True), ["0"]),
+            (dict(contains=True), ["3"]),
+            (dict(intersects=True), ["0", "1", "2", "3", "5"]),
+            (dict(within=True, contains=True), ["0", "1", "2", "3", "4", "5"]),
+        ):
+            self.assertListEqual(
+                ids(
+                    search_result.filter_overlap(
+                        geometry=search_geometry, **crunch_params
+                    )
+                ),
+                expected_ids,
+                crunch_params,
+            )
+        # products found with another search geometry keep their search intersection
+        other_search_result = SearchResult(
+            [EOProduct("peps", {"id": "0", "geometry": box(3, 3, 5, 5)})]
+        )
+        self.assertListEqual(
+            ids(
+                other_search_result.filter_overlap(
+                    geometry=search_geometry, minimum_overlap=50
+                )
+            ),
+            ["0"],
+        )
+        self.assertListEqual(
+            ids(
+                search_result.filter_overlap(
+                    geometry=box(0, 0, 4, 0), minimum_overlap=0
+                )
+            ),
+            [],
+        )
+
+    def test_search_result_filter_latest_intersect(self):
+        """SearchResult.filter_latest_intersect must keep the latest products until the search extent is covered"""
+        search_geometry = box(0, 0, 4, 1)
+        geometries = [
+            # latest products first
+            box(0, 0, 1, 1),
+            box(10, 10, 11, 11),
+            box(0.5, 0, 2, 1),
+            box(2, 0, 3.99, 1),
+            box(3, 0, 4, 1),
+            box(0, 0, 4, 1),
+        ]
+        search_result = SearchResult(
+            [
+                EOProduct(
+                    "peps",
+                    {
+                        "id": str(i),
+                        "geometry": product_geometry,
+                        "startTimeFromAscendingNode": f"2023-01-{10 - i:02d}",
+                    },
+                    geometry=search_geometry,
+                )
+                for i, product_geometry in enumerate(geometries)
+            ]
+        )
+
+        def ids(results):
+            return [p.properties["id"] for p in results]
+
+        # products not intersecting the search extent are skipped
+        self.assertListEqual(
+            ids(search_result.filter_latest_intersect(search_geometry)),
+            ["0", "2", "3", "4"],
+        )
+        # less than 1% of the search extent is left uncovered by product 3
+        self.assertListEqual(
+            ids(
+                search_result.crunch(
+                    FilterLatestIntersect({"coverage_tolerance": 0.01}),
+                    geometry=search_geometry,
+                )
+            ),
+            ["0", "2", "3"],
+        )
+        # not covered
+        self.assertListEqual(
+            ids(search_result[:4].filter_latest_intersect(box(0, 0, 5, 1))),
+            ["0", "2", "3"],
+        )
+        self.assertEqual(first_covering_index(search_geometry, geometries, window=2), 4)
+        self.assertIsNone(first_covering_index(search_geometry, geometries[:4]))
+
+    def test_search_result_filter_minimal_cover(self):
+        """SearchResult.filter_minimal_cover must select the fewest products covering the search extent"""
+        search_geometry = box(0, 0, 4, 1)
+        geometries = [
+            box(0, 0, 1, 1),
+            box(0, 0, 2.5, 1),
+            box(1, 0, 2, 1),
+            box(2, 0, 4, 1),
+            box(1.5, 0, 4, 1),
+            box(10, 10, 11, 11),
+        ]
+        search_result = SearchResult(
+            [
+                EOProduct(
+                    "peps",
+                    {
+                        "id": str(i),
+                        "geometry": product_geometry,
+                        "cloudCover": cloud_cover,
+                        "startTimeFromAscendingNode": f"2023-01-{10 - i:02d}",
+                    },
+                )
+                for i, (product_geometry, cloud_cover) in enumerate(
+                    zip(geometries, [0, 90, 0, 0, 80, 0])
+                )
+            ]
+        )
+
+        def ids(results):
+            return [p.properties["id"] for p in results]
+
+        # largest uncovered area first
+        self.assertListEqual(
+            ids(search_result.filter_minimal_cover(search_geometry)), ["1", "3"]
+        )
+        # cloudy products cost more
+        self.assertListEqual(
+            ids(
+                search_result.filter_minimal_cover(
+                    search_geometry, weight_by="cloudCover", weight_factor=10
+                )
+            ),
+            ["3", "0", "2"],
+        )
+        # target coverage reached with the first product
+        self.assertListEqual(
+            ids(search_result.filter_minimal_cover(search_geometry, 60)), ["1"]
+        )
+        # the latest products are preferred
+        self.assertListEqual(
+            ids(
+                search_result.crunch(
+                    FilterMinimalCover(
+                        dict(weight_by="date", weight_factor=10, minimum_coverage=50)
+                    ),
+                    geometry=search_geometry,
+                )
+            ),
+            ["0", "1"],
+        )
+        # not covered
+        self.assertListEqual(
+            ids(search_result[:2].filter_minimal_cover(search_geometry)), ["1"]
+        )
+
+    def test_search_result_crunch_pipeline(self):
+        """SearchResult.crunch_pipeline must crunch lazily as the chained crunchers"""
+        search_result = SearchResult(
+            [
+                EOProduct(
+                    "peps",
+                    {
+                        "id": str(i),
+                        "geometry": box(i, 0, i + 1, 1),
+                        "cloudCover": i * 10,
+                        "startTimeFromAscendingNode": f"2023-01-{i + 1:02d}",
+                    },
+                )
+                for i in range(10)
+            ]
+        )
+
+        def ids(results):
+            return [p.properties["id"] for p in results]
+
+        overlap = FilterOverlap(dict(intersects=True))
+        date = FilterDate(dict(start="2023-01-02"))
+        latest = FilterLatestIntersect({})
+        cloud_cover = FilterProperty(dict(cloudCover=60, operator="lt"))
+        pipeline = search_result.crunch_pipeline(
+            [overlap, date, latest, cloud_cover], chunk_size=3, geometry=[0, 0, 6, 1]
+        )
+        self.assertIsInstance(pipeline, CrunchPipeline)
+        # the cheapest filters first, up to the cruncher needing all the products
+        self.assertListEqual(
+            pipeline.stages, [[date, overlap], [latest], [cloud_cover]]
+        )
+
+        expected = (
+            search_result.filter_overlap([0, 0, 6, 1], intersects=True)
+            .filter_date(start="2023-01-02")
+            .filter_latest_intersect([0, 0, 6, 1])
+            .filter_property(operator="lt", cloudCover=60)
+        )
+        self.assertListEqual(ids(pipeline.collect()), ids(expected))
+        self.assertListEqual(ids(pipeline.collect()), ["5", "4", "3", "2", "1"])
+
+        # the products are filtered as they are iterated over
+        consumed = []
+
+        def products():
+            for product in search_result:
+                consumed.append(product)
+                yield product
+
+        lazy_pipeline = CrunchPipeline(
+            products(), [date, overlap], chunk_size=3, geometry=[0, 0, 6, 1]
+        )
+        self.assertListEqual(consumed, [])
+        self.assertEqual(next(iter(lazy_pipeline)).properties["id"], "1")
+        self.assertEqual(len(consumed), 3)
+
+        # the property filter is disabled if any of the products lacks the property
+        search_result[3].properties.pop("cloudCover")
+        cloud_cover = FilterProperty(dict(cloudCover=20, operator="lt"))
+        pipeline = SearchResult(search_result[:4]).crunch_pipeline(
+            [date, cloud_cover], chunk_size=2
+        )
+        self.assertListEqual(pipeline.stages, [[date], [cloud_cover]])
+        self.assertListEqual(
+            ids(pipeline.collect()),
+            ids(SearchResult(search_result[:4]).crunch(date).crunch(cloud_cover)),
+        )
+        self.assertListEqual(ids(pipeline.collect()), ["1", "2", "3"])
+
+    def test_search_result_filter_duplicates(self):
+        """SearchResult.filter_duplicates must keep a single copy of each product"""
+        title = "S2A_MSIL1C_20230101T105441_N0509_R051_T31TCJ_20230101T112302"
+        footprint = box(0.9998, 43.2001, 2.4001, 44.1999)
+
+        def product(provider, product_id, **properties):
+            return EOProduct(provider, dict(dict(id=product_id), **properties))
+
+        search_result = SearchResult(
+            [
+                product(
+                    "peps",
+                    "0",
+                    title=title,
+                    platformSerialIdentifier="S2A",
+                    startTimeFromAscendingNode="2023-01-01T10:54:41.024Z",
+                    geometry=footprint,
+                    storageStatus="OFFLINE",
+                ),
+                # another product of the same tile
+                product(
+                    "peps",
+                    "1",
+                    title=title.replace("20230101", "20230111"),
+                    platformSerialIdentifier="S2A",
+                    startTimeFromAscendingNode="2023-01-11T10:54:41.024Z",
+                    geometry=footprint,
+                ),
+                product(
+                    "creodias",
+                    "2",
+                    title=f"{title}.SAFE",
+                    geometry=footprint,
+                    storageStatus="ONLINE",
+                ),
+                # same acquisition, another title format
+                product(
+                    "earth_search",
+                    "3",
+                    title="S2A_31TCJ_20230101_0_L1C",
+                    platformSerialIdentifier="sentinel-2a",
+                    startTimeFromAscendingNode="2023-01-01T10:54:41Z",
+                    geometry=box(1, 43.2, 2.4, 44.2),
+                    storageStatus="ONLINE",
+                ),
+                product("peps", "4", geometry=box(10, 10, 11, 11)),
+            ]
+        )
+
+        def ids(results):
+            return [p.properties["id"] for p in results]
+
+        # the first online copy is kept
+        self.assertListEqual(ids(search_result.filter_duplicates()), ["1", "2", "4"])
+        self.assertListEqual(
+            ids(search_result.filter_duplicates(["earth_search", "creodias"])),
+            ["1", "3", "4"],
+        )
+        self.assertListEqual(
+            ids(search_result.filter_duplicates(["peps"], prefer_online=False)),
+            ["0", "1", "4"],
+        )
+        # footprints are compared to the given precision
+        self.assertListEqual(
+            ids(
+                SearchResult(search_result[:2] + search_result[3:]).crunch(
+                    FilterDuplicates(dict(footprint_precision=4))
+                )
+            ),
+            ["0", "1", "3", "4"],
+        )
+        # whatever their position on the grid used to find the close acquisitions
+        close_products = [
+            product(
+                "peps" if i == 0 else "creodias",
+                str(i),
+                platformSerialIdentifier="S2A",
+                startTimeFromAscendingNode=start,
+                geometry=box(minx, 43.2, minx + 1.4, 44.2),
+            )
+            for i, (start, minx) in enumerate(
+                [
+                    ("2023-01-01T10:54:41.499Z", 1.0449),
+                    ("2023-01-01T10:54:41.501Z", 1.0451),
+                ]
+            )
+        ]
+        self.assertListEqual(
+            ids(
+                SearchResult(close_products).crunch(
+                    FilterDuplicates(dict(footprint_precision=2))
+                )
+            ),
+            ["0"],
+        )
+        # the levels of a same acquisition are different products
+        levels = [
+            EOProduct(
+                "peps",
+                dict(
+                    id=str(i),
+                    platformSerialIdentifier="S2A",
+                    startTimeFromAscendingNode="2023-01-01T10:54:41.024Z",
+                    geometry=footprint,
+                ),
+                productType=product_type,
+            )
+            for i, product_type in enumerate(["S2_MSI_L1C", "S2_MSI_L2A"])
+        ]
+        self.assertListEqual(ids(SearchResult(levels).filter_duplicates()), ["0", "1"])
@@ -26,7 +26,7 @@ import pytest
 
 from eodag.utils.exceptions import ValidationError
 from tests import TEST_RESOURCES_PATH, mock
-from tests.context import SearchResult
+from tests.context import DEFAULT_ITEMS_PER_PAGE, SearchResult
 
 
 class TestStacUtils(unittest.TestCase):
@@ -360,7 +360,12 @@ class TestStacUtils(unittest.TestCase):
     )
     def test_search_products(self, mock_count_hits, mock_do_search):
         """search_products runs without any error"""
-        self.rest_utils.search_products("S2_MSI_L1C", {})
+        response = self.rest_utils.search_products("S2_MSI_L1C", {})
+        self.assertEqual(response.media_type, "application/geo+json")
+        self.assertEqual(
+            json.loads(response.body)["properties"],
+            {"page": 1, "itemsPerPage": DEFAULT_ITEMS_PER_PAGE, "totalResults": 1},
+        )
         self.rest_utils.search_products("S2_MSI_L1C", {"unserialized": "true"})
 
         # STAC formatted
@@ -19,6 +19,7 @@
 import copy
 import os
 import sys
+import time
 import unittest
 from contextlib import closing
 from datetime import datetime
@@ -26,15 +27,26 @@ from io import StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import requests
+from requests.auth import HTTPBasicAuth
+from shapely import geometry
+
 from tests.context import (
     DownloadedCallback,
+    MemorySearchCache,
     ProgressCallback,
+    SQLiteSearchCache,
+    cached_parse,
     deepcopy,
     flatten_top_directories,
     get_bucket_name_and_prefix,
+    get_jsonpath_keys,
     get_timestamp,
+    get_value_from_keys,
     merge_mappings,
+    parse_geometries,
     path_to_uri,
+    search_cache_key,
     setup_logging,
     uri_to_path,
 )
@@ -290,3 +302,167 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(shallow_copied["a"][0]["b"][0], 5)
         # deep copy did not change
         self.assertEqual(deep_copied["a"][0]["b"][0], 0)
+
+    def test_get_value_from_keys(self):
+        """get_value_from_keys must find the same values as the equivalent jsonpath"""
+        json = {
+            "foo": {"bar": "baz", "none": None},
+            "list": [{"a": 1}, {"a": 2}],
+            "text": "abc",
+        }
+        for path_str in [
+            "$.foo.bar",
+            "$.foo.none",
+            "$.foo.missing",
+            "$.foo.bar.missing",
+            "$.list[1].a",
+            "$.list[-1].a",
+            "$.list[2].a",
+            "$.list.a",
+            "$.text[0]",
+        ]:
+            path = cached_parse(path_str)
+            keys = get_jsonpath_keys(path)
+            self.assertIsNotNone(keys, path_str)
+            found = path.find(json)
+            value = get_value_from_keys(json, keys, "not found")
+            if found:
+                self.assertEqual(value, found[0].value, path_str)
+            else:
+                self.assertEqual(value, "not found", path_str)
+        # paths that must be evaluated by jsonpath_ng
+        for path_str in ["$.list[*].a", "$.list[?(@.a==1)]", "$.foo.*"]:
+            self.assertIsNone(get_jsonpath_keys(cached_parse(path_str)), path_str)
+
+    def test_parse_geometries(self):
+        """parse_geometries must parse WKT and GeoJSON geometries with shapely"""
+        not_serializable = {"type": "Point", "coordinates": {0, 1}}
+        parsed = parse_geometries(
+            [
+                "POINT (1 2)",
+                {"type": "Point", "coordinates": [3, 4]},
+                "not a wkt",
+                not_serializable,
+                5,
+            ]
+        )
+        self.assertEqual(parsed[0], geometry.Point(1, 2))
+        self.assertEqual(parsed[1], geometry.Point(3, 4))
+        # left to be parsed one by one
+        self.assertEqual(parsed[2:], ["not a wkt", not_serializable, 5])
+
+
+class TestSearchCache(unittest.TestCase):
+    def make_response(self, content=b'{"features": []}', headers=None):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = "https://foo.bar/search"
+        response.encoding = "utf-8"
+        response.headers.update(headers or {})
+        response._content = content
+        return response
+
+    def test_search_cache_key(self):
+        """search_cache_key must not depend on the order of the query parameters"""
+        self.assertEqual(
+            search_cache_key("foo", "https://foo.bar/search?a=1&b=2&page=1"),
+            search_cache_key("foo", "https://foo.bar/search?page=1&b=2&a=1"),
+        )
+        self.assertNotEqual(
+            search_cache_key("foo", "https://foo.bar/search?a=1&page=1"),
+            search_cache_key("foo", "https://foo.bar/search?a=1&page=2"),
+        )
+        self.assertNotEqual(
+            search_cache_key("foo", "https://foo.bar/search?a=1"),
+            search_cache_key("bar", "https://foo.bar/search?a=1"),
+        )
+        self.assertEqual(
+            search_cache_key("foo", "https://foo.bar/search", {"a": 1, "b": {"c": 2}}),
+            search_cache_key("foo", "https://foo.bar/search", {"b": {"c": 2}, "a": 1}),
+        )
+        self.assertNotEqual(
+            search_cache_key("foo", "https://foo.bar/search", {"a": 1}),
+            search_cache_key("foo", "https://foo.bar/search", {"a": 2}),
+        )
+        # the credentials of the requests are part of the key
+        url = "https://foo.bar/search?a=1"
+        self.assertEqual(
+            search_cache_key("foo", url, auth=HTTPBasicAuth("user", "password")),
+            search_cache_key("foo", url, auth=HTTPBasicAuth("user", "password")),
+        )
+        self.assertNotEqual(
+            search_cache_key("foo", url, auth=HTTPBasicAuth("user", "password")),
+            search_cache_key("foo", url, auth=HTTPBasicAuth("other", "password")),
+        )
+        self.assertNotEqual(
+            search_cache_key("foo", url),
+            search_cache_key("foo", url, auth=HTTPBasicAuth("user", "password")),
+        )
+
+    def test_memory_search_cache(self):
+        """MemorySearchCache must store raw responses and count hits and misses"""
+        cache = MemorySearchCache(max_size=2)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", self.make_response(b'{"foo": "bar"}'))
+        response = cache.get("a")
+        self.assertEqual(response.json(), {"foo": "bar"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cache.stats, {"hits": 1, "misses": 1})
+
+        # least recently used response is evicted
+        cache.set("b", self.make_response())
+        cache.get("a")
+        cache.set("c", self.make_response())
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+
+        cache.clear()
+        self.assertEqual(cache.stats, {"hits": 0, "misses": 0})
+        self.assertIsNone(cache.get("a"))
+
+    def test_search_cache_ttl(self):
+        """Search caches must not return expired responses"""
+        cache = MemorySearchCache(ttl=0.1)
+        cache.set("a", self.make_response())
+        self.assertIsNotNone(cache.get("a"))
+        time.sleep(0.15)
+        self.assertIsNone(cache.get("a"))
+        # ttl override
+        cache.set("a", self.make_response(), ttl=60)
+        time.sleep(0.15)
+        self.assertIsNotNone(cache.get("a"))
+
+    def test_search_cache_cache_control(self):
+        """Search caches must follow the Cache-Control header of the responses"""
+        cache = MemorySearchCache(ttl=60)
+        cache.set("a", self.make_response(headers={"Cache-Control": "no-store"}))
+        self.assertIsNone(cache.get("a"))
+        cache.set("b", self.make_response(headers={"Cache-Control": "max-age=0"}))
+        self.assertIsNone(cache.get("b"))
+        cache.set("c", self.make_response(headers={"Cache-Control": "max-age=120"}))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_sqlite_search_cache(self):
+        """SQLiteSearchCache must keep the responses between sessions"""
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cache", "search.db")
+            cache = SQLiteSearchCache(path)
+            cache.set(
+                "a",
+                self.make_response(
+                    b'{"foo": "bar"}', headers={"Content-Type": "application/json"}
+                ),
+            )
+            cache.close()
+
+            cache = SQLiteSearchCache(path)
+            response = cache.get("a")
+            self.assertEqual(response.json(), {"foo": "bar"})
+            self.assertEqual(response.headers["content-type"], "application/json")
+            self.assertEqual(response.url, "https://foo.bar/search")
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.stats, {"hits": 1, "misses": 1})
+            cache.clear()
+            self.assertIsNone(cache.get("a"))
+            cache.close()
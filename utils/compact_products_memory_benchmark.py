@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the memory used by a search result made of full products and by its
+compact version, e.g.: python utils/compact_products_memory_benchmark.py 100000"""
+import argparse
+import gc
+import tracemalloc
+
+from shapely.geometry import box
+
+from eodag.api.product import EOProduct
+from eodag.api.search_result import SearchResult
+
+
+def build_products(count):
+    """Build products looking like the ones returned by a search, each one having its
+    own properties and search kwargs as they are built from a provider response
+
+    :param count: The number of products to build
+    :type count: int
+    :returns: The products
+    :rtype: list(:class:`~eodag.api.product._product.EOProduct`)
+    """
+    search_geometry = box(0, 40, 10, 50)
+    products = []
+    for i in range(count):
+        lon, lat = i % 10, 40 + i % 9
+        properties = {
+            # values built as they are by the providers responses parsing
+            "id": "S2A_MSIL1C_20230101T%06d_N0509_R%03d" % (i, i % 143),
+            "title": "S2A_MSIL1C_20230101T%06d" % i,
+            "productType": "".join(["S2MSI", "1C"]),
+            "platform": "".join(["SENTINEL", "2"]),
+            "platformSerialIdentifier": "".join(["S2", "A"]),
+            "instrument": "".join(["MSI"]),
+            "processingLevel": "".join(["LEVEL", "1C"]),
+            "sensorType": "".join(["OPTICAL"]),
+            "storageStatus": "".join(["ONLINE"]),
+            "startTimeFromAscendingNode": "2023-01-01T10:%02d:00.000Z" % (i % 60),
+            "completionTimeFromAscendingNode": "2023-01-01T10:%02d:05.000Z" % (i % 60),
+            "cloudCover": float(i % 100),
+            "orbitNumber": i % 143,
+            "downloadLink": "https://example.com/download/%s" % i,
+            "quicklook": "https://example.com/quicklook/%s" % i,
+            "geometry": box(lon, lat, lon + 1, lat + 1).wkt,
+        }
+        products.append(
+            EOProduct(
+                "peps",
+                properties,
+                productType="S2_MSI_L1C",
+                geometry=search_geometry,
+                items_per_page=500,
+                page=1 + i // 500,
+            )
+        )
+    return products
+
+
+def measure(build):
+    """Get the memory allocated by the object returned by the given function
+
+    :param build: The function building the object to measure
+    :type build: Callable
+    :returns: The object and the memory it uses, in bytes
+    :rtype: tuple(Any, int)
+    """
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def compact_products_memory_benchmark(count):
+    """Print the memory used by a search result and by its compact version. The
+    memory allocated by GEOS for the shapely geometries of the full products is not
+    traced, their actual size is bigger
+
+    :param count: The number of products of the search result
+    :type count: int
+    """
+    _, full_size = measure(lambda: SearchResult(build_products(count)))
+    # the full products are released once compacted
+    _, compact_size = measure(lambda: SearchResult(build_products(count)).compact())
+    print("%s products" % count)
+    print("full:    %8.1f MB, %5d bytes/product" % (full_size / 1e6, full_size / count))
+    print(
+        "compact: %8.1f MB, %5d bytes/product"
+        % (compact_size / 1e6, compact_size / count)
+    )
+    print("ratio:   %8.1f" % (full_size / compact_size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("count", nargs="?", type=int, default=100000)
+    compact_products_memory_benchmark(parser.parse_args().count)